@@ -0,0 +1,154 @@
+# coding=utf-8
+"""Performance benchmarks of *PyPinT*
+
+The benchmarks follow the conventions of `airspeed velocity`_, i.e. methods prefixed with ``time_`` record the wall
+time and methods prefixed with ``peakmem_`` record the peak memory of the benchmarked call.
+Parameterized benchmark classes list their parameter values in ``params``.
+
+All random data is drawn from generators seeded with :py:data:`.SEED`, so results of different revisions are
+comparable.
+
+Examples
+--------
+Run the benchmarks of the current revision with::
+
+    cd $PyPinT_ROOT_DIR
+    asv run --python=same --quick
+
+.. _airspeed velocity: http://asv.readthedocs.org/
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+from pypint.communicators.forward_sending_messaging import ForwardSendingMessaging
+from pypint.integrators.sdc_integrator import SdcIntegrator
+from pypint.multi_level_providers.multi_time_level_provider import MultiTimeLevelProvider
+from pypint.multi_level_providers.level_transition_providers.time_transition_provider import TimeTransitionProvider
+from pypint.plugins.multigrid.level import MultigridLevel1D
+from pypint.plugins.multigrid.stencil import Stencil
+from pypint.solvers.cores import ExplicitSdcCore, ImplicitSdcCore, SemiImplicitSdcCore, \
+    ImplicitMlSdcCore, SemiImplicitMlSdcCore
+from pypint.utilities.logging import LOG
+from pypint.utilities.threshold_check import ThresholdCheck
+from examples.problems.heat_equation import HeatEquation
+from examples.problems.lambda_u import LambdaU
+
+
+SEED = 42
+"""Seed of all random number generators used by the benchmarks
+"""
+
+SDC_CORES = OrderedDict([
+    ('explicit', ExplicitSdcCore),
+    ('implicit', ImplicitSdcCore),
+    ('semi-implicit', SemiImplicitSdcCore)
+])
+
+MLSDC_CORES = OrderedDict([
+    ('implicit', ImplicitMlSdcCore),
+    ('semi-implicit', SemiImplicitMlSdcCore)
+])
+
+
+def quiet_logging():
+    """Disables the logger, as formatting log messages would dominate the timings of small problems
+    """
+    LOG.disabled = True
+
+
+def lambda_u():
+    """Scalar test equation with eigenvalue :math:`-1+i`
+    """
+    return LambdaU(lmbda=complex(-1.0, 1.0))
+
+
+def heat_equation(num_points=31):
+    """One-dimensional heat equation with homogeneous Dirichlet boundaries and a random initial value
+
+    Parameters
+    ----------
+    num_points : :py:class:`int`
+        *(optional)*
+        number of inner points of the space grid
+    """
+    _zero = lambda x: np.zeros(x.shape)
+    _problem = HeatEquation(dim=(num_points, 1),
+                            time_end=1e-3,
+                            thermal_diffusivity=0.5,
+                            initial_value=np.random.RandomState(SEED).rand(num_points, 1),
+                            rhs_function_wrt_space=lambda dof, tensor: 0.0,
+                            boundary_functions=[[_zero, _zero]],
+                            boundaries=['dirichlet'] * 2,
+                            geometry=np.asarray([[0, 1]]))
+    _level = MultigridLevel1D(num_points, mg_problem=_problem, max_borders=np.array([2, 2]), role='FL')
+    _problem._mg_level = _level
+    _problem._mg_stencil = \
+        Stencil(np.array([1.0, -2.0, 1.0]) * _problem.thermal_diffusivity / _level.h**2)
+    _problem._mg_stencil.grid = _level.mid.shape
+    return _problem
+
+
+PROBLEMS = OrderedDict([
+    ('LambdaU', lambda_u),
+    ('HeatEquation', heat_equation)
+])
+
+UNSUPPORTED = frozenset([('HeatEquation', 'implicit')])
+"""Combinations of problems and cores not supported by the problem
+
+The space solver of the heat equation requires the split into an explicit and implicit part.
+"""
+
+
+def skip_unsupported(problem, core):
+    """Skips benchmarks of unsupported combinations of problems and cores
+
+    Raises
+    ------
+    NotImplementedError
+        if the combination is not supported, which marks the benchmark as skipped
+    """
+    if (problem, core) in UNSUPPORTED:
+        raise NotImplementedError("%s does not support the %s core." % (problem, core))
+
+
+def threshold(max_iterations=10):
+    """Fixed number of iterations, so that all revisions do the same amount of work
+    """
+    return ThresholdCheck(max_threshold=max_iterations, conditions=('iterations',))
+
+
+def ml_provider(num_nodes):
+    """Multi-level provider with one level per given number of nodes
+
+    Parameters
+    ----------
+    num_nodes : :py:class:`list` of :py:class:`int`
+        numbers of nodes from the finest to the coarsest level
+    """
+    _provider = MultiTimeLevelProvider()
+    _integrators = []
+    for _num_nodes in num_nodes:
+        _integrator = SdcIntegrator()
+        _integrator.init(num_nodes=_num_nodes)
+        _integrators.append(_integrator)
+        _provider.add_coarse_level(_integrator)
+    # coarse levels are inserted as level 0, i.e. the finest level has the highest index
+    for _fine in range(0, len(_integrators) - 1):
+        _coarse_level = len(_integrators) - 2 - _fine
+        _provider.add_level_transition(TimeTransitionProvider(fine_nodes=_integrators[_fine].nodes,
+                                                              coarse_nodes=_integrators[_fine + 1].nodes),
+                                       _coarse_level, _coarse_level + 1)
+    return _provider
+
+
+def linked_communicator(problem, tag=None):
+    """Forward sending messaging linked to itself and holding the initial value of the given problem
+    """
+    _comm = ForwardSendingMessaging()
+    _comm.link_solvers(previous=_comm, next=_comm)
+    _comm.write_buffer(tag=tag, value=problem.initial_value, time_point=problem.time_start)
+    return _comm
@@ -0,0 +1,31 @@
+# coding=utf-8
+"""Benchmarks of the import time of PyPinT's entry points
+
+Each import runs in a fresh interpreter, thus the timings include loading all dependencies pulled in eagerly.
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+
+
+class ImportTime(object):
+    """Cold import of the package and the modules of a typical solver script
+    """
+    params = [['pypint', 'pypint.utilities.logging', 'pypint.problems', 'pypint.integrators.sdc_integrator',
+               'pypint.solvers.parallel_sdc', 'pypint.solvers.ml_sdc']]
+    param_names = ['module']
+
+    def timeraw_import(self, module):
+        return "import %s" % module
+
+
+class ImportFootprint(object):
+    """Number of modules loaded by importing the solvers
+    """
+
+    def track_loaded_modules(self):
+        import subprocess
+        import sys
+        return int(subprocess.check_output([sys.executable, '-c',
+                                            'import sys, pypint.solvers.parallel_sdc, pypint.solvers.ml_sdc; '
+                                            'print(len(sys.modules))']))
+    track_loaded_modules.unit = 'modules'
@@ -0,0 +1,41 @@
+# coding=utf-8
+"""Benchmarks of the integrators
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+
+from pypint.integrators.sdc_integrator import SdcIntegrator
+from benchmarks import SEED
+
+
+class SdcIntegratorSetup(object):
+    """Computation of nodes, weights and the integration matrices
+    """
+    params = [3, 5, 7, 9, 13]
+    param_names = ['num_nodes']
+
+    def time_init(self, num_nodes):
+        SdcIntegrator().init(num_nodes=num_nodes)
+
+    def peakmem_init(self, num_nodes):
+        SdcIntegrator().init(num_nodes=num_nodes)
+
+
+class SdcIntegratorEvaluation(object):
+    """Integration of all nodes of an interval
+    """
+    params = [3, 5, 7, 9, 13]
+    param_names = ['num_nodes']
+
+    def setup(self, num_nodes):
+        self.integrator = SdcIntegrator()
+        self.integrator.init(num_nodes=num_nodes, interval=np.array([0.0, 1.0]))
+        self.data = np.random.RandomState(SEED).rand(num_nodes, 64, 1)
+
+    def time_evaluate_nodes(self, num_nodes):
+        self.integrator.evaluate_nodes(self.data, from_previous=True)
+
+    def time_evaluate_node_by_node(self, num_nodes):
+        for _node in range(1, num_nodes):
+            self.integrator.evaluate(self.data, from_node=_node - 1, target_node=_node)
@@ -0,0 +1,81 @@
+# coding=utf-8
+"""Benchmarks of the multigrid space solver
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+.. moduleauthor:: Dieter Moser <d.moser@fz-juelich.de>
+"""
+import numpy as np
+
+from pypint.plugins.multigrid import MG_SMOOTHER_PRESETS, MG_LEVEL_PRESETS, MG_RESTRICTION_PRESETS, \
+    MG_INTERPOLATION_PRESETS
+from pypint.plugins.multigrid.multigrid_core import MultiGridCore
+from pypint.plugins.multigrid.multigrid_problem import MultigridProblem
+from pypint.plugins.multigrid.stencil import Stencil
+from benchmarks import SEED, quiet_logging
+
+
+def _laplace_stencil_form_1d(level):
+    return np.asarray([1.0, -2.0, 1.0]) / level.h**2, np.asarray([1])
+
+
+def _laplace_stencil_form_2d(level):
+    return np.asarray([[0.0, 1.0, 0.0], [1.0, -4.0, 1.0], [0.0, 1.0, 0.0]]) / level.h[0]**2, np.asarray([1, 1])
+
+
+def _multigrid_core(dim, smoother):
+    _zero = lambda x: 0.0
+    # three levels of the presets, each refining the grid of the coarser one by 2 * n + 1 points
+    _shape_fine = np.atleast_1d(MG_LEVEL_PRESETS["Standard-%dD" % dim]["shape_coarse"]) * 4 + 3
+    _problem = MultigridProblem(rhs_function_wrt_space=lambda *args: 0.0,
+                                dim=tuple(int(_points) for _points in _shape_fine) + (1,),
+                                boundary_functions=[[_zero, _zero]] * dim,
+                                boundaries="dirichlet",
+                                geometry=np.asarray([[0, 1]] * dim))
+    _options = {}
+    _options.update(MG_SMOOTHER_PRESETS[smoother])
+    _options.update(MG_LEVEL_PRESETS["Standard-%dD" % dim])
+    _options.update(MG_RESTRICTION_PRESETS["Standard-%dD" % dim])
+    _options.update(MG_INTERPOLATION_PRESETS["Standard-%dD" % dim])
+    _core = MultiGridCore(_problem, _laplace_stencil_form_1d if dim == 1 else _laplace_stencil_form_2d, **_options)
+    _core.set_initial_value(-1, np.random.RandomState(SEED).rand(*_core.levels[-1].mid.shape))
+    _core.fill_rhs(-1)
+    _core.pad(-1)
+    _core.modify_rhs(-1)
+    return _core
+
+
+class VCycle(object):
+    """V-cycle on three levels of the standard level presets
+    """
+    params = [[1, 2], ['Jacobi', 'RedBlackGaussSeidel', 'Chebyshev']]
+    param_names = ['dim', 'smoother']
+
+    def setup(self, dim, smoother):
+        quiet_logging()
+        self.core = _multigrid_core(dim, smoother)
+
+    def time_v_cycle(self, dim, smoother):
+        self.core.v_cycle()
+
+    def peakmem_v_cycle(self, dim, smoother):
+        self.core.v_cycle()
+
+
+class StencilToSparseMatrix(object):
+    """Assembly of the sparse matrix of the Laplacian
+    """
+    params = [[1, 2], [64, 256, 1024]]
+    param_names = ['dim', 'points_per_dim']
+
+    def setup(self, dim, points_per_dim):
+        if dim == 1:
+            self.stencil = Stencil(np.asarray([1.0, -2.0, 1.0]))
+        else:
+            self.stencil = Stencil(np.asarray([[0.0, 1.0, 0.0], [1.0, -4.0, 1.0], [0.0, 1.0, 0.0]]))
+        self.grid = (points_per_dim,) * dim
+
+    def time_to_sparse_matrix(self, dim, points_per_dim):
+        self.stencil.to_sparse_matrix(self.grid, format="csr")
+
+    def peakmem_to_sparse_matrix(self, dim, points_per_dim):
+        self.stencil.to_sparse_matrix(self.grid, format="csr")
@@ -0,0 +1,33 @@
+# coding=utf-8
+"""Benchmarks of the solution data storages
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+import numpy as np
+
+from pypint.solutions.data_storage.trajectory_solution_data import TrajectorySolutionData
+from benchmarks import SEED
+
+
+class TrajectorySolutionDataGrowth(object):
+    """Appending the solutions of many time points to a trajectory
+    """
+    params = [[10, 100, 1000], [1, 1024]]
+    param_names = ['num_time_points', 'dofs']
+
+    def setup(self, num_time_points, dofs):
+        self.values = np.random.RandomState(SEED).rand(num_time_points, dofs)
+        self.time_points = np.linspace(0.0, 1.0, num_time_points)
+
+    def _grow(self):
+        _trajectory = TrajectorySolutionData()
+        for _values, _time_point in zip(self.values, self.time_points):
+            _trajectory.add_solution_data(values=_values, time_point=_time_point)
+        _trajectory.finalize()
+        return _trajectory
+
+    def time_add_solution_data(self, num_time_points, dofs):
+        self._grow()
+
+    def peakmem_add_solution_data(self, num_time_points, dofs):
+        self._grow()
@@ -0,0 +1,60 @@
+# coding=utf-8
+"""Benchmarks of the SDC and MLSDC solvers
+
+Each solver runs a fixed number of iterations, so that the timings of different revisions compare the same amount of
+work.
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from pypint.integrators.sdc_integrator import SdcIntegrator
+from pypint.solvers.ml_sdc import MlSdc
+from pypint.solvers.parallel_sdc import ParallelSdc
+from benchmarks import PROBLEMS, SDC_CORES, MLSDC_CORES, skip_unsupported, quiet_logging, threshold, ml_provider, \
+    linked_communicator
+
+
+class ParallelSdcRun(object):
+    """Two time steps with five nodes each on a single interval
+    """
+    params = [list(PROBLEMS.keys()), list(SDC_CORES.keys())]
+    param_names = ['problem', 'core']
+    # a solver runs only once, thus it has to be set up anew for each measurement
+    number = 1
+
+    def setup(self, problem, core):
+        skip_unsupported(problem, core)
+        quiet_logging()
+        self.problem = PROBLEMS[problem]()
+        self.solver = ParallelSdc(communicator=linked_communicator(self.problem))
+        self.solver.init(integrator=SdcIntegrator, threshold=threshold(), problem=self.problem,
+                         num_time_steps=2, num_nodes=5)
+
+    def time_run(self, problem, core):
+        self.solver.run(SDC_CORES[core], dt=self.problem.time_end - self.problem.time_start)
+
+    def peakmem_run(self, problem, core):
+        self.solver.run(SDC_CORES[core], dt=self.problem.time_end - self.problem.time_start)
+
+
+class MlSdcRun(object):
+    """A single interval with a hierarchy of two or three levels
+
+    The explicit MLSDC core is not benchmarked, as it does not support coarse levels yet.
+    """
+    params = [list(PROBLEMS.keys()), list(MLSDC_CORES.keys()), [2, 3]]
+    param_names = ['problem', 'core', 'num_levels']
+    number = 1
+
+    def setup(self, problem, core, num_levels):
+        skip_unsupported(problem, core)
+        quiet_logging()
+        self.problem = PROBLEMS[problem]()
+        _provider = ml_provider([7, 5, 3][-num_levels:])
+        self.solver = MlSdc(communicator=linked_communicator(self.problem, tag=_provider.num_levels - 1))
+        self.solver.init(problem=self.problem, ml_provider=_provider, threshold=threshold())
+
+    def time_run(self, problem, core, num_levels):
+        self.solver.run(MLSDC_CORES[core], dt=self.problem.time_end - self.problem.time_start)
+
+    def peakmem_run(self, problem, core, num_levels):
+        self.solver.run(MLSDC_CORES[core], dt=self.problem.time_end - self.problem.time_start)
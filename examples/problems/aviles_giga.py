@@ -1,12 +1,30 @@
 # coding=utf-8
-import scipy.fftpack as spfft
+import threading
+import weakref
+
 import scipy.optimize as scop
 import numpy as np
+try:
+    # SciPy 1.4 and newer distribute the transforms of multiple fields over threads
+    from scipy.fft import rfft2, irfft2
+    _FFT_HAS_WORKERS = True
+except ImportError:
+    from numpy.fft import rfft2, irfft2
+    _FFT_HAS_WORKERS = False
 
 from pypint.plugins.multigrid.i_transient_multigrid_problem import IInitialValueProblem
 from pypint.utilities import assert_is_callable, assert_is_instance
 
 
+class _WorkBuffers(threading.local):
+    # work buffers of each thread per problem; they are not stored on the problems to keep these picklable
+    def __init__(self):
+        self.of_problem = weakref.WeakKeyDictionary()
+
+
+_WORK_BUFFERS = _WorkBuffers()
+
+
 class AvilesGiga(IInitialValueProblem):
     """A nonlinear partial differential equation in two spacial dimensions for
         which describes a homogeneous dipole model
@@ -43,26 +61,19 @@ class AvilesGiga(IInitialValueProblem):
 
         if isinstance(self.epsilon, complex):
             self.numeric_type = np.complex
-        self._u = np.zeros((self._m, self._m), dtype=np.complex128)
-        # place to work on
-        self._u_x = self._u.copy()
-        self._u_y = self._u.copy()
-        self._u_f = self._u.copy()
-        self._u_angle = self._u.copy()
-        self._u_edens = self._u.copy()
-        self._B = self._u.copy()
-        # arrays to work in fourier space
-        self._k_od = np.hstack((np.arange(self._n+1, dtype=np.int64),
-                               np.arange(self._n, dtype=np.int64)-self._n))
-        self._k_y = self._k_od
-        self._k_x = self._k_od.reshape(self._m, 1)
-        for i in range(self._m-1):
-            self._k_y = np.vstack((self._k_y, self._k_od))
-            self._k_x = np.hstack((self._k_x, self._k_od.reshape(self._m, 1)))
-
+        # the fields are real, thus the real-to-complex transforms only hold the non-negative wave numbers of the
+        # last axis; as the number of points is odd, there is no Nyquist mode
+        self._shape = (self._m, self._m)
+        self._k_x = np.fft.ifftshift(np.arange(-self._n, self._n + 1, dtype=np.int64)).reshape(self._m, 1)
+        self._k_y = np.arange(self._n + 1, dtype=np.int64).reshape(1, self._n + 1)
         self._k_2 = self._k_x**2 + self._k_y**2
         self._k_4 = self._k_2**2
-
+        # spectral derivatives in x and y direction stacked along the first axis
+        self._ik = 1j * np.array(np.broadcast_arrays(self._k_x, self._k_y), dtype=np.float64)
+        # the transforms of multiple fields are distributed over this number of threads if supported by SciPy
+        self._fft_options = {}
+        if kwargs.get('fft_workers') is not None and _FFT_HAS_WORKERS:
+            self._fft_options['workers'] = kwargs['fft_workers']
 
         if kwargs.get('delta_times_for_time_levels') is not None and self._mg_level is not None:
             assert_is_instance(kwargs['delta_times_for_time_levels'], (list, np.ndarray),
@@ -82,14 +93,14 @@ class AvilesGiga(IInitialValueProblem):
         self._epsilon = value
 
     def fft(self, u):
-        """Wrapper around some fft
+        """Real-to-complex transform of the last two axes
         """
-        return spfft.fft2(u)
+        return rfft2(u, **self._fft_options)
 
-    def ifft(self, u):
-        """Wrapper around some ifft
+    def ifft(self, u_f):
+        """Complex-to-real transform of the last two axes
         """
-        return spfft.ifft2(u)
+        return irfft2(u_f, s=self._shape, **self._fft_options)
 
     def energy_linear(self):
         pass
@@ -97,38 +108,67 @@ class AvilesGiga(IInitialValueProblem):
     def energy_non_linear(selfself):
         pass
 
-    def compute_grad(self):
-        self._u_x[:] = np.real(self.ifft(np.complex(0, 1) * self._k_x * self._u_f))
-        self._u_y[:] = np.real(self.ifft(np.complex(0, 1) * self._k_y * self._u_f))
-        self._B = self._u_x**2 + self._u_y**2 - 1
+    def compute_grad(self, u_f):
+        """Gradients of the fields given in spectral space
 
-    def compute_non_linear(self):
-        return np.real(self.ifft(np.complex(0, 1) * self._k_x * (self.fft(self._B*self._u_x)) +
-                                 np.complex(0, 1) * self._k_y * (self.fft(self._B*self._u_y))))
+        Both components are transformed with a single call.
 
-    def compute_linear(self):
-        return np.real(self.ifft(self._k_4 * self.fft(self._u)))
+        Returns
+        -------
+        grad : :py:class:`numpy.ndarray`
+            of shape ``u_f.shape[:-2] + (2, m, m)`` with the :math:`x` and :math:`y` component along the third last
+            axis
+        """
+        _grad_f = self._buffer('grad_f', u_f.shape[:-2] + self._ik.shape, np.complex128)
+        np.multiply(self._ik, u_f[..., np.newaxis, :, :], out=_grad_f)
+        return self.ifft(_grad_f)
+
+    def compute_non_linear(self, u_f):
+        """Divergence :math:`\\grad \\cdot ((|\\grad u|^2 - 1) \\grad u)` in spectral space
+        """
+        _grad = self.compute_grad(u_f)
+        _b = self._buffer('b', _grad.shape[:-3] + (1,) + self._shape, np.float64)
+        np.sum(np.square(_grad), axis=-3, keepdims=True, out=_b)
+        _b -= 1.0
+        _grad *= _b
+        _flux_f = self.fft(_grad)
+        _flux_f *= self._ik
+        return np.sum(_flux_f, axis=-3)
+
+    def compute_linear(self, u_f):
+        """Bi-Laplacian :math:`\\Delta^2 u` in spectral space
+        """
+        return self._k_4 * u_f
 
     def evaluate_wrt_time(self, time, phi_of_time, **kwargs):
         """Computing the right hand side with respect to time
         """
         super(AvilesGiga, self).evaluate_wrt_time(time, phi_of_time, **kwargs)
-        self._u.reshape(phi_of_time.shape)[:] = phi_of_time
-        self._u_f = self.fft(self._u)
-        self.compute_grad()
-        if kwargs.get('partial') is not None:
-            if isinstance(kwargs['partial'], str) and kwargs['partial'] == 'impl':
-                return (- self.epsilon * self.compute_linear()).reshape(phi_of_time.shape)
-            elif kwargs['partial'] == 'expl':
-                return (self.compute_non_linear() / self.epsilon).reshape(phi_of_time.shape)
-        else:
-            return (self.compute_non_linear() / self.epsilon - self.epsilon * self.compute_linear()).reshape(phi_of_time.shape)
+        return self._spectral_rhs(phi_of_time.reshape(self._shape), kwargs.get('partial')).reshape(phi_of_time.shape)
+
+    def evaluate_wrt_time_batch(self, times, values, **kwargs):
+        """Computing the right hand side with respect to time for all values at once
+
+        The two-dimensional FFTs act on the last two axes, thus all values are transformed with a single call.
+        """
+        self._assert_batch(times, values, **kwargs)
+        self._count_rhs_evaluations(times.size)
+        return self._spectral_rhs(values.reshape((-1,) + self._shape), kwargs.get('partial')).reshape(values.shape)
 
     def implicit_solve(self, next_x, func, method="unused", **kwargs):
         """A solver for the implicit equations.
+
+        For the linear part (i.e. ``partial="impl"``) the equation
+        :math:`x + \\Delta t \\epsilon \\Delta^2 x = b` with the explicit term :math:`b` is diagonal in spectral
+        space and solved exactly.
+        Otherwise, the Newton-Krylov method is used.
         """
         assert_is_instance(next_x, np.ndarray, descriptor="Initial Guess", checking_obj=self)
         assert_is_callable(func, descriptor="Function of RHS for Implicit Solver", checking_obj=self)
+        if kwargs.get('partial') == 'impl' and 'expl_term' in kwargs and 'delta_time' in kwargs:
+            _b_f = self.fft(kwargs['expl_term'].reshape(self._shape))
+            _b_f /= 1.0 + kwargs['delta_time'] * self.epsilon * self._k_4
+            return self.ifft(_b_f).reshape(self.dim_for_time_solver)
         sol = scop.newton_krylov(func, next_x.reshape(-1))
         assert_is_instance(sol, np.ndarray, descriptor="Solution", checking_obj=self)
         return sol.reshape(self.dim_for_time_solver)
@@ -137,13 +177,32 @@ class AvilesGiga(IInitialValueProblem):
         """ returns angles of the vector (u_x, u_y)
 
         """
-        self._u.reshape(u.shape)[:] = u
-        self.compute_grad()
-        return np.angle(np.complex(0, 1) * self._u_x + self._u_y)
-
-
+        _grad = self.compute_grad(self.fft(u.reshape(self._shape)))
+        return np.angle(1j * _grad[0] + _grad[1])
 
+    def _spectral_rhs(self, u, partial=None):
+        """Right hand side of the fields ``u`` stacked along the leading axes
 
+        The linear and non-linear part are summed up in spectral space, thus only a single inverse transform is needed.
+        """
+        _u_f = self.fft(u)
+        if partial == 'impl':
+            _rhs_f = self.compute_linear(_u_f)
+            _rhs_f *= -self.epsilon
+        else:
+            _rhs_f = self.compute_non_linear(_u_f)
+            _rhs_f /= self.epsilon
+            if partial != 'expl':
+                _rhs_f -= self.epsilon * self.compute_linear(_u_f)
+        return self.ifft(_rhs_f)
+
+    def _buffer(self, name, shape, dtype):
+        # the right hand side may be evaluated by multiple threads at once (e.g. by node-parallel sweeps), thus each
+        # thread has its own buffers; they are reallocated only for a different number of fields
+        _buffers = _WORK_BUFFERS.of_problem.setdefault(self, {})
+        if name not in _buffers or _buffers[name].shape != shape:
+            _buffers[name] = np.empty(shape, dtype=dtype)
+        return _buffers[name]
 
     def print_lines_for_log(self):
         _lines = super(AvilesGiga, self).print_lines_for_log()
@@ -41,7 +41,7 @@ class Constant(IInitialValueProblem, HasExactSolutionMixin):
         self.time_end = 1.0
         self.initial_value = shift * np.ones(self.dim_for_time_solver)
         self.constant = constant
-        self._exact_function = lambda t: self.initial_value + self.constant * t
+        self._exact_function = self._exact
         self._strings['rhs_wrt_time'] = "C"
         self._strings['exact'] = 'u_0 + C * t'
 
@@ -49,6 +49,15 @@ class Constant(IInitialValueProblem, HasExactSolutionMixin):
         super(Constant, self).evaluate_wrt_time(time, phi_of_time, **kwargs)
         return self.constant * np.ones(self.dim_for_time_solver)
 
+    def exact_batch(self, times):
+        if self.exact_function != self._exact:
+            # a reassigned exact solution function can only be evaluated per time point
+            return super(Constant, self).exact_batch(times)
+        return self._exact(times.reshape((-1,) + (1,) * self.initial_value.ndim))
+
+    def _exact(self, t):
+        return self.initial_value + self.constant * t
+
     def print_lines_for_log(self):
         _lines = super(Constant, self).print_lines_for_log()
         _lines.update(HasExactSolutionMixin.print_lines_for_log(self))
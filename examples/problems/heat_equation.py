@@ -4,6 +4,7 @@
 .. moduleauthor:: Dieter Moser <d.moser@fz-juelich.de>
 """
 import numpy as np
+import scipy.signal as sig
 
 from pypint.plugins.multigrid.i_transient_multigrid_problem import ITransientMultigridProblem
 from pypint.plugins.multigrid.i_multigrid_level import IMultigridLevel
@@ -81,6 +82,18 @@ class HeatEquation(ITransientMultigridProblem):
             # LOG.debug(" --> %s" % _out.reshape(phi_of_time.shape))
             return _out.reshape(phi_of_time.shape)
 
+    def evaluate_wrt_time_batch(self, times, values, **kwargs):
+        self._assert_batch(times, values, **kwargs)
+        if kwargs.get('partial') and kwargs['partial'] != "impl":
+            return np.zeros(values.shape)
+        _padded_phis = []
+        for _phi in values:
+            self._mg_level.mid[:] = _phi.reshape(-1)
+            _padded_phis.append(self._mg_level.evaluable_view(self._mg_stencil).copy())
+        # a leading stencil axis of length one convolves all padded values at once
+        _out = sig.convolve(np.array(_padded_phis), self._mg_stencil.reversed_arr[np.newaxis], "valid")
+        return _out.reshape(values.shape)
+
     def mg_stencil(self, delta_time, delta_space):
         _stencil = np.array(
             [
@@ -107,7 +120,7 @@ class HeatEquation(ITransientMultigridProblem):
         self._direct_solvers[time_level][delta_time] = {
             'mg_level': mg_level,
             'stencil': _stencil,
-            'solver': _stencil.generate_direct_solver(mg_level.mid.shape)
+            'solver': _stencil.generate_direct_solver(mg_level.mid.shape, boundaries=self.boundaries)
         }
 
     def implicit_solve(self, next_x, func, method="direct", **kwargs):
@@ -54,7 +54,7 @@ class LambdaU(IInitialValueProblem, HasExactSolutionMixin, HasDirectImplicitMixi
         if isinstance(self.lmbda, complex):
             self.numeric_type = np.complex
 
-        self.exact_function = lambda phi_of_time: self.initial_value * np.exp(self.lmbda * phi_of_time)
+        self.exact_function = self._exact
 
         self._strings['rhs_wrt_time'] = r"\lambda u(t, \phi(t))"
         self._strings['exact'] = r"e^{\lambda t}"
@@ -69,6 +69,26 @@ class LambdaU(IInitialValueProblem, HasExactSolutionMixin, HasDirectImplicitMixi
         else:
             return self.lmbda * phi_of_time
 
+    def evaluate_wrt_time_batch(self, times, values, **kwargs):
+        self._assert_batch(times, values, **kwargs)
+        self._count_rhs_evaluations(times.size)
+        if kwargs.get('partial') is not None and isinstance(self.lmbda, complex):
+            if kwargs['partial'] == 'impl':
+                return self.lmbda.real * values
+            elif kwargs['partial'] == 'expl':
+                return self.lmbda.imag * values
+        else:
+            return self.lmbda * values
+
+    def exact_batch(self, times):
+        if self.exact_function != self._exact:
+            # a reassigned exact solution function can only be evaluated per time point
+            return super(LambdaU, self).exact_batch(times)
+        return self._exact(times.reshape((-1,) + (1,) * self.initial_value.ndim))
+
+    def _exact(self, phi_of_time):
+        return self.initial_value * np.exp(self.lmbda * phi_of_time)
+
     def direct_implicit(self, *args, **kwargs):
         """Direct Implicit Formula for :math:`u'(t, \\phi_t) &= \\lambda u(t, \\phi_t)`
         """
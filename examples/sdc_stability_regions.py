@@ -10,10 +10,8 @@ warnings.simplefilter('ignore', category=DeprecationWarning)
 warnings.simplefilter('ignore', category=RuntimeWarning)
 
 import argparse
-import concurrent.futures
-import pickle as pickle
+from collections import OrderedDict
 import numpy as np
-import time
 import matplotlib.pyplot as plt
 import matplotlib.cm as cm
 
@@ -22,41 +20,35 @@ from pypint.integrators.sdc_integrator import SdcIntegrator
 from pypint.solvers.parallel_sdc import ParallelSdc
 from pypint.solvers.cores.semi_implicit_sdc_core import SemiImplicitSdcCore
 from pypint.utilities.threshold_check import ThresholdCheck
+from pypint.utilities.parameter_sweep import ParameterSweep
+from pypint.utilities.logging import LOG
+from pypint.plugins.events import SolverEvent, RecordArrayEventSink
 from examples.problems.lambda_u import LambdaU
 
 
-def run_problem(real, imag, max_iter, num_steps, num_nodes, criteria, task, num_tasks, n_procs, starttime):
-    _width = len(str(num_tasks))
-    _percent = float(task) / float(num_tasks) * 100
-    _diff_time = time.time() - starttime
-    _time_epsilon = 0.1
-    if task > n_procs \
-            and ((_diff_time > 8.0 and
-                  ((_diff_time % 10.0) < _time_epsilon) or ((10.0 - (_diff_time % 10.0)) < _time_epsilon))
-                 or (num_tasks % 2 == 0 and _percent % 4 == 0)
-                 or (num_tasks % 2 != 0 and _percent % 4 == 0)):
-        print("[ {:6.2f}%] Starting task {:{width}d} of {:{width}d}: \\lambda = {: .3f}{:+.3f}i"
-              .format(_percent, task, num_tasks, real, imag, width=_width))
-
+def run_problem(real, imag, max_iter, num_steps, num_nodes, criteria):
     problem = LambdaU(lmbda=complex(real, imag))
     check = ThresholdCheck(min_threshold=1e-14, max_threshold=max_iter,
                            conditions=('residual', 'iterations'))
 
+    # the number of iterations is taken from the solver's events instead of its log output
+    LOG.disabled = True
     comm = ForwardSendingMessaging()
     solver = ParallelSdc(communicator=comm)
+    solver.event_sink = RecordArrayEventSink()
     comm.link_solvers(previous=comm, next=comm)
     comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
 
     solver.init(integrator=SdcIntegrator, problem=problem, threshold=check, num_time_steps=num_steps, num_nodes=num_nodes)
     try:
-        solution = solver.run(SemiImplicitSdcCore, dt=(problem.time_end - problem.time_start))
-        return int(solution[-1].used_iterations)
+        solver.run(SemiImplicitSdcCore, dt=(problem.time_end - problem.time_start))
+        _end = solver.event_sink.of_kind(SolverEvent.Kind.interval_end)[-1]
+        return int(_end.iteration) + 1 if _end.reason != 'failed' else max_iter + 1
     except RuntimeError:
         return max_iter + 1
 
 
 def sdc_stability_region(num_points, max_iter, num_steps, num_nodes, num_procs, real, imag, criteria):
-    _start_time = time.time()
     _test_region = {
         'real': real,
         'imag': imag
@@ -78,33 +70,17 @@ def sdc_stability_region(num_points, max_iter, num_steps, num_nodes, num_procs,
         'real': np.linspace(_test_region['real'][0], _test_region['real'][1], _num_points_per_axis['real']),
         'imag': np.linspace(_test_region['imag'][0], _test_region['imag'][1], _num_points_per_axis['imag'])
     }
-    _results = np.zeros((_num_points_per_axis['imag'], _num_points_per_axis['real']), dtype=np.int)
-    _futures = np.zeros((_num_points_per_axis['imag'], _num_points_per_axis['real']), dtype=object)
-
     _name = "sdc_stability_{:.2f}-{:.2f}_{:.2f}-{:.2f}_p{:d}_maxI{:d}_T{:d}_n{:d}"\
             .format(_test_region["real"][0], _test_region['real'][1], _test_region['imag'][0], _test_region['imag'][1],
                     num_points, max_iter, num_steps, num_nodes)
 
-    with concurrent.futures.ProcessPoolExecutor(max_workers=num_procs) as pool:
-        for a in range(0, _points['real'].size):
-            for j in range(0, _points['imag'].size):
-                _futures[j][a] = \
-                    pool.submit(run_problem, _points['real'][a], _points['imag'][j], max_iter, num_steps, num_nodes,
-                                criteria, a * _points['imag'].size + j + 1, _points['real'].size * _points['imag'].size,
-                                num_procs, _start_time)
-
-    for a in range(0, _points['real'].size):
-        for j in range(0, _points['imag'].size):
-            if _futures[j][a].exception(timeout=None) is None:
-                _results[j][a] = _futures[j][a].result(timeout=None)
-            else:
-                _results[j][a] = max_iter
-                print("[FAILED  ] \\lambda = {: .3f}{:+.3f}i.\n[  reason] {:s}"
-                      .format(_points['real'][a], _points['imag'][j], _futures[j][a].exception()))
-
-    with open("{:s}.pickle".format(_name), 'wb') as f:
-        pickle.dump(_results, f)
-        print("Iteration Data:\n%s" % _results)
+    # the results are streamed to disk; an interrupted analysis continues with the points not yet computed
+    _sweep = ParameterSweep(run_problem, OrderedDict([('imag', _points['imag']), ('real', _points['real'])]),
+                            "{:s}.npy".format(_name), dtype=int, failed_value=max_iter,
+                            arguments={'max_iter': max_iter, 'num_steps': num_steps, 'num_nodes': num_nodes,
+                                       'criteria': criteria})
+    _results = np.array(_sweep.run(max_workers=num_procs))
+    print("Iteration Data:\n%s" % _results)
 
     plt.rc('text', usetex=True)
     plt.hold(True)
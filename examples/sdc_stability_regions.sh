@@ -1,4 +1,4 @@
-#!/bin/sh
-
-python3 "$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"/sdc_stability_regions.py "$@" | grep -e '^\[' --color=never
+#!/bin/bash
 
+# the solvers do not log any more, thus only the progress and results of the analysis are printed
+python3 "$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"/sdc_stability_regions.py "$@"
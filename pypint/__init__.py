@@ -8,6 +8,8 @@ benefits of parallel-in-time routines to a zoo of time integrators in various ap
 
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 .. moduleauthor:: Dieter Moser <d.moser@fz-juelich.de>
+
+Subpackages are imported on first access (e.g. ``pypint.solvers``), thus ``import pypint`` itself is cheap.
 """
 
 from sys import version_info
@@ -22,3 +24,15 @@ except ImportError:
     warnings.warn("Version file could not be loaded!")
     __git_revision__ = "UNKNOWN"
     __version__ = "UNKNOWN"
+
+
+_SUBPACKAGES = ('communicators', 'integrators', 'multi_level_providers', 'plugins', 'problems', 'solutions',
+                'solvers', 'utilities')
+
+
+def __getattr__(name):
+    # lazy loading of the subpackages (PEP 562; only effective as of Python 3.7)
+    if name in _SUBPACKAGES:
+        from importlib import import_module
+        return import_module('pypint.' + name)
+    raise AttributeError("module 'pypint' has no attribute '%s'" % name)
@@ -7,5 +7,6 @@
 
 from pypint.communicators.message import Message
 from pypint.communicators.forward_sending_messaging import ForwardSendingMessaging
+from pypint.communicators.pipeline_messaging import PipelineMessaging
 
-__all__ = ['Message', 'ForwardSendingMessaging']
+__all__ = ['Message', 'ForwardSendingMessaging', 'PipelineMessaging']
@@ -99,6 +99,15 @@ class ICommunicationProvider(object):
         if 'flag' in kwargs:
             self._buffer[tag].flag = deepcopy(kwargs['flag'])
 
+    @property
+    def previous_finished(self):
+        """Whether the previous solver has finished its work
+
+        Communicators not tracking the state of the previous solver always report :py:class:`True`, i.e. solvers may
+        terminate on their own termination criteria.
+        """
+        return True
+
     def tagged_buffer(self, tag):
         if tag in self._buffer:
             return self._buffer[tag]
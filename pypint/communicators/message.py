@@ -3,7 +3,7 @@
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
 from enum import Enum, unique
-from pypint.utilities import assert_is_instance
+from pypint.utilities import assert_is_instance, VALIDATION
 
 
 class Message(object):
@@ -68,7 +68,8 @@ class Message(object):
 
     @flag.setter
     def flag(self, flag):
-        assert_is_instance(flag, Message.SolverFlag, descriptor="Flag", checking_obj=self)
+        if VALIDATION.internal:
+            assert_is_instance(flag, Message.SolverFlag, descriptor="Flag", checking_obj=self)
         self._flag = flag
 
     @flag.deleter
@@ -0,0 +1,260 @@
+# coding=utf-8
+"""
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from collections import deque
+
+import numpy as np
+from mpi4py import MPI
+
+from pypint.communicators.i_communication_provider import ICommunicationProvider
+from pypint.communicators.message import Message
+from pypint.utilities import assert_condition, assert_is_instance, assert_is_in, VALIDATION
+
+
+class MpiMessaging(ICommunicationProvider):
+    """A linear forward-directed communication pattern between solvers on different MPI ranks
+
+    Messages are sent to the next rank with nonblocking ``Isend``.
+    Value, time point and flag of a message are packed into a single byte buffer, which is transferred through the
+    buffer protocol, i.e. NumPy arrays are never pickled.
+    Therefore, all values must match the shape and data type of the given ``value_template``.
+
+    For each tag a nonblocking ``Irecv`` from the previous rank is posted on linking and reposted as soon as a message
+    has arrived.
+    Thus, messages are transferred while the solver is sweeping and receiving only copies the arrived messages into
+    the tagged buffers.
+    As for :py:class:`.PipelineMessaging`, messages with one of the ``blocking_tags`` are received in the order they
+    have been sent and receiving on such a tag waits for the next message unless the previous solver has finished.
+    On all other tags the latest message available is received without waiting.
+
+    Notes
+    -----
+    This requires ``mpi4py``, which is not a dependency of PyPinT.
+    Hence, this communicator is not imported by :py:mod:`pypint.communicators`.
+
+    Examples
+    --------
+    A ring of all ranks started with ``mpirun -np 4``:
+
+    >>> comm = MpiMessaging(value_template=np.zeros(1), blocking_tags=[None])  # doctest: +SKIP
+    >>> rank, size = comm.comm.Get_rank(), comm.comm.Get_size()  # doctest: +SKIP
+    >>> comm.link_solvers(previous=(rank - 1) % size, next=(rank + 1) % size)  # doctest: +SKIP
+    >>> comm.send(value=np.array([rank]), time_point=0.0)  # doctest: +SKIP
+    >>> comm.receive().value  # doctest: +SKIP
+    """
+
+    _header_size = 3
+    """Number of :py:class:`numpy.float64` in front of a message's value: time point, flag and presence of the value
+    """
+
+    _terminal_flags = [Message.SolverFlag.converged, Message.SolverFlag.finished, Message.SolverFlag.failed]
+
+    def __init__(self, *args, **kwargs):
+        """
+        Parameters
+        ----------
+        value_template : :py:class:`numpy.ndarray`
+            array of the shape and data type of all values sent and received (e.g. the initial value of the problem)
+        tags : :py:class:`list`
+            *(optional)*
+            all tags used by the solvers (e.g. the level indices of :py:class:`.MlSdc`);
+            defaults to the untagged buffer only, i.e. ``[None]``
+        blocking_tags : :py:class:`list`
+            *(optional)*
+            tags to receive in order and wait for;
+            defaults to no tags
+        comm : ``mpi4py.MPI.Comm``
+            *(optional)*
+            MPI communicator of the ranks to link;
+            defaults to ``MPI.COMM_WORLD``
+
+        Raises
+        ------
+        ValueError
+
+            * if ``value_template`` is not given or not a :py:class:`numpy.ndarray`
+            * if a blocking tag is not one of the tags
+        """
+        super(MpiMessaging, self).__init__(*args, **kwargs)
+        assert_condition('value_template' in kwargs, ValueError, message="A value template must be given.",
+                         checking_obj=self)
+        assert_is_instance(kwargs['value_template'], np.ndarray, descriptor="Value Template", checking_obj=self)
+        self._shape = kwargs['value_template'].shape
+        self._dtype = kwargs['value_template'].dtype
+        self._offset = self._header_size * np.dtype(np.float64).itemsize
+        self._buffer_size = self._offset + kwargs['value_template'].nbytes
+
+        self._tags = kwargs['tags'] if 'tags' in kwargs else [None]
+        assert_is_instance(self._tags, list, descriptor="Tags", checking_obj=self)
+        self._blocking_tags = kwargs['blocking_tags'] if 'blocking_tags' in kwargs else []
+        assert_is_instance(self._blocking_tags, list, descriptor="Blocking Tags", checking_obj=self)
+        for _tag in self._blocking_tags:
+            assert_is_in(_tag, self._tags, elem_desc="Blocking Tag", list_desc="Tags", checking_obj=self)
+
+        self._comm = kwargs['comm'] if 'comm' in kwargs else MPI.COMM_WORLD
+        self._previous = None
+        self._next = None
+        self._receives = []
+        self._sends = []
+        self._pending = dict((_tag, deque()) for _tag in self._blocking_tags)
+        self._previous_finished = False
+
+    def send(self, tag=None, **kwargs):
+        """Sends given message to the next rank without waiting for its completion
+
+        Sending without a next rank is a no-op.
+
+        See Also
+        --------
+        :py:meth:`.ICommunicationProvider.write_buffer`
+            for allowed arguments
+        """
+        super(MpiMessaging, self).send(tag=tag, **kwargs)
+        if self._next is not None:
+            self._complete_sends()
+            _buffer = self._pack(**kwargs)
+            self._sends.append((self._comm.Isend([_buffer, MPI.BYTE], dest=self._next, tag=self._mpi_tag(tag)),
+                                _buffer))
+
+    def receive(self, tag=None, **kwargs):
+        """Returns this communicator's buffer for the given tag
+
+        Parameters
+        ----------
+        tag : hashable
+            *(optional)*
+            tag of the message
+
+        Returns
+        -------
+        message : :py:class:`.Message` or :py:class:`None`
+            :py:class:`None` if nothing has been written for this tag
+        """
+        super(MpiMessaging, self).receive(tag=tag, **kwargs)
+        self._receive_pending(block=False)
+        if tag in self._blocking_tags:
+            while len(self._pending[tag]) == 0 and not self.previous_finished:
+                self._receive_pending(block=True)
+            if len(self._pending[tag]) > 0:
+                self.write_buffer(tag=tag, **self._pending[tag].popleft())
+        return self.buffer if tag is None else self.tagged_buffer(tag=tag)
+
+    def link_solvers(self, *args, **kwargs):
+        """Links the given ranks with this communicator and posts the receives from the previous rank
+
+        Parameters
+        ----------
+        previous : :py:class:`int` or :py:class:`None`
+            rank of the previous solver; :py:class:`None` for the first solver
+        next : :py:class:`int` or :py:class:`None`
+            rank of the next solver; :py:class:`None` for the last solver
+
+        Raises
+        ------
+        ValueError
+            if not exactly the two ranks are given
+        """
+        super(MpiMessaging, self).link_solvers(*args, **kwargs)
+        assert_condition(len(kwargs) == 2 and 'previous' in kwargs and 'next' in kwargs,
+                         ValueError, message="Exactly the previous and next ranks must be given.",
+                         checking_obj=self)
+        self._cancel_receives()
+        self._previous = kwargs['previous']
+        self._next = kwargs['next']
+        if self._previous is not None:
+            for _tag in self._tags:
+                _buffer = np.empty(self._buffer_size, dtype=np.uint8)
+                self._receives.append((self._post_receive(_tag, _buffer), _tag, _buffer))
+
+    def close(self):
+        """Waits for all sent messages to complete and cancels the posted receives
+        """
+        self._complete_sends(wait=True)
+        self._cancel_receives()
+
+    @property
+    def previous_finished(self):
+        """Whether the previous solver has finished its work
+
+        :py:class:`True` for the first solver or after a message with a converged, finished or failed flag has been
+        received.
+        """
+        return self._previous is None or self._previous_finished
+
+    @property
+    def comm(self):
+        """Read-only accessor for the MPI communicator
+        """
+        return self._comm
+
+    def _mpi_tag(self, tag):
+        if VALIDATION.internal:
+            assert_is_in(tag, self._tags, elem_desc="Tag", list_desc="Tags", checking_obj=self)
+        return self._tags.index(tag)
+
+    def _post_receive(self, tag, buffer):
+        return self._comm.Irecv([buffer, MPI.BYTE], source=self._previous, tag=self._mpi_tag(tag))
+
+    def _pack(self, **kwargs):
+        _buffer = np.zeros(self._buffer_size, dtype=np.uint8)
+        _header = _buffer[:self._offset].view(np.float64)
+        _header[0] = kwargs['time_point'] if 'time_point' in kwargs else np.nan
+        _header[1] = kwargs['flag'].value if 'flag' in kwargs else np.nan
+        if 'value' in kwargs:
+            _value = np.ascontiguousarray(kwargs['value'], dtype=self._dtype)
+            if VALIDATION.internal:
+                assert_condition(_value.shape == self._shape, ValueError,
+                                 message="Value must be of shape {}: NOT {}".format(self._shape, _value.shape),
+                                 checking_obj=self)
+            _header[2] = 1.0
+            _buffer[self._offset:] = _value.view(np.uint8).reshape(-1)
+        return _buffer
+
+    def _unpack(self, buffer):
+        _header = buffer[:self._offset].view(np.float64)
+        _message = {}
+        if not np.isnan(_header[0]):
+            _message['time_point'] = float(_header[0])
+        if not np.isnan(_header[1]):
+            _message['flag'] = Message.SolverFlag(int(_header[1]))
+        if _header[2] > 0.0:
+            _message['value'] = buffer[self._offset:].view(self._dtype).reshape(self._shape).copy()
+        return _message
+
+    def _receive_pending(self, block=False):
+        if len(self._receives) == 0:
+            return
+        if block:
+            # wait for the first message on any tag;
+            # its completed request is set to MPI.REQUEST_NULL, for which Test() below succeeds once more
+            MPI.Request.Waitany([_request for _request, _tag, _buffer in self._receives])
+        for _index, (_request, _tag, _buffer) in enumerate(self._receives):
+            # messages of a tag arrive in the order they have been sent
+            while _request.Test():
+                _message = self._unpack(_buffer)
+                _request = self._post_receive(_tag, _buffer)
+                if _tag in self._blocking_tags:
+                    self._pending[_tag].append(_message)
+                elif len(_message) > 0:
+                    self.write_buffer(tag=_tag, **_message)
+                if 'flag' in _message and _message['flag'] in self._terminal_flags:
+                    self._previous_finished = True
+            self._receives[_index] = (_request, _tag, _buffer)
+
+    def _complete_sends(self, wait=False):
+        if wait:
+            MPI.Request.Waitall([_request for _request, _buffer in self._sends])
+            self._sends = []
+        else:
+            # the send buffers must be kept until their messages are transferred
+            self._sends = [(_request, _buffer) for _request, _buffer in self._sends if not _request.Test()]
+
+    def _cancel_receives(self):
+        for _request, _tag, _buffer in self._receives:
+            _request.Cancel()
+            _request.Wait()
+        self._receives = []
+
+
+__all__ = ['MpiMessaging']
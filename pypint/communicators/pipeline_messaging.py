@@ -0,0 +1,139 @@
+# coding=utf-8
+"""
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from collections import deque
+from queue import Empty
+
+from pypint.communicators.i_communication_provider import ICommunicationProvider
+from pypint.communicators.message import Message
+from pypint.utilities import assert_condition, assert_is_instance
+
+
+class PipelineMessaging(ICommunicationProvider):
+    """A linear forward-directed communication pattern between solvers in separate processes
+
+    Messages are passed to the next solver through a queue (e.g. a :py:class:`multiprocessing.Queue`) shared by the
+    two processes.
+
+    On receiving, all messages sent by the previous solver so far are written into the tagged buffers.
+    Messages with one of the ``blocking_tags`` are received in the order they have been sent and receiving on such a
+    tag waits for the next message unless the previous solver has finished.
+    On all other tags the latest message available is received without waiting.
+
+    Examples
+    --------
+    >>> from multiprocessing import Queue
+    >>> queue = Queue()
+    >>> sender, receiver = PipelineMessaging(), PipelineMessaging(blocking_tags=[0])
+    >>> sender.link_solvers(previous=None, next=queue)
+    >>> receiver.link_solvers(previous=queue, next=None)
+    >>> sender.send(tag=0, value=1.0, time_point=0.5)
+    >>> receiver.receive(tag=0).value
+    1.0
+    """
+
+    _terminal_flags = [Message.SolverFlag.converged, Message.SolverFlag.finished, Message.SolverFlag.failed]
+
+    def __init__(self, *args, **kwargs):
+        """
+        Parameters
+        ----------
+        blocking_tags : :py:class:`list`
+            *(optional)*
+            tags to receive in order and wait for (usually the coarsest level);
+            defaults to no tags
+        """
+        super(PipelineMessaging, self).__init__(*args, **kwargs)
+        self._previous = None
+        self._next = None
+        self._blocking_tags = kwargs['blocking_tags'] if 'blocking_tags' in kwargs else []
+        assert_is_instance(self._blocking_tags, list, descriptor="Blocking Tags", checking_obj=self)
+        self._pending = dict((_tag, deque()) for _tag in self._blocking_tags)
+        self._previous_finished = False
+
+    def send(self, tag=None, **kwargs):
+        """Sends given message to the next communicator
+
+        Sending without a next communicator (i.e. on the last solver of the pipeline) is a no-op.
+
+        See Also
+        --------
+        :py:meth:`.ICommunicationProvider.write_buffer`
+            for allowed arguments
+        """
+        super(PipelineMessaging, self).send(tag=tag, **kwargs)
+        if self._next is not None:
+            self._next.put((tag, kwargs))
+
+    def receive(self, tag=None, **kwargs):
+        """Returns this communicator's buffer for the given tag
+
+        Parameters
+        ----------
+        tag : hashable
+            *(optional)*
+            tag of the message
+
+        Returns
+        -------
+        message : :py:class:`.Message` or :py:class:`None`
+            :py:class:`None` if nothing has been written for this tag
+        """
+        super(PipelineMessaging, self).receive(tag=tag, **kwargs)
+        self._receive_pending(block=False)
+        if tag in self._blocking_tags:
+            while len(self._pending[tag]) == 0 and not self.previous_finished:
+                self._receive_pending(block=True)
+            if len(self._pending[tag]) > 0:
+                self.write_buffer(tag=tag, **self._pending[tag].popleft())
+        return self.buffer if tag is None else self.tagged_buffer(tag=tag)
+
+    def link_solvers(self, *args, **kwargs):
+        """Links the given queues with this communicator
+
+        Parameters
+        ----------
+        previous : :py:class:`multiprocessing.Queue` or :py:class:`None`
+            queue of messages from the previous solver; :py:class:`None` for the first solver
+        next : :py:class:`multiprocessing.Queue` or :py:class:`None`
+            queue of messages to the next solver; :py:class:`None` for the last solver
+
+        Raises
+        ------
+        ValueError
+            if not exactly the two queues are given
+        """
+        super(PipelineMessaging, self).link_solvers(*args, **kwargs)
+        assert_condition(len(kwargs) == 2 and 'previous' in kwargs and 'next' in kwargs,
+                         ValueError, message="Exactly the previous and next queues must be given.",
+                         checking_obj=self)
+        self._previous = kwargs['previous']
+        self._next = kwargs['next']
+
+    @property
+    def previous_finished(self):
+        """Whether the previous solver has finished its work
+
+        :py:class:`True` for the first solver of the pipeline or after a message with a converged, finished or failed
+        flag has been received.
+        """
+        return self._previous is None or self._previous_finished
+
+    def _receive_pending(self, block=False):
+        while self._previous is not None:
+            try:
+                _tag, _message = self._previous.get(block=block)
+            except Empty:
+                break
+            # only wait for the first message
+            block = False
+            if _tag in self._blocking_tags:
+                self._pending[_tag].append(_message)
+            else:
+                self.write_buffer(tag=_tag, **_message)
+            if 'flag' in _message and _message['flag'] in self._terminal_flags:
+                self._previous_finished = True
+
+
+__all__ = ['PipelineMessaging']
@@ -6,7 +6,7 @@ import numpy as np
 
 from pypint.integrators.node_providers.i_nodes import INodes
 from pypint.integrators.weight_function_providers.i_weight_function import IWeightFunction
-from pypint.utilities import assert_is_instance, assert_condition, class_name
+from pypint.utilities import assert_is_instance, assert_condition, class_name, VALIDATION
 
 
 class IntegratorBase(object):
@@ -106,6 +106,8 @@ class IntegratorBase(object):
             * if either ``time_start`` or ``time_end`` are not given
             * if ``time_start`` is larger or equals ``time_end``
         """
+        if not VALIDATION.internal:
+            return
         assert_is_instance(data, np.ndarray, descriptor="Data to integrate", checking_obj=self)
         assert_condition("time_start" in kwargs or "time_end" in kwargs,
                          ValueError, message="Either start or end of time interval need to be given.",
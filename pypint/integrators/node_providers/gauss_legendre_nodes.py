@@ -4,7 +4,6 @@
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
 import numpy as np
-from scipy import linalg
 
 from pypint.integrators.node_providers.i_nodes import INodes
 from pypint.utilities import assert_condition
@@ -95,6 +94,7 @@ class GaussLegendreNodes(INodes):
         # Determining the abscissas (nodes)
         # - since det(nodesI-comp_mat)=P_n(nodes), the abscissas are the roots
         #   of the characteristic polynomial, i.d. the eigenvalues of comp_mat
+        from scipy import linalg
         [eig_vals, _] = linalg.eig(comp_mat)
         indizes = np.argsort(eig_vals)
         nodes = eig_vals[indizes]
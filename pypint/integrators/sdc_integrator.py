@@ -10,17 +10,30 @@ import numpy as np
 from pypint.integrators.integrator_base import IntegratorBase
 from pypint.integrators.node_providers.gauss_lobatto_nodes import GaussLobattoNodes
 from pypint.integrators.weight_function_providers.polynomial_weight_function import PolynomialWeightFunction
-from pypint.utilities import assert_is_instance, assert_condition, assert_named_argument
+from pypint.utilities import assert_is_instance, assert_condition, assert_named_argument, assert_is_in, VALIDATION
 from pypint.utilities.logging import LOG
 
 
+_MIN_DIAGONAL_CACHE = {}
+
+
 class SdcIntegrator(IntegratorBase):
     """Integral part of the SDC algorithm.
     """
+
+    q_delta_types = ['implicit_euler', 'explicit_euler', 'lu', 'min']
+    """Valid types of the sweeper preconditioner :math:`Q_\\Delta` (see :py:meth:`.q_delta`)
+    """
+
+    diagonal_q_delta_types = ['min']
+    """Types of :py:attr:`.q_delta_types` resulting in a diagonal :math:`Q_\\Delta`
+    """
+
     def __init__(self):
         super(SdcIntegrator, self).__init__()
         self._smat = np.zeros(0)
         self._qmat = np.zeros(0)
+        self._q_delta = {}
 
     def init(self, nodes_type=GaussLobattoNodes, num_nodes=3, weights_function=PolynomialWeightFunction, interval=None):
         """Initialize SDC Integrator
@@ -86,45 +99,140 @@ class SdcIntegrator(IntegratorBase):
         --------
         :py:meth:`.IntegratorBase.evaluate` : overridden method
         """
-        _target_index = self._qmat.shape[0] - 1
-        if 'target_node' in kwargs:
-            assert_is_instance(kwargs['target_node'], int, descriptor="Target Node Index", checking_obj=self)
-            _target_index = kwargs["target_node"]
-
-        _from_index = 0
-        if 'from_node' in kwargs:
-            assert_is_instance(kwargs['from_node'], int, descriptor="From Node Index", checking_obj=self)
-            _from_index = kwargs['from_node']
-
-        assert_condition(_from_index < _target_index,
-                         ValueError,
-                         message="Integration must cover at least two nodes: %d !< %d" % (_from_index, _target_index),
-                         checking_obj=self)
-
-        super(SdcIntegrator, self).evaluate(data,
-                                            time_start=self.nodes[_from_index],
-                                            time_end=self.nodes[_target_index])
-        if _from_index != 0:
-            assert_condition(_target_index <= self._smat.shape[0],
-                             ValueError, message="Target Node Index {:d} too large. Must be within [{:d},{:d})"
-                                                 .format(_target_index, 1, self._smat.shape[0]),
+        _target_index = kwargs.get('target_node', self._qmat.shape[0] - 1)
+        _from_index = kwargs.get('from_node', 0)
+
+        if VALIDATION.internal:
+            if 'target_node' in kwargs:
+                assert_is_instance(kwargs['target_node'], int, descriptor="Target Node Index", checking_obj=self)
+            if 'from_node' in kwargs:
+                assert_is_instance(kwargs['from_node'], int, descriptor="From Node Index", checking_obj=self)
+            assert_condition(_from_index < _target_index,
+                             ValueError,
+                             message="Integration must cover at least two nodes: %d !< %d"
+                                     % (_from_index, _target_index),
                              checking_obj=self)
+            super(SdcIntegrator, self).evaluate(data,
+                                                time_start=self.nodes[_from_index],
+                                                time_end=self.nodes[_target_index])
+
+        if _from_index != 0:
+            if VALIDATION.internal:
+                assert_condition(_target_index <= self._smat.shape[0],
+                                 ValueError, message="Target Node Index {:d} too large. Must be within [{:d},{:d})"
+                                                     .format(_target_index, 1, self._smat.shape[0]),
+                                 checking_obj=self)
             # LOG.debug("Integrating from node {:d} to {:d} with S-Mat row {:d} on interval {}."
             #           .format(_from_index, _target_index, _target_index - 1, self.nodes_type.interval))
             # LOG.debug("  data:    %s" % data.flatten())
             # LOG.debug("  weights: %s" % self._smat[_target_index - 1])
             return np.tensordot(self._smat[_target_index - 1], data, axes=([0], [0]))
         else:
-            assert_condition(_target_index < self._qmat.shape[0],
-                             ValueError, message="Target Node Index {:d} too large. Must be within [{:d}, {:d}]"
-                                                 .format(_target_index, 1, self._qmat.shape[0]),
-                             checking_obj=self)
+            if VALIDATION.internal:
+                assert_condition(_target_index < self._qmat.shape[0],
+                                 ValueError, message="Target Node Index {:d} too large. Must be within [{:d}, {:d}]"
+                                                     .format(_target_index, 1, self._qmat.shape[0]),
+                                 checking_obj=self)
             # LOG.debug("Integrating up to node {:d} with Q-Mat row {:d} on interval {}."
             #           .format(_target_index, _target_index, self.nodes_type.interval))
             # LOG.debug("  data:    %s" % data.flatten())
             # LOG.debug("  weights: %s" % self._qmat[_target_index])
             return np.tensordot(self._qmat[_target_index], data, axes=([0], [0]))
 
+    def evaluate_nodes(self, data, from_previous=False, out=None):
+        """Computes the integrals up to all nodes with a single matrix product
+
+        With ``from_previous`` the :math:`S`-matrix is applied, i.e. row :math:`i` of the result is the integral from
+        node :math:`i` to node :math:`i+1` as given by :py:meth:`.evaluate` with ``from_node=i`` and
+        ``target_node=i+1``.
+        Otherwise the :math:`Q`-matrix is applied, i.e. row :math:`i` of the result is the integral from the first
+        node to node :math:`i` as given by :py:meth:`.evaluate` with ``target_node=i``; the first row is zero.
+
+        Parameters
+        ----------
+        data : :py:class:`numpy.ndarray`
+            values at all nodes stacked along the first axis
+        from_previous : :py:class:`bool`
+            *(optional)*
+            whether to integrate from the respective previous node (:math:`S`-matrix) or from the first node
+            (:math:`Q`-matrix)
+            *(defaults to ``False``)*
+        out : :py:class:`numpy.ndarray`
+            *(optional)*
+            C-contiguous array of the result's shape and data type to write the result into
+
+        Returns
+        -------
+        integrals : :py:class:`numpy.ndarray`
+            ``out`` if given
+
+        Raises
+        ------
+        ValueError
+            if the number of values does not match the number of nodes
+        """
+        if VALIDATION.internal:
+            assert_condition(data.shape[0] == self.num_nodes, ValueError,
+                             message="Number of values does not match number of nodes: %d != %d"
+                                     % (data.shape[0], self.num_nodes),
+                             checking_obj=self)
+        _mat = self._smat if from_previous else self._qmat
+        _data = data.reshape(data.shape[0], -1)
+        if out is None:
+            return _mat.dot(_data).reshape((_mat.shape[0],) + data.shape[1:])
+        else:
+            np.dot(_mat, _data, out=out.reshape(_mat.shape[0], -1))
+            return out
+
+    def q_delta(self, q_delta_type='implicit_euler'):
+        """Lower triangular approximation :math:`Q_\\Delta` of the :math:`Q`-matrix used as sweeper preconditioner
+
+        As :math:`Q`, :math:`Q_\\Delta` has a constant zero first row and refers to the current interval.
+
+        Parameters
+        ----------
+        q_delta_type : :py:class:`str`
+            *(optional)*
+            one of :py:attr:`.q_delta_types`:
+
+            ``implicit_euler`` *(default)*
+                the classic implicit Euler sweep with the node distances on and below the diagonal
+            ``explicit_euler``
+                the explicit Euler sweep with the node distances below the diagonal
+            ``lu``
+                Weiser's *LU-trick*, i.e. :math:`Q_\\Delta = U^T` for :math:`Q^T = LU`;
+                usually speeds up convergence for stiff problems considerably
+            ``min``
+                diagonal matrix minimizing the spectral radius of the iteration matrix
+                :math:`I - Q_\\Delta^{-1} Q` in the stiff limit;
+                all nodes can be computed in parallel
+
+        Returns
+        -------
+        q_delta : :py:class:`numpy.ndarray`
+            of the same shape as the :math:`Q`-matrix
+        """
+        assert_is_in(q_delta_type, self.q_delta_types, elem_desc="Q-Delta Type", list_desc="Valid Q-Delta Types",
+                     checking_obj=self)
+        if q_delta_type not in self._q_delta:
+            _nodes = self.nodes
+            _q_delta = np.zeros(self._qmat.shape, dtype=float)
+            if q_delta_type == 'implicit_euler':
+                for i in range(1, _nodes.size):
+                    _q_delta[i, 1:i + 1] = _nodes[1:i + 1] - _nodes[0:i]
+            elif q_delta_type == 'explicit_euler':
+                for i in range(1, _nodes.size):
+                    _q_delta[i, 0:i] = _nodes[1:i + 1] - _nodes[0:i]
+            elif q_delta_type == 'lu':
+                import scipy.linalg as spl
+                _p, _l, _u = spl.lu(self._qmat[1:, 1:].T)
+                _q_delta[1:, 1:] = _u.T
+            else:
+                _width = _nodes[-1] - _nodes[0]
+                _q_delta[1:, 1:] = np.diag(_width * self._min_diagonal(self._qmat[1:, 1:] / _width))
+            self._q_delta[q_delta_type] = _q_delta
+        return self._q_delta[q_delta_type]
+
     def transform_interval(self, interval):
         """Transforms nodes onto new interval
 
@@ -133,7 +241,8 @@ class SdcIntegrator(IntegratorBase):
         :py:meth:`.IntegratorBase.transform_interval` : overridden method
         """
         if interval is not None:
-            if interval[1] - interval[0] != self.nodes[-1] - self.nodes[0]:
+            # widths of shifted intervals may differ in their last bits only
+            if not np.isclose(interval[1] - interval[0], self.nodes[-1] - self.nodes[0], rtol=1e-14, atol=0.0):
                 LOG.debug("Size of interval changed. Recalculating weights.")
                 super(SdcIntegrator, self).transform_interval(interval)
                 self._construct_s_matrix()
@@ -161,6 +270,7 @@ class SdcIntegrator(IntegratorBase):
 
         # compute Q-matrix
         self._construct_q_matrix()
+        self._q_delta = {}
 
     def _construct_q_matrix(self):
         """Constructs integration :math:`Q`-matrix
@@ -174,6 +284,21 @@ class SdcIntegrator(IntegratorBase):
         for i in range(0, self._smat.shape[0]):
             self._qmat[i + 1] = self._qmat[i] + self._smat[i]
 
+    @staticmethod
+    def _min_diagonal(qmat):
+        """Diagonal of :math:`Q_\\Delta` minimizing the spectral radius of :math:`I - Q_\\Delta^{-1} Q`
+
+        The optimization is cached for the normalized :math:`Q`-matrix.
+        """
+        _key = qmat.round(12).tobytes()
+        if _key not in _MIN_DIAGONAL_CACHE:
+            from scipy.optimize import minimize
+            _identity = np.eye(qmat.shape[0])
+            _spectral_radius = lambda x: np.abs(np.linalg.eigvals(_identity - np.diag(x).dot(qmat))).max()
+            _inverse_diagonal = minimize(_spectral_radius, 10.0 * np.ones(qmat.shape[0]), method='Nelder-Mead').x
+            _MIN_DIAGONAL_CACHE[_key] = 1.0 / _inverse_diagonal
+        return _MIN_DIAGONAL_CACHE[_key]
+
     def __str__(self):
         return "SdcIntegrator<0x%x>(nodes=%s, weights=%s)" % (id(self), self.nodes_type, self.weights_function)
 
@@ -6,20 +6,25 @@ import numpy as np
 from math import fabs
 
 from pypint.multi_level_providers.level_transition_providers.i_level_transition_provider import ILevelTransitionProvider
-from pypint.utilities.math import lagrange_polynome
+from pypint.utilities.math import lagrange_matrix
 from pypint.utilities import assert_named_argument, assert_condition
 from pypint.utilities.logging import LOG
 
 
+_OPERATOR_CACHE = {}
+
+
 class TimeTransitionProvider(ILevelTransitionProvider):
     """Level Transition Provider between two time levels
 
     Provides prolongation and restringation between two time levels based on interpolation.
 
     In case of nested notes (i.e. fine level with 5 Gauss-Lobatto nodes, coarse level with 3 Gauss-Lobatto nodes)
-    the restringation is a simple injection.
+    the restringation is a simple injection, which is applied by indexing instead of a matrix product.
 
     Prolongation is always done via plain interpolation.
+
+    The operators are shared by all providers with the same nodes relative to their interval.
     """
     def __init__(self, *args, **kwargs):
         """
@@ -57,34 +62,93 @@ class TimeTransitionProvider(ILevelTransitionProvider):
 
     def prolongate(self, coarse_data):
         super(TimeTransitionProvider, self).prolongate(coarse_data)
+        if self._prolongation_indices is not None:
+            return coarse_data[self._prolongation_indices]
         return np.tensordot(self.prolongation_operator, coarse_data, axes=([1], [0]))
         # return np.dot(self.prolongation_operator, coarse_data)
 
     def restringate(self, fine_data):
         super(TimeTransitionProvider, self).restringate(fine_data)
+        if self._restringation_indices is not None:
+            return fine_data[self._restringation_indices]
         return np.tensordot(self.restringation_operator, fine_data, axes=([1], [0]))
         # return np.dot(self.restringation_operator, fine_data)
 
+    @property
+    def prolongation_operator(self):
+        """Accessor for the prolongation operator.
+
+        Setting a new operator disables the injection by index for nested nodes.
+        """
+        return self._prolongation_operator
+
+    @prolongation_operator.setter
+    def prolongation_operator(self, prolongation_operator):
+        self._prolongation_operator = prolongation_operator
+        self._prolongation_indices = None
+
+    @property
+    def restringation_operator(self):
+        """Accessor for the restringation operator.
+
+        Setting a new operator disables the injection by index for nested nodes.
+        """
+        return self._restringation_operator
+
+    @restringation_operator.setter
+    def restringation_operator(self, restringation_operator):
+        self._restringation_operator = restringation_operator
+        self._restringation_indices = None
+
     def _compute_prolongation_matrix(self):
-        self._prolongation_operator = np.zeros((self.num_fine_points, self.num_coarse_points), dtype=float)
-        for k in range(0, self.num_fine_points):
-            for j in range(0, self.num_coarse_points):
-                self._prolongation_operator[k][j] = lagrange_polynome(j, self._coarse_nodes, self._fine_nodes[k])
-        #     self._prolongation_operator[k] = self._scaled_interpolation_weights(from_points=self._coarse_nodes,
-        #                                                                         to_points=self._fine_nodes,
-        #                                                                         index=k)
+        self._prolongation_operator, self._prolongation_indices = \
+            self._cached_operator(from_points=self._coarse_nodes, to_points=self._fine_nodes)
         # LOG.debug("Prolongation Operator: %s" % self._prolongation_operator)
 
     def _compute_restringation_matrix(self):
-        self._restringation_operator = np.zeros((self.num_coarse_points, self.num_fine_points), dtype=float)
-        for k in range(0, self.num_coarse_points):
-            for j in range(0, self.num_fine_points):
-                self._restringation_operator[k][j] = lagrange_polynome(j, self._fine_nodes, self._coarse_nodes[k])
-                #     self._restringation_operator[k] = self._scaled_interpolation_weights(from_points=self._fine_nodes,
-                #                                                                          to_points=self._coarse_nodes,
-                #                                                                          index=k)
+        self._restringation_operator, self._restringation_indices = \
+            self._cached_operator(from_points=self._fine_nodes, to_points=self._coarse_nodes)
         # LOG.debug("Restringation Operator: %s" % self._restringation_operator)
 
+    def _cached_operator(self, from_points, to_points):
+        """Interpolation operator from one set of nodes onto another
+
+        The operator is computed by barycentric Lagrange interpolation on the reference interval :math:`[0, 1]`
+        spanned by the fine nodes.
+        As the interpolation is invariant under affine transformations, the operator is cached by the nodes on the
+        reference interval and shared by all providers with the same nodes, regardless of their interval.
+
+        In case all target nodes coincide with one of the source nodes, the interpolation is an injection and the
+        respective indices of the source nodes are returned as well.
+
+        Returns
+        -------
+        operator : :py:class:`numpy.ndarray`
+            read-only interpolation matrix of shape ``(to_points.size, from_points.size)``
+        indices : :py:class:`numpy.ndarray` of :py:class:`int` or :py:class:`None`
+            :py:class:`None` if this is not an injection
+        """
+        _start = self._fine_nodes[0]
+        _width = self._fine_nodes[-1] - self._fine_nodes[0]
+        if _width == 0.0:
+            _width = 1.0
+        _from = (from_points - _start) / _width
+        _to = (to_points - _start) / _width
+
+        _key = (_from.round(12).tobytes(), _to.round(12).tobytes())
+        if _key not in _OPERATOR_CACHE:
+            _matching = np.isclose(_to[:, np.newaxis], _from[np.newaxis, :], rtol=0.0, atol=1e-12)
+            if np.all(np.any(_matching, axis=1)):
+                _indices = np.argmax(_matching, axis=1)
+                _operator = np.zeros((_to.size, _from.size), dtype=float)
+                _operator[np.arange(_to.size), _indices] = 1.0
+            else:
+                _indices = None
+                _operator = lagrange_matrix(_from, _to)
+            _operator.setflags(write=False)
+            _OPERATOR_CACHE[_key] = (_operator, _indices)
+        return _OPERATOR_CACHE[_key]
+
     def _scaled_interpolation_weights(self, from_points, to_points, index):
         """non-proofen custom integration method
 
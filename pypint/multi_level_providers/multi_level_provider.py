@@ -3,9 +3,12 @@
 
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
+import numpy as np
+
 from pypint.integrators.integrator_base import IntegratorBase
 from pypint.multi_level_providers.level_transition_providers.i_level_transition_provider \
     import ILevelTransitionProvider
+from pypint.plugins.timers.instrumentation import timed
 from pypint.utilities import assert_condition, assert_is_instance
 
 
@@ -23,6 +26,7 @@ class MultiLevelProvider(object):
         self._level_transitioners = {}
         self._default_transitioner = default_transitioner
         self._level_integrators = []
+        self._level_numeric_types = []
         self._num_levels = num_levels
         if num_levels is not None and default_integrator is not None:
             for level in range(0, num_levels):
@@ -43,7 +47,24 @@ class MultiLevelProvider(object):
         """
         return self._level_integrators[level]
 
-    def prolongate(self, coarse_data, coarse_level, fine_level=None):
+    def numeric_type(self, level):
+        """Accessor for the numeric type of the values on the specified level.
+
+        Parameters
+        ----------
+        level : :py:class:`int`
+            Level to retrieve the numeric type for.
+
+        Returns
+        -------
+        numeric_type : :py:class:`numpy.dtype` or :py:class:`None`
+            Numeric type the values of the level are stored in.
+            :py:class:`None` if the level uses the numeric type of the problem.
+        """
+        return self._level_numeric_types[level]
+
+    @timed('level transfer')
+    def prolongate(self, coarse_data, coarse_level, fine_level=None, cast=True):
         """Prolongates given data from coarser to finer level.
 
         Parameters
@@ -59,6 +80,12 @@ class MultiLevelProvider(object):
             Fine level to prolongate onto.
             In case it is :py:class:`None` the next finer level is taken.
 
+        cast : :py:class:`bool`
+            *(optional)*
+            Whether to cast the prolongated data to the numeric type of the fine level (see :py:meth:`.numeric_type`).
+            Data from a level with reduced precision is promoted to at least double precision for fine levels using
+            the numeric type of the problem.
+
         Returns
         -------
         prolongated data : :py:class:`numpy.ndarray`
@@ -68,9 +95,12 @@ class MultiLevelProvider(object):
         --------
         :py:meth:`.ILevelTransitionProvider.prolongate` : for details on prolongation
         """
-        return self._level_transition(coarse_level=coarse_level, fine_level=fine_level).prolongate(coarse_data)
+        coarse_level, fine_level = self._transition_levels(coarse_level, fine_level)
+        _data = self._level_transition(coarse_level=coarse_level, fine_level=fine_level).prolongate(coarse_data)
+        return self._cast_to_level(_data, fine_level, coarse_level) if cast else _data
 
-    def restringate(self, fine_data, fine_level, coarse_level=None):
+    @timed('level transfer')
+    def restringate(self, fine_data, fine_level, coarse_level=None, cast=True):
         """Restringates given data from finer to coarser level.
 
         Parameters
@@ -86,6 +116,12 @@ class MultiLevelProvider(object):
             Coarse level to restringate onto.
             In case it is :py:class:`None` the next coarser level is taken.
 
+        cast : :py:class:`bool`
+            *(optional)*
+            Whether to cast the restringated data to the numeric type of the coarse level (see
+            :py:meth:`.numeric_type`).
+            Without casting the precision of the fine data is kept, e.g. for the FAS correction.
+
         Returns
         -------
         restringated data : :py:class:`numpy.ndarray`
@@ -95,9 +131,11 @@ class MultiLevelProvider(object):
         --------
         :py:meth:`.ILevelTransitionProvider.restringate` : for details on restringation
         """
-        return self._level_transition(coarse_level=coarse_level, fine_level=fine_level).restringate(fine_data)
+        coarse_level, fine_level = self._transition_levels(coarse_level, fine_level)
+        _data = self._level_transition(coarse_level=coarse_level, fine_level=fine_level).restringate(fine_data)
+        return self._cast_to_level(_data, coarse_level, fine_level) if cast else _data
 
-    def add_coarse_level(self, integrator, top_level=0):
+    def add_coarse_level(self, integrator, top_level=0, numeric_type=None):
         """Adds a coarser level including an integrator and transitioner.
 
         Parameters
@@ -109,6 +147,15 @@ class MultiLevelProvider(object):
             Next finer level of the new level.
             ``-1`` is the finest level, ``0`` the currently coarsest.
 
+        numeric_type : :py:class:`numpy.dtype`
+            *(optional)*
+            Numeric type of the values on the new level, e.g. :py:class:`numpy.float32` for sweeps in single precision
+            on a coarse level.
+            Values are cast to it when transferred onto the level.
+            As the coarse corrections are rounded to it, the solution on the finest level might deviate from the one
+            in full precision by up to its machine precision.
+            Defaults to the numeric type of the problem.
+
         Raises
         ------
         ValueError
@@ -117,6 +164,7 @@ class MultiLevelProvider(object):
         assert_is_instance(integrator, IntegratorBase, descriptor="Integrator", checking_obj=self)
         self._num_levels += 1
         self._level_integrators.insert(top_level, integrator)
+        self._level_numeric_types.insert(top_level, np.dtype(numeric_type) if numeric_type is not None else None)
 
     def add_level_transition(self, transitioner, coarse_level, fine_level):
         """Adds specialized level transitioner for specified levels.
@@ -156,6 +204,34 @@ class MultiLevelProvider(object):
         """
         return self._num_levels
 
+    def _transition_levels(self, coarse_level=None, fine_level=None):
+        """Completes the indices of the coarse and fine level of a transition.
+
+        Returns
+        -------
+        coarse_level, fine_level : :py:class:`int`
+            Index of the next coarser level if ``coarse_level`` is :py:class:`None`, index of the next finer level if
+            ``fine_level`` is :py:class:`None`.
+        """
+        if fine_level is None and coarse_level is not None:
+            fine_level = coarse_level + 1
+        if coarse_level is None and fine_level is not None:
+            coarse_level = fine_level - 1
+        return coarse_level, fine_level
+
+    def _cast_to_level(self, data, level, from_level):
+        """Casts data transferred from ``from_level`` to the numeric type of ``level``.
+
+        Data of a level with its own numeric type transferred to a level using the numeric type of the problem is
+        promoted to at least double precision.
+        """
+        _numeric_type = self._level_numeric_types[level]
+        if _numeric_type is None:
+            if self._level_numeric_types[from_level] is None:
+                return data
+            _numeric_type = np.result_type(float, data.dtype)
+        return data.astype(_numeric_type, copy=False)
+
     def _level_transition(self, coarse_level=None, fine_level=None):
         """Extracts level transition provider for given coarse and fine levels.
 
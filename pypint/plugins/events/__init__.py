@@ -0,0 +1,16 @@
+# coding=utf-8
+"""Event Plugins for PyPinT
+
+Solvers emit typed :py:class:`.SolverEvent` records (interval start and end, iteration summaries) to an event sink, so
+that analyses do not have to parse the log output.
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+
+from pypint.plugins.events.solver_event import SolverEvent
+from pypint.plugins.events.i_event_sink import IEventSink
+from pypint.plugins.events.event_sinks import NullEventSink, RecordArrayEventSink, JsonLinesEventSink, \
+    default_event_sink
+
+__all__ = ['SolverEvent', 'IEventSink', 'NullEventSink', 'RecordArrayEventSink', 'JsonLinesEventSink',
+           'default_event_sink']
@@ -0,0 +1,125 @@
+# coding=utf-8
+"""
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from os import environ
+import json
+
+import numpy as np
+
+from pypint.plugins.events.i_event_sink import IEventSink
+from pypint.plugins.events.solver_event import SolverEvent
+
+
+class NullEventSink(IEventSink):
+    """Discards all events
+
+    This is the default sink of the solvers.
+    """
+
+    enabled = False
+
+
+class RecordArrayEventSink(IEventSink):
+    """Collects all events in memory and provides them as a NumPy record array
+
+    Examples
+    --------
+    >>> sink = RecordArrayEventSink()
+    >>> sink.emit(SolverEvent(SolverEvent.Kind.iteration, interval=0, iteration=0, residual=1e-3))
+    >>> sink.emit(SolverEvent(SolverEvent.Kind.interval_end, interval=0, iteration=0, reason='residual'))
+    >>> sink.records.kind.tolist(), sink.records.residual[0]
+    (['iteration', 'interval end'], 0.001)
+    >>> sink.of_kind(SolverEvent.Kind.interval_end).reason.tolist()
+    ['residual']
+    """
+
+    def __init__(self):
+        self._records = []
+
+    def emit(self, event):
+        self._records.append(event.as_record())
+
+    @property
+    def records(self):
+        """All received events as :py:class:`numpy.recarray` of :py:attr:`.SolverEvent.dtype`
+        """
+        return np.rec.array(self._records, dtype=SolverEvent.dtype) if len(self._records) > 0 \
+            else np.recarray((0,), dtype=SolverEvent.dtype)
+
+    def of_kind(self, kind):
+        """All received events of the given kind
+
+        Parameters
+        ----------
+        kind : :py:class:`.SolverEvent.Kind`
+
+        Returns
+        -------
+        records : :py:class:`numpy.recarray`
+        """
+        _records = self.records
+        return _records[_records.kind == kind.value]
+
+    def clear(self):
+        """Discards all received events
+        """
+        self._records = []
+
+    def __len__(self):
+        return len(self._records)
+
+
+class JsonLinesEventSink(IEventSink):
+    """Writes each event as a JSON object on a line of its own
+
+    Missing values are written as ``null``.
+    """
+
+    def __init__(self, file, mode='a'):
+        """
+        Parameters
+        ----------
+        file : :py:class:`str` or file-like object
+            path of the file or writable text file
+        mode : :py:class:`str`
+            *(optional)*
+            mode to open the file with if a path is given; defaults to appending
+        """
+        if isinstance(file, str):
+            self._file = open(file, mode, buffering=1)
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+
+    def emit(self, event):
+        self._file.write(json.dumps(event.as_dict()) + '\n')
+
+    def close(self):
+        if self._owns_file and not self._file.closed:
+            self._file.close()
+
+
+_DEFAULT_SINK = None
+
+
+def default_event_sink():
+    """Sink of all solvers not given a sink explicitly
+
+    In case the environment variable ``$PYPINT_EVENTS`` is set, all solvers of this process append their events as JSON
+    lines to the file named by its value.
+    Otherwise, events are discarded.
+
+    Returns
+    -------
+    sink : :py:class:`.JsonLinesEventSink` or :py:class:`.NullEventSink`
+    """
+    global _DEFAULT_SINK
+    if _DEFAULT_SINK is None:
+        _DEFAULT_SINK = JsonLinesEventSink(environ['PYPINT_EVENTS']) if environ.get('PYPINT_EVENTS') \
+            else NullEventSink()
+    return _DEFAULT_SINK
+
+
+__all__ = ['NullEventSink', 'RecordArrayEventSink', 'JsonLinesEventSink', 'default_event_sink']
@@ -0,0 +1,32 @@
+# coding=utf-8
+"""
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+
+
+class IEventSink(object):
+    """Basic interface for receivers of :py:class:`.SolverEvent` records
+
+    Solvers only assemble events if their sink is enabled, i.e. a disabled sink does not cost anything.
+    """
+
+    enabled = True
+    """Whether the solvers should emit events to this sink
+    """
+
+    def emit(self, event):
+        """Receives a single event
+
+        Parameters
+        ----------
+        event : :py:class:`.SolverEvent`
+        """
+        pass
+
+    def close(self):
+        """Releases all resources held by this sink (e.g. open files)
+        """
+        pass
+
+
+__all__ = ['IEventSink']
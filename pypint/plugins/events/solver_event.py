@@ -0,0 +1,104 @@
+# coding=utf-8
+"""
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from collections import namedtuple
+from enum import Enum, unique
+
+import numpy as np
+
+
+class SolverEvent(namedtuple('SolverEvent', ['kind', 'solver', 'interval', 'iteration', 'level', 'time_start',
+                                             'time_end', 'residual', 'error', 'solution_reduction', 'error_reduction',
+                                             'reason', 'wall_time'])):
+    """Typed record emitted by the iterative time solvers
+
+    All events share the same fields; fields not applicable to an event are :py:class:`None`.
+
+    Attributes
+    ----------
+    kind : :py:class:`.SolverEvent.Kind`
+    solver : :py:class:`str`
+        name of the emitting solver (e.g. ``ParallelSdc<0x7f1c2a3b4c5d>``)
+    interval : :py:class:`int`
+        index of the interval of the emitting solver
+    iteration : :py:class:`int`
+        index of the iteration on the interval
+    level : :py:class:`int`
+        index of the level of multi-level solvers
+    time_start, time_end : :py:class:`float`
+        bounds of the interval
+    residual, error, solution_reduction, error_reduction : :py:class:`float`
+        supremum norms of the respective values of the last step
+    reason : :py:class:`str`
+        comma separated list of the reached thresholds or ``failed``
+    wall_time : :py:class:`float`
+        wall time of the iteration or interval in seconds
+
+    Examples
+    --------
+    >>> event = SolverEvent(SolverEvent.Kind.iteration, interval=0, iteration=2, residual=1e-8)
+    >>> event.kind.value, event.residual, event.error
+    ('iteration', 1e-08, None)
+    """
+
+    @unique
+    class Kind(Enum):
+        """Kinds of solver events
+        """
+
+        #: a new interval has been initialized
+        interval_start = 'interval start'
+
+        #: an iteration on the current interval has finished
+        iteration = 'iteration'
+
+        #: the solver has finished the current interval (converged, finished or failed)
+        interval_end = 'interval end'
+
+    __slots__ = ()
+
+    dtype = np.dtype([('kind', 'U16'), ('solver', 'U64'), ('interval', np.int64), ('iteration', np.int64),
+                      ('level', np.int64), ('time_start', np.float64), ('time_end', np.float64),
+                      ('residual', np.float64), ('error', np.float64), ('solution_reduction', np.float64),
+                      ('error_reduction', np.float64), ('reason', 'U64'), ('wall_time', np.float64)])
+    """NumPy data type of a record of an event
+
+    Missing integers are stored as ``-1``, missing floats as ``nan`` and missing strings as empty strings.
+    """
+
+    def __new__(cls, kind, **kwargs):
+        """
+        Parameters
+        ----------
+        kind : :py:class:`.SolverEvent.Kind`
+        kwargs :
+            any of the other fields; defaulting to :py:class:`None`
+        """
+        return super(SolverEvent, cls).__new__(cls, kind, *[kwargs.pop(_field, None) for _field in cls._fields[1:]],
+                                               **kwargs)
+
+    def as_record(self):
+        """Converts this event into a tuple matching :py:attr:`.dtype`
+        """
+        _record = [self.kind.value]
+        for _field in self._fields[1:]:
+            _value = getattr(self, _field)
+            if _value is None:
+                _kind = SolverEvent.dtype[_field].kind
+                _value = -1 if _kind == 'i' else np.nan if _kind == 'f' else ''
+            _record.append(_value)
+        return tuple(_record)
+
+    def as_dict(self):
+        """Converts this event into a dictionary of plain Python types (e.g. for JSON)
+        """
+        _dict = self._asdict()
+        _dict['kind'] = self.kind.value
+        for _field, _value in _dict.items():
+            if isinstance(_value, np.generic):
+                _dict[_field] = _value.item()
+        return _dict
+
+
+__all__ = ['SolverEvent']
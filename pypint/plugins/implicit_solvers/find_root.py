@@ -4,7 +4,6 @@
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
 import numpy as np
-from scipy.optimize import root
 
 from pypint.utilities import assert_is_callable, assert_is_instance
 
@@ -57,6 +56,7 @@ def find_root(fun, x0, method="hybr"):
             _value_map[i] = [_transformed_size]
             _transformed_size += 1
 
+    from scipy.optimize import root
     if _transform_necessary:
         _wrapped_func = \
             lambda x_next: _transform_to_real(fun(_transform_to_complex(x_next, _value_map)),
@@ -0,0 +1,259 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from collections import OrderedDict
+import inspect
+import threading
+
+import numpy as np
+import scipy.sparse as sprs
+import scipy.sparse.linalg as spla
+from scipy.optimize import OptimizeResult
+
+from pypint.utilities import assert_is_callable, assert_is_instance, assert_is_in, assert_condition, class_name
+
+
+_KRYLOV_TOLERANCE_ARGUMENT = 'rtol' if 'rtol' in inspect.signature(spla.gmres).parameters else 'tol'
+"""Name of the relative tolerance argument of SciPy's Krylov methods
+
+SciPy 1.12 renamed ``tol`` to ``rtol`` and 1.14 removed ``tol``.
+"""
+
+_CACHE_LOCK = threading.Lock()
+"""Guards the caches of all solvers, as the nodes of a sweep may be solved concurrently
+
+A module-level lock keeps the solvers picklable.
+"""
+
+
+class NewtonKrylovSolver(object):
+    """Jacobian-free Newton-Krylov solver for large (sparse) implicit systems
+
+    Solves :math:`f(x)=0` with an inexact Newton method, where each Newton correction is computed by a Krylov method
+    (GMRES by default).
+    By default, the Jacobian is never assembled, but its action is approximated by finite differences of :math:`f`.
+    Thus, in contrast to ``scipy.optimize.root(method="hybr")`` no dense :math:`n \\times n` Jacobian is needed.
+
+    Optionally, a Jacobian can be given as a sparse matrix, dense array or ``LinearOperator``.
+    Matrices are factorized (incomplete or complete LU) and used as preconditioner for the Krylov method; with
+    ``matrix_free=False`` the Jacobian also replaces the finite difference approximation.
+    Jacobians and their preconditioners are cached by a given key and reused by later solves with the same key, e.g.
+    for all nodes with the same node distance and all iterations of a sweep.
+    Only the :py:attr:`.default_cache_size` most recently used keys are kept, as adaptive time steps produce an
+    unbounded number of distinct keys.
+
+    Examples
+    --------
+    >>> solver = NewtonKrylovSolver(tolerance=1e-12)
+    >>> sol = solver.solve(lambda x: x**3 - 8.0, np.array([1.0, 3.0]))
+    >>> np.allclose(sol.x, 2.0)
+    True
+    """
+
+    valid_krylov_methods = ['gmres', 'lgmres', 'bicgstab']
+
+    valid_preconditioners = ['ilu', 'lu']
+
+    default_cache_size = 16
+    """Default number of cached Jacobians and preconditioners
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Parameters
+        ----------
+        tolerance : :py:class:`float`
+            *(optional)*
+            absolute tolerance on the supremum norm of :math:`f(x)`;
+            defaults to ``1e-10``
+        max_iterations : :py:class:`int`
+            *(optional)*
+            maximum number of Newton iterations;
+            defaults to ``50``
+        krylov_method : :py:class:`str`
+            *(optional)*
+            one of :py:attr:`.valid_krylov_methods`;
+            defaults to ``gmres``
+        krylov_tolerance : :py:class:`float`
+            *(optional)*
+            relative tolerance of the Krylov method (i.e. the forcing term of the inexact Newton method);
+            defaults to ``1e-4``
+        preconditioner : :py:class:`str`, :py:class:`None` or ``LinearOperator``
+            *(optional)*
+            ``ilu`` *(default)* or ``lu`` for factorizing a given Jacobian matrix, :py:class:`None` for no
+            preconditioning or a fixed ``LinearOperator`` approximating the inverse Jacobian
+        matrix_free : :py:class:`bool`
+            *(optional)*
+            whether to use finite differences for the Jacobian action even if a Jacobian is given;
+            defaults to :py:class:`True`
+        max_reuse : :py:class:`int` or :py:class:`None`
+            *(optional)*
+            number of solves a cached Jacobian is reused before it is evaluated again;
+            defaults to :py:class:`None` (i.e. reused until :py:meth:`.reset`)
+        cache_size : :py:class:`int`
+            *(optional)*
+            number of Jacobians and preconditioners kept by least recent use;
+            defaults to :py:attr:`.default_cache_size`
+        """
+        self._tolerance = kwargs.get('tolerance', 1e-10)
+        self._max_iterations = kwargs.get('max_iterations', 50)
+        self._krylov_method = kwargs.get('krylov_method', 'gmres')
+        assert_is_in(self._krylov_method, self.valid_krylov_methods, elem_desc="Krylov Method",
+                     list_desc="Valid Krylov Methods", checking_obj=self)
+        self._krylov_tolerance = kwargs.get('krylov_tolerance', 1e-4)
+        self._preconditioner = kwargs.get('preconditioner', 'ilu')
+        if self._preconditioner is not None and not isinstance(self._preconditioner, spla.LinearOperator):
+            assert_is_in(self._preconditioner, self.valid_preconditioners, elem_desc="Preconditioner",
+                         list_desc="Valid Preconditioners", checking_obj=self)
+        self._matrix_free = kwargs.get('matrix_free', True)
+        self._max_reuse = kwargs.get('max_reuse', None)
+        self._cache_size = kwargs.get('cache_size', self.default_cache_size)
+        assert_condition(isinstance(self._cache_size, int) and self._cache_size > 0, ValueError,
+                         message="Cache size must be a positive integer: NOT {}".format(self._cache_size),
+                         checking_obj=self)
+        self._cache = OrderedDict()
+
+    def solve(self, fun, x0, jacobian=None, key=None):
+        """Finds a root of ``fun`` starting at ``x0``
+
+        Parameters
+        ----------
+        fun : :py:class:`callable`
+            function mapping a flat :py:class:`numpy.ndarray` onto one of the same shape
+        x0 : :py:class:`numpy.ndarray`
+            initial guess
+        jacobian : sparse matrix, :py:class:`numpy.ndarray`, ``LinearOperator`` or :py:class:`callable`
+            *(optional)*
+            Jacobian of ``fun`` (or :py:class:`None`);
+            a callable without arguments returning one of the former is only called if no cached Jacobian for
+            ``key`` is available
+        key : hashable
+            *(optional)*
+            identifies the Jacobian for reuse in later solves;
+            without a key the Jacobian is not cached
+
+        Returns
+        -------
+        solution : ``scipy.optimize.OptimizeResult``
+            with ``x``, ``success``, ``message``, ``nit`` (Newton iterations), ``nfev`` and ``fun``
+        """
+        assert_is_callable(fun, descriptor="Function to find root of", checking_obj=self)
+        assert_is_instance(x0, np.ndarray, descriptor="Initial Guess", checking_obj=self)
+
+        _x = x0.reshape(-1).copy()
+        _jacobian, _preconditioner = self._jacobian_and_preconditioner(jacobian, key, _x.size, _x.dtype)
+
+        _f = fun(_x)
+        _nfev = 1
+        _success = False
+        _message = "Maximum number of Newton iterations reached"
+        _iteration = 0
+        while _iteration < self._max_iterations:
+            if np.abs(_f).max() <= self._tolerance:
+                _success = True
+                _message = "Converged"
+                break
+            _iteration += 1
+
+            if _jacobian is None:
+                _operator = self._finite_difference_operator(fun, _x, _f)
+            else:
+                _operator = _jacobian
+            # the right hand side is normalized as older SciPy versions apply the tolerance partly absolute
+            _f_norm = np.linalg.norm(_f)
+            _delta, _info = getattr(spla, self._krylov_method)(_operator, -_f / _f_norm, M=_preconditioner,
+                                                               **{_KRYLOV_TOLERANCE_ARGUMENT: self._krylov_tolerance})
+            if _info < 0:
+                _message = "Krylov method failed with illegal input or breakdown ({:d})".format(_info)
+                break
+
+            _x += _f_norm * _delta
+            _f = fun(_x)
+            _nfev += 1 + (_operator.nfev if hasattr(_operator, 'nfev') else 0)
+
+        return OptimizeResult(x=_x, success=_success, message=_message, nit=_iteration, nfev=_nfev, fun=_f)
+
+    def reset(self):
+        """Drops all cached Jacobians and preconditioners
+        """
+        with _CACHE_LOCK:
+            self._cache.clear()
+
+    @property
+    def tolerance(self):
+        return self._tolerance
+
+    @property
+    def max_iterations(self):
+        return self._max_iterations
+
+    @property
+    def matrix_free(self):
+        return self._matrix_free
+
+    def _jacobian_and_preconditioner(self, jacobian, key, size, dtype):
+        if key is not None:
+            with _CACHE_LOCK:
+                if key in self._cache and (self._max_reuse is None or self._cache[key]['uses'] < self._max_reuse):
+                    self._cache.move_to_end(key)
+                    _cached = self._cache[key]
+                    _cached['uses'] += 1
+                    return _cached['jacobian'], _cached['preconditioner']
+
+        # the preconditioner is built without holding the lock; concurrent solves of the same key may build it twice
+        if callable(jacobian) and not isinstance(jacobian, spla.LinearOperator):
+            jacobian = jacobian()
+        _cached = {
+            'jacobian': None if self._matrix_free or jacobian is None else spla.aslinearoperator(jacobian),
+            'preconditioner': self._build_preconditioner(jacobian, size, dtype),
+            'uses': 1
+        }
+        if key is not None:
+            with _CACHE_LOCK:
+                self._cache[key] = _cached
+                self._cache.move_to_end(key)
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return _cached['jacobian'], _cached['preconditioner']
+
+    def _build_preconditioner(self, jacobian, size, dtype):
+        if isinstance(self._preconditioner, spla.LinearOperator):
+            return self._preconditioner
+        if self._preconditioner is None or jacobian is None or isinstance(jacobian, spla.LinearOperator):
+            return None
+        assert_condition(jacobian.shape == (size, size), ValueError,
+                         message="Jacobian must be of shape {}: NOT {}".format((size, size), jacobian.shape),
+                         checking_obj=self)
+        _matrix = sprs.csc_matrix(jacobian, dtype=np.result_type(jacobian.dtype, dtype))
+        if self._preconditioner == 'ilu':
+            _factors = spla.spilu(_matrix)
+        else:
+            _factors = spla.splu(_matrix)
+        return spla.LinearOperator((size, size), matvec=_factors.solve, dtype=_matrix.dtype)
+
+    @staticmethod
+    def _finite_difference_operator(fun, x, f):
+        _x_norm = np.linalg.norm(x)
+        _operator = None
+
+        def _matvec(v):
+            _v = np.asarray(v).reshape(-1)
+            _v_norm = np.linalg.norm(_v)
+            if _v_norm == 0.0:
+                return np.zeros(f.shape, dtype=f.dtype)
+            _epsilon = np.sqrt(np.finfo(float).eps) * (1.0 + _x_norm) / _v_norm
+            _operator.nfev += 1
+            return (fun(x + _epsilon * _v) - f) / _epsilon
+
+        _operator = spla.LinearOperator((x.size, x.size), matvec=_matvec, dtype=np.result_type(x.dtype, f.dtype))
+        _operator.nfev = 0
+        return _operator
+
+    def __str__(self):
+        return "{}(krylov_method={}, matrix_free={}, preconditioner={})"\
+            .format(class_name(self), self._krylov_method, self._matrix_free, self._preconditioner)
+
+
+__all__ = ['NewtonKrylovSolver']
@@ -87,4 +87,32 @@ MG_SMOOTHER_PRESETS["ILU"] = {
     }
 }
 
+MG_SMOOTHER_PRESETS["RedBlackGaussSeidel"] = {
+    "smoothing_type": "red_black",
+    "n_pre": 2,
+    "n_post": 2,
+    "smooth_opts": {
+        "omega": 1.0
+    }
+}
+
+MG_SMOOTHER_PRESETS["MultiColorGaussSeidel"] = {
+    "smoothing_type": "gauss_seidel",
+    "n_pre": 2,
+    "n_post": 2,
+    "smooth_opts": {
+        "omega": 1.0
+    }
+}
+
+MG_SMOOTHER_PRESETS["Chebyshev"] = {
+    "smoothing_type": "chebyshev",
+    "n_pre": 1,
+    "n_post": 1,
+    "smooth_opts": {
+        "degree": 3,
+        "ratio": 30.0
+    }
+}
+
 __all__ = ['MG_SMOOTHER_PRESETS', 'MG_LEVEL_PRESETS', 'MG_RESTRICTION_PRESETS', 'MG_INTERPOLATION_PRESETS']
@@ -0,0 +1,176 @@
+# coding=utf-8
+"""Process-wide sharing of direct solvers for stencil operators
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from collections import OrderedDict
+from hashlib import sha1
+import weakref
+
+import numpy as np
+import scipy.sparse.linalg as spla
+
+from pypint.utilities.logging import LOG
+
+
+class FactorizationRegistry(object):
+    """Registry of sparse LU factorizations shared by identical stencils on identical grids
+
+    Factorizations are keyed by a hash of the stencil array and center, the grid shape and the boundary conditions.
+    Each :py:meth:`.acquire` increments the reference count of the factorization, each :py:meth:`.release` decrements
+    it.
+    When the estimated memory of all factorizations exceeds :py:attr:`.max_bytes`, unreferenced factorizations are
+    evicted in least recently used order.
+    Referenced factorizations are never evicted.
+
+    Examples
+    --------
+    >>> from pypint.plugins.multigrid.stencil import Stencil
+    >>> registry = FactorizationRegistry()
+    >>> solver = registry.acquire(Stencil(np.array([1.0, -2.0, 1.0])), (5,))
+    >>> registry.acquire(Stencil(np.array([1.0, -2.0, 1.0])), (5,)) is solver
+    True
+    """
+    def __init__(self, max_bytes=256 * 1024 ** 2):
+        """
+        Parameters
+        ----------
+        max_bytes : :py:class:`int`
+            *(optional)*
+            memory bound for unreferenced factorizations in bytes
+        """
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._owners = set()
+
+    @staticmethod
+    def key(stencil, grid, boundaries=None):
+        """Hash identifying a factorization
+
+        Parameters
+        ----------
+        stencil : :py:class:`.Stencil`
+        grid : :py:class:`tuple`
+            shape of the grid
+        boundaries : :py:class:`list` of :py:class:`str` or :py:class:`None`
+            *(optional)*
+            boundary conditions of the grid
+
+        Returns
+        -------
+        key : :py:class:`str`
+        """
+        _arr = np.ascontiguousarray(stencil.arr)
+        _hash = sha1(_arr.tobytes())
+        _hash.update(str((_arr.dtype.str, _arr.shape, tuple(stencil.center), tuple(grid),
+                          tuple(boundaries) if boundaries is not None else None)).encode())
+        return _hash.hexdigest()
+
+    def acquire(self, stencil, grid, boundaries=None, owner=None):
+        """Returns the direct solver for the stencil on the grid
+
+        The factorization is computed only if it is not already registered.
+
+        Parameters
+        ----------
+        stencil : :py:class:`.Stencil`
+        grid : :py:class:`tuple`
+            shape of the grid
+        boundaries : :py:class:`list` of :py:class:`str` or :py:class:`None`
+            *(optional)*
+            boundary conditions of the grid
+        owner : :py:class:`object`
+            *(optional)*
+            if given, the acquired reference is released as soon as ``owner`` gets garbage collected
+
+        Returns
+        -------
+        solver : :py:class:`callable`
+            solving :math:`Ax=b` for a given flat :math:`b`
+        """
+        _key = self.key(stencil, grid, boundaries)
+        if _key in self._entries:
+            self._entries.move_to_end(_key)
+        else:
+            _lu = spla.splu(stencil.to_sparse_matrix(grid, "csc"))
+            _nbytes = (_lu.L.nnz + _lu.U.nnz) * (_lu.L.data.itemsize + _lu.L.indices.itemsize) \
+                + 2 * _lu.perm_r.nbytes
+            self._entries[_key] = {'solver': _lu.solve, 'refs': 0, 'nbytes': _nbytes}
+        self._entries[_key]['refs'] += 1
+        self._evict()
+        if owner is not None:
+            self._owners.add(weakref.ref(owner, lambda ref, key=_key: self._release_owner(ref, key)))
+        return self._entries[_key]['solver']
+
+    def release(self, key):
+        """Releases a reference acquired by :py:meth:`.acquire`
+
+        Parameters
+        ----------
+        key : :py:class:`str`
+            as given by :py:meth:`.key`
+        """
+        if key in self._entries:
+            if self._entries[key]['refs'] <= 0:
+                raise RuntimeError("Factorization has already been released")
+            self._entries[key]['refs'] -= 1
+            self._evict()
+
+    def references(self, key):
+        """Number of references to a registered factorization
+
+        Returns
+        -------
+        references : :py:class:`int`
+            ``0`` for unknown keys
+        """
+        return self._entries[key]['refs'] if key in self._entries else 0
+
+    def clear(self):
+        """Removes all factorizations regardless of their references
+        """
+        self._entries.clear()
+
+    @property
+    def max_bytes(self):
+        """Memory bound for unreferenced factorizations in bytes
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes):
+        self._max_bytes = max_bytes
+        self._evict()
+
+    @property
+    def nbytes(self):
+        """Estimated memory of all registered factorizations in bytes
+        """
+        return sum(_entry['nbytes'] for _entry in self._entries.values())
+
+    def _release_owner(self, ref, key):
+        self._owners.discard(ref)
+        self.release(key)
+
+    def _evict(self):
+        _nbytes = self.nbytes
+        for _key in [_key for _key, _entry in self._entries.items() if _entry['refs'] == 0]:
+            if _nbytes <= self._max_bytes:
+                break
+            _nbytes -= self._entries[_key]['nbytes']
+            del self._entries[_key]
+            LOG.debug("Evicted factorization {}".format(_key))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+FACTORIZATION_REGISTRY = FactorizationRegistry()
+"""Process-wide registry of direct solvers used by :py:meth:`.Stencil.generate_direct_solver`
+"""
+
+
+__all__ = ['FactorizationRegistry', 'FACTORIZATION_REGISTRY']
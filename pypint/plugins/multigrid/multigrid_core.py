@@ -10,9 +10,11 @@ print(sys.path)
 # from pypint.plugins.multigrid.multigrid_solution import MultiGridSolution
 from pypint.plugins.multigrid.level import MultigridLevel1D
 from pypint.plugins.multigrid.level2d import MultigridLevel2D
-from pypint.plugins.multigrid.multigrid_smoother import SplitSmoother,ILUSmoother, DirectSolverSmoother, WeightedJacobiSmoother
+from pypint.plugins.multigrid.multigrid_smoother import SplitSmoother, ILUSmoother, DirectSolverSmoother, \
+    WeightedJacobiSmoother, MultiColorGaussSeidelSmoother, RedBlackGaussSeidelSmoother, ChebyshevSmoother
 from pypint.utilities import assert_is_callable, assert_is_instance, assert_condition
 from pypint.plugins.multigrid.stencil import Stencil
+from pypint.plugins.timers.instrumentation import timed
 # from pypint.plugins.multigrid.interpolation import InterpolationByStencilListIn1D, InterpolationByStencilForLevels, InterpolationByStencilForLevelsClassical
 # from pypint.plugins.multigrid.restriction import RestrictionStencilPure, RestrictionByStencilForLevels, RestrictionByStencilForLevelsClassical
 from operator import iadd,add
@@ -221,6 +223,14 @@ class MultiGridCore(object):
                 self.smoothers.append(SplitSmoother(l_plus, l_minus, self.levels[-1]))
             elif kwargs["smoothing_type"] is "ilu":
                 self.smoothers.append(ILUSmoother(self.stencils[-1], self.levels[-1], **kwargs["smooth_opts"]))
+            elif kwargs["smoothing_type"] == "red_black":
+                self.smoothers.append(RedBlackGaussSeidelSmoother(self.stencils[-1], self.levels[-1],
+                                                                  **kwargs["smooth_opts"]))
+            elif kwargs["smoothing_type"] == "gauss_seidel":
+                self.smoothers.append(MultiColorGaussSeidelSmoother(self.stencils[-1], self.levels[-1],
+                                                                    **kwargs["smooth_opts"]))
+            elif kwargs["smoothing_type"] == "chebyshev":
+                self.smoothers.append(ChebyshevSmoother(self.stencils[-1], self.levels[-1], **kwargs["smooth_opts"]))
             else:
                 raise ValueError("Wrong smoothing type")
             # append interpolation
@@ -289,6 +299,7 @@ class MultiGridCore(object):
             print("Level %d after smoothing" % (i+1))
             self.levels[i+1].print_all()
 
+    @timed('mg cycle')
     def v_cycle(self):
         # start with top_level down the v_cycle
 
@@ -1,4 +1,5 @@
 # coding=utf-8
+from collections import OrderedDict
 
 import numpy as np
 from pypint.multi_level_providers.multi_level_provider import MultiLevelProvider
@@ -7,11 +8,25 @@ from pypint.plugins.multigrid.stencil import Stencil
 from pypint.plugins.multigrid.i_multigrid_level import IMultigridLevel
 import scipy.signal as sig
 import scipy.sparse as sprs
+import scipy.sparse.linalg as spla
 from pypint.plugins.multigrid.i_multigrid_smoother import IMultigridSmoother
 
+ILU_FACTORIZATION_CACHE_SIZE = 32
+"""Maximum number of incomplete LU factorizations kept by :py:class:`.ILUSmoother`
+"""
+
+_ILU_FACTORIZATION_CACHE = OrderedDict()
+
+_CHEBYSHEV_EIGENVALUE_CACHE = {}
+"""Estimated largest eigenvalues of :math:`D^{-1}A` by stencil and level shape
+"""
+
+
 class ILUSmoother(IMultigridSmoother):
     """ makes a incomplete LU smoother solver
 
+    The incomplete factorizations are cached by stencil coefficients, grid shape and ILU parameters, thus smoothers
+    rebuilt for recurring stencils (e.g. for the same node distances of a transient problem) reuse them.
     """
     def __init__(self, stencil, level, fill_factor=20, drop_tolerance=1e-6):
         """__init__ method"""
@@ -19,20 +34,33 @@ class ILUSmoother(IMultigridSmoother):
         assert_is_instance(level, IMultigridLevel, "Level should be "
                                                   "level instance")
         self.level = level
-        self.sp_matrix = stencil.to_sparse_matrix(level.mid.shape, "csc")
-        self.solver = sprs.linalg.spilu(self.sp_matrix, drop_tol=drop_tolerance, fill_factor=fill_factor).solve
         self.stencil = stencil
-    def relax(self,n=1):
+        _key = (stencil.arr.tobytes(), stencil.arr.shape, tuple(stencil.center), tuple(level.mid.shape),
+                fill_factor, drop_tolerance)
+        if _key in _ILU_FACTORIZATION_CACHE:
+            _ILU_FACTORIZATION_CACHE.move_to_end(_key)
+        else:
+            _sp_matrix = stencil.to_sparse_matrix(level.mid.shape, "csc")
+            _ILU_FACTORIZATION_CACHE[_key] = \
+                (_sp_matrix, spla.spilu(_sp_matrix, drop_tol=drop_tolerance, fill_factor=fill_factor).solve)
+            if len(_ILU_FACTORIZATION_CACHE) > ILU_FACTORIZATION_CACHE_SIZE:
+                _ILU_FACTORIZATION_CACHE.popitem(last=False)
+        self.sp_matrix, self.solver = _ILU_FACTORIZATION_CACHE[_key]
+
+    def relax(self, n=1):
         """ Just computes the usual iteration
                 with B^{-1} as the ilu
-                x_{k+1} = x_k - B^{-1}Ax + B^{-1}b
+                x_{k+1} = x_k + B^{-1}(b - Ax_k)
+
+            The residual is computed first, thus only one solve with the incomplete factors is needed per iteration.
         """
-        # print("putin", self.level.rhs.reshape(-1)[:])
-        # print("getout", self.solver(self.level.rhs.reshape(-1)))
         for i in range(n):
-            self.level.mid[:] += (self.solver(self.level.rhs.reshape(-1)) -
-                                  self.solver(self.stencil.eval_convolve(
-                                      self.level.evaluable_view(self.stencil)).reshape(-1))).reshape(self.level.mid.shape)
+            if self.level.modified_rhs:
+                _res = self.level.rhs.reshape(-1) - self.sp_matrix.dot(self.level.mid.reshape(-1))
+            else:
+                _res = self.level.rhs.reshape(-1) \
+                    - self.stencil.eval_convolve(self.level.evaluable_view(self.stencil)).reshape(-1)
+            self.level.mid[:] += self.solver(_res).reshape(self.level.mid.shape)
 
 class DirectSolverSmoother(IMultigridSmoother):
     """Takes the stencil and wraps the solver of stencil class, so that ist may
@@ -45,7 +73,7 @@ class DirectSolverSmoother(IMultigridSmoother):
         assert_is_instance(level, IMultigridLevel, "Level should be "
                                                   "level instance")
         self.level = level
-        self.solver = stencil.generate_direct_solver(level.mid.shape)
+        self.solver = stencil.generate_direct_solver(level.mid.shape, boundaries=level.mg_problem.boundaries)
         self.stencil = stencil
 
     def relax(self):
@@ -222,3 +250,268 @@ class WeightedJacobiSmoother(IMultigridSmoother):
             - self.stencil.eval_convolve(self.lvl_view) \
                 * self.omega / self.center_value
 
+
+class MultiColorGaussSeidelSmoother(IMultigridSmoother):
+    """Multicolor Gauss-Seidel smoother working in place on the level
+
+    The grid points are split into colors, such that no two points of the same color are coupled by the stencil.
+    Hence all points of one color can be updated at once by vectorized, strided slices of the level array, while
+    the update of the next color already sees the new values (Gauss-Seidel).
+
+    By default each axis :math:`i` is split into :math:`m_i = \\max |o_i| + 1` residue classes, where :math:`o`
+    ranges over all non-zero stencil offsets, resulting in :math:`\\prod_i m_i` colors
+    (i.e. 2, 4 and 8 colors for compact 1D, 2D and 3D stencils like the 9-point or 27-point Laplacian).
+    With ``colors="red-black"`` the classes are merged by the parity of the index sum, which is only valid for
+    stencils coupling axis-neighbours only (e.g. the 3-, 5- and 7-point Laplacian).
+
+    If the level's right hand side has been modified by :py:meth:`.Stencil.modify_rhs`, the boundary values are
+    already contained in it and the sweeps use zero ghost cells instead of the level's borders.
+    """
+    def __init__(self, stencil, level, colors=None, omega=1.0, *args, **kwargs):
+        """init
+
+        Parameters
+        ----------
+        stencil : :py:class:`.Stencil`
+            stencil of the operator :math:`A` in :math:`Au=b`
+        level : :py:class:`.IMultigridLevel`
+            level to work on; :math:`b` is taken from its ``rhs``
+        colors : :py:class:`None` or ``"red-black"``
+            *(optional)*
+            coloring of the grid points; defaults to the residue classes described above
+        omega : :py:class:`float`
+            *(optional)*
+            relaxation parameter; values larger than one give a successive over-relaxation
+
+        Raises
+        ------
+        ValueError
+            * if the stencil has a zero center
+            * if a red-black coloring is requested for a stencil coupling same-colored points
+        """
+        assert_is_instance(stencil, Stencil, "A Stencil object is needed")
+        assert_is_instance(level, IMultigridLevel, "Level should be "
+                                                   "level instance")
+        self.level = level
+        self.stencil = stencil
+        self.omega = omega
+        self.center_value = stencil.arr[tuple(stencil.center)]
+        assert_condition(self.center_value != 0.0, ValueError,
+                         "Gauss-Seidel needs a non-zero stencil center", checking_obj=self)
+
+        _offsets = [np.asarray(_pos) for _pos in stencil.relative_positions_woc
+                    if stencil.arr[tuple(_pos + stencil.center)] != 0.0]
+        _coefs = [stencil.arr[tuple(_pos + stencil.center)] for _pos in _offsets]
+
+        self._steps = np.ones(stencil.dim, dtype=np.int)
+        for _pos in _offsets:
+            self._steps = np.maximum(self._steps, np.abs(_pos) + 1)
+
+        if colors is None:
+            _classes = [tuple(_r) for _r in np.ndindex(*self._steps)]
+            self._colors = [[_r] for _r in _classes]
+        elif colors == "red-black":
+            assert_condition(all(np.abs(_pos).sum() % 2 == 1 for _pos in _offsets), ValueError,
+                             "Red-black coloring needs a stencil coupling axis-neighbours only", checking_obj=self)
+            self._steps[:] = 2
+            _classes = [tuple(_r) for _r in np.ndindex(*self._steps)]
+            self._colors = [[_r for _r in _classes if sum(_r) % 2 == _parity] for _parity in (0, 1)]
+        else:
+            raise ValueError("Unknown coloring: %s" % colors)
+
+        # sweeps are done on an array with the stencil's ghost cells around the level's mid;
+        # with a modified rhs these ghost cells have to be zero
+        self._padded = level.evaluable_view(stencil)
+        self._zero_padded = None
+
+        # precompute the slices of all residue classes and their neighbours
+        _shape = level.mid.shape
+        self._updates = []
+        for _color in self._colors:
+            _color_updates = []
+            for _r in _color:
+                _target = tuple(slice(_c + _ri, _c + _n, _s)
+                                for _c, _ri, _n, _s in zip(stencil.center, _r, _shape, self._steps))
+                _rhs = tuple(slice(_ri, _n, _s) for _ri, _n, _s in zip(_r, _shape, self._steps))
+                _neighbours = [(_coef, tuple(slice(_t.start + _o, _t.stop + _o, _t.step)
+                                             for _t, _o in zip(_target, _pos)))
+                               for _coef, _pos in zip(_coefs, _offsets)]
+                _color_updates.append((_target, _rhs, _neighbours))
+            self._updates.append(_color_updates)
+
+        super().__init__(stencil.dim, *args, **kwargs)
+
+    @property
+    def num_colors(self):
+        """Number of colors the grid points are split into
+        """
+        return len(self._colors)
+
+    def relax(self, n=1):
+        """Does n Gauss-Seidel sweeps over all colors
+
+        Parameters
+        ----------
+            n : Integer
+                relax n times
+        """
+        if self.level.modified_rhs:
+            if self._zero_padded is None:
+                self._zero_padded = np.zeros(self._padded.shape, dtype=self._padded.dtype)
+            _u = self._zero_padded
+            _u_mid = _u[tuple(slice(_c, _c + _n) for _c, _n in zip(self.stencil.center, self.level.mid.shape))]
+            _u_mid[:] = self.level.mid
+        else:
+            _u = self._padded
+            _u_mid = None
+        _b = self.level.rhs.reshape(self.level.mid.shape)
+        for i in range(n):
+            for _color_updates in self._updates:
+                for _target, _rhs, _neighbours in _color_updates:
+                    _sum = _b[_rhs].copy()
+                    for _coef, _neighbour in _neighbours:
+                        _sum -= _coef * _u[_neighbour]
+                    if self.omega == 1.0:
+                        _u[_target] = _sum / self.center_value
+                    else:
+                        _u[_target] *= (1.0 - self.omega)
+                        _u[_target] += self.omega * _sum / self.center_value
+        if _u_mid is not None:
+            self.level.mid[:] = _u_mid
+
+
+class RedBlackGaussSeidelSmoother(MultiColorGaussSeidelSmoother):
+    """Red-black Gauss-Seidel smoother
+
+    Shortcut for the :py:class:`.MultiColorGaussSeidelSmoother` with ``colors="red-black"`` for stencils like the
+    3-, 5- and 7-point Laplacian in 1D, 2D and 3D.
+    """
+    def __init__(self, stencil, level, omega=1.0, *args, **kwargs):
+        super().__init__(stencil, level, "red-black", omega, *args, **kwargs)
+
+
+def estimate_max_eigenvalue(stencil, shape, method="power", iterations=10):
+    """Estimates the largest eigenvalue of the Jacobi preconditioned operator :math:`D^{-1}A`
+
+    The estimate is cached by the stencil scaled by its center value and the grid shape.
+    Thus, stencils differing only by a constant factor (e.g. scaled by a time step width) share the estimate.
+
+    Parameters
+    ----------
+    stencil : :py:class:`.Stencil`
+    shape : :py:class:`tuple`
+        shape of the grid
+    method : :py:class:`str`
+        *(optional)*
+        either ``power`` for power iterations or ``lanczos`` for a few Lanczos steps (symmetric operators only)
+    iterations : :py:class:`int`
+        *(optional)*
+        number of power or Lanczos iterations
+
+    Returns
+    -------
+    lambda_max : :py:class:`float`
+    """
+    _center_value = stencil.arr[tuple(stencil.center)]
+    _key = (tuple((stencil.arr / _center_value).reshape(-1)), stencil.arr.shape, tuple(stencil.center),
+            tuple(shape), method, iterations)
+    if _key not in _CHEBYSHEV_EIGENVALUE_CACHE:
+        _d_inv_a = stencil.to_sparse_matrix(shape, "csr") / _center_value
+        if method == "power":
+            # fixed seed for reproducible smoothers
+            _x = np.random.RandomState(42).rand(_d_inv_a.shape[0])
+            _lambda = 0.0
+            for i in range(iterations):
+                _x /= np.linalg.norm(_x)
+                _y = _d_inv_a.dot(_x)
+                _lambda = abs(np.dot(_x, _y))
+                _x = _y
+            _lambda = max(_lambda, np.linalg.norm(_x))
+        elif method == "lanczos":
+            _lambda = abs(spla.eigsh(_d_inv_a, k=1, which="LM", ncv=min(iterations + 2, _d_inv_a.shape[0] - 1),
+                                     tol=1e-2, maxiter=iterations, return_eigenvectors=False,
+                                     v0=np.random.RandomState(42).rand(_d_inv_a.shape[0]))[0])
+        else:
+            raise ValueError("Unknown eigenvalue estimation method: %s" % method)
+        _CHEBYSHEV_EIGENVALUE_CACHE[_key] = _lambda
+    return _CHEBYSHEV_EIGENVALUE_CACHE[_key]
+
+
+class ChebyshevSmoother(IMultigridSmoother):
+    """Chebyshev polynomial smoother for the Jacobi preconditioned system
+
+    Applies a Chebyshev polynomial of degree ``degree`` in :math:`D^{-1}A` damping the eigenvalues in
+    :math:`[\\lambda_{max} / ratio, 1.1 \\lambda_{max}]`, where :math:`\\lambda_{max}` is estimated once by
+    :py:func:`.estimate_max_eigenvalue`.
+    In contrast to the :py:class:`.WeightedJacobiSmoother` there is no relaxation parameter to tune and only one
+    sparse matrix-vector product per degree is needed.
+    """
+    def __init__(self, stencil, level, degree=3, ratio=30.0, eigenvalue_estimation="power", iterations=10,
+                 *args, **kwargs):
+        """init
+
+        Parameters
+        ----------
+        stencil : :py:class:`.Stencil`
+            stencil of the operator :math:`A` in :math:`Au=b`
+        level : :py:class:`.IMultigridLevel`
+            level to work on; :math:`b` is taken from its ``rhs``
+        degree : :py:class:`int`
+            *(optional)*
+            degree of the Chebyshev polynomial
+        ratio : :py:class:`float`
+            *(optional)*
+            ratio of the upper and lower bound of the damped eigenvalue interval
+        eigenvalue_estimation : :py:class:`str`
+            *(optional)*
+            ``power`` or ``lanczos``; see :py:func:`.estimate_max_eigenvalue`
+        iterations : :py:class:`int`
+            *(optional)*
+            number of iterations for the eigenvalue estimation
+        """
+        assert_is_instance(stencil, Stencil, "A Stencil object is needed")
+        assert_is_instance(level, IMultigridLevel, "Level should be "
+                                                   "level instance")
+        assert_condition(degree > 0, ValueError, "Degree of Chebyshev polynomial must be positive", checking_obj=self)
+        self.level = level
+        self.stencil = stencil
+        self.degree = degree
+        self.center_value = stencil.arr[tuple(stencil.center)]
+        self.sp_matrix = stencil.to_sparse_matrix(level.mid.shape, "csr")
+
+        self.lambda_max = estimate_max_eigenvalue(stencil, level.mid.shape, eigenvalue_estimation, iterations)
+        _upper = 1.1 * self.lambda_max
+        _lower = self.lambda_max / ratio
+        self._theta = 0.5 * (_upper + _lower)
+        self._delta = 0.5 * (_upper - _lower)
+
+        super().__init__(stencil.dim, *args, **kwargs)
+
+    def relax(self, n=1):
+        """Applies the Chebyshev polynomial n times
+
+        Parameters
+        ----------
+            n : Integer
+                relax n times
+        """
+        _sigma = self._theta / self._delta
+        _b = self.level.rhs.reshape(-1)
+        for i in range(n):
+            if self.level.modified_rhs:
+                _r = _b - self.sp_matrix.dot(self.level.mid.reshape(-1))
+            else:
+                _r = _b - self.stencil.eval_convolve(self.level.evaluable_view(self.stencil)).reshape(-1)
+            _rho = 1.0 / _sigma
+            _d = _r / (self.center_value * self._theta)
+            # the level's mid might not be contiguous, thus the correction is accumulated separately
+            _correction = np.zeros(_d.shape, dtype=_d.dtype)
+            for k in range(self.degree):
+                _correction += _d
+                if k < self.degree - 1:
+                    _r -= self.sp_matrix.dot(_d)
+                    _rho_new = 1.0 / (2.0 * _sigma - _rho)
+                    _d *= _rho_new * _rho
+                    _d += (2.0 * _rho_new / self._delta) * _r / self.center_value
+                    _rho = _rho_new
+            self.level.mid[:] += _correction.reshape(self.level.mid.shape)
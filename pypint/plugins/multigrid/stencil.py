@@ -4,8 +4,9 @@ import scipy.signal as sig
 import scipy.sparse as sprs
 import scipy.sparse.linalg as spla
 import functools as ft
-from pypint.utilities import assert_is_callable, assert_is_instance, assert_condition
+from pypint.utilities import assert_is_callable, assert_is_instance, assert_condition, VALIDATION
 from pypint.plugins.multigrid.i_multigrid_level import IMultigridLevel
+from pypint.plugins.multigrid.factorization_registry import FACTORIZATION_REGISTRY
 from pypint.utilities.logging import LOG
 from pypint.utilities import func_name
 
@@ -22,15 +23,17 @@ class Stencil(object):
     handling of the ghostcells.
     """
     def __init__(self, arr, center=None, order=1, **kwargs):
-        assert_is_instance(arr, np.ndarray, "the array is not a numpy array")
+        if VALIDATION.internal:
+            assert_is_instance(arr, np.ndarray, "the array is not a numpy array")
         if center is None:
             self.center = np.array(np.floor(np.asarray(arr.shape)*0.5),
                                    dtype=np.int)
         else:
-            assert_is_instance(center, np.ndarray,
-                               "the center is not a np array")
-            assert_condition(arr.ndim == center.size, ValueError,
-                             "center does not match with stencil array")
+            if VALIDATION.internal:
+                assert_is_instance(center, np.ndarray,
+                                   "the center is not a np array")
+                assert_condition(arr.ndim == center.size, ValueError,
+                                 "center does not match with stencil array")
             self.center = np.array(center, dtype=np.int)
         self.arr = arr
         self.dim = arr.ndim
@@ -141,21 +144,24 @@ class Stencil(object):
         """
         pass
 
-    def generate_direct_solver(self, grid=None):
+    def generate_direct_solver(self, grid=None, boundaries=None):
         """Generates direct solver from a LU factorization of the sparse matrix
 
+        The factorization is shared with all identical stencils on the same grid through the
+        :py:data:`.FACTORIZATION_REGISTRY` as long as this stencil is alive.
+
+        Parameters
+        ----------
+        grid : tuple
+            *(optional)*
+            grid dimensions; defaults to the stencil's grid
+        boundaries : list of str
+            *(optional)*
+            boundary conditions of the grid
         """
         if grid is None:
-            # LOG.debug("Generate Solver for internal Spare Matrix: %s" % self.sp_matrix)
-            solver = spla.factorized(self.sp_matrix)
-        else:
-            # LOG.debug("Generate Solver for given Grid %s" % (grid,))
-            sp_matrix = self.to_sparse_matrix(grid, "csc")
-            # LOG.debug("  with Sparse Matrix: %s" % sp_matrix.todense())
-            # print("Jahier\n", sp_matrix.todense())
-            # print("Jahier.shape\n", sp_matrix.todense().shape)
-            solver = spla.factorized(sp_matrix)
-        return solver
+            grid = self._grid
+        return FACTORIZATION_REGISTRY.acquire(self, grid, boundaries=boundaries, owner=self)
 
     def eval_convolve(self, array_in, convolve_control="valid"):
         """Evaluate via scipy.signal.convolve
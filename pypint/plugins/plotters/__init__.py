@@ -3,9 +3,9 @@
 
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 .. moduleauthor:: Dieter Moser <d.moser@fz-juelich.de>
+
+Matplotlib is only imported by the plotters, i.e. importing this package does not load it.
 """
-import matplotlib.pyplot as plt
-from matplotlib.collections import LineCollection
 import numpy as np
 
 
@@ -23,12 +23,20 @@ def make_segments(x, y):
 
 
 # Interface to LineCollection:
-def colorline(x, y, z=None, cmap=plt.get_cmap('jet'), norm=plt.Normalize(0.0, 1.0), linewidth=3, alpha=1.0):
+def colorline(x, y, z=None, cmap=None, norm=None, linewidth=3, alpha=1.0):
     """
     Plot a colored line with coordinates x and y
     Optionally specify colors in the array z
     Optionally specify a colormap, a norm function and a line width
+    (defaulting to the 'jet' colormap and a norm on [0,1])
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    if cmap is None:
+        cmap = plt.get_cmap('jet')
+    if norm is None:
+        norm = plt.Normalize(0.0, 1.0)
 
     # Default colors equally spaced on [0,1]:
     if z is None:
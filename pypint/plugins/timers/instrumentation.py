@@ -0,0 +1,391 @@
+# coding=utf-8
+"""Hierarchical timers and counters for the phases of the solvers
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from collections import OrderedDict
+from functools import wraps
+from time import perf_counter
+import csv
+import json
+import threading
+
+
+class Instrumentation(object):
+    """Nested timers and counters aggregated per interval, iteration and level
+
+    Timers are identified by their path, i.e. the names of all timers running when they were started and their own
+    name (e.g. ``('sweep', 'implicit solve')``).
+    Counters are identified by the path of the running timers and their own name.
+    Both are aggregated per context, which is set by the solvers (see :py:meth:`.set_context`).
+
+    Solvers activate their instrumentation while running (see :py:meth:`.activate`), so that components without a
+    reference to the solver (e.g. cores and level transition providers) record into it via
+    :py:func:`.active_instrumentation`.
+
+    Recording an event costs a few hundred nanoseconds, i.e. the instrumentation is enabled by default.
+    An instrumentation is active for the thread activating it only and is not thread-safe.
+    Worker threads (e.g. of the node-parallel sweeps of :py:class:`.ParallelSdc`) record into a forked
+    instrumentation (see :py:meth:`.fork`), which is joined into the currently running timers afterwards (see
+    :py:meth:`.join`).
+    Thus, the total time of timers of worker threads may exceed the wall time of the enclosing timer.
+
+    Examples
+    --------
+    >>> instrumentation = Instrumentation()
+    >>> instrumentation.set_context(interval=0, iteration=1)
+    >>> with instrumentation.timing('sweep'):
+    ...     instrumentation.count('rhs values', 3)
+    >>> instrumentation.timers[0]['path']
+    'sweep'
+    >>> instrumentation.counters[0]['path'], instrumentation.counters[0]['count']
+    ('sweep/rhs values', 3)
+    """
+
+    context_fields = ('interval', 'iteration', 'level')
+    """Fields of the context the timers and counters are aggregated by
+    """
+
+    def __init__(self, enabled=True):
+        """
+        Parameters
+        ----------
+        enabled : :py:class:`bool`
+            *(optional)*
+            whether to record timers and counters
+        """
+        self.enabled = enabled
+        self._contexts = []
+        self._context_ids = {}
+        self._context_id = None
+        self.set_context(interval=None, iteration=None, level=None)
+        self._node = self._root = _Node()
+        self._stack = []
+
+    def set_context(self, **kwargs):
+        """Sets the context of all following events
+
+        Parameters
+        ----------
+        interval : :py:class:`int` or :py:class:`None`
+            *(optional)*
+            index of the current interval
+        iteration : :py:class:`int` or :py:class:`None`
+            *(optional)*
+            index of the current iteration
+        level : :py:class:`int` or :py:class:`None`
+            *(optional)*
+            index of the current level
+
+        Fields not given are kept.
+        """
+        _previous = self._contexts[self._context_id] if self._context_id is not None else (None, None, None)
+        _context = tuple(kwargs[_field] if _field in kwargs else _value
+                         for _field, _value in zip(self.context_fields, _previous))
+        self._context_id = self._context_index(_context)
+
+    def fork(self):
+        """Creates an instrumentation for a worker thread
+
+        Returns
+        -------
+        fork : :py:class:`.Instrumentation`
+            enabled if this one is and with the current context of this one
+        """
+        _fork = Instrumentation(enabled=self.enabled)
+        _fork.set_context(**dict(zip(self.context_fields, self._contexts[self._context_id])))
+        return _fork
+
+    def join(self, fork):
+        """Adds the timers and counters of a forked instrumentation to the currently running timers
+
+        Parameters
+        ----------
+        fork : :py:class:`.Instrumentation`
+            instrumentation created by :py:meth:`.fork` whose worker thread has finished
+        """
+        if self.enabled:
+            _nodes = [(self._node, fork._root)]
+            while len(_nodes) > 0:
+                _node, _fork_node = _nodes.pop()
+                for _name, _fork_child in _fork_node.children.items():
+                    _child = _node.children.get(_name)
+                    if _child is None:
+                        _child = _node.children[_name] = _Node(_name, _node)
+                    for _fork_context_id, (_count, _total, _max) in _fork_child.timers.items():
+                        _context_id = self._context_index(fork._contexts[_fork_context_id])
+                        _timer = _child.timers.get(_context_id)
+                        if _timer is None:
+                            _child.timers[_context_id] = [_count, _total, _max]
+                        else:
+                            _timer[0] += _count
+                            _timer[1] += _total
+                            if _max > _timer[2]:
+                                _timer[2] = _max
+                    for _fork_context_id, _count in _fork_child.counters.items():
+                        _context_id = self._context_index(fork._contexts[_fork_context_id])
+                        _child.counters[_context_id] = _child.counters.get(_context_id, 0) + _count
+                    _nodes.append((_child, _fork_child))
+
+    def start(self, name):
+        """Starts a timer nested into the currently running timers
+
+        Parameters
+        ----------
+        name : :py:class:`str`
+        """
+        if self.enabled:
+            _node = self._node
+            _child = _node.children.get(name)
+            if _child is None:
+                _child = _node.children[name] = _Node(name, _node)
+            self._stack.append((_node, perf_counter()))
+            self._node = _child
+
+    def stop(self):
+        """Stops the most recently started timer
+        """
+        if self.enabled:
+            _end = perf_counter()
+            _timers = self._node.timers
+            self._node, _start = self._stack.pop()
+            _elapsed = _end - _start
+            _timer = _timers.get(self._context_id)
+            if _timer is None:
+                _timers[self._context_id] = [1, _elapsed, _elapsed]
+            else:
+                _timer[0] += 1
+                _timer[1] += _elapsed
+                if _elapsed > _timer[2]:
+                    _timer[2] = _elapsed
+
+    def timing(self, name):
+        """Context manager for a timer
+
+        Parameters
+        ----------
+        name : :py:class:`str`
+        """
+        return _Timing(self, name)
+
+    def count(self, name, increment=1):
+        """Increments a counter within the currently running timers
+
+        Parameters
+        ----------
+        name : :py:class:`str`
+        increment : :py:class:`int`
+            *(optional)*
+        """
+        if self.enabled:
+            _node = self._node
+            _child = _node.children.get(name)
+            if _child is None:
+                _child = _node.children[name] = _Node(name, _node)
+            _child.counters[self._context_id] = _child.counters.get(self._context_id, 0) + increment
+
+    def activate(self):
+        """Makes this instrumentation the one returned by :py:func:`.active_instrumentation` in the calling thread
+        """
+        _ACTIVE.stack.append(self)
+
+    def deactivate(self):
+        """Restores the previously active instrumentation of the calling thread
+        """
+        for _index in range(len(_ACTIVE.stack) - 1, 0, -1):
+            if _ACTIVE.stack[_index] is self:
+                del _ACTIVE.stack[_index]
+                break
+
+    def reset(self):
+        """Discards all recorded timers and counters
+        """
+        self._node = self._root = _Node()
+        self._stack = []
+
+    def aggregate(self, *fields):
+        """Sums up the timers over all context fields not given
+
+        Parameters
+        ----------
+        fields : :py:class:`str`
+            context fields to keep (see :py:attr:`.context_fields`)
+
+        Returns
+        -------
+        timers : :py:class:`list` of :py:class:`collections.OrderedDict`
+            records as of :py:attr:`.timers` restricted to the given fields
+        """
+        _indices = [self.context_fields.index(_field) for _field in fields]
+        _aggregated = OrderedDict()
+        for (_context, _path), (_count, _total, _max) in self._collect('timers'):
+            _key = (tuple(_context[_index] for _index in _indices), _path)
+            if _key in _aggregated:
+                _aggregated[_key][0] += _count
+                _aggregated[_key][1] += _total
+                _aggregated[_key][2] = max(_aggregated[_key][2], _max)
+            else:
+                _aggregated[_key] = [_count, _total, _max]
+        return [_record(fields, _context, _path, count=_count, total=_total, max=_max)
+                for (_context, _path), (_count, _total, _max) in _aggregated.items()]
+
+    @property
+    def timers(self):
+        """Read-only list of all timers
+
+        Each record holds the context fields, the ``/``-separated ``path``, the number of measurements ``count``,
+        the ``total`` and ``max`` time in seconds.
+        """
+        return [_record(self.context_fields, _context, _path, count=_count, total=_total, max=_max)
+                for (_context, _path), (_count, _total, _max) in self._collect('timers')]
+
+    @property
+    def counters(self):
+        """Read-only list of all counters
+
+        Each record holds the context fields, the ``/``-separated ``path`` and the ``count``.
+        """
+        return [_record(self.context_fields, _context, _path, count=_count)
+                for (_context, _path), _count in self._collect('counters')]
+
+    def to_json(self, file):
+        """Writes all timers and counters as JSON
+
+        Parameters
+        ----------
+        file : :py:class:`str` or file-like object
+            path or writable text file
+        """
+        _data = {'timers': self.timers, 'counters': self.counters}
+        if isinstance(file, str):
+            with open(file, 'w') as _file:
+                json.dump(_data, _file, indent=2)
+        else:
+            json.dump(_data, file, indent=2)
+
+    def to_csv(self, file):
+        """Writes all timers and counters as CSV with one row per timer or counter
+
+        Parameters
+        ----------
+        file : :py:class:`str` or file-like object
+            path or writable text file
+        """
+        _fields = ('kind',) + self.context_fields + ('path', 'count', 'total', 'max')
+        if isinstance(file, str):
+            with open(file, 'w', newline='') as _file:
+                self._write_csv(_file, _fields)
+        else:
+            self._write_csv(file, _fields)
+
+    def _write_csv(self, file, fields):
+        _writer = csv.DictWriter(file, fieldnames=fields)
+        _writer.writeheader()
+        for _timer in self.timers:
+            _writer.writerow(dict(_timer, kind='timer'))
+        for _counter in self.counters:
+            _writer.writerow(dict(_counter, kind='counter'))
+
+    def _context_index(self, context):
+        # events are recorded by the index of their context, which is cheaper to hash than the context itself
+        _context_id = self._context_ids.get(context)
+        if _context_id is None:
+            _context_id = self._context_ids[context] = len(self._contexts)
+            self._contexts.append(context)
+        return _context_id
+
+    def _collect(self, kind):
+        _items = []
+        _nodes = [(_child, (_child.name,)) for _child in self._root.children.values()]
+        while len(_nodes) > 0:
+            _node, _path = _nodes.pop()
+            for _context_id, _value in getattr(_node, kind).items():
+                _items.append(((self._contexts[_context_id], _path), _value))
+            _nodes.extend((_child, _path + (_child.name,)) for _child in _node.children.values())
+        return sorted(_items, key=_sort_key)
+
+    def __str__(self):
+        return "Instrumentation<0x%x>(timers=%d, counters=%d)" \
+               % (id(self), len(self._collect('timers')), len(self._collect('counters')))
+
+
+class _Node(object):
+    # a timer or counter identified by the path from the root to this node
+    __slots__ = ('name', 'parent', 'children', 'timers', 'counters')
+
+    def __init__(self, name=None, parent=None):
+        self.name = name
+        self.parent = parent
+        self.children = {}
+        self.timers = {}
+        self.counters = {}
+
+
+class _ActiveStack(threading.local):
+    def __init__(self):
+        self.stack = [_DISABLED]
+
+
+class _Timing(object):
+    __slots__ = ('_instrumentation', '_name')
+
+    def __init__(self, instrumentation, name):
+        self._instrumentation = instrumentation
+        self._name = name
+
+    def __enter__(self):
+        self._instrumentation.start(self._name)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._instrumentation.stop()
+
+
+def _sort_key(item):
+    # contexts may contain None, which is not comparable to integers
+    return tuple((_value is not None, _value or 0) for _value in item[0][0]), item[0][1]
+
+
+def _record(fields, context, path, **kwargs):
+    _result = OrderedDict(zip(fields, context))
+    _result['path'] = '/'.join(path)
+    _result.update(kwargs)
+    return _result
+
+
+_DISABLED = Instrumentation(enabled=False)
+_ACTIVE = _ActiveStack()
+
+
+def active_instrumentation():
+    """The instrumentation of the currently running solver
+
+    Returns
+    -------
+    instrumentation : :py:class:`.Instrumentation`
+        a disabled instrumentation if no solver is running in the calling thread
+    """
+    return _ACTIVE.stack[-1]
+
+
+def timed(name):
+    """Decorator timing each call of the decorated function with the active instrumentation
+
+    Parameters
+    ----------
+    name : :py:class:`str`
+        name of the timer
+    """
+    def _decorator(func):
+        @wraps(func)
+        def _timed(*args, **kwargs):
+            _instrumentation = _ACTIVE.stack[-1]
+            _instrumentation.start(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _instrumentation.stop()
+        return _timed
+    return _decorator
+
+
+__all__ = ['Instrumentation', 'active_instrumentation', 'timed']
@@ -5,8 +5,10 @@
 """
 from collections import OrderedDict
 
+import numpy as np
+
 from pypint.problems.i_problem import IProblem
-from pypint.utilities import assert_is_callable, assert_is_instance, class_name
+from pypint.utilities import assert_is_callable, assert_is_instance, class_name, VALIDATION
 
 
 class HasExactSolutionMixin(object):
@@ -57,6 +59,31 @@ class HasExactSolutionMixin(object):
         assert_is_callable(self._exact_function, descriptor="Exact Function", checking_obj=self)
         return self._exact_function(time)
 
+    def exact_batch(self, times):
+        """Evaluates the exact solution at multiple time points at once.
+
+        By default, :py:meth:`.exact` is called for each time point.
+        Problems with a vectorizable exact solution should override this with a single vectorized evaluation.
+
+        Parameters
+        ----------
+        times : :py:class:`numpy.ndarray`
+            Time points :math:`t_m` of shape ``(M,)``.
+
+        Returns
+        -------
+        exact_solutions : :py:class:`numpy.ndarray`
+            Exact solutions stacked along the first axis.
+
+        Raises
+        ------
+        ValueError :
+            if ``times`` is not a :py:class:`numpy.ndarray`
+        """
+        if VALIDATION.internal:
+            assert_is_instance(times, np.ndarray, descriptor="Time Points", checking_obj=self)
+        return np.array([self.exact(float(_time)) for _time in times])
+
     @property
     def exact_function(self):
         """Accessor for the exact solution function.
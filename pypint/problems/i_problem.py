@@ -2,16 +2,25 @@
 """
 .. moduleauthor: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
+import threading
 import warnings
 from collections import OrderedDict
 
 import numpy as np
 
 from pypint.plugins.implicit_solvers.find_root import find_root
-from pypint.utilities import assert_is_callable, assert_is_instance, assert_is_in, class_name, assert_condition
+from pypint.utilities import assert_is_callable, assert_is_instance, assert_is_in, class_name, assert_condition, \
+    VALIDATION
 from pypint.utilities.logging import LOG
 
 
+_RHS_EVALUATION_COUNT_LOCK = threading.Lock()
+"""Guards the right hand side evaluation counters against concurrent updates from node-parallel sweeps
+
+It is shared by all problems, as problems must stay picklable for multi-process solvers.
+"""
+
+
 class IProblem(object):
     """Basic interface for all problems of type :math:`u'(t,\\phi(t))=F(t,\\phi(t))`
     """
@@ -41,6 +50,10 @@ class IProblem(object):
 
             rhs_wrt_time : :py:class:`str`
                 string representation of the right hand side w.r.t. time
+        implicit_solver : :py:class:`.NewtonKrylovSolver`
+            *(optional)*
+            Solver used by :py:meth:`.implicit_solve`.
+            Defaults to ``scipy.optimize.root`` via :py:func:`.find_root`.
 
         Examples
         --------
@@ -83,6 +96,9 @@ class IProblem(object):
             if 'rhs_wrt_time' in kwargs['strings']:
                 self._strings['rhs_wrt_time'] = kwargs['strings']['rhs_wrt_time']
 
+        self._implicit_solver = None
+        self.implicit_solver = kwargs.get('implicit_solver')
+
         self._count_rhs_eval = 0
 
     def evaluate_wrt_time(self, time, phi_of_time, **kwargs):
@@ -110,19 +126,55 @@ class IProblem(object):
         ValueError :
             if ``time`` or ``phi_of_time`` are not of correct type.
         """
-        assert_is_instance(time, float, descriptor="Time Point", checking_obj=self)
-        assert_is_instance(phi_of_time, np.ndarray, descriptor="Data Vector", checking_obj=self)
-        if kwargs.get('partial') is not None:
-            assert_is_instance(kwargs['partial'], str, descriptor="Partial Descriptor", checking_obj=self)
-        self._count_rhs_eval += 1
+        if VALIDATION.internal:
+            assert_is_instance(time, float, descriptor="Time Point", checking_obj=self)
+            assert_is_instance(phi_of_time, np.ndarray, descriptor="Data Vector", checking_obj=self)
+            if kwargs.get('partial') is not None:
+                assert_is_instance(kwargs['partial'], str, descriptor="Partial Descriptor", checking_obj=self)
+        self._count_rhs_evaluations()
         return np.zeros(self.dim, dtype=self.numeric_type)
 
+    def evaluate_wrt_time_batch(self, times, values, **kwargs):
+        """Evaluates given right hand side at multiple time points with given time-dependent values at once.
+
+        By default, :py:meth:`.evaluate_wrt_time` is called for each time point.
+        Problems with a vectorizable right hand side (e.g. a linear or FFT-based one) should override this with a
+        single vectorized evaluation, validating the arguments with :py:meth:`._assert_batch`.
+
+        Parameters
+        ----------
+        times : :py:class:`numpy.ndarray`
+            Time points :math:`t_m` of shape ``(M,)``.
+        values : :py:class:`numpy.ndarray`
+            Time-dependent data :math:`\\phi(t_m)` stacked along the first axis, i.e. of shape
+            ``(M,) + dim_for_time_solver``.
+        partial : :py:class:`str` or :py:class:`None`
+            *(optional)*
+            see :py:meth:`.evaluate_wrt_time`
+
+        Returns
+        -------
+        rhs_values : :py:class:`numpy.ndarray`
+            of the same shape as ``values``
+
+        Raises
+        ------
+        ValueError :
+            if ``times`` or ``values`` are not of correct type or their lengths do not match.
+        """
+        self._assert_batch(times, values, **kwargs)
+        return np.array([self.evaluate_wrt_time(float(_time), _value, **kwargs)
+                         for _time, _value in zip(times, values)])
+
     def implicit_solve(self, next_x, func, method="hybr", **kwargs):
         """A solver for implicit equations.
 
         Finds the implicitly defined :math:`x_{i+1}` for the given right hand side function :math:`f(x_{i+1})`, such
         that :math:`x_{i+1}=f(x_{i+1})`.
 
+        If an :py:attr:`.implicit_solver` is set, it is used instead of ``scipy.optimize.root``.
+        Given ``time_point`` and ``delta_time``, the Jacobian :math:`\\Delta_t J_F - I` of ``func`` is built from
+        :py:meth:`.jacobian_wrt_time` and reused for all further solves with the same ``delta_time``.
 
         Parameters
         ----------
@@ -135,6 +187,15 @@ class IProblem(object):
             Method fo the root finding algorithm. See `scipy.optimize.root
             <http://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.root.html#scipy.optimize.root>` for
             details.
+        time_point : :py:class:`float`
+            *(optional)*
+            time point of the implicitly defined value
+        delta_time : :py:class:`float`
+            *(optional)*
+            factor of the right hand side in ``func``
+        partial : :py:class:`str`
+            *(optional)*
+            part of the right hand side in ``func``; see :py:meth:`.evaluate_wrt_time`
 
         Returns
         -------
@@ -152,17 +213,100 @@ class IProblem(object):
         UserWarning :
             If the implicit solver did not converged, i.e. the solution object's ``success`` is not :py:class:`True`.
         """
-        assert_is_instance(next_x, np.ndarray, descriptor="Initial Guess", checking_obj=self)
-        assert_is_callable(func, descriptor="Function of RHS for Implicit Solver", checking_obj=self)
-        sol = find_root(fun=func, x0=next_x.reshape(-1), method=method)
+        if VALIDATION.internal:
+            assert_is_instance(next_x, np.ndarray, descriptor="Initial Guess", checking_obj=self)
+            assert_is_callable(func, descriptor="Function of RHS for Implicit Solver", checking_obj=self)
+        if self.implicit_solver is not None:
+            _jacobian = None
+            _key = None
+            if kwargs.get('time_point') is not None and kwargs.get('delta_time') is not None:
+                _jacobian = lambda: self._implicit_jacobian(kwargs['time_point'], next_x, kwargs['delta_time'],
+                                                            kwargs.get('partial'))
+                _key = (kwargs['delta_time'], kwargs.get('partial'), kwargs.get('time_level'))
+            sol = self.implicit_solver.solve(func, next_x.reshape(-1), jacobian=_jacobian, key=_key)
+        else:
+            sol = find_root(fun=func, x0=next_x.reshape(-1), method=method)
         if not sol.success:
             warnings.warn("Implicit solver did not converged.")
             LOG.debug("sol.x: %s" % sol.x)
             LOG.error("Implicit solver failed: %s" % sol.message)
-        else:
+        elif VALIDATION.internal:
             assert_is_instance(sol.x, np.ndarray, descriptor="Solution", checking_obj=self)
         return sol.x.reshape(self.dim_for_time_solver)
 
+    def jacobian_wrt_time(self, time, phi_of_time, **kwargs):
+        """Jacobian of the right hand side with respect to the time-dependent value.
+
+        Used by the :py:attr:`.implicit_solver` for preconditioning the implicit solves.
+        Specializations may return a sparse matrix, a :py:class:`numpy.ndarray` or a ``LinearOperator`` acting on
+        flattened values.
+
+        Parameters
+        ----------
+        time : :py:class:`float`
+            Time point :math:`t`
+        phi_of_time : :py:class:`numpy.ndarray`
+            Time-dependent data.
+        partial : :py:class:`str` or :py:class:`None`
+            *(optional)*
+            see :py:meth:`.evaluate_wrt_time`
+
+        Returns
+        -------
+        jacobian : :py:class:`None`
+            if no Jacobian is available (default)
+        """
+        return None
+
+    @property
+    def implicit_solver(self):
+        """Accessor for the solver used by :py:meth:`.implicit_solve`
+
+        Parameters
+        ----------
+        implicit_solver : :py:class:`.NewtonKrylovSolver` or :py:class:`None`
+            :py:class:`None` for ``scipy.optimize.root``
+        """
+        return self._implicit_solver
+
+    @implicit_solver.setter
+    def implicit_solver(self, implicit_solver):
+        if implicit_solver is not None:
+            from pypint.plugins.implicit_solvers.newton_krylov import NewtonKrylovSolver
+            assert_is_instance(implicit_solver, NewtonKrylovSolver, descriptor="Implicit Solver", checking_obj=self)
+        self._implicit_solver = implicit_solver
+
+    def _implicit_jacobian(self, time_point, phi_of_time, delta_time, partial):
+        _jacobian = self.jacobian_wrt_time(time_point, phi_of_time.reshape(self.dim_for_time_solver),
+                                           partial=partial)
+        if _jacobian is None:
+            return None
+        import scipy.sparse as sprs
+        import scipy.sparse.linalg as spla
+        if isinstance(_jacobian, spla.LinearOperator):
+            return spla.LinearOperator(_jacobian.shape, matvec=lambda v: delta_time * _jacobian.matvec(v) - v,
+                                       dtype=_jacobian.dtype)
+        elif sprs.issparse(_jacobian):
+            return delta_time * _jacobian - sprs.identity(_jacobian.shape[0], dtype=_jacobian.dtype, format='csc')
+        else:
+            return delta_time * np.asarray(_jacobian) - np.eye(_jacobian.shape[0], dtype=_jacobian.dtype)
+
+    def _count_rhs_evaluations(self, count=1):
+        with _RHS_EVALUATION_COUNT_LOCK:
+            self._count_rhs_eval += count
+
+    def _assert_batch(self, times, values, **kwargs):
+        if not VALIDATION.internal:
+            return
+        assert_is_instance(times, np.ndarray, descriptor="Time Points", checking_obj=self)
+        assert_is_instance(values, np.ndarray, descriptor="Data Vectors", checking_obj=self)
+        assert_condition(times.ndim == 1 and values.shape[0] == times.size, ValueError,
+                         message="Number of time points and data vectors do not match: {} != {}"
+                                 .format(times.shape, values.shape[0]),
+                         checking_obj=self)
+        if kwargs.get('partial') is not None:
+            assert_is_instance(kwargs['partial'], str, descriptor="Partial Descriptor", checking_obj=self)
+
     @property
     def rhs_function_wrt_time(self):
         """Accessor for the right hand side function.
@@ -279,7 +423,7 @@ class IProblem(object):
         _lines = OrderedDict()
         if self._strings['rhs_wrt_time'] is not None:
             _lines['Formula w.r.t. Time'] = r"u(t, \phi(t)) = %s" % self._strings['rhs_wrt_time']
-        _lines['DOFs'] = "{:s}".format(self.dim)
+        _lines['DOFs'] = "{}".format(self.dim)
         return _lines
 
     def __str__(self):
@@ -287,7 +431,7 @@ class IProblem(object):
             _outstr = r"u'(t,\phi(t))=%s" % self._strings['rhs_wrt_time']
         else:
             _outstr = r"%s" % class_name(self)
-        _outstr += r", DOFs={:s}".format(self.dim)
+        _outstr += r", DOFs={}".format(self.dim)
         return _outstr
 
 
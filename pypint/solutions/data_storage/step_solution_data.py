@@ -8,7 +8,7 @@ from copy import deepcopy
 import numpy as np
 
 from pypint.solvers.diagnosis import Error, Residual
-from pypint.utilities import assert_is_instance, assert_condition, class_name
+from pypint.utilities import assert_is_instance, class_name, VALIDATION
 from pypint.utilities.logging import LOG
 
 
@@ -94,8 +94,8 @@ class StepSolutionData(object):
         ValueError :
             If it has already been locked.
         """
-        assert_condition(not self.finalized, AttributeError,
-                         message="This solution data storage is already finalized.", checking_obj=self)
+        if self.finalized:
+            raise AttributeError("This solution data storage is already finalized.")
         self._finalized = True
 
     def definalize(self):
@@ -133,9 +133,10 @@ class StepSolutionData(object):
 
     @value.setter
     def value(self, value):
-        assert_condition(not self.finalized, AttributeError,
-                         message="Cannot change this solution data storage any more.", checking_obj=self)
-        assert_is_instance(value, np.ndarray, descriptor="Values", checking_obj=self)
+        if self.finalized:
+            raise AttributeError("Cannot change this solution data storage any more.")
+        if VALIDATION.internal:
+            assert_is_instance(value, np.ndarray, descriptor="Values", checking_obj=self)
         self._dim = value.shape
         self._numeric_type = value.dtype
         self._data = value
@@ -162,9 +163,10 @@ class StepSolutionData(object):
 
     @time_point.setter
     def time_point(self, time_point):
-        assert_condition(not self.finalized, AttributeError,
-                         message="Cannot change this solution data storage any more.", checking_obj=self)
-        assert_is_instance(time_point, float, descriptor="Time Point", checking_obj=self)
+        if self.finalized:
+            raise AttributeError("Cannot change this solution data storage any more.")
+        if VALIDATION.internal:
+            assert_is_instance(time_point, float, descriptor="Time Point", checking_obj=self)
         self._time_point = time_point
 
     @property
@@ -190,9 +192,10 @@ class StepSolutionData(object):
 
     @error.setter
     def error(self, error):
-        assert_condition(not self.finalized, AttributeError,
-                         message="Cannot change this solution data storage any more.", checking_obj=self)
-        assert_is_instance(error, (np.ndarray, Error), descriptor="Error", checking_obj=self)
+        if self.finalized:
+            raise AttributeError("Cannot change this solution data storage any more.")
+        if VALIDATION.internal:
+            assert_is_instance(error, (np.ndarray, Error), descriptor="Error", checking_obj=self)
         self._error = error if isinstance(error, Error) else Error(value=error)
 
     @property
@@ -218,9 +221,10 @@ class StepSolutionData(object):
 
     @residual.setter
     def residual(self, residual):
-        assert_condition(not self.finalized, AttributeError,
-                         message="Cannot change this solution data storage any more.", checking_obj=self)
-        assert_is_instance(residual, (np.ndarray, Residual), descriptor="Residual", checking_obj=self)
+        if self.finalized:
+            raise AttributeError("Cannot change this solution data storage any more.")
+        if VALIDATION.internal:
+            assert_is_instance(residual, (np.ndarray, Residual), descriptor="Residual", checking_obj=self)
         self._residual = residual if isinstance(residual, Residual) else Residual(value=residual)
 
     @property
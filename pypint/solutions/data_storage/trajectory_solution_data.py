@@ -8,7 +8,7 @@ import warnings
 import numpy as np
 
 from pypint.solutions.data_storage.step_solution_data import StepSolutionData
-from pypint.utilities import assert_condition, class_name
+from pypint.utilities import assert_condition, class_name, VALIDATION
 
 
 class TrajectorySolutionData(object):
@@ -73,8 +73,8 @@ class TrajectorySolutionData(object):
             * if construction of :py:class:`.StepSolutionData` fails
             * if internal consistency check fails (see :py:meth:`._check_consistency`)
         """
-        assert_condition(not self.finalized, AttributeError,
-                         message="Cannot change this solution data storage any more.", checking_obj=self)
+        if self.finalized:
+            raise AttributeError("Cannot change this solution data storage any more.")
         _old_data = self._data  # backup for potential rollback
 
         if len(args) == 1 and isinstance(args[0], StepSolutionData):
@@ -107,8 +107,8 @@ class TrajectorySolutionData(object):
         ValueError :
             If it has already been locked.
         """
-        assert_condition(not self.finalized, AttributeError,
-                         message="This solution data storage is already finalized.", checking_obj=self)
+        if self.finalized:
+            raise AttributeError("This solution data storage is already finalized.")
         self._finalized = True
 
     @property
@@ -194,7 +194,7 @@ class TrajectorySolutionData(object):
             * if the numeric type of at least one step does not match :py:attr:`.numeric_type`
             * if the spacial dimension of at least one step does not match :py:attr:`.dim`
         """
-        if self._data.size > 0:
+        if self._data.size > 0 and VALIDATION.internal:
             _time_point = self.data[0].time_point
             for step in range(1, self.data.size):
                 assert_condition(self.data[step].time_point > _time_point, ValueError,
@@ -211,7 +211,7 @@ class TrajectorySolutionData(object):
                                  ValueError,
                                  message=("Spacial dimension of step {:d} does not match global spacial dimension: "
                                           .format(step, self.dim) +
-                                          "{:s} != {:s}".format(self.data[step].dim, self.dim)),
+                                          "{} != {}".format(self.data[step].dim, self.dim)),
                                  checking_obj=self)
 
     def append(self, p_object):
@@ -34,8 +34,8 @@ class ISolution(object):
         raise NotImplementedError("Must be implemented and overridden by subclasses.")
 
     def finalize(self):
-        assert_condition(not self.finalized, ValueError,
-                         message="Solution cannot be changed any more.", checking_obj=self)
+        if self.finalized:
+            raise ValueError("Solution cannot be changed any more.")
         self._finalized = True
 
     @property
@@ -61,8 +61,8 @@ class ISolution(object):
 
     @used_iterations.setter
     def used_iterations(self, used_iterations):
-        assert_condition(not self.finalized, ValueError,
-                         message="Solution cannot be changed any more.", checking_obj=self)
+        if self.finalized:
+            raise ValueError("Solution cannot be changed any more.")
         assert_condition(used_iterations > 0, ValueError,
                          message="Number of used iterations must be non-zero positive: NOT {:d}"
                                  .format(used_iterations),
@@ -7,7 +7,7 @@ import numpy as np
 from pypint.solvers.cores.mlsdc_solver_core import MlSdcSolverCore
 from pypint.solvers.states.mlsdc_solver_state import MlSdcSolverState
 from pypint.problems import IProblem
-from pypint.utilities import assert_is_instance, assert_named_argument
+from pypint.utilities import assert_is_instance, assert_named_argument, VALIDATION
 from pypint.utilities.logging import LOG
 
 
@@ -34,8 +34,9 @@ class ExplicitMlSdcCore(MlSdcSolverCore):
         """
         super(ExplicitMlSdcCore, self).run(state, **kwargs)
 
-        assert_is_instance(state, MlSdcSolverState, descriptor="State", checking_obj=self)
-        assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
+        if VALIDATION.internal:
+            assert_is_instance(state, MlSdcSolverState, descriptor="State", checking_obj=self)
+            assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
 
         _problem = kwargs['problem']
 
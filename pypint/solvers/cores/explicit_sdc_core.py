@@ -6,7 +6,7 @@
 from pypint.solvers.cores.sdc_solver_core import SdcSolverCore
 from pypint.solvers.states.sdc_solver_state import SdcSolverState
 from pypint.problems import IProblem
-from pypint.utilities import assert_is_instance, assert_named_argument
+from pypint.utilities import assert_is_instance, assert_named_argument, VALIDATION
 
 
 class ExplicitSdcCore(SdcSolverCore):
@@ -32,8 +32,9 @@ class ExplicitSdcCore(SdcSolverCore):
         """
         super(ExplicitSdcCore, self).run(state, **kwargs)
 
-        assert_is_instance(state, SdcSolverState, descriptor="State", checking_obj=self)
-        assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
+        if VALIDATION.internal:
+            assert_is_instance(state, SdcSolverState, descriptor="State", checking_obj=self)
+            assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
 
         _problem = kwargs['problem']
 
@@ -55,5 +56,20 @@ class ExplicitSdcCore(SdcSolverCore):
              * (_previous_step.rhs - _previous_iteration_previous_step.rhs)
              + state.current_step.integral)
 
+    def solve_node(self, problem, initial_value, previous_value, time_point, q_delta, integral):
+        """Picard step for a single node
+
+        Without implicit part, a sweep with a diagonal preconditioner reduces to the Picard iteration
+
+        .. math::
+
+            u_m^{k+1} = u_0 + \\Delta_t I_0^m \\left( F(\\vec{u}^k) \\right)
+
+        See Also
+        --------
+        :py:meth:`.SdcSolverCore.solve_node` : overridden method
+        """
+        return initial_value + integral
+
 
 __all__ = ['ExplicitSdcCore']
@@ -3,8 +3,12 @@
 
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
-from pypint.utilities import assert_is_instance
+import numpy as np
+
+from pypint.utilities import assert_is_instance, VALIDATION
 from pypint.solvers.states.i_solver_state import ISolverState
+from pypint.solvers.diagnosis import Error
+from pypint.plugins.timers.instrumentation import active_instrumentation, timed
 
 
 class ISolverCore(object):
@@ -26,7 +30,69 @@ class ISolverCore(object):
         state : :py:class:`.ISolverState`
             Current state of the solver.
         """
-        assert_is_instance(state, ISolverState, descriptor="Solver's State", checking_obj=self)
+        if VALIDATION.internal:
+            assert_is_instance(state, ISolverState, descriptor="Solver's State", checking_obj=self)
+
+    @staticmethod
+    def _evaluate_rhs(problem, step, time_point=None, partial=None):
+        """(Partial) right hand side of the value of a step
+
+        The evaluation is cached in :py:attr:`.IStepState.partial_rhs` until the step's value is changed.
+        A full evaluation at the step's own time point reuses :py:attr:`.IStepState.rhs`.
+
+        Parameters
+        ----------
+        problem : :py:class:`.IProblem`
+        step : :py:class:`.IStepState`
+        time_point : :py:class:`float`
+            *(optional)*
+            defaults to the time point of the step
+        partial : :py:class:`str` or :py:class:`None`
+            *(optional)*
+            see :py:meth:`.IProblem.evaluate_wrt_time`
+
+        Returns
+        -------
+        rhs : :py:class:`numpy.ndarray`
+        """
+        if time_point is None:
+            time_point = step.time_point
+        if partial is None and step.rhs_evaluated and time_point == step.time_point:
+            return step.rhs
+        if (partial, time_point) not in step.partial_rhs:
+            with active_instrumentation().timing('rhs'):
+                step.partial_rhs[(partial, time_point)] = \
+                    problem.evaluate_wrt_time(time_point, step.value, partial=partial)
+        return step.partial_rhs[(partial, time_point)]
+
+    @staticmethod
+    @timed('implicit solve')
+    def _implicit_solve(problem, next_x, func, **kwargs):
+        """Proxy for :py:meth:`.IProblem.implicit_solve` recording the time spent in the implicit solver
+        """
+        return problem.implicit_solve(next_x, func, **kwargs)
+
+    @staticmethod
+    def _compute_errors(problem, steps, exact=None):
+        """Errors of the values of the given steps with respect to the exact solution at their time points
+
+        The errors of all steps are computed by a single vectorized subtraction.
+
+        Parameters
+        ----------
+        problem : :py:class:`.HasExactSolutionMixin`
+        steps : :py:class:`list` of :py:class:`.IStepState`
+        exact : :py:class:`numpy.ndarray`
+            *(optional)*
+            exact solution at the time points of the steps stacked along the first axis;
+            evaluated with :py:meth:`.HasExactSolutionMixin.exact_batch` if not given
+        """
+        _values = np.array([_step.value for _step in steps])
+        if exact is None:
+            exact = problem.exact_batch(np.array([_step.time_point for _step in steps], dtype=float))
+        _errors = abs(_values - np.reshape(exact, _values.shape))
+        for _step, _error in zip(steps, _errors):
+            _step.solution.error = Error(_error)
 
     def compute_residual(self, state, **kwargs):
         """Computes the residual of the current state
@@ -36,7 +102,8 @@ class ISolverCore(object):
         state : :py:class:`.ISolverState`
             Current state of the solver.
         """
-        assert_is_instance(state, ISolverState, descriptor="Solver's State", checking_obj=self)
+        if VALIDATION.internal:
+            assert_is_instance(state, ISolverState, descriptor="Solver's State", checking_obj=self)
 
     def compute_error(self, state, **kwargs):
         """Computes the error of the current state
@@ -45,8 +112,16 @@ class ISolverCore(object):
         ----------
         state : :py:class:`.ISolverState`
             Current state of the solver.
+        steps : :py:class:`list` of :py:class:`.IStepState`
+            *(optional)*
+            Steps to compute the errors for at once; defaults to the current step.
+        exact : :py:class:`numpy.ndarray`
+            *(optional)*
+            Exact solution at the time points of the steps stacked along the first axis (see
+            :py:meth:`._compute_errors`).
         """
-        assert_is_instance(state, ISolverState, descriptor="Solver's State", checking_obj=self)
+        if VALIDATION.internal:
+            assert_is_instance(state, ISolverState, descriptor="Solver's State", checking_obj=self)
 
 
 __all__ = ['ISolverCore']
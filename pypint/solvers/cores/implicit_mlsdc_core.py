@@ -8,7 +8,7 @@ from pypint.solvers.cores.mlsdc_solver_core import MlSdcSolverCore
 from pypint.solvers.states.mlsdc_solver_state import MlSdcSolverState
 from pypint.problems import IProblem
 from pypint.problems.has_direct_implicit_mixin import problem_has_direct_implicit
-from pypint.utilities import assert_is_instance, assert_named_argument
+from pypint.utilities import assert_is_instance, assert_named_argument, VALIDATION
 from pypint.utilities.logging import LOG
 
 
@@ -35,8 +35,9 @@ class ImplicitMlSdcCore(MlSdcSolverCore):
         """
         super(ImplicitMlSdcCore, self).run(state, **kwargs)
 
-        assert_is_instance(state, MlSdcSolverState, descriptor="State", checking_obj=self)
-        assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
+        if VALIDATION.internal:
+            assert_is_instance(state, MlSdcSolverState, descriptor="State", checking_obj=self)
+            assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
         _problem = kwargs['problem']
 
         use_intermediate = kwargs['use_intermediate'] if 'use_intermediate' in kwargs else False
@@ -64,10 +65,10 @@ class ImplicitMlSdcCore(MlSdcSolverCore):
 
         _fas = np.zeros(_previous_iteration_current_step.rhs.shape,
                         dtype=_previous_iteration_current_step.rhs.dtype)
-        if not use_intermediate and _previous_iteration_current_step.has_fas_correction():
-            # LOG.debug("   previous iteration current step has FAS: %s"
-            #           % _previous_iteration_current_step.fas_correction)
-            _fas = _previous_iteration_current_step.fas_correction
+        # the FAS correction belongs to the level, i.e. it also applies to sweeps on coarse-corrected values
+        if state.current_step.has_fas_correction():
+            # LOG.debug("   current step has FAS: %s" % state.current_step.fas_correction)
+            _fas = state.current_step.fas_correction
 
         if problem_has_direct_implicit(_problem, self):
             if not state.current_iteration.on_finest_level:
@@ -95,7 +96,10 @@ class ImplicitMlSdcCore(MlSdcSolverCore):
                 _expl_term \
                 + state.current_step.delta_tau * _problem.evaluate_wrt_time(state.current_step.time_point, x_next) \
                 - x_next
-            _sol = _problem.implicit_solve(state.current_step.value, _func)
+            _sol = self._implicit_solve(_problem, state.current_step.value, _func,
+                                        time_level=state.current_iteration.current_level_index,
+                                        time_point=state.current_step.time_point,
+                                        delta_time=state.current_step.delta_tau)
 
         if type(state.current_step.value) == type(_sol):
             state.current_step.value = _sol
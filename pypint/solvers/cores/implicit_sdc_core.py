@@ -7,7 +7,7 @@ from pypint.solvers.cores.sdc_solver_core import SdcSolverCore
 from pypint.solvers.states.sdc_solver_state import SdcSolverState
 from pypint.problems import IProblem
 from pypint.problems.has_direct_implicit_mixin import problem_has_direct_implicit
-from pypint.utilities import assert_is_instance, assert_named_argument, assert_condition
+from pypint.utilities import assert_is_instance, assert_named_argument, assert_condition, VALIDATION
 
 
 class ImplicitSdcCore(SdcSolverCore):
@@ -25,28 +25,46 @@ class ImplicitSdcCore(SdcSolverCore):
         .. math::
 
             u_{m+1}^{k+1} - \\Delta_\\tau F(t_{m+1}, u_{m+1}^{k+1}) =
-                u_m^{k+1} + \\Delta_\\tau F(t_{m+1}, u_{m+1}^k) + \\Delta_t I_m^{m+1} \\left( F(\\vec{u}^k) \\right)
+                u_m^{k+1} + \\Delta_\\tau F(t_{m+1}, u_{m+1}^k)
+                + \\Delta_t I_m^{m+1} \\left( F(\\vec{u}^k) \\right)
+
+        With a general lower triangular preconditioner :math:`Q_\\Delta` the node distance :math:`\\Delta_\\tau` is
+        replaced by the implicit coefficient :math:`c_{m+1}` and the explicit correction
+        :math:`\\sum_{j \\leq m} c_j \\left( F(t_j, u_j^{k+1}) - F(t_j, u_j^k) \\right)` is added to the right hand
+        side.
 
         Parameters
         ----------
         solver_state : :py:class:`.SdcSolverState`
+        q_delta : :py:class:`numpy.ndarray`
+            *(optional)*
+            coefficients :math:`c` of the preconditioner (see :py:meth:`.SdcSolverCore._q_delta_correction`);
+            defaults to the implicit Euler sweep
         """
         super(ImplicitSdcCore, self).run(state, **kwargs)
 
-        assert_is_instance(state, SdcSolverState, descriptor="State", checking_obj=self)
-        assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
+        if VALIDATION.internal:
+            assert_is_instance(state, SdcSolverState, descriptor="State", checking_obj=self)
+            assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
         _problem = kwargs['problem']
 
         _previous_iteration_current_step = self._previous_iteration_current_step(state)
 
+        if 'q_delta' in kwargs:
+            _delta_tau = kwargs['q_delta'][-1]
+            _integral = state.current_step.integral + self._q_delta_correction(state, _problem, kwargs['q_delta'])
+        else:
+            _delta_tau = state.current_step.delta_tau
+            _integral = state.current_step.integral
+
         if problem_has_direct_implicit(_problem, self):
             _previous_iteration_previous_step = self._previous_iteration_previous_step(state)
 
             _sol = _problem.direct_implicit(phis_of_time=[_previous_iteration_previous_step.value,
                                                           _previous_iteration_current_step.value,
                                                           state.current_time_step.previous_step.value],
-                                            delta_node=state.current_step.delta_tau,
-                                            integral=state.current_step.integral,
+                                            delta_node=_delta_tau,
+                                            integral=_integral,
                                             core=self)
         else:
             # using step-wise formula
@@ -55,22 +73,44 @@ class ImplicitSdcCore(SdcSolverCore):
             # Note: \Delta_t is always 1.0 as it's part of the integral
             _expl_term = \
                 (state.current_time_step.previous_step.value
-                 - state.current_step.delta_tau
-                 * _problem.evaluate_wrt_time(state.current_step.time_point,
-                                              _previous_iteration_current_step.value)
-                 + state.current_step.integral).reshape(-1)
+                 - _delta_tau
+                 * self._evaluate_rhs(_problem, _previous_iteration_current_step,
+                                      time_point=state.current_step.time_point)
+                 + _integral).reshape(-1)
             _func = lambda x_next: \
                 _expl_term \
-                + state.current_step.delta_tau \
+                + _delta_tau \
                   * _problem.evaluate_wrt_time(state.current_step.time_point,
                                                x_next.reshape(_problem.dim_for_time_solver)).reshape(-1) \
                 - x_next
-            _sol = _problem.implicit_solve(state.current_step.value.reshape(-1), _func)
+            _sol = self._implicit_solve(_problem, state.current_step.value.reshape(-1), _func,
+                                        time_point=state.current_step.time_point,
+                                        delta_time=_delta_tau)
 
         if type(state.current_step.value) == type(_sol):
             state.current_step.value = _sol
         else:
             state.current_step.value = _sol[0]
 
+    def solve_node(self, problem, initial_value, previous_value, time_point, q_delta, integral):
+        """Implicit solve for a single node with a diagonal preconditioner
+
+        See Also
+        --------
+        :py:meth:`.SdcSolverCore.solve_node` : overridden method
+        """
+        _expl_term = \
+            (initial_value
+             - q_delta * problem.evaluate_wrt_time(time_point, previous_value)
+             + integral).reshape(-1)
+        _func = lambda x_next: \
+            _expl_term \
+            + q_delta * problem.evaluate_wrt_time(time_point,
+                                                  x_next.reshape(problem.dim_for_time_solver)).reshape(-1) \
+            - x_next
+        return self._implicit_solve(problem, previous_value.reshape(-1), _func,
+                                    time_point=time_point,
+                                    delta_time=q_delta).reshape(previous_value.shape)
+
 
 __all__ = ['ImplicitSdcCore']
@@ -6,8 +6,8 @@ from pypint.solvers.cores.i_solver_core import ISolverCore
 from pypint.solvers.states.mlsdc_solver_state import MlSdcStepState
 from pypint.problems.has_exact_solution_mixin import problem_has_exact_solution
 from pypint.problems import IProblem
-from pypint.solvers.diagnosis import Error, Residual
-from pypint.utilities import assert_named_argument, assert_is_instance
+from pypint.solvers.diagnosis import Residual
+from pypint.utilities import assert_named_argument, assert_is_instance, VALIDATION
 from pypint.utilities.logging import LOG
 
 
@@ -66,23 +66,19 @@ class MlSdcSolverCore(ISolverCore):
     def compute_error(self, state, step_index=None, **kwargs):
         super(MlSdcSolverCore, self).compute_error(state, **kwargs)
 
-        assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
+        if VALIDATION.internal:
+            assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
 
         _problem = kwargs['problem']
 
         if problem_has_exact_solution(_problem, self):
-            # LOG.debug("Error for t={:.3f}: {} - {}".format(state.current_step.time_point,
-            #                                               state.current_step.value,
-            #                                               _problem.exact(state.current_step.time_point)))
-            if step_index is not None:
-                state.current_level[step_index].solution.error = Error(
-                    abs(state.current_level[step_index].value
-                        - _problem.exact(state.current_level[step_index].time_point))
-                )
+            if 'steps' in kwargs:
+                _steps = kwargs['steps']
+            elif step_index is not None:
+                _steps = [state.current_level[step_index]]
             else:
-                state.current_step.solution.error = Error(
-                    abs(state.current_step.value - _problem.exact(state.current_step.time_point))
-                )
+                _steps = [state.current_step]
+            self._compute_errors(_problem, _steps, exact=kwargs.get('exact'))
         else:
             # we need the exact solution for that
             #  (unless we find an error approximation method)
@@ -91,21 +87,32 @@ class MlSdcSolverCore(ISolverCore):
     def _previous_iteration_previous_step(self, state):
         if state.previous_iteration_index is not None:
             if state.previous_step_index is not None:
-                assert_is_instance(state.previous_iteration[state.current_level_index][state.previous_step_index],
-                                   MlSdcStepState)
+                if VALIDATION.internal:
+                    assert_is_instance(state.previous_iteration[state.current_level_index][state.previous_step_index],
+                                       MlSdcStepState)
                 return state.previous_iteration[state.current_level_index][state.previous_step_index]
             else:
-                assert_is_instance(state.previous_iteration[state.current_level_index].initial,
-                                   MlSdcStepState)
+                if VALIDATION.internal:
+                    assert_is_instance(state.previous_iteration[state.current_level_index].initial,
+                                       MlSdcStepState)
                 return state.previous_iteration[state.current_level_index].initial
+        elif state.predictor is not None and state.current_iteration.on_finest_level:
+            # the predictor takes the place of the previous iteration on the finest level of the first iteration
+            if state.previous_step_index is not None:
+                return state.predictor[state.previous_step_index]
+            else:
+                return state.predictor.initial
         else:
-            assert_is_instance(state.initial,
-                               MlSdcStepState)
+            if VALIDATION.internal:
+                assert_is_instance(state.initial,
+                                   MlSdcStepState)
             return state.initial
 
     def _previous_iteration_current_step(self, state):
         if state.previous_iteration_index is not None:
             return state.previous_iteration[state.current_level_index][state.current_step_index]
+        elif state.predictor is not None and state.current_iteration.on_finest_level:
+            return state.predictor[state.current_step_index]
         else:
             return state.initial
 
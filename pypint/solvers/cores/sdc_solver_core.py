@@ -2,11 +2,13 @@
 """
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
+import numpy as np
+
 from pypint.solvers.cores.i_solver_core import ISolverCore
 from pypint.problems.has_exact_solution_mixin import problem_has_exact_solution
 from pypint.problems import IProblem
-from pypint.solvers.diagnosis import Error, Residual
-from pypint.utilities import assert_named_argument
+from pypint.solvers.diagnosis import Residual
+from pypint.utilities import assert_named_argument, VALIDATION
 
 
 class SdcSolverCore(ISolverCore):
@@ -52,34 +54,113 @@ class SdcSolverCore(ISolverCore):
     def compute_error(self, state, **kwargs):
         super(SdcSolverCore, self).compute_error(state, **kwargs)
 
-        assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
+        if VALIDATION.internal:
+            assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
 
         _problem = kwargs['problem']
 
         if problem_has_exact_solution(_problem, self):
-            # LOG.debug("Error for t={:.3f}: {} - {}".format(state.current_step.time_point,
-            #                                               state.current_step.value,
-            #                                               _problem.exact(state.current_step.time_point)))
-            state.current_step.solution.error = Error(
-                abs(state.current_step.value - _problem.exact(state.current_step.time_point))
-            )
+            self._compute_errors(_problem, kwargs['steps'] if 'steps' in kwargs else [state.current_step],
+                                 exact=kwargs.get('exact'))
         else:
             # we need the exact solution for that
             #  (unless we find an error approximation method)
             pass
 
-    def _previous_iteration_previous_step(self, state):
+    def _previous_iteration(self, state):
+        # the predictor (if any) takes the place of the previous iteration of the first iteration
         if state.previous_iteration_index is not None:
+            return state.previous_iteration
+        else:
+            return state.predictor
+
+    def _previous_iteration_previous_step(self, state):
+        _previous_iteration = self._previous_iteration(state)
+        if _previous_iteration is not None:
             if state.previous_step_index is not None:
-                return state.previous_iteration[state.current_time_step_index][state.previous_step_index]
+                return _previous_iteration[state.current_time_step_index][state.previous_step_index]
             else:
-                return state.previous_iteration[state.current_time_step_index].initial
+                return _previous_iteration[state.current_time_step_index].initial
         else:
             return state.initial
 
+    def solve_node(self, problem, initial_value, previous_value, time_point, q_delta, integral):
+        """Computes a single node of a sweep with a diagonal preconditioner :math:`Q_\\Delta`
+
+        With a diagonal :math:`Q_\\Delta` the nodes do not depend on each other within a sweep:
+
+        .. math::
+
+            u_m^{k+1} - q_m F_I(t_m, u_m^{k+1}) =
+                u_0 - q_m F_I(t_m, u_m^k) + \\Delta_t I_0^m \\left( F(\\vec{u}^k) \\right)
+
+        where :math:`F_I` is the implicitly treated part of the right hand side.
+        This method does not access any solver state and thus can be run concurrently for all nodes.
+
+        Parameters
+        ----------
+        problem : :py:class:`.IProblem`
+        initial_value : :py:class:`numpy.ndarray`
+            value :math:`u_0` at the start of the time step
+        previous_value : :py:class:`numpy.ndarray`
+            value :math:`u_m^k` of the previous iteration
+        time_point : :py:class:`float`
+            time point :math:`t_m` of the node
+        q_delta : :py:class:`float`
+            diagonal entry :math:`q_m` of :math:`Q_\\Delta`
+        integral : :py:class:`numpy.ndarray`
+            integral from the start of the time step to the node
+
+        Returns
+        -------
+        value : :py:class:`numpy.ndarray`
+            new value :math:`u_m^{k+1}`
+        """
+        raise NotImplementedError("Must be implemented and overridden by subclasses.")
+
+    def _q_delta_correction(self, state, problem, q_delta, partial=None):
+        """Explicit part of a sweep with a lower triangular preconditioner :math:`Q_\\Delta`
+
+        For the current node :math:`m+1` of the current time step this computes
+
+        .. math::
+
+            \\sum_{j=0}^{m} c_j \\left( F(t_j, u_j^{k+1}) - F(t_j, u_j^k) \\right)
+
+        Parameters
+        ----------
+        q_delta : :py:class:`numpy.ndarray`
+            difference :math:`c` of the rows :math:`m+1` and :math:`m` of :math:`Q_\\Delta` up to the current node
+            (see :py:meth:`.SdcIntegrator.q_delta`), where the last entry is the implicit coefficient
+        partial : :py:class:`str` or :py:class:`None`
+            *(optional)*
+            partial right hand side to evaluate
+
+        Returns
+        -------
+        correction : :py:class:`numpy.ndarray` or :py:class:`float`
+            ``0.0`` if there are no non-zero explicit coefficients
+        """
+        _correction = 0.0
+        _previous_iteration = self._previous_iteration(state)
+        for _node in np.nonzero(q_delta[:-1])[0]:
+            if _node == 0:
+                _current = state.current_time_step.initial
+                _previous = _previous_iteration[state.current_time_step_index].initial \
+                    if _previous_iteration is not None else state.initial
+            else:
+                _current = state.current_time_step[_node - 1]
+                _previous = _previous_iteration[state.current_time_step_index][_node - 1] \
+                    if _previous_iteration is not None else state.initial
+            _correction = _correction + q_delta[_node] * (
+                self._evaluate_rhs(problem, _current, partial=partial)
+                - self._evaluate_rhs(problem, _previous, time_point=_current.time_point, partial=partial))
+        return _correction
+
     def _previous_iteration_current_step(self, state):
-        if state.previous_iteration_index is not None:
-            return state.previous_iteration[state.current_time_step_index][state.current_step_index]
+        _previous_iteration = self._previous_iteration(state)
+        if _previous_iteration is not None:
+            return _previous_iteration[state.current_time_step_index][state.current_step_index]
         else:
             return state.initial
 
@@ -8,7 +8,7 @@ from pypint.solvers.cores.mlsdc_solver_core import MlSdcSolverCore
 from pypint.solvers.states.mlsdc_solver_state import MlSdcSolverState
 from pypint.problems import IProblem
 from pypint.problems.has_direct_implicit_mixin import problem_has_direct_implicit
-from pypint.utilities import assert_is_instance, assert_named_argument
+from pypint.utilities import assert_is_instance, assert_named_argument, VALIDATION
 from pypint.utilities.logging import LOG
 
 
@@ -41,8 +41,9 @@ class SemiImplicitMlSdcCore(MlSdcSolverCore):
         """
         super(SemiImplicitMlSdcCore, self).run(state, **kwargs)
 
-        assert_is_instance(state, MlSdcSolverState, descriptor="State", checking_obj=self)
-        assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
+        if VALIDATION.internal:
+            assert_is_instance(state, MlSdcSolverState, descriptor="State", checking_obj=self)
+            assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
         _problem = kwargs['problem']
 
         use_intermediate = kwargs['use_intermediate'] if 'use_intermediate' in kwargs else False
@@ -70,10 +71,10 @@ class SemiImplicitMlSdcCore(MlSdcSolverCore):
 
         _fas = np.zeros(_previous_iteration_current_step.rhs.shape,
                         dtype=_previous_iteration_current_step.rhs.dtype)
-        if not use_intermediate and _previous_iteration_current_step.has_fas_correction():
-            # LOG.debug("   previous iteration current step has FAS: %s"
-            #           % _previous_iteration_current_step.fas_correction)
-            _fas = _previous_iteration_current_step.fas_correction
+        # the FAS correction belongs to the level, i.e. it also applies to sweeps on coarse-corrected values
+        if state.current_step.has_fas_correction():
+            # LOG.debug("   current step has FAS: %s" % state.current_step.fas_correction)
+            _fas = state.current_step.fas_correction
 
         if problem_has_direct_implicit(_problem, self):
             _sol = _problem.direct_implicit(phis_of_time=[_previous_iteration_previous_step.value,
@@ -87,15 +88,12 @@ class SemiImplicitMlSdcCore(MlSdcSolverCore):
 
         else:
             # Note: \Delta_t is always 1.0 as it's part of the integral
-            _Fe_u_cp = _problem.evaluate_wrt_time(state.previous_step.time_point,
-                                               state.previous_step.value,
-                                               partial="expl")
-            _Fe_u_pp = _problem.evaluate_wrt_time(_previous_iteration_previous_step.time_point,
-                                                 _previous_iteration_previous_step.value,
-                                                 partial="expl")
-            _Fe_u_pc = _problem.evaluate_wrt_time(state.current_step.time_point,
-                                                 _previous_iteration_current_step.value,
-                                                 partial="impl")
+            _Fe_u_cp = self._evaluate_rhs(_problem, state.previous_step,
+                                          time_point=state.previous_step.time_point, partial="expl")
+            _Fe_u_pp = self._evaluate_rhs(_problem, _previous_iteration_previous_step,
+                                          time_point=_previous_iteration_previous_step.time_point, partial="expl")
+            _Fe_u_pc = self._evaluate_rhs(_problem, _previous_iteration_current_step,
+                                          time_point=state.current_step.time_point, partial="impl")
             _expl_term = \
                 (state.previous_step.value
                  + state.current_step.delta_tau
@@ -114,12 +112,15 @@ class SemiImplicitMlSdcCore(MlSdcSolverCore):
             # LOG.debug("shape expl term: %s" % (_expl_term.shape,))
             # LOG.debug("shape impl func: %s" % (_func(state.current_step.value.reshape(-1)).shape,))
             _sol = \
-                _problem.implicit_solve(
+                self._implicit_solve(
+                    _problem,
                     state.current_step.value.reshape(-1),
                     _func,
                     expl_term=_expl_term,
                     time_level=state.current_iteration.current_level_index,
-                    delta_time=state.current_iteration.current_level.current_step.delta_tau
+                    time_point=state.current_step.time_point,
+                    delta_time=state.current_iteration.current_level.current_step.delta_tau,
+                    partial="impl"
                 ).reshape(state.current_step.value.shape)
 
         if type(state.current_step.value) == type(_sol):
@@ -7,7 +7,7 @@ from pypint.solvers.cores.sdc_solver_core import SdcSolverCore
 from pypint.solvers.states.sdc_solver_state import SdcSolverState
 from pypint.problems import IProblem
 from pypint.problems.has_direct_implicit_mixin import problem_has_direct_implicit
-from pypint.utilities import assert_is_instance, assert_named_argument
+from pypint.utilities import assert_is_instance, assert_named_argument, VALIDATION
 
 
 class SemiImplicitSdcCore(SdcSolverCore):
@@ -29,9 +29,20 @@ class SemiImplicitSdcCore(SdcSolverCore):
                                                   - F_E(t_m, u_m^{k+1}) + F_E(t_m, u_m^k) \\right) \\\\
                           &+ \\Delta_t I_m^{m+1} \\left( F(\\vec{u}^k) \\right)
 
+        With a general lower triangular preconditioner :math:`Q_\\Delta` for the implicit part, :math:`\\Delta_\\tau` of
+        :math:`F_I` is replaced by the implicit coefficient :math:`c_{m+1}` and the explicit correction
+        :math:`\\sum_{j \\leq m} c_j \\left( F_I(t_j, u_j^{k+1}) - F_I(t_j, u_j^k) \\right)` is added to the right hand
+        side.
+        The explicit part is always integrated with the explicit Euler.
+
         Parameters
         ----------
         state : :py:class:`.SdcSolverState`
+        q_delta : :py:class:`numpy.ndarray`
+            *(optional)*
+            coefficients :math:`c` of the preconditioner for the implicit part
+            (see :py:meth:`.SdcSolverCore._q_delta_correction`);
+            defaults to the implicit Euler sweep
 
         Notes
         -----
@@ -39,14 +50,24 @@ class SemiImplicitSdcCore(SdcSolverCore):
         """
         super(SemiImplicitSdcCore, self).run(state, **kwargs)
 
-        assert_is_instance(state, SdcSolverState, descriptor="State", checking_obj=self)
-        assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
+        if VALIDATION.internal:
+            assert_is_instance(state, SdcSolverState, descriptor="State", checking_obj=self)
+            assert_named_argument('problem', kwargs, types=IProblem, descriptor="Problem", checking_obj=self)
         _problem = kwargs['problem']
 
         _previous_iteration_current_step = self._previous_iteration_current_step(state)
         _previous_iteration_previous_step = self._previous_iteration_previous_step(state)
 
-        if problem_has_direct_implicit(_problem, self):
+        if 'q_delta' in kwargs:
+            _delta_tau = kwargs['q_delta'][-1]
+            _integral = state.current_step.integral \
+                + self._q_delta_correction(state, _problem, kwargs['q_delta'], partial="impl")
+        else:
+            _delta_tau = state.current_step.delta_tau
+            _integral = state.current_step.integral
+
+        if problem_has_direct_implicit(_problem, self) and 'q_delta' not in kwargs:
+            # the direct formulas use the same node distance for the implicit and explicit part
             _sol = _problem.direct_implicit(phis_of_time=[_previous_iteration_previous_step.value,
                                                           _previous_iteration_current_step.value,
                                                           state.previous_step.value],
@@ -59,32 +80,57 @@ class SemiImplicitSdcCore(SdcSolverCore):
             _expl_term = \
                 (state.previous_step.value
                  + state.current_step.delta_tau
-                 * (_problem.evaluate_wrt_time(state.current_step.time_point,
-                                               state.previous_step.value,
-                                               partial="expl")
-                    - _problem.evaluate_wrt_time(state.previous_step.time_point,
-                                                 _previous_iteration_previous_step.value,
-                                                 partial="expl")
-                    - _problem.evaluate_wrt_time(state.current_step.time_point,
-                                                 _previous_iteration_current_step.value,
-                                                 partial="impl"))
-                 + state.current_step.integral).reshape(-1)
+                 * (self._evaluate_rhs(_problem, state.previous_step, partial="expl")
+                    - self._evaluate_rhs(_problem, _previous_iteration_previous_step,
+                                         time_point=state.previous_step.time_point, partial="expl"))
+                 - _delta_tau
+                 * self._evaluate_rhs(_problem, _previous_iteration_current_step,
+                                      time_point=state.current_step.time_point, partial="impl")
+                 + _integral).reshape(-1)
             _func = lambda x_next: \
                 _expl_term \
-                + state.current_step.delta_tau \
+                + _delta_tau \
                   * _problem.evaluate_wrt_time(state.current_step.time_point,
                                                x_next.reshape(_problem.dim_for_time_solver),
                                                partial="impl").reshape(-1) \
                 - x_next
-            _sol = _problem.implicit_solve(state.current_step.value.reshape(-1), _func,
-                                           expl_term=_expl_term,
-                                           time_level=0,
-                                           delta_time=state.current_step.delta_tau).reshape(state.current_step.value.shape)
+            _sol = self._implicit_solve(_problem, state.current_step.value.reshape(-1), _func,
+                                        expl_term=_expl_term,
+                                        time_level=0,
+                                        time_point=state.current_step.time_point,
+                                        delta_time=_delta_tau,
+                                        partial="impl").reshape(state.current_step.value.shape)
 
         if type(state.current_step.value) == type(_sol):
             state.current_step.value = _sol
         else:
             state.current_step.value = _sol[0]
 
+    def solve_node(self, problem, initial_value, previous_value, time_point, q_delta, integral):
+        """Implicit solve of the implicit part for a single node with a diagonal preconditioner
+
+        The explicit part is only contained in the integral, i.e. it is not corrected within the sweep.
+
+        See Also
+        --------
+        :py:meth:`.SdcSolverCore.solve_node` : overridden method
+        """
+        _expl_term = \
+            (initial_value
+             - q_delta * problem.evaluate_wrt_time(time_point, previous_value, partial="impl")
+             + integral).reshape(-1)
+        _func = lambda x_next: \
+            _expl_term \
+            + q_delta * problem.evaluate_wrt_time(time_point,
+                                                  x_next.reshape(problem.dim_for_time_solver),
+                                                  partial="impl").reshape(-1) \
+            - x_next
+        return self._implicit_solve(problem, previous_value.reshape(-1), _func,
+                                    expl_term=_expl_term,
+                                    time_level=0,
+                                    time_point=time_point,
+                                    delta_time=q_delta,
+                                    partial="impl").reshape(previous_value.shape)
+
 
 __all__ = ['SemiImplicitSdcCore']
@@ -3,8 +3,16 @@
 
 .. moduleauthor: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
+import numpy as np
+
 from pypint.solvers.states.i_solver_state import ISolverState
 from pypint.solvers.cores.i_solver_core import ISolverCore
+from pypint.integrators.integrator_base import IntegratorBase
+from pypint.plugins.timers.instrumentation import Instrumentation
+from pypint.plugins.events.solver_event import SolverEvent
+from pypint.plugins.events.event_sinks import default_event_sink
+from pypint.problems import problem_has_exact_solution
+from pypint.solvers.diagnosis.norms import supremum_norm
 from pypint.utilities.threshold_check import ThresholdCheck
 from pypint.utilities import assert_condition, assert_is_callable, class_name
 
@@ -18,6 +26,8 @@ class IIterativeTimeSolver(object):
         self._integrator = None
         self._core = ISolverCore()
         self._timer = None
+        self._instrumentation = Instrumentation()
+        self._event_sink = default_event_sink()
         self._threshold_check = ThresholdCheck()
         self._state = ISolverState()
 
@@ -31,6 +41,8 @@ class IIterativeTimeSolver(object):
 
         integrator : :py:class:`.IntegratorBase`
             Integrator to be used by this solver.
+            Either the class, which gets instantiated, or an instance, which is used as is (e.g. for sharing an
+            initialized integrator among several solvers).
 
         threshold : :py:class:`.ThresholdCheck`
             *(optional)*
@@ -38,8 +50,12 @@ class IIterativeTimeSolver(object):
         """
         self._problem = problem
         if 'integrator' in kwargs:
-            assert_is_callable(kwargs['integrator'], message="Integrator must be instantiable.", checking_obj=self)
-            self._integrator = kwargs['integrator']()
+            if isinstance(kwargs['integrator'], IntegratorBase):
+                self._integrator = kwargs['integrator']
+            else:
+                assert_is_callable(kwargs['integrator'], message="Integrator must be instantiable.",
+                                   checking_obj=self)
+                self._integrator = kwargs['integrator']()
         if "threshold" in kwargs and isinstance(kwargs["threshold"], ThresholdCheck):
             self.threshold = kwargs["threshold"]
 
@@ -103,6 +119,46 @@ class IIterativeTimeSolver(object):
     def timer(self, timer):
         self._timer = timer
 
+    @property
+    def instrumentation(self):
+        """Accessor for the timers and counters of the phases of this solver
+
+        The instrumentation is active while the solver is running (see :py:meth:`.Instrumentation.activate`).
+
+        Parameters
+        ----------
+        instrumentation : :py:class:`.Instrumentation`
+
+        Returns
+        -------
+        instrumentation : :py:class:`.Instrumentation`
+        """
+        return self._instrumentation
+
+    @instrumentation.setter
+    def instrumentation(self, instrumentation):
+        self._instrumentation = instrumentation
+
+    @property
+    def event_sink(self):
+        """Accessor for the receiver of the :py:class:`.SolverEvent` records of this solver
+
+        Defaults to :py:func:`.default_event_sink`.
+
+        Parameters
+        ----------
+        event_sink : :py:class:`.IEventSink`
+
+        Returns
+        -------
+        event_sink : :py:class:`.IEventSink`
+        """
+        return self._event_sink
+
+    @event_sink.setter
+    def event_sink(self, event_sink):
+        self._event_sink = event_sink
+
     @property
     def threshold(self):
         """Accessor for threshold check of this solver.
@@ -142,6 +198,136 @@ class IIterativeTimeSolver(object):
         }
         return _lines
 
+    def _evaluate_rhs(self, steps, time_points=None):
+        """Evaluates the right hand sides of all given steps not yet evaluated
+
+        All right hand sides are computed by a single call to :py:meth:`.IProblem.evaluate_wrt_time_batch`.
+
+        Parameters
+        ----------
+        steps : :py:class:`list` of :py:class:`.IStepState`
+        time_points : :py:class:`list` of :py:class:`float`
+            *(optional)*
+            time points of the steps (e.g. for intermediate steps not carrying their own time point);
+            defaults to the time points of the steps
+        """
+        if time_points is None:
+            time_points = [_step.time_point for _step in steps]
+        _pending = []
+        for _index, _step in enumerate(steps):
+            # a step may be given multiple times (e.g. the initial value spread to all nodes)
+            if not _step.rhs_evaluated and all(steps[_other] is not _step for _other in _pending):
+                _pending.append(_index)
+        if len(_pending) > 0:
+            with self._instrumentation.timing('rhs'):
+                _rhs = self.problem.evaluate_wrt_time_batch(np.array([time_points[_index] for _index in _pending],
+                                                                     dtype=float),
+                                                            np.array([steps[_index].value for _index in _pending]))
+                self._instrumentation.count('values', len(_pending))
+            for _index, _value in zip(_pending, _rhs):
+                steps[_index].rhs = _value
+
+    def _exact_values(self, time_points):
+        """Exact solution at the given time points
+
+        As the time points of the nodes are fixed for an interval, the exact solution is evaluated once per interval by
+        a single call to :py:meth:`.HasExactSolutionMixin.exact_batch` and passed on to
+        :py:meth:`.ISolverCore.compute_error`.
+
+        Parameters
+        ----------
+        time_points : :py:class:`numpy.ndarray`
+            time points of arbitrary shape
+
+        Returns
+        -------
+        exact : :py:class:`numpy.ndarray` or :py:class:`None`
+            of shape ``time_points.shape + dim_for_time_solver``;
+            :py:class:`None` if the problem does not have an exact solution
+        """
+        if not problem_has_exact_solution(self.problem, self):
+            return None
+        _time_points = np.asarray(time_points, dtype=float)
+        return self.problem.exact_batch(_time_points.reshape(-1)) \
+            .reshape(_time_points.shape + self.problem.dim_for_time_solver)
+
+    def _emit_event(self, kind, **fields):
+        """Emits a :py:class:`.SolverEvent` of this solver to the event sink
+
+        Parameters
+        ----------
+        kind : :py:class:`.SolverEvent.Kind`
+        fields :
+            further fields of the event
+        """
+        self._event_sink.emit(SolverEvent(kind, solver="%s<0x%x>" % (class_name(self), id(self)), **fields))
+
+    def _emit_interval_start_event(self, interval, width):
+        """Emits the start of the interval of the current state
+
+        Parameters
+        ----------
+        interval : :py:class:`int`
+            index of the interval
+        width : :py:class:`float`
+            width of the interval
+        """
+        if self._event_sink.enabled:
+            self._emit_event(SolverEvent.Kind.interval_start, interval=interval,
+                             time_start=self.state.initial.time_point,
+                             time_end=self.state.initial.time_point + width)
+
+    def _emit_iteration_event(self, interval, wall_time):
+        """Emits the summary of the current iteration after checking the thresholds
+
+        Parameters
+        ----------
+        interval : :py:class:`int`
+            index of the interval
+        wall_time : :py:class:`float`
+            time spent in the iteration
+        """
+        if self._event_sink.enabled:
+            _index = self.state.current_iteration_index
+            _fields = {
+                'residual': supremum_norm(self.state.current_step.solution.residual),
+                'error': supremum_norm(self.state.current_step.solution.error)
+            }
+            if not self.state.is_first_iteration:
+                _fields['solution_reduction'] = supremum_norm(self.state.solution.solution_reduction(_index))
+                if problem_has_exact_solution(self.problem, self):
+                    _fields['error_reduction'] = supremum_norm(self.state.solution.error_reduction(_index))
+            self._emit_event(SolverEvent.Kind.iteration, interval=interval, iteration=_index, wall_time=wall_time,
+                             **_fields)
+
+    def _emit_interval_end_event(self, interval):
+        """Emits the end of the interval of the current and finalized state
+
+        The reason is the list of reached thresholds or ``failed`` in case the solver exceeded the maximum number of
+        iterations.
+
+        Parameters
+        ----------
+        interval : :py:class:`int`
+            index of the interval
+        """
+        if self._event_sink.enabled:
+            _index = self.state.last_iteration_index
+            _reached = self.threshold.has_reached()
+            _fields = {
+                'residual': supremum_norm(self.state.last_iteration.final_step.solution.residual),
+                'error': supremum_norm(self.state.last_iteration.final_step.solution.error),
+                'solution_reduction': supremum_norm(self.state.solution.solution_reduction(_index))
+            }
+            if problem_has_exact_solution(self.problem, self):
+                _fields['error_reduction'] = supremum_norm(self.state.solution.error_reduction(_index))
+            self._emit_event(SolverEvent.Kind.interval_end, interval=interval, iteration=_index,
+                             time_start=self.state.initial.time_point,
+                             time_end=self.state.last_iteration.final_step.time_point,
+                             reason='failed' if _index > self.threshold.max_iterations or _reached is None
+                             else ', '.join(_reached),
+                             wall_time=self.timer.past() if self.timer is not None else None, **_fields)
+
     def _print_header(self):
         pass
 
@@ -21,8 +21,9 @@ from pypint.solvers.states.mlsdc_solver_state import MlSdcSolverState
 from pypint.solvers.diagnosis import IDiagnosisValue
 from pypint.solvers.diagnosis.norms import supremum_norm
 from pypint.plugins.timers.timer_base import TimerBase
+from pypint.plugins.timers.instrumentation import timed
 from pypint.utilities.threshold_check import ThresholdCheck
-from pypint.utilities import assert_is_instance, assert_condition, func_name, assert_named_argument
+from pypint.utilities import assert_is_instance, assert_condition, func_name, assert_named_argument, assert_is_in
 from pypint.utilities.logging import *
 
 
@@ -35,6 +36,9 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
     :py:class:`.IParallelSolver` :
         mixed-in interface
     """
+
+    predictor_types = ['spread', 'coarse']
+
     def __init__(self, **kwargs):
         super(MlSdc, self).__init__(**kwargs)
         IParallelSolver.__init__(self, **kwargs)
@@ -46,12 +50,15 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         self._dt = 0.0
         self._ml_provider = None
+        self._predictor = 'spread'
+        self._num_predictor_sweeps = 1
 
         self.__nodes_type = GaussLobattoNodes
         self.__weights_type = PolynomialWeightFunction
-        self.__exact = np.zeros(0)
+        self.__exact = None  # exact solution at the nodes of the current interval; for each level
         self.__deltas = None  # deltas between nodes as array; for each level (0: coarsest)
         self.__time_points = None  # time points of nodes as array; for each level
+        self.__q_rhs = {}  # buffers of the integrated right hand sides; for each level
 
     def init(self, problem, **kwargs):
         """Initializes MLSDC solver with given problem, integrator and multi-level provider.
@@ -70,6 +77,17 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         weights_type : :py:class:`.IWeightFunction`
             *(optional)*
             Integration weights function to be used (class name, **NOT instance**).
+        predictor : :py:class:`str`
+            *(optional)*
+            Initialization of the first iteration of each interval, one of :py:attr:`.predictor_types`
+            (see :py:meth:`._predict` for details).
+            Defaults to ``spread``, i.e. the initial value is copied to all nodes.
+        num_predictor_sweeps : :py:class:`int`
+            *(optional)*
+            Number of sweeps on the coarsest level of the ``coarse`` predictor.
+            All but the first sweep start from the coarse value received from the previous solver, i.e. in a pipeline
+            of solvers over consecutive intervals the :math:`p`-th solver should do :math:`p` sweeps.
+            Defaults to ``1``.
 
         Raises
         ------
@@ -95,8 +113,17 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         super(MlSdc, self).init(problem, **kwargs)
 
-        # TODO: need to store the exact solution somewhere else
-        self.__exact = np.zeros(self.ml_provider.integrator(-1).num_nodes, dtype=np.object)
+        if 'predictor' in kwargs:
+            assert_is_in(kwargs['predictor'], self.predictor_types, elem_desc="Predictor",
+                         list_desc="Valid Predictors", checking_obj=self)
+            self._predictor = kwargs['predictor']
+
+        if 'num_predictor_sweeps' in kwargs:
+            assert_condition(isinstance(kwargs['num_predictor_sweeps'], int) and kwargs['num_predictor_sweeps'] > 0,
+                             ValueError, message="Number of predictor sweeps must be a positive integer: NOT {}"
+                                                 .format(kwargs['num_predictor_sweeps']),
+                             checking_obj=self)
+            self._num_predictor_sweeps = kwargs['num_predictor_sweeps']
 
     def run(self, core, **kwargs):
         """Applies SDC solver to the initialized problem setup.
@@ -120,139 +147,145 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         assert_named_argument('dt', kwargs, types=float, descriptor="Width of Interval", checking_obj=self)
         self._dt = kwargs['dt']
 
-        self._print_header()
-
-        # start iterations
-        # TODO: exact solution storage handling
-        self.__exact[0] = self.problem.initial_value
+        self._instrumentation.activate()
 
-        _has_work = True
-        _previous_flag = Message.SolverFlag.none
-        _current_flag = Message.SolverFlag.none
-        __work_loop_count = 1
+        try:
+            self._print_header()
 
-        while _has_work:
-            # LOG.debug("Work Loop: %d" % __work_loop_count)
-            _previous_flag = _current_flag
+            # start iterations
+            _has_work = True
+            _previous_flag = Message.SolverFlag.none
             _current_flag = Message.SolverFlag.none
-
-            # receive dedicated message
-            _msg = self._communicator.receive(tag=(self.ml_provider.num_levels - 1))
-
-            if _msg.flag == Message.SolverFlag.failed:
-                # previous solver failed
-                # --> pass on the failure and abort
-                _current_flag = Message.SolverFlag.failed
-                _has_work = False
-                # LOG.debug("Previous Solver Failed")
-            else:
-                if _msg.flag == Message.SolverFlag.time_adjusted:
-                    # the previous solver has adjusted its interval
-                    # --> we need to recompute our interval
-                    _current_flag = self._adjust_interval_width()
-                    # we don't immediately start the computation of the newly computed interval
-                    # but try to pass the new interval end to the next solver as soon as possible
-                    # (this should avoid throwing away useless computation)
-                    # LOG.debug("Previous Solver Adjusted Time")
+            __work_loop_count = 1
+
+            while _has_work:
+                # LOG.debug("Work Loop: %d" % __work_loop_count)
+                _previous_flag = _current_flag
+                _current_flag = Message.SolverFlag.none
+
+                # receive dedicated message
+                with self._instrumentation.timing('receive'):
+                    _msg = self._communicator.receive(tag=(self.ml_provider.num_levels - 1))
+
+                if _msg.flag == Message.SolverFlag.failed:
+                    # previous solver failed
+                    # --> pass on the failure and abort
+                    _current_flag = Message.SolverFlag.failed
+                    _has_work = False
+                    # LOG.debug("Previous Solver Failed")
                 else:
-                    if _previous_flag in \
-                            [Message.SolverFlag.none, Message.SolverFlag.converged, Message.SolverFlag.finished,
-                             Message.SolverFlag.time_adjusted]:
-                        # we just started or finished our previous interval
-                        # --> start a new interval
-                        _has_work = self._init_new_interval(_msg.time_point)
-
-                        if _has_work:
-                            # set initial values
-                            self.state.initial.value = _msg.value.copy()
-                            self.state.initial.solution.time_point = _msg.time_point
-                            self.state.initial.done()
-
-                            # LOG.debug("New Interval Initialized")
-
-                            # start logging output
-                            self._print_interval_header()
-
-                            # start global timing (per interval)
-                            self.timer.start()
+                    if _msg.flag == Message.SolverFlag.time_adjusted:
+                        # the previous solver has adjusted its interval
+                        # --> we need to recompute our interval
+                        _current_flag = self._adjust_interval_width()
+                        # we don't immediately start the computation of the newly computed interval
+                        # but try to pass the new interval end to the next solver as soon as possible
+                        # (this should avoid throwing away useless computation)
+                        # LOG.debug("Previous Solver Adjusted Time")
+                    else:
+                        if _previous_flag in \
+                                [Message.SolverFlag.none, Message.SolverFlag.converged, Message.SolverFlag.finished,
+                                 Message.SolverFlag.time_adjusted]:
+                            # we just started or finished our previous interval
+                            # --> start a new interval
+                            _has_work = self._init_new_interval(_msg.time_point)
+
+                            if _has_work:
+                                # set initial values
+                                self.state.initial.value = _msg.value.copy()
+                                self.state.initial.solution.time_point = _msg.time_point
+                                self.state.initial.done()
+
+                                # LOG.debug("New Interval Initialized")
+
+                                # start logging output
+                                self._print_interval_header()
+
+                                # start global timing (per interval)
+                                self.timer.start()
+                                self._emit_interval_start_event(len(self._states) - 1, self._dt)
+                            else:
+                                # LOG.debug("No New Interval Available")
+                                pass
+                        elif _previous_flag == Message.SolverFlag.iterating:
+                            # LOG.debug("Next Iteration")
+                            pass
                         else:
-                            # LOG.debug("No New Interval Available")
+                            # LOG.warn("WARNING!!! Something went wrong here")
                             pass
-                    elif _previous_flag == Message.SolverFlag.iterating:
-                        # LOG.debug("Next Iteration")
-                        pass
-                    else:
-                        # LOG.warn("WARNING!!! Something went wrong here")
-                        pass
-
-                    if _has_work:
-                        # we are still on the same interval or have just successfully initialized a new interval
-                        # --> do the real computation
-                        # LOG.debug("Starting New Solver Main Loop")
-
-                        # initialize a new iteration state
-                        self.state.proceed()
-
-                        if _msg.time_point == self.state.initial.time_point:
-                            if _previous_flag == Message.SolverFlag.iterating:
-                                # LOG.debug("Updating initial value")
-                                # if the previous solver has a new initial value for us, we use it
-                                self.state.current_iteration.initial.value = _msg.value.copy()
-
-                        _current_flag = self._main_solver_loop()
-
-                        if _current_flag in \
-                                [Message.SolverFlag.converged, Message.SolverFlag.finished, Message.SolverFlag.failed]:
-                            _log_msgs = {'': OrderedDict()}
-                            if self.state.last_iteration_index <= self.threshold.max_iterations:
-                                _group = 'Converged after %d iteration(s)' % (self.state.last_iteration_index + 1)
-                                _log_msgs[''][_group] = OrderedDict()
-                                _log_msgs[''][_group] = self.threshold.has_reached(log=True)
-                                _log_msgs[''][_group]['Final Residual'] = "{:.3e}"\
-                                    .format(supremum_norm(self.state.last_iteration.final_step.solution.residual))
-                                _log_msgs[''][_group]['Solution Reduction'] = "{:.3e}"\
-                                    .format(supremum_norm(self.state.solution
-                                                          .solution_reduction(self.state.last_iteration_index)))
-                                if problem_has_exact_solution(self.problem, self):
-                                    _log_msgs[''][_group]['Error Reduction'] = "{:.3e}"\
+
+                        if _has_work:
+                            # we are still on the same interval or have just successfully initialized a new interval
+                            # --> do the real computation
+                            # LOG.debug("Starting New Solver Main Loop")
+
+                            # initialize a new iteration state
+                            self.state.proceed()
+
+                            if np.isclose(_msg.time_point, self.state.initial.time_point):
+                                if _previous_flag == Message.SolverFlag.iterating:
+                                    # LOG.debug("Updating initial value")
+                                    # if the previous solver has a new initial value for us, we use it
+                                    self.state.current_iteration.initial.value = _msg.value.copy()
+
+                            _current_flag = self._main_solver_loop()
+
+                            if _current_flag in [Message.SolverFlag.converged, Message.SolverFlag.finished,
+                                                 Message.SolverFlag.failed]:
+                                _log_msgs = {'': OrderedDict()}
+                                if self.state.last_iteration_index <= self.threshold.max_iterations:
+                                    _group = 'Converged after %d iteration(s)' % (self.state.last_iteration_index + 1)
+                                    _log_msgs[''][_group] = OrderedDict()
+                                    _log_msgs[''][_group] = self.threshold.has_reached(log=True)
+                                    _log_msgs[''][_group]['Final Residual'] = "{:.3e}"\
+                                        .format(supremum_norm(self.state.last_iteration.final_step.solution.residual))
+                                    _log_msgs[''][_group]['Solution Reduction'] = "{:.3e}"\
                                         .format(supremum_norm(self.state.solution
-                                                              .error_reduction(self.state.last_iteration_index)))
-                            else:
-                                warnings.warn("{}: Did not converged: {:s}".format(self._core.name, self.problem))
-                                _group = "FAILED: After maximum of {:d} iteration(s)"\
-                                         .format(self.state.last_iteration_index + 1)
-                                _log_msgs[''][_group] = OrderedDict()
-                                _log_msgs[''][_group]['Final Residual'] = "{:.3e}"\
-                                    .format(supremum_norm(self.state.last_iteration.final_step.solution.residual))
-                                _log_msgs[''][_group]['Solution Reduction'] = "{:.3e}"\
-                                    .format(supremum_norm(self.state.solution
-                                                          .solution_reduction(self.state.last_iteration_index)))
-                                if problem_has_exact_solution(self.problem, self):
-                                    _log_msgs[''][_group]['Error Reduction'] = "{:.3e}"\
+                                                              .solution_reduction(self.state.last_iteration_index)))
+                                    if problem_has_exact_solution(self.problem, self):
+                                        _log_msgs[''][_group]['Error Reduction'] = "{:.3e}"\
+                                            .format(supremum_norm(self.state.solution
+                                                                  .error_reduction(self.state.last_iteration_index)))
+                                else:
+                                    warnings.warn("{}: Did not converged: {:s}".format(self._core.name, self.problem))
+                                    _group = "FAILED: After maximum of {:d} iteration(s)"\
+                                             .format(self.state.last_iteration_index + 1)
+                                    _log_msgs[''][_group] = OrderedDict()
+                                    _log_msgs[''][_group]['Final Residual'] = "{:.3e}"\
+                                        .format(supremum_norm(self.state.last_iteration.final_step.solution.residual))
+                                    _log_msgs[''][_group]['Solution Reduction'] = "{:.3e}"\
                                         .format(supremum_norm(self.state.solution
-                                                              .error_reduction(self.state.last_iteration_index)))
-                                LOG.warn("  {} Failed: Maximum number iterations reached without convergence."
-                                         .format(self._core.name))
-                            print_logging_message_tree(_log_msgs)
-                    elif _previous_flag in [Message.SolverFlag.converged, Message.SolverFlag.finished]:
-                        # LOG.debug("Solver Finished.")
-
-                        self.timer.stop()
-
-                        self._print_footer()
-                    else:
-                        # something went wrong
-                        # --> we failed
-                        # LOG.warn("Solver failed.")
-                        _current_flag = Message.SolverFlag.failed
-
-            self._communicator.send(value=self.state.current_iteration.finest_level.final_step.value,
-                                    time_point=self.state.current_iteration.finest_level.final_step.time_point,
-                                    flag=_current_flag)
-            __work_loop_count += 1
-
-        # end while:has_work is None
-        # LOG.debug("Solver Main Loop Done")
+                                                              .solution_reduction(self.state.last_iteration_index)))
+                                    if problem_has_exact_solution(self.problem, self):
+                                        _log_msgs[''][_group]['Error Reduction'] = "{:.3e}"\
+                                            .format(supremum_norm(self.state.solution
+                                                                  .error_reduction(self.state.last_iteration_index)))
+                                    LOG.warn("  {} Failed: Maximum number iterations reached without convergence."
+                                             .format(self._core.name))
+                                print_logging_message_tree(_log_msgs)
+                                self._emit_interval_end_event(len(self._states) - 1)
+                        elif _previous_flag in [Message.SolverFlag.converged, Message.SolverFlag.finished]:
+                            # LOG.debug("Solver Finished.")
+
+                            self.timer.stop()
+
+                            self._print_footer()
+                        else:
+                            # something went wrong
+                            # --> we failed
+                            # LOG.warn("Solver failed.")
+                            _current_flag = Message.SolverFlag.failed
+
+                with self._instrumentation.timing('send'):
+                    self._communicator.send(value=self.state.current_iteration.finest_level.final_step.value,
+                                            time_point=self.state.current_iteration.finest_level.final_step.time_point,
+                                            flag=_current_flag)
+                __work_loop_count += 1
+
+            # end while:has_work is None
+            # LOG.debug("Solver Main Loop Done")
+        finally:
+            self._instrumentation.deactivate()
 
         return [_s.solution for _s in self._states]
 
@@ -269,6 +302,17 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         else:
             return None
 
+    @property
+    def predictor(self):
+        """Read-only accessor for the type of the predictor
+
+        Returns
+        -------
+        predictor : :py:class:`str`
+            one of :py:attr:`.predictor_types`
+        """
+        return self._predictor
+
     @property
     def ml_provider(self):
         """Read-only accessor for the multi level provider
@@ -283,6 +327,9 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         # initialize iteration timer of same type as global timer
         _iter_timer = self.timer.__class__()
 
+        self._instrumentation.set_context(interval=len(self._states) - 1,
+                                          iteration=self.state.current_iteration_index, level=None)
+
         # initialize solver states for this iteration
         self._init_new_iteration()
 
@@ -290,11 +337,13 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         # iterate on time steps
         _iter_timer.start()
-        self._level()
+        with self._instrumentation.timing('iteration'):
+            self._level()
         _iter_timer.stop()
 
         # check termination criteria
         self.threshold.check(self.state)
+        self._emit_iteration_event(len(self._states) - 1, _iter_timer.past())
 
         # log this iteration's summary
         if self.state.is_first_iteration:
@@ -314,9 +363,13 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
                                           _iter_timer.past())
 
         # finalize this iteration (i.e. TrajectorySolutionData.finalize())
-        self.state.current_iteration.finalize()
+        with self._instrumentation.timing('finalize'):
+            self.state.current_iteration.finalize()
 
         _reason = self.threshold.has_reached()
+        if _reason is not None and 'iterations' not in _reason and not self.comm.previous_finished:
+            # the initial value may still change as long as the previous solver is iterating
+            _reason = None
         if _reason is None:
             # LOG.debug("solver main loop done: no reason")
             return Message.SolverFlag.iterating
@@ -325,14 +378,16 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
             _dim = list(self.problem.spacial_dim)
             _dim.insert(0, self.ml_provider.integrator(self.state.last.current_level_index).num_nodes)
             LOG.debug("-->\n%s" % (self.state.last.current_level.values.reshape(tuple(_dim)).tolist()))
-            self.state.finalize()
+            with self._instrumentation.timing('finalize'):
+                self.state.finalize()
             return Message.SolverFlag.finished
         else:
             # LOG.debug("solver main loop done: other")
             _dim = list(self.problem.spacial_dim)
             _dim.insert(0, self.ml_provider.integrator(self.state.last.current_level_index).num_nodes)
             LOG.debug("-->\n%s" % (self.state.last.current_level.values.reshape(tuple(_dim)).tolist()))
-            self.state.finalize()
+            with self._instrumentation.timing('finalize'):
+                self.state.finalize()
             return Message.SolverFlag.converged
 
     def _init_new_state(self):
@@ -344,7 +399,8 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         if self.state:
             # print("Finished a State")
             # finalize the current state
-            self.state.finalize()
+            with self._instrumentation.timing('finalize'):
+                self.state.finalize()
 
         # print("Stating a new state")
         # initialize solver state
@@ -367,10 +423,10 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         """
         assert_is_instance(start, float, descriptor="Time Point", checking_obj=self)
 
-        if start + self._dt > self.problem.time_end:
+        if start + self._dt > self.problem.time_end and not np.isclose(start + self._dt, self.problem.time_end):
             return False
 
-        if self.state and start == self.state.initial.time_point:
+        if self.state and np.isclose(start, self.state.initial.time_point):
             return False
 
         self._init_new_state()
@@ -400,6 +456,9 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         # print("Time Points: %s" % self.__time_points)
 
+        self.__exact = [self._exact_values(self.__time_points[_level])
+                        for _level in range(0, self.ml_provider.num_levels)]
+
         return True
 
     def _init_new_iteration(self):
@@ -430,6 +489,43 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
                                        " (this shouldn't have happend)",
                          checking_obj=self)
 
+        if _previous_iteration is None and self._predictor != 'spread':
+            self._predict()
+
+    def _predict(self):
+        """Computes the values the first iteration of the current interval starts from on the finest level
+
+        With the ``coarse`` predictor sweeps on the coarsest level starting from the spread initial value are
+        prolongated level by level to the finest level.
+        After each sweep the coarse value at the end of the interval is sent to the next solver; each further sweep
+        starts from the coarse value received from the previous solver (pipelined predictor).
+        The result is stored as :py:attr:`.ISolverState.predictor` and takes the place of the previous iteration on the
+        finest level in the first iteration.
+        The values of all coarser levels are overwritten by the restriction of the first V-cycle.
+        """
+        _iteration = self.state.current_iteration
+        while not _iteration.on_base_level:
+            _iteration.step_down()
+
+        for _sweep in range(0, self._num_predictor_sweeps):
+            if _sweep > 0:
+                self._receive_initial_value()
+            LOG.debug("predictor sweep %d" % (_sweep + 1))
+            self._sdc_sweep(copy=False, with_residual=False)
+            with self._instrumentation.timing('send'):
+                self.comm.send(tag=self.state.current_level_index,
+                               value=_iteration.current_level.final_step.value,
+                               time_point=_iteration.current_level.final_step.time_point)
+
+        while not _iteration.on_finest_level:
+            _iteration.finer_level.values = \
+                self.ml_provider.prolongate(_iteration.current_level.values,
+                                            coarse_level=_iteration.current_level_index,
+                                            fine_level=_iteration.finer_level_index)
+            _iteration.step_up()
+
+        self.state.predictor = deepcopy(_iteration.current_level)
+
     def _adjust_interval_width(self):
         """Adjust width of time interval
         """
@@ -441,7 +537,9 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         _fine_data = q_rhs_fine + fas_fine if fas_fine is not None else q_rhs_fine
 
         # 1. restringate fine data
-        _restringated_fine = self.ml_provider.restringate(_fine_data, fine_lvl)
+        #    (in the precision of the fine level, thus the FAS correction is accumulated in full precision on coarse
+        #     levels of reduced precision)
+        _restringated_fine = self.ml_provider.restringate(_fine_data, fine_lvl, cast=False)
         # LOG.debug("R x (Q_fine x F_fine + FAS_fine):\n    %s\n  = R(%s)\n  = R(%s + %s)"
         #           % (_restringated_fine, _fine_data, q_rhs_fine, fas_fine))
 
@@ -456,13 +554,35 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         # LOG.debug("FAS Correction:\n    %s\n  = %s - %s"
         #           % (self.state.current_iteration.current_level.fas_correction, _restringated_fine, q_rhs_coarse))
 
+    def _level_numeric_type(self, level_index):
+        """Numeric type of the values on the given level
+
+        Either the one given to the :py:class:`.MultiTimeLevelProvider` for the level or the one of the problem.
+        """
+        _numeric_type = self.ml_provider.numeric_type(level_index)
+        return _numeric_type if _numeric_type is not None else self.problem.numeric_type
+
+    def _integrate_level(self, level_index, rhs):
+        """Integrals of the given right hand sides from the start of the interval to all nodes of the given level
+
+        The result is written into a buffer of the level, which is reused on the next call for the same level.
+        """
+        _dtype = np.result_type(float, rhs.dtype)
+        if level_index not in self.__q_rhs \
+                or self.__q_rhs[level_index].shape != rhs.shape or self.__q_rhs[level_index].dtype != _dtype:
+            self.__q_rhs[level_index] = np.empty(rhs.shape, dtype=_dtype)
+        return self.ml_provider.integrator(level_index).evaluate_nodes(rhs, out=self.__q_rhs[level_index])
+
+    def _compute_level_errors(self):
+        """Errors of all steps of the current level at once with the exact solution cached for the interval
+        """
+        _exact = self.__exact[self.state.current_level_index]
+        self._core.compute_error(self.state, problem=self.problem, steps=list(self.state.current_level),
+                                 exact=_exact[1:] if _exact is not None else None)
+
     def _recompute_rhs_for_level(self, level):
         if level.rhs is None:
-            if not level.initial.rhs_evaluated:
-                level.initial.rhs = self.problem.evaluate_wrt_time(level.initial.time_point, level.initial.value)
-            for step in level:
-                if not step.rhs_evaluated:
-                    step.rhs = self.problem.evaluate_wrt_time(step.time_point, step.value)
+            self._evaluate_rhs([level.initial] + [level[_step_index] for _step_index in range(0, len(level))])
 
     def _compute_residual(self, finalize=False):
         LOG.debug("Computing Residual")
@@ -474,14 +594,15 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         self._recompute_rhs_for_level(self.state.current_level)
 
+        _integrals = None
         for _step_index in range(0, len(self.state.current_level)):
             _step = self.state.current_level[_step_index]
 
             if not _step.integral_available:
-                _step.integral = \
-                    self.ml_provider \
-                        .integrator(self.state.current_level_index) \
-                        .evaluate(self.state.current_level.rhs, from_node=_step_index, target_node=_step_index + 1)
+                if _integrals is None:
+                    _integrals = self.ml_provider.integrator(self.state.current_level_index) \
+                        .evaluate_nodes(self.state.current_level.rhs, from_previous=True)
+                _step.integral = _integrals[_step_index]
             _full_integral += _step.integral
 
             self._core.compute_residual(self.state, step=_step, integral=_full_integral)
@@ -523,18 +644,16 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         if finalize:
             LOG.debug("Finalizing Level %d" % self.state.current_iteration.current_level_index)
-            self.state.current_iteration.current_level.finalize()
+            with self._instrumentation.timing('finalize'):
+                self.state.current_iteration.current_level.finalize()
 
     def _level(self):
         _current_level = self.state.current_iteration.current_level
         _finer_level = self.state.current_iteration.finer_level
         _coarser_level = self.state.current_iteration.coarser_level
+        self._instrumentation.set_context(level=self.state.current_iteration.current_level_index)
 
-        _msg = self.comm.receive(tag=self.state.current_level_index)
-        if _msg and _msg.time_point == self.state.initial.time_point:
-            _current_level.initial.definalize()
-            _current_level.initial.value = _msg.value
-            _current_level.initial.done()
+        self._receive_initial_value()
 
         # LOG.debug("Level %d initial values: %s"
         #           % (self.state.current_iteration.current_level_index, _current_level.values))
@@ -548,28 +667,10 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         if not self.state.current_iteration.on_finest_level:
             # compute FAS Correction
-            _q_rhs_coarse = \
-                np.concatenate(
-                    (np.array([np.zeros(self.problem.dim_for_time_solver, dtype=self.problem.numeric_type)]),
-                     np.array([
-                        self.ml_provider
-                            .integrator(self.state.current_iteration.current_level_index)
-                            .evaluate(_current_level.rhs, target_node=_step_i+1)
-                        for _step_i in range(0, len(_current_level))
-                     ], dtype=self.problem.numeric_type)),
-                    axis=0)
+            _q_rhs_coarse = self._integrate_level(self.state.current_iteration.current_level_index,
+                                                  _current_level.rhs)
             self._recompute_rhs_for_level(_finer_level)
-
-            _q_rhs_fine = \
-                np.concatenate(
-                    (np.array([np.zeros(self.problem.dim_for_time_solver, dtype=self.problem.numeric_type)]),
-                     np.array([
-                         self.ml_provider
-                             .integrator(self.state.current_iteration.finer_level_index)
-                             .evaluate(_finer_level.rhs, target_node=_step_i+1)
-                         for _step_i in range(0, len(_finer_level))
-                     ], dtype=self.problem.numeric_type)),
-                    axis=0)
+            _q_rhs_fine = self._integrate_level(self.state.current_iteration.finer_level_index, _finer_level.rhs)
 
             self._compute_fas_correction(_q_rhs_fine, _finer_level.fas_correction, _q_rhs_coarse,
                                          fine_lvl=self.state.current_iteration.finer_level_index)
@@ -591,6 +692,7 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
             #  RECURSION HERE!
             self._level()
             # -> coarser level is done; coming up again
+            self._instrumentation.set_context(level=self.state.current_iteration.current_level_index)
 
             # coarse correction
             # TODO: correct RHS evaluations; not values
@@ -606,8 +708,7 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
                 _current_level[_step_index].intermediate.value = _corrected_values[_step_index + 1]
 
             # LOG.debug("Recompute Errors")
-            for _step_index in range(0, len(_current_level)):
-                self._core.compute_error(self.state, step_index=_step_index, problem=self.problem)
+            self._compute_level_errors()
 
             # post-sweep
             LOG.debug("post-sweep with coarse-corrected intermediate")
@@ -633,9 +734,10 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         self._compute_residual(finalize=True)
 
-        self.comm.send(tag=self.state.current_level_index,
-                       value=_current_level.final_step.value,
-                       time_point=_current_level.final_step.time_point)
+        with self._instrumentation.timing('send'):
+            self.comm.send(tag=self.state.current_level_index,
+                           value=_current_level.final_step.value,
+                           time_point=_current_level.final_step.time_point)
 
         self._print_level_end()
 
@@ -646,6 +748,17 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
             # pass on to next finer level
             self.state.current_iteration.step_up()
 
+    def _receive_initial_value(self):
+        # the previous solver's value at the end of its interval is the initial value of the current level
+        _current_level = self.state.current_iteration.current_level
+        with self._instrumentation.timing('receive'):
+            _msg = self.comm.receive(tag=self.state.current_level_index)
+        if _msg and np.isclose(_msg.time_point, self.state.initial.time_point):
+            _current_level.initial.definalize()
+            _current_level.initial.value = _msg.value
+            _current_level.initial.done()
+
+    @timed('sweep')
     def _sdc_sweep(self, use_intermediate=False, copy=True, with_residual=False):
         """
         Parameters
@@ -664,71 +777,33 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         # compute integral
         self.state.current_iteration.current_level.integral = 0.0
 
-        if not self.state.current_iteration.current_level.initial.rhs_evaluated:
-            self.state.current_iteration.current_level.initial.rhs = \
-                self.problem.evaluate_wrt_time(self.state.current_iteration.current_level.initial.time_point,
-                                               self.state.current_iteration.current_level.initial.value)
-
-        _integrate_values = np.array([self.state.current_iteration.current_level.initial.rhs],
-                                     dtype=self.problem.numeric_type)
-
-        for _step_index in range(0, len(self.state.current_iteration.current_level)):
-            # TODO: clean up this conditional
-            if self.state.current_iteration.on_finest_level and self.state.is_first_iteration and not use_intermediate:
-                # LOG.debug("On First Iteration on Finest Level. Taking breadcasted initial value.")
-                _integrate_values = \
-                    np.append(_integrate_values,
-                              np.array([self.state.current_iteration.current_level.initial.rhs],
-                                       dtype=self.problem.numeric_type),
-                              axis=0)
-
-            elif not self.state.current_iteration.on_finest_level:
-                # LOG.debug("Not on Finest Level. Taking current intermediate value.")
-                _step = self.state.current_iteration.current_level[_step_index]
-                if use_intermediate:
-                    if not _step.intermediate.rhs_evaluated:
-                        _step.intermediate.rhs = self.problem.evaluate_wrt_time(_step.time_point,
-                                                                                _step.intermediate.value)
-                    _integrate_values = \
-                        np.append(_integrate_values,
-                                  np.array([_step.intermediate.rhs], dtype=self.problem.numeric_type),
-                                  axis=0)
-                else:
-                    if not _step.rhs_evaluated:
-                        _step.rhs = self.problem.evaluate_wrt_time(_step.time_point, _step.value)
-                    _integrate_values = \
-                        np.append(_integrate_values,
-                                  np.array([_step.rhs], dtype=self.problem.numeric_type),
-                                  axis=0)
-
-            elif use_intermediate:
-                # LOG.debug("On Finest Level. Using intermediate value.")
-                _step = self.state.current_iteration.current_level[_step_index]
-                if not _step.intermediate.rhs_evaluated:
-                    _step.intermediate.rhs = self.problem.evaluate_wrt_time(_step.time_point, _step.intermediate.value)
-                _integrate_values = \
-                    np.append(_integrate_values,
-                              np.array([_step.intermediate.rhs], dtype=self.problem.numeric_type),
-                              axis=0)
-
+        _level = self.state.current_iteration.current_level
+        if self.state.current_iteration.on_finest_level and self.state.is_first_iteration and not use_intermediate:
+            if self.state.predictor is not None:
+                # LOG.debug("On First Iteration on Finest Level. Taking predicted value.")
+                _steps = [self.state.predictor[_step_index] for _step_index in range(0, len(_level))]
             else:
-                # LOG.debug("On Finest Level. Taking previous iteration's value.")
-                _step = self.state.previous_iteration[self.state.current_iteration.current_level_index][_step_index]
-                if use_intermediate:
-                    if not _step.intermediate.rhs_evaluated:
-                        _step.intermediate.rhs = self.problem.evaluate_wrt_time(_step.time_point,
-                                                                                _step.intermediate.value)
-                    _integrate_values = \
-                        np.append(_integrate_values,
-                                  np.array([_step.intermediate.rhs], dtype=self.problem.numeric_type),
-                                  axis=0)
-                else:
-                    if not _step.rhs_evaluated:
-                        _step.rhs = self.problem.evaluate_wrt_time(_step.time_point, _step.value)
-                    _integrate_values = \
-                        np.append(_integrate_values,
-                                  np.array([_step.rhs], dtype=self.problem.numeric_type),
-                                  axis=0)
+                # LOG.debug("On First Iteration on Finest Level. Taking breadcasted initial value.")
+                _steps = [_level.initial] * len(_level)
+        elif use_intermediate:
+            # LOG.debug("Using intermediate value.")
+            _steps = [_level[_step_index].intermediate for _step_index in range(0, len(_level))]
+        elif not self.state.current_iteration.on_finest_level:
+            # LOG.debug("Not on Finest Level. Taking current value.")
+            _steps = [_level[_step_index] for _step_index in range(0, len(_level))]
+        else:
+            # LOG.debug("On Finest Level. Taking previous iteration's value.")
+            _steps = [self.state.previous_iteration[self.state.current_iteration.current_level_index][_step_index]
+                      for _step_index in range(0, len(_level))]
+        _steps = [_level.initial] + _steps
+        if use_intermediate:
+            # intermediate steps do not carry time points of their own
+            self._evaluate_rhs(_steps, [_level.initial.time_point] + [_level[_step_index].time_point
+                                                                      for _step_index in range(0, len(_level))])
+        else:
+            self._evaluate_rhs(_steps)
+        _integrate_values = np.array([_step.rhs for _step in _steps],
+                                     dtype=self._level_numeric_type(self.state.current_iteration.current_level_index))
 
         assert_condition(_integrate_values.shape[0] == _num_nodes,
                          ValueError, message="Number of integration values not correct: %d != %d"
@@ -742,14 +817,15 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         # else:
         #     LOG.debug("Values Before: %s" % self.state.current_iteration.current_level.values)
 
+        _integrals = _integrator.evaluate_nodes(_integrate_values, from_previous=True)
+
         # do the actual SDC steps of this SDC sweep
         for _step_index in range(0, len(self.state.current_iteration.current_level)):
             # LOG.debug("Step %d:" % _step_index)
             _current_step = self.state.current_iteration.current_level[_step_index]
             # if not _current_step.integral_available:
             # TODO: fix unneccessary recomputation of integrals
-            _current_step.integral = _integrator.evaluate(_integrate_values,
-                                                          from_node=_step_index, target_node=_step_index + 1)
+            _current_step.integral = _integrals[_step_index]
 
             # we successively compute the full integral
             # LOG.debug("  Full Integral up to %d: %s = %s + %s"
@@ -765,6 +841,8 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
 
         del _integrate_values
 
+        self._compute_level_errors()
+
         # LOG.debug("Values After: %s" % self.state.current_iteration.current_level.values)
 
         if with_residual:
@@ -780,7 +858,14 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         """
         if copy:
             # copy solution of previous iteration to this one
-            if self.state.is_first_iteration:
+            if self.state.is_first_iteration and self.state.predictor is not None \
+                    and self.state.current_iteration.on_finest_level:
+                if use_intermediate:
+                    self.state.current_step.intermediate.value = \
+                        self.state.predictor[self.state.current_step_index].value.copy()
+                else:
+                    self.state.current_step.value = self.state.predictor[self.state.current_step_index].value.copy()
+            elif self.state.is_first_iteration:
                 if use_intermediate:
                     # LOG.debug("Coppying Initial Value to step %d intermediate" % self.state.current_step_index)
                     self.state.current_step.intermediate.value = self.state.current_level.initial.value.copy()
@@ -801,8 +886,10 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         # compute step
         self._core.run(self.state, problem=self.problem, use_intermediate=use_intermediate)
 
-        # calculate error
-        self._core.compute_error(self.state, problem=self.problem)
+        _numeric_type = self.ml_provider.numeric_type(self.state.current_level_index)
+        if _numeric_type is not None and self.state.current_step.value.dtype != _numeric_type:
+            # the step is computed in the precision of the FAS correction; the level keeps its own one
+            self.state.current_step.value = self.state.current_step.value.astype(_numeric_type)
 
         # step gets finalized after computation of residual
 
@@ -810,12 +897,14 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         _lines = super(MlSdc, self).print_lines_for_log()
         return _lines
 
+    @timed('logging')
     def _print_interval_header(self):
         LOG.info("%s%s" % (VERBOSITY_LVL1, SEPARATOR_LVL3))
         LOG.info("{}  Interval: [{:.3f}, {:.3f}]"
                  .format(VERBOSITY_LVL1, self.state.initial.time_point, self.state.initial.time_point + self._dt))
         self._print_output_tree_header()
 
+    @timed('logging')
     def _print_output_tree_header(self):
         LOG.info("%s   iter" % VERBOSITY_LVL1)
         LOG.info("%s       \\" % VERBOSITY_LVL2)
@@ -825,11 +914,13 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         LOG.info("%s        |      \\_" % VERBOSITY_LVL2)
         LOG.info("%s        \\_   sol r.red    err r.red      resid       time" % VERBOSITY_LVL1)
 
+    @timed('logging')
     def _print_iteration(self, _iter):
         _iter = self._output_format(_iter, 'int', width=4)
         LOG.info("%s   %s" % (VERBOSITY_LVL1, _iter))
         LOG.info("%s       \\" % VERBOSITY_LVL2)
 
+    @timed('logging')
     def _print_level_header(self):
         _lvl = self._output_format(self.state.current_level_index, 'int', width=2)
         _nodes = self._output_format(self.ml_provider.integrator(self.state.current_level_index).num_nodes,
@@ -838,9 +929,11 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
                                                _lvl, _nodes))
         LOG.info("%s        %s|     \\" % (VERBOSITY_LVL3, ('|      ' * (self.ml_provider.num_levels - self.state.current_level_index - 1))))
 
+    @timed('logging')
     def _print_level_end(self):
         LOG.info("%s        %s|      \\_" % (VERBOSITY_LVL2, ('|      ' * (self.ml_provider.num_levels - self.state.current_level_index - 1))))
 
+    @timed('logging')
     def _print_iteration_end(self, solred, errred, resid, time):
         _solred = self._output_format(solred, 'exp')
         _errred = self._output_format(errred, 'exp')
@@ -848,6 +941,7 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
         _time = self._output_format(time, 'float', width=6.3)
         LOG.info("%s        \\_   %s    %s    %s    %s" % (VERBOSITY_LVL1, _solred, _errred, _resid, _time))
 
+    @timed('logging')
     def _print_step(self, step, t0, t1, phi, resid, err, fas=None, cc=None):
         _step = self._output_format(step, 'int', width=2)
         _t0 = self._output_format(t0, 'float', width=6.3)
@@ -861,6 +955,7 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
                  % (VERBOSITY_LVL3, ('|      ' * (self.ml_provider.num_levels - self.state.current_level_index)),
                     _step, _t0, _t1, _phi, _resid, _err, _fas, _cc))
 
+    @timed('logging')
     def _print_sweep_end(self):
         LOG.info("%s        %s|    \\_"
                  % (VERBOSITY_LVL3, ('|      ' * (self.ml_provider.num_levels - self.state.current_level_index))))
@@ -868,7 +963,7 @@ class MlSdc(IIterativeTimeSolver, IParallelSolver):
     def _output_format(self, value, _type, width=None):
         def _value_to_numeric(val):
             if isinstance(val, np.ndarray):
-                if val.size > 1 or val.dtype == np.complex:
+                if val.size > 1 or np.iscomplexobj(val):
                     return supremum_norm(val)
                 else:
                     return val[0]
@@ -6,6 +6,7 @@
 from copy import deepcopy
 import warnings as warnings
 from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
 
 import numpy as np
 
@@ -20,8 +21,11 @@ from pypint.solvers.states.sdc_solver_state import SdcSolverState
 from pypint.solvers.diagnosis import IDiagnosisValue
 from pypint.solvers.diagnosis.norms import supremum_norm
 from pypint.plugins.timers.timer_base import TimerBase
+from pypint.plugins.timers.instrumentation import timed
 from pypint.utilities.threshold_check import ThresholdCheck
-from pypint.utilities import assert_is_instance, assert_condition, func_name, assert_named_argument
+from pypint.utilities import assert_is_instance, assert_condition, func_name, assert_named_argument, assert_is_in, \
+    class_name
+from pypint.utilities.math import lagrange_polynome
 from pypint.utilities.logging import *
 
 
@@ -80,6 +84,9 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
     :py:class:`.IParallelSolver` :
         mixed-in interface
     """
+
+    predictor_types = ['spread', 'explicit_euler', 'implicit_euler', 'extrapolation']
+
     def __init__(self, **kwargs):
         super(ParallelSdc, self).__init__(**kwargs)
         IParallelSolver.__init__(self, **kwargs)
@@ -95,11 +102,24 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
             'n': np.zeros(0)
         }
         self._classic = True
+        self._q_delta_type = 'implicit_euler'
+        self._node_parallel = False
+        self._node_executor = None
+        self._predictor = 'spread'
+        self._adaptive = False
+        self._adaptivity = {
+            'tolerance': 1e-6,
+            'safety': 0.9,
+            'min_factor': 0.2,
+            'max_factor': 2.0,
+            'min_width': None,
+            'max_width': None
+        }
 
         self.__nodes_type = GaussLobattoNodes
         self.__weights_type = PolynomialWeightFunction
         self.__num_nodes = 3
-        self.__exact = np.zeros(0)
+        self.__exact = None  # exact solution at all nodes of the current interval; for each time step
         self.__time_points = {
             'steps': np.zeros(0),
             'nodes': np.zeros(0)
@@ -126,7 +146,47 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
             Flag for specifying the type of the SDC sweep.
             :py:class:`True`: *(default)* For the classic SDC as known from the literature;
             :py:class:`False`: For the modified SDC as developed by Torbjörn Klatt.
-
+        q_delta_type : :py:class:`str`
+            *(optional)*
+            Type of the preconditioner :math:`Q_\\Delta` of the implicit part of the sweeps, one of
+            :py:attr:`.SdcIntegrator.q_delta_types`.
+            Defaults to ``implicit_euler``, i.e. the classic sweep with the node distances.
+        node_parallel : :py:class:`bool` or :py:class:`concurrent.futures.Executor`
+            *(optional)*
+            Computes all nodes of a sweep concurrently (see :py:meth:`.SdcSolverCore.solve_node`).
+            This requires a diagonal :math:`Q_\\Delta` (see :py:attr:`.SdcIntegrator.diagonal_q_delta_types`) and
+            the classic SDC sweep.
+            :py:class:`True` runs the nodes on a thread pool with one thread per node, which is effective as the
+            implicit solves spend most of their time in NumPy and SciPy releasing the GIL.
+            Alternatively, any executor can be given; a process pool requires a picklable problem.
+            Defaults to :py:class:`False`.
+        predictor : :py:class:`str`
+            *(optional)*
+            Initialization of the first iteration of each interval, one of :py:attr:`.predictor_types`
+            (see :py:meth:`._predict` for details).
+            Defaults to ``spread``, i.e. the initial value is copied to all nodes.
+        adaptive : :py:class:`bool`
+            *(optional)*
+            Flag for adapting the width of the intervals to the estimated local error.
+            See :py:meth:`._adjust_interval_width` for details.
+            Defaults to :py:class:`False`.
+        error_tolerance : :py:class:`float`
+            *(optional)*
+            tolerance of the estimated local error per interval for adaptive interval widths;
+            defaults to ``1e-6``
+        safety_factor : :py:class:`float`
+            *(optional)*
+            safety factor applied to the optimal interval width;
+            defaults to ``0.9``
+        min_interval_width : :py:class:`float`
+            *(optional)*
+            lower bound for adaptive interval widths; intervals of this width are accepted regardless of their error
+            estimate;
+            defaults to :math:`\\sqrt{\\epsilon}` times the length of the problem's time interval
+        max_interval_width : :py:class:`float`
+            *(optional)*
+            upper bound for adaptive interval widths;
+            defaults to the length of the problem's time interval
 
         Raises
         ------
@@ -144,9 +204,9 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
             mixed in overridden method (with further parameters)
         """
         assert_is_instance(problem, IInitialValueProblem, descriptor="Initial Value Problem", checking_obj=self)
-        assert_condition(issubclass(integrator, IntegratorBase),
-                         ValueError, message="Integrator must be an IntegratorBase: NOT %s"
-                                             % integrator.__mro__[-2].__name__,
+        assert_condition(isinstance(integrator, IntegratorBase)
+                         or (isinstance(integrator, type) and issubclass(integrator, IntegratorBase)),
+                         ValueError, message="Integrator must be an IntegratorBase: NOT %s" % class_name(integrator),
                          checking_obj=self)
 
         super(ParallelSdc, self).init(problem, integrator=integrator, **kwargs)
@@ -173,8 +233,46 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
             assert_is_instance(kwargs['classic'], bool, descriptor="Classic Flag", checking_obj=self)
             self._classic = kwargs['classic']
 
-        # TODO: need to store the exact solution somewhere else
-        self.__exact = np.zeros(self.num_time_steps * (self.__num_nodes - 1) + 1, dtype=np.object)
+        if 'q_delta_type' in kwargs:
+            assert_condition(hasattr(self._integrator, 'q_delta'), ValueError,
+                             message="Integrator does not provide Q-Delta preconditioners: {}"
+                                     .format(class_name(self._integrator)),
+                             checking_obj=self)
+            assert_is_in(kwargs['q_delta_type'], self._integrator.q_delta_types, elem_desc="Q-Delta Type",
+                         list_desc="Valid Q-Delta Types", checking_obj=self)
+            self._q_delta_type = kwargs['q_delta_type']
+
+        if 'node_parallel' in kwargs:
+            assert_is_instance(kwargs['node_parallel'], (bool, Executor), descriptor="Node Parallel Flag",
+                               checking_obj=self)
+            if kwargs['node_parallel'] is not False:
+                assert_is_in(self._q_delta_type, self._integrator.diagonal_q_delta_types, elem_desc="Q-Delta Type",
+                             list_desc="Diagonal Q-Delta Types", checking_obj=self)
+                assert_condition(self.classic, ValueError,
+                                 message="Node parallel sweeps require the classic SDC sweep.", checking_obj=self)
+            self._node_parallel = kwargs['node_parallel']
+
+        if 'predictor' in kwargs:
+            assert_is_in(kwargs['predictor'], self.predictor_types, elem_desc="Predictor",
+                         list_desc="Valid Predictors", checking_obj=self)
+            self._predictor = kwargs['predictor']
+
+        if 'adaptive' in kwargs:
+            assert_is_instance(kwargs['adaptive'], bool, descriptor="Adaptive Flag", checking_obj=self)
+            self._adaptive = kwargs['adaptive']
+
+        for _option, _key in [('error_tolerance', 'tolerance'), ('safety_factor', 'safety'),
+                              ('min_interval_width', 'min_width'), ('max_interval_width', 'max_width')]:
+            if _option in kwargs:
+                assert_condition(kwargs[_option] > 0.0, ValueError,
+                                 message="{} must be positive: NOT {}".format(_option, kwargs[_option]),
+                                 checking_obj=self)
+                self._adaptivity[_key] = kwargs[_option]
+        _time_span = self.problem.time_end - self.problem.time_start
+        if self._adaptivity['min_width'] is None:
+            self._adaptivity['min_width'] = np.sqrt(np.finfo(float).eps) * _time_span
+        if self._adaptivity['max_width'] is None:
+            self._adaptivity['max_width'] = _time_span
 
     def run(self, core, **kwargs):
         """Applies SDC solver to the initialized problem setup.
@@ -187,7 +285,8 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
             core solver stepping method
         dt : :py:class:`float`
             width of the interval to work on; this is devided into the number of given
-            time steps this solver has been initialized with
+            time steps this solver has been initialized with;
+            for adaptive interval widths this is the width of the first interval
 
         See Also
         --------
@@ -198,42 +297,46 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         assert_named_argument('dt', kwargs, types=float, descriptor="Width of Interval", checking_obj=self)
         self._dt = kwargs['dt']
 
-        self._print_header()
+        self._instrumentation.activate()
 
-        # start iterations
-        # TODO: exact solution storage handling
-        self.__exact[0] = self.problem.initial_value
+        if self._node_parallel is True:
+            self._node_executor = ThreadPoolExecutor(max_workers=self.num_nodes - 1)
+        elif self._node_parallel is not False:
+            self._node_executor = self._node_parallel
 
-        _has_work = True
-        _previous_flag = Message.SolverFlag.none
-        _current_flag = Message.SolverFlag.none
-        __work_loop_count = 1
+        try:
+            self._print_header()
 
-        while _has_work:
-            LOG.debug("Work Loop: %d" % __work_loop_count)
-            _previous_flag = _current_flag
+            # start iterations
+            _has_work = True
+            _previous_flag = Message.SolverFlag.none
             _current_flag = Message.SolverFlag.none
-
-            # receive dedicated message
-            _msg = self._communicator.receive()
-
-            if _msg.flag == Message.SolverFlag.failed:
-                # previous solver failed
-                # --> pass on the failure and abort
-                _current_flag = Message.SolverFlag.failed
-                _has_work = False
-                LOG.debug("Previous Solver Failed")
-            else:
-                if _msg.flag == Message.SolverFlag.time_adjusted:
-                    # the previous solver has adjusted its interval
-                    # --> we need to recompute our interval
-                    _current_flag = self._adjust_interval_width()
-                    # we don't immediately start the computation of the newly computed interval
-                    # but try to pass the new interval end to the next solver as soon as possible
-                    # (this should avoid throwing away useless computation)
-                    LOG.debug("Previous Solver Adjusted Time")
+            __work_loop_count = 1
+
+            while _has_work:
+                LOG.debug("Work Loop: %d" % __work_loop_count)
+                _previous_flag = _current_flag
+                _current_flag = Message.SolverFlag.none
+
+                # receive dedicated message
+                with self._instrumentation.timing('receive'):
+                    _msg = self._communicator.receive()
+
+                if _msg.flag == Message.SolverFlag.failed:
+                    # previous solver failed
+                    # --> pass on the failure and abort
+                    _current_flag = Message.SolverFlag.failed
+                    _has_work = False
+                    LOG.debug("Previous Solver Failed")
                 else:
-                    if _previous_flag in \
+                    if _msg.flag == Message.SolverFlag.time_adjusted:
+                        # the previous solver has adjusted its interval
+                        # --> our interval starts at the new end of the previous interval and needs to be recomputed
+                        while self.state and self.state.initial.time_point >= _msg.time_point:
+                            self._states.pop()
+                        LOG.debug("Previous Solver Adjusted Time")
+
+                    if _msg.flag == Message.SolverFlag.time_adjusted or _previous_flag in \
                             [Message.SolverFlag.none, Message.SolverFlag.converged, Message.SolverFlag.finished,
                              Message.SolverFlag.time_adjusted]:
                         # we just started or finished our previous interval
@@ -242,10 +345,13 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
 
                         if _has_work:
                             # set initial values
-                            self.state.initial.solution.value = _msg.value.copy()
+                            self.state.initial.value = _msg.value.copy()
                             self.state.initial.solution.time_point = _msg.time_point
                             self.state.initial.done()
 
+                            # initialize the first iteration
+                            self._predict()
+
                             LOG.debug("New Interval Initialized")
 
                             # start logging output
@@ -253,6 +359,7 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
 
                             # start global timing (per interval)
                             self.timer.start()
+                            self._emit_interval_start_event(len(self._states) - 1, self._dt)
                         else:
                             # pass
                             LOG.debug("No New Interval Available")
@@ -273,7 +380,7 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
                             if _previous_flag == Message.SolverFlag.iterating:
                                 LOG.debug("Updating initial value")
                                 # if the previous solver has a new initial value for us, we use it
-                                self.state.current_iteration.initial.solution.value = _msg.value.copy()
+                                self.state.current_iteration.initial.value = _msg.value.copy()
 
                         _current_flag = self._main_solver_loop()
 
@@ -310,6 +417,11 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
                                 LOG.warn("  {} Failed: Maximum number iterations reached without convergence."
                                          .format(self._core.name))
                             print_logging_message_tree(_log_msgs)
+                            self._emit_interval_end_event(len(self._states) - 1)
+
+                        if self._adaptive and _current_flag in \
+                                [Message.SolverFlag.converged, Message.SolverFlag.finished]:
+                            _current_flag = self._adjust_interval_width(_current_flag)
                     elif _previous_flag in [Message.SolverFlag.converged, Message.SolverFlag.finished]:
                         LOG.debug("Solver Finished.")
 
@@ -322,13 +434,28 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
                         LOG.warn("Solver failed.")
                         _current_flag = Message.SolverFlag.failed
 
-            self._communicator.send(value=self.state.current_iteration.final_step.solution.value,
-                                    time_point=self.state.current_iteration.final_step.time_point,
-                                    flag=_current_flag)
-            __work_loop_count += 1
-
-        # end while:has_work is None
-        LOG.debug("Solver Main Loop Done")
+                with self._instrumentation.timing('send'):
+                    if _current_flag == Message.SolverFlag.time_adjusted:
+                        # the interval gets recomputed with the adjusted width starting from its initial value
+                        self._communicator.send(value=self.state.initial.value,
+                                                time_point=self.state.initial.time_point,
+                                                flag=_current_flag)
+                    else:
+                        # a finalized state resets its current iteration to the first one
+                        self._communicator.send(value=self.state.last_iteration.final_step.solution.value,
+                                                time_point=self.state.last_iteration.final_step.time_point,
+                                                flag=_current_flag)
+                __work_loop_count += 1
+
+            # end while:has_work is None
+            LOG.debug("Solver Main Loop Done")
+        finally:
+            # also shut down the worker threads if the solver raised
+            if self._node_parallel is True:
+                self._node_executor.shutdown()
+            self._node_executor = None
+
+            self._instrumentation.deactivate()
 
         return [_s.solution for _s in self._states]
 
@@ -367,6 +494,37 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         """
         return self.__num_nodes
 
+    @property
+    def predictor(self):
+        """Read-only accessor for the type of the predictor
+
+        Returns
+        -------
+        predictor : :py:class:`str`
+            one of :py:attr:`.predictor_types`
+        """
+        return self._predictor
+
+    @property
+    def adaptive(self):
+        """Read-only accessor for the adaptivity of the interval widths
+
+        Returns
+        -------
+        is_adaptive : :py:class:`bool`
+        """
+        return self._adaptive
+
+    @property
+    def interval_width(self):
+        """Read-only accessor for the width of the current (or next, if adaptive) interval
+
+        Returns
+        -------
+        interval_width : :py:class:`float`
+        """
+        return self._dt
+
     @property
     def classic(self):
         """Read-only accessor for the type of SDC
@@ -387,7 +545,8 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         """
         if self.state:
             # finalize the current state
-            self.state.finalize()
+            with self._instrumentation.timing('finalize'):
+                self.state.finalize()
 
         # initialize solver state
         self._states.append(SdcSolverState(num_nodes=self.num_nodes - 1, num_time_steps=self.num_time_steps))
@@ -409,7 +568,12 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         """
         assert_is_instance(start, float, descriptor="Time Point", checking_obj=self)
 
-        if start + self._dt > self.problem.time_end:
+        if self._adaptive:
+            # the last interval is shortened to end exactly at the end of time given by problem
+            if self.problem.time_end - start <= np.finfo(float).eps * max(1.0, abs(self.problem.time_end)):
+                return False
+            self._dt = min(self._dt, self.problem.time_end - start)
+        elif start + self._dt > self.problem.time_end and not np.isclose(start + self._dt, self.problem.time_end):
             return False
 
         if self.state and start == self.state.initial.time_point:
@@ -427,9 +591,13 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         self.__time_points['steps'] = np.linspace(start, start + self._dt, self.num_time_steps + 1)
 
         # initialize and transform integrator for time step width
-        self._integrator.init(self.__nodes_type, self.__num_nodes, self.__weights_type,
-                              interval=np.array([self.__time_points['steps'][0], self.__time_points['steps'][1]],
-                                                dtype=np.float))
+        _interval = np.array([self.__time_points['steps'][0], self.__time_points['steps'][1]], dtype=np.float)
+        if self._integrator_matches_setup():
+            # the integrator is already set up (e.g. by a previous interval or another solver sharing it)
+            # --> only shift it onto the new time step; its matrices are reused for an unchanged width
+            self._integrator.transform_interval(_interval)
+        else:
+            self._integrator.init(self.__nodes_type, self.__num_nodes, self.__weights_type, interval=_interval)
 
         self.__time_points['nodes'] = np.zeros((self.num_time_steps, self.num_nodes), dtype=np.float)
         _deltas_n = np.zeros(self.num_time_steps * (self.num_nodes - 1) + 1)
@@ -445,31 +613,164 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
                 _deltas_n[_i + 1] = _nodes.nodes[_n + 1] - _nodes.nodes[_n]
         self._deltas['n'] = _deltas_n[1:].copy()
 
+        self.__exact = self._exact_values(self.__time_points['nodes'])
+
         return True
 
-    def _adjust_interval_width(self):
-        """Adjust width of time interval
+    def _integrator_matches_setup(self):
+        """Whether the integrator has already been initialized with this solver's nodes and weights function
+
+        Weights functions given with options (i.e. as a :py:class:`dict`) are never considered to match.
         """
-        raise NotImplementedError("Time Adaptivity not yet implemented.")
-        # return Message.SolverFlag.time_adjusted
+        return self._integrator.nodes_type is not None \
+            and type(self._integrator.nodes_type) is self.__nodes_type \
+            and self._integrator.num_nodes == self.__num_nodes \
+            and isinstance(self.__weights_type, type) \
+            and type(self._integrator.weights_function) is self.__weights_type
+
+    def _adjust_interval_width(self, flag):
+        """Adjust width of time interval based on an embedded error estimate
+
+        The local error of the current interval is estimated by the difference of the values at the end of the
+        interval of the last two iterations, where the first iteration is compared to the predicted value (or the
+        initial value for the ``spread`` predictor).
+        With :math:`k` iterations this estimates the local error of the second to last iteration, which is of order
+        :math:`p = \\min(k, 2N-1)` for :math:`N` nodes.
+        The width of the next interval is then chosen as
+
+        .. math::
+
+            \\Delta t_{new} = \\Delta t \\cdot \\min\\left(f_{max}, \\max\\left(f_{min},
+                s \\left(\\frac{tol}{err}\\right)^{1/p}\\right)\\right)
+
+        bounded by the minimum and maximum interval width.
+        If the error estimate exceeds the tolerance, the current interval is rejected and must be recomputed with the
+        reduced width.
+
+        Parameters
+        ----------
+        flag : :py:class:`.Message.SolverFlag`
+            flag of the current (converged or finished) interval
+
+        Returns
+        -------
+        flag : :py:class:`.Message.SolverFlag`
+            :py:attr:`.Message.SolverFlag.time_adjusted` if the current interval got rejected;
+            the given ``flag`` otherwise
+        """
+        if self.state.last_iteration_index > 0:
+            _previous_value = self.state[self.state.last_iteration_index - 1].final_step.value
+        elif self.state.predictor is not None:
+            _previous_value = self.state.predictor.final_step.value
+        else:
+            _previous_value = self.state.initial.value
+        _error = supremum_norm(self.state.last_iteration.final_step.value - _previous_value)
+        _order = min(self.state.last_iteration_index + 1, 2 * self.num_nodes - 1)
+
+        if _error > 0.0:
+            _factor = self._adaptivity['safety'] * (self._adaptivity['tolerance'] / _error) ** (1.0 / _order)
+            _factor = min(self._adaptivity['max_factor'], max(self._adaptivity['min_factor'], _factor))
+        else:
+            _factor = self._adaptivity['max_factor']
+        _width = self.state.delta_interval
+        self._dt = min(self._adaptivity['max_width'], max(self._adaptivity['min_width'], _factor * _width))
+
+        if _error > self._adaptivity['tolerance'] and _width > self._adaptivity['min_width']:
+            LOG.info("{}  Rejected Interval: error estimate {:.3e} > {:.3e}; new width: {:.3e}"
+                     .format(VERBOSITY_LVL1, _error, self._adaptivity['tolerance'], self._dt))
+            return Message.SolverFlag.time_adjusted
+        else:
+            LOG.info("{}  Accepted Interval: error estimate {:.3e}; next width: {:.3e}"
+                     .format(VERBOSITY_LVL1, _error, self._dt))
+            return flag
+
+    def _predict(self):
+        """Computes the values the first iteration of the current interval starts from
+
+        Depending on the chosen predictor (see :py:attr:`.predictor_types`) the values at the nodes are
+
+        ``spread``
+            the initial value of the interval at all nodes; no :py:attr:`.ISolverState.predictor` is set
+
+        ``explicit_euler``
+            a sweep of the explicit Euler method from node to node,
+            :math:`u_{m+1} = u_m + \\Delta_\\tau F(t_m, u_m)`
+
+        ``implicit_euler``
+            a sweep of the Euler method of the core (see :py:meth:`.SdcSolverCore.solve_node`), i.e. implicit Euler for
+            the implicit core and the IMEX Euler for the semi-implicit core,
+            :math:`u_{m+1} - \\Delta_\\tau F_I(t_{m+1}, u_{m+1}) = u_m + \\Delta_\\tau F_E(t_{m+1}, u_m)`
+
+        ``extrapolation``
+            the collocation polynomial of the last time step of the previous interval evaluated at the nodes, shifted
+            to match the initial value of the current interval;
+            falls back to ``spread`` if this solver did not compute the directly preceding interval (e.g. on the
+            first interval or when working on every :math:`P`-th interval in a pipeline of :math:`P` solvers)
+        """
+        if self._predictor == 'spread':
+            return
+
+        if self._predictor == 'extrapolation':
+            if len(self._states) < 2 \
+                    or not np.isclose(self._states[-2].last_iteration.final_step.time_point,
+                                      self.state.initial.time_point):
+                return
+            # base points of the collocation polynomial of the previous interval's last time step
+            _last_time_step = self._states[-2].last_iteration.last_time_step
+            _base_points = np.array([_last_time_step.initial.time_point]
+                                    + [_step.time_point for _step in _last_time_step], dtype=np.float)
+            _base_values = np.array([_last_time_step.initial.value] + [_step.value for _step in _last_time_step],
+                                    dtype=self.problem.numeric_type)
+            _extrapolate = lambda t: \
+                np.tensordot(np.array([lagrange_polynome(_j, _base_points, t) for _j in range(0, _base_points.size)]),
+                             _base_values, axes=([0], [0]))
+            _shift = self.state.initial.value - _extrapolate(self.state.initial.time_point)
+
+        _predictor = self.state.init_predictor()
+
+        for _time_step_index in range(0, self.num_time_steps):
+            _time_step = _predictor[_time_step_index]
+            for _step_index in range(0, len(_time_step)):
+                _step = _time_step[_step_index]
+                _step.delta_tau = self._deltas['n'][_time_step_index * (self.num_nodes - 1) + _step_index]
+                _step.solution.time_point = self.__time_points['nodes'][_time_step_index][_step_index + 1]
+                _previous = _time_step[_step_index - 1] if _step_index > 0 else _time_step.initial
+
+                if self._predictor == 'extrapolation':
+                    _step.value = _extrapolate(_step.time_point) + _shift
+                elif self._predictor == 'explicit_euler':
+                    if not _previous.rhs_evaluated:
+                        _previous.rhs = self.problem.evaluate_wrt_time(_previous.time_point, _previous.value)
+                    _step.value = _previous.value + _step.delta_tau * _previous.rhs
+                else:
+                    # with the explicit term evaluated at the previous value the core's node solve is an Euler step
+                    _step.value = \
+                        self._core.solve_node(self.problem, _previous.value, _previous.value, _step.time_point,
+                                              _step.delta_tau,
+                                              _step.delta_tau * self.problem.evaluate_wrt_time(_step.time_point,
+                                                                                               _previous.value))
 
     def _main_solver_loop(self):
         # initialize iteration timer of same type as global timer
         _iter_timer = self.timer.__class__()
+        self._instrumentation.set_context(interval=len(self._states) - 1,
+                                          iteration=self.state.current_iteration_index)
 
         self._print_iteration(self.state.current_iteration_index + 1)
 
         # iterate on time steps
         _iter_timer.start()
-        for _current_time_step in self.state.current_iteration:
-            # run this time step
-            self._time_step()
-            if self.state.current_time_step_index < len(self.state.current_iteration) - 1:
-                self.state.current_iteration.proceed()
+        with self._instrumentation.timing('iteration'):
+            for _current_time_step in self.state.current_iteration:
+                # run this time step
+                self._time_step()
+                if self.state.current_time_step_index < len(self.state.current_iteration) - 1:
+                    self.state.current_iteration.proceed()
         _iter_timer.stop()
 
         # check termination criteria
         self.threshold.check(self.state)
+        self._emit_iteration_event(len(self._states) - 1, _iter_timer.past())
 
         # log this iteration's summary
         if self.state.is_first_iteration:
@@ -489,7 +790,8 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
                                           _iter_timer.past())
 
         # finalize this iteration (i.e. TrajectorySolutionData.finalize())
-        self.state.current_iteration.finalize()
+        with self._instrumentation.timing('finalize'):
+            self.state.current_iteration.finalize()
 
         _reason = self.threshold.has_reached()
         if _reason is None:
@@ -497,13 +799,16 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
             return Message.SolverFlag.iterating
         elif _reason == ['iterations']:
             # LOG.debug("solver main loop done: iterations")
-            self.state.finalize()
+            with self._instrumentation.timing('finalize'):
+                self.state.finalize()
             return Message.SolverFlag.finished
         else:
             # LOG.debug("solver main loop done: other")
-            self.state.finalize()
+            with self._instrumentation.timing('finalize'):
+                self.state.finalize()
             return Message.SolverFlag.converged
 
+    @timed('sweep')
     def _time_step(self):
         self.state.current_time_step.delta_time_step = self._deltas['t']
         for _step in range(0, len(self.state.current_time_step)):
@@ -521,26 +826,16 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         _integral = 0.0
         _integrate_values = None
         if self.classic:
-            if not self.state.current_time_step.initial.rhs_evaluated:
-                self.state.current_time_step.initial.rhs = \
-                    self.problem.evaluate_wrt_time(self.state.current_time_step.initial.time_point,
-                                                   self.state.current_time_step.initial.value)
-
-            _integrate_values = np.array([self.state.current_time_step.initial.rhs], dtype=self.problem.numeric_type)
+            _previous_iteration = \
+                self.state.predictor if self.state.is_first_iteration else self.state.previous_iteration
+            _steps = [self.state.current_time_step.initial]
             for _step_index in range(0, len(self.state.current_time_step)):
-                if self.state.is_first_iteration:
-                    _integrate_values = \
-                        np.append(_integrate_values,
-                                  np.array([self.state.current_time_step.initial.rhs], dtype=self.problem.numeric_type),
-                                  axis=0)
+                if _previous_iteration is None:
+                    _steps.append(self.state.current_time_step.initial)
                 else:
-                    _step = self.state.previous_iteration[self.state.current_time_step_index][_step_index]
-                    if not _step.rhs_evaluated:
-                        _step.rhs = self.problem.evaluate_wrt_time(_step.time_point, _step.value)
-                    _integrate_values = \
-                        np.append(_integrate_values,
-                                  np.array([_step.rhs], dtype=self.problem.numeric_type),
-                                  axis=0)
+                    _steps.append(_previous_iteration[self.state.current_time_step_index][_step_index])
+            self._evaluate_rhs(_steps)
+            _integrate_values = np.array([_step.rhs for _step in _steps], dtype=self.problem.numeric_type)
 
             assert_condition(_integrate_values.shape[0] == self.num_nodes,
                              ValueError, message="Number of integration values not correct: {:d} != {:d}"
@@ -549,22 +844,32 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
 
         _full_integral = 0.0
 
-        # do the actual SDC steps of this SDC sweep
-        for _step_index in range(0, len(self.state.current_time_step)):
-            _current_step = self.state.current_time_step[_step_index]
-            if self.classic:
-                _integral = self._integrator.evaluate(_integrate_values,
-                                                      from_node=_step_index, target_node=_step_index + 1)
-                # we successively compute the full integral, which is used for the residual at the end
-                _full_integral += _integral
-            _current_step.integral = _integral.copy()
-            # do the SDC step of this sweep
-            self._sdc_step()
-            if self.state.current_step_index < len(self.state.current_time_step) - 1:
-                self.state.current_time_step.proceed()
+        if self._node_executor is not None:
+            # with a diagonal Q-Delta all nodes of this sweep are independent
+            _full_integral = self._node_parallel_sweep(_integrate_values)
+        else:
+            # do the actual SDC steps of this SDC sweep
+            for _step_index in range(0, len(self.state.current_time_step)):
+                _current_step = self.state.current_time_step[_step_index]
+                if self.classic:
+                    _integral = self._integrator.evaluate(_integrate_values,
+                                                          from_node=_step_index, target_node=_step_index + 1)
+                    # we successively compute the full integral, which is used for the residual at the end
+                    _full_integral += _integral
+                _current_step.integral = _integral.copy()
+                # do the SDC step of this sweep
+                self._sdc_step()
+                if self.state.current_step_index < len(self.state.current_time_step) - 1:
+                    self.state.current_time_step.proceed()
 
         del _integrate_values
 
+        # errors of all steps of this time step at once
+        self._core.compute_error(self.state, problem=self.problem,
+                                 steps=list(self.state.current_time_step),
+                                 exact=self.__exact[self.state.current_time_step_index, 1:]
+                                 if self.__exact is not None else None)
+
         # compute residual and print step details
         for _step_index in range(0, len(self.state.current_time_step)):
             _step = self.state.current_time_step[_step_index]
@@ -597,7 +902,60 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         self._print_time_step_end()
 
         # finalizing the current time step (i.e. TrajectorySolutionData.finalize)
-        self.state.current_time_step.finalize()
+        with self._instrumentation.timing('finalize'):
+            self.state.current_time_step.finalize()
+
+    def _node_parallel_sweep(self, integrate_values):
+        """Computes all nodes of the current time step concurrently
+
+        Parameters
+        ----------
+        integrate_values : :py:class:`numpy.ndarray`
+            right hand side evaluations of the previous iteration
+
+        Returns
+        -------
+        full_integral : :py:class:`numpy.ndarray`
+            integral over the whole time step
+        """
+        _q_delta = self._integrator.q_delta(self._q_delta_type)
+        _time_step = self.state.current_time_step
+
+        # the worker threads record into forks of the instrumentation, which are joined into the running sweep timer
+        _forks = []
+        _futures = []
+        for _step_index in range(0, len(_time_step)):
+            _step = _time_step[_step_index]
+            _step.integral = self._integrator.evaluate(integrate_values,
+                                                       from_node=_step_index, target_node=_step_index + 1)
+            if not self.state.is_first_iteration:
+                _previous_value = self.state.previous_iteration[self.state.current_time_step_index][_step_index].value
+            elif self.state.predictor is not None:
+                _previous_value = self.state.predictor[self.state.current_time_step_index][_step_index].value
+            else:
+                _previous_value = self.state.initial.value
+            _forks.append(self._instrumentation.fork())
+            _futures.append(
+                self._node_executor.submit(self._solve_node, _forks[-1],
+                                           _time_step.initial.value, _previous_value, _step.time_point,
+                                           _q_delta[_step_index + 1, _step_index + 1],
+                                           self._integrator.evaluate(integrate_values, target_node=_step_index + 1)))
+
+        for _step_index in range(0, len(_time_step)):
+            _time_step[_step_index].value = _futures[_step_index].result()
+            self._instrumentation.join(_forks[_step_index])
+            if self.state.current_step_index < len(_time_step) - 1:
+                _time_step.proceed()
+
+        return self._integrator.evaluate(integrate_values, target_node=len(_time_step))
+
+    def _solve_node(self, instrumentation, *args):
+        # runs in a worker thread of the node-parallel sweeps
+        instrumentation.activate()
+        try:
+            return self._core.solve_node(self.problem, *args)
+        finally:
+            instrumentation.deactivate()
 
     def _sdc_step(self):
         # helper variables
@@ -606,7 +964,11 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
 
         # copy solution of previous iteration to this one
         if self.state.is_first_iteration:
-            self.state.current_step.value = self.state.initial.value.copy()
+            if self.state.predictor is not None:
+                self.state.current_step.value = \
+                    self.state.predictor[_current_time_step_index][_current_step_index].value.copy()
+            else:
+                self.state.current_step.value = self.state.initial.value.copy()
         else:
             self.state.current_step.value = \
                 self.state.previous_iteration[_current_time_step_index][_current_step_index].value.copy()
@@ -660,10 +1022,14 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         # # END if not self.classic
 
         # compute step
-        self._core.run(self.state, problem=self.problem)
-
-        # calculate error
-        self._core.compute_error(self.state, problem=self.problem)
+        if self._q_delta_type == 'implicit_euler':
+            self._core.run(self.state, problem=self.problem)
+        else:
+            # row differences of Q-Delta up to the current node (in the integrator's 0-based node indexing)
+            _q_delta = self._integrator.q_delta(self._q_delta_type)
+            _node = _current_step_index + 1
+            self._core.run(self.state, problem=self.problem,
+                           q_delta=_q_delta[_node, :_node + 1] - _q_delta[_node - 1, :_node + 1])
 
         # step gets finalized after computation of residual
 
@@ -675,12 +1041,14 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
             _lines['Integrator']['Number Time Steps'] = "%d" % self._num_time_steps
         return _lines
 
+    @timed('logging')
     def _print_interval_header(self):
         LOG.info("%s%s" % (VERBOSITY_LVL1, SEPARATOR_LVL3))
         LOG.info("{}  Interval: [{:.3f}, {:.3f}]"
                  .format(VERBOSITY_LVL1, self.state.initial.time_point, self.state.initial.time_point + self._dt))
         self._print_output_tree_header()
 
+    @timed('logging')
     def _print_output_tree_header(self):
         LOG.info("%s   iter" % VERBOSITY_LVL1)
         LOG.info("%s        \\" % VERBOSITY_LVL2)
@@ -690,11 +1058,13 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         LOG.info("%s         |      \\_" % VERBOSITY_LVL2)
         LOG.info("%s         \\_   sol r.red    err r.red      resid       time" % VERBOSITY_LVL1)
 
+    @timed('logging')
     def _print_iteration(self, _iter):
         _iter = self._output_format(_iter, 'int', width=5)
         LOG.info("%s   %s" % (VERBOSITY_LVL1, _iter))
         LOG.info("%s        \\" % VERBOSITY_LVL2)
 
+    @timed('logging')
     def _print_iteration_end(self, solred, errred, resid, time):
         _solred = self._output_format(solred, 'exp')
         _errred = self._output_format(errred, 'exp')
@@ -702,6 +1072,7 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
         _time = self._output_format(time, 'float', width=6.3)
         LOG.info("%s         \\_   %s    %s    %s    %s" % (VERBOSITY_LVL1, _solred, _errred, _resid, _time))
 
+    @timed('logging')
     def _print_time_step(self, time_step, start, end, delta):
         _time_step = self._output_format(time_step, 'int', width=3)
         _start = self._output_format(start, 'float', width=6.3)
@@ -713,9 +1084,11 @@ class ParallelSdc(IIterativeTimeSolver, IParallelSolver):
                          supremum_norm(self.state.current_time_step.initial.solution.value),
                          None, None)
 
+    @timed('logging')
     def _print_time_step_end(self):
         LOG.info("%s         |      \\_" % VERBOSITY_LVL2)
 
+    @timed('logging')
     def _print_step(self, step, t0, t1, phi, resid, err):
         _step = self._output_format(step, 'int', width=2)
         _t0 = self._output_format(t0, 'float', width=6.3)
@@ -0,0 +1,253 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import pickle
+
+import numpy as np
+
+from pypint.communicators.forward_sending_messaging import ForwardSendingMessaging
+from pypint.integrators.sdc_integrator import SdcIntegrator
+from pypint.problems import IInitialValueProblem
+from pypint.solvers.parallel_sdc import ParallelSdc
+from pypint.solvers.cores.i_solver_core import ISolverCore
+from pypint.solvers.cores.explicit_sdc_core import ExplicitSdcCore
+from pypint.solvers.diagnosis.norms import supremum_norm
+from pypint.utilities.threshold_check import ThresholdCheck
+from pypint.utilities import assert_is_instance, assert_condition, assert_named_argument, class_name
+from pypint.utilities.logging import LOG
+
+
+class _Propagator(object):
+    """Propagates a value over a single time slice with :py:class:`.ParallelSdc`
+
+    All time slices share one :py:class:`.SdcIntegrator`.
+    As the time slices are of equal width, its integration matrices are computed only once and are reused by all
+    following slices (see :py:meth:`.ParallelSdc._integrator_matches_setup`).
+    """
+    def __init__(self, problem, options):
+        self._problem = problem
+        self._core = options['core']
+        self._options = dict((_key, _value) for _key, _value in options.items() if _key != 'core')
+        self._integrator = SdcIntegrator()
+
+    def propagate(self, value, time_start, dt):
+        _comm = ForwardSendingMessaging()
+        # the final value is sent to a separate communicator, thus the solver stops after this time slice
+        _result = ForwardSendingMessaging()
+        _comm.link_solvers(previous=_comm, next=_result)
+        _comm.write_buffer(value=value.copy(), time_point=time_start)
+        _solver = ParallelSdc(communicator=_comm)
+        _solver.init(problem=self._problem, integrator=self._integrator, **self._options)
+        _solver.run(self._core, dt=dt)
+        return _result.buffer.value.copy()
+
+
+_FINE_PROPAGATOR = (None, None)
+"""Pickled and unpickled fine propagator of a process of the pool of :py:meth:`.Parareal.run`
+"""
+
+
+def _propagate_fine(propagator, value, time_start, dt):
+    # the propagator is unpickled on the first task of a run only, thus the process keeps its integrator
+    global _FINE_PROPAGATOR
+    if _FINE_PROPAGATOR[0] != propagator:
+        _FINE_PROPAGATOR = (propagator, pickle.loads(propagator))
+    return _FINE_PROPAGATOR[1].propagate(value, time_start, dt)
+
+
+class Parareal(object):
+    """*Parareal* with :py:class:`.ParallelSdc` as fine and coarse propagators
+
+    The time interval of the problem is split into consecutive time slices of equal width.
+    Starting from a serial prediction with the coarse propagator :math:`\\mathcal{G}`, each iteration computes
+
+    .. math::
+
+        U_{n+1}^{k+1} = \\mathcal{G}(U_n^{k+1}) + \\mathcal{F}(U_n^k) - \\mathcal{G}(U_n^k)
+
+    for the values :math:`U_n` at the starts of the time slices.
+    The fine propagator :math:`\\mathcal{F}` is evaluated for all time slices concurrently in a process pool, while
+    the serial coarse correction is done in the main process.
+    Each process keeps its propagator, and thus its integrator, for all time slices and iterations.
+
+    After :math:`k` iterations the first :math:`k` time slices are exact (with respect to the fine propagator) and are
+    not propagated again.
+
+    Notes
+    -----
+    The fine propagator is pickled once per run and sent along with the tasks, thus the problem must be picklable.
+
+    Examples
+    --------
+    >>> parareal = Parareal()  # doctest: +SKIP
+    >>> parareal.init(problem=problem, fine={'core': ImplicitSdcCore, 'num_nodes': 5})  # doctest: +SKIP
+    >>> values = parareal.run(dt=0.25)  # doctest: +SKIP
+    """
+    def __init__(self):
+        self._problem = None
+        self._fine = {
+            'core': ExplicitSdcCore,
+            'num_nodes': 5
+        }
+        self._coarse = {
+            'core': ExplicitSdcCore,
+            'num_nodes': 3,
+            'threshold': ThresholdCheck(max_threshold=2, conditions=('iterations',))
+        }
+        self.threshold = ThresholdCheck(min_threshold=1e-10, max_threshold=None,
+                                        conditions=('solution reduction', 'iterations'))
+        self._num_processes = None
+        self._num_time_slices = 0
+        self._num_iterations = 0
+
+    def init(self, problem, **kwargs):
+        """Initializes Parareal with given problem and propagators
+
+        Parameters
+        ----------
+        problem : :py:class:`.IInitialValueProblem`
+        fine : :py:class:`dict`
+            *(optional)*
+            options of the fine propagator;
+            ``core`` is the :py:class:`.SdcSolverCore` class and all further options are passed on to
+            :py:meth:`.ParallelSdc.init`;
+            defaults to :py:class:`.ExplicitSdcCore` with 5 nodes and the default thresholds of :py:class:`.ParallelSdc`
+        coarse : :py:class:`dict`
+            *(optional)*
+            options of the coarse propagator (see ``fine``);
+            defaults to two sweeps of :py:class:`.ExplicitSdcCore` with 3 nodes
+        threshold : :py:class:`.ThresholdCheck`
+            *(optional)*
+            ``solution reduction`` is the maximum change of the values at the time slices' ends between two iterations
+            and ``iterations`` the maximum number of iterations;
+            at most as many iterations as time slices are done
+        num_processes : :py:class:`int`
+            *(optional)*
+            number of processes of the pool for the fine propagator;
+            defaults to the number of time slices
+
+        Raises
+        ------
+        ValueError :
+
+            * if given problem is not an :py:class:`.IInitialValueProblem`
+            * if a propagator's ``core`` is not an :py:class:`.ISolverCore`
+            * if a propagator is given an integrator or adaptive interval widths
+        """
+        assert_is_instance(problem, IInitialValueProblem, descriptor="Initial Value Problem", checking_obj=self)
+        self._problem = problem
+
+        for _name in ['fine', 'coarse']:
+            if _name in kwargs:
+                assert_is_instance(kwargs[_name], dict, descriptor="Options of {} Propagator".format(_name),
+                                   checking_obj=self)
+                _options = getattr(self, '_' + _name).copy()
+                _options.update(kwargs[_name])
+                assert_condition(isinstance(_options['core'], type) and issubclass(_options['core'], ISolverCore),
+                                 ValueError, message="The {} solver core class must be valid: NOT {}"
+                                                     .format(_name, class_name(_options['core'])),
+                                 checking_obj=self)
+                assert_condition('integrator' not in _options, ValueError,
+                                 message="The integrators of the propagators are provided by Parareal.",
+                                 checking_obj=self)
+                assert_condition(not _options.get('adaptive', False), ValueError,
+                                 message="Propagators must not adapt their interval widths.", checking_obj=self)
+                setattr(self, '_' + _name, _options)
+
+        if 'threshold' in kwargs:
+            assert_is_instance(kwargs['threshold'], ThresholdCheck, descriptor="Threshold", checking_obj=self)
+            self.threshold = kwargs['threshold']
+
+        if 'num_processes' in kwargs:
+            assert_condition(isinstance(kwargs['num_processes'], int) and kwargs['num_processes'] > 0,
+                             ValueError, message="Number of processes must be a positive integer: NOT {}"
+                                                 .format(kwargs['num_processes']),
+                             checking_obj=self)
+            self._num_processes = kwargs['num_processes']
+
+    def run(self, **kwargs):
+        """Solves the problem with Parareal
+
+        Parameters
+        ----------
+        dt : :py:class:`float`
+            width of a single time slice; must divide the time interval of the problem
+
+        Returns
+        -------
+        values : :py:class:`list` of :py:class:`numpy.ndarray`
+            the values at the ends of the time slices
+
+        Raises
+        ------
+        ValueError :
+
+            * if ``dt`` does not divide the time interval of the problem
+        """
+        assert_named_argument('dt', kwargs, types=float, descriptor="Width of Time Slice", checking_obj=self)
+        _dt = kwargs['dt']
+        _time_span = self._problem.time_end - self._problem.time_start
+        self._num_time_slices = int(round(_time_span / _dt))
+        assert_condition(self._num_time_slices > 0 and np.isclose(self._num_time_slices * _dt, _time_span),
+                         ValueError, message="Width of time slices must divide the time interval: {} / {}"
+                                             .format(_time_span, _dt),
+                         checking_obj=self)
+        _num_slices = self._num_time_slices
+        _starts = [self._problem.time_start + _n * _dt for _n in range(0, _num_slices)]
+        _max_iterations = _num_slices if self.threshold.max_iterations is None \
+            else min(_num_slices, self.threshold.max_iterations)
+
+        LOG.info("Starting Parareal with {:d} time slices".format(_num_slices))
+        _coarse = _Propagator(self._problem, self._coarse)
+        _values = [self._problem.initial_value.copy()] + [None] * _num_slices
+        _coarse_values = [None] * (_num_slices + 1)
+        for _n in range(0, _num_slices):
+            _coarse_values[_n + 1] = _coarse.propagate(_values[_n], _starts[_n], _dt)
+            _values[_n + 1] = _coarse_values[_n + 1].copy()
+
+        self._num_iterations = 0
+        _fine = pickle.dumps(_Propagator(self._problem, self._fine))
+        with ProcessPoolExecutor(max_workers=self._num_processes or _num_slices) as _executor:
+            while self._num_iterations < _max_iterations:
+                # the first time slices are exact already
+                _first = self._num_iterations
+                _fine_values = list(_executor.map(_propagate_fine, repeat(_fine), _values[_first:_num_slices],
+                                                  _starts[_first:], repeat(_dt)))
+                _reduction = 0.0
+                for _n in range(_first, _num_slices):
+                    _coarse_value = _coarse.propagate(_values[_n], _starts[_n], _dt)
+                    _value = _coarse_value + _fine_values[_n - _first] - _coarse_values[_n + 1]
+                    _reduction = max(_reduction, supremum_norm(_value - _values[_n + 1]))
+                    _coarse_values[_n + 1] = _coarse_value
+                    _values[_n + 1] = _value
+                self._num_iterations += 1
+                LOG.info("Parareal iteration {:d}: solution reduction {:.3e}".format(self._num_iterations, _reduction))
+
+                if self.threshold.min_solution_reduction is not None \
+                        and _reduction <= self.threshold.min_solution_reduction:
+                    break
+
+        return _values[1:]
+
+    @property
+    def num_time_slices(self):
+        """Read-only accessor for the number of time slices of the last run
+        """
+        return self._num_time_slices
+
+    @property
+    def num_iterations(self):
+        """Read-only accessor for the number of Parareal iterations of the last run
+        """
+        return self._num_iterations
+
+    @property
+    def problem(self):
+        return self._problem
+
+
+__all__ = ['Parareal']
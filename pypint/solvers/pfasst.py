@@ -0,0 +1,232 @@
+# coding=utf-8
+"""
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from multiprocessing import Process, Queue
+import queue
+import time
+import traceback
+
+import numpy as np
+
+from pypint.communicators.message import Message
+from pypint.communicators.pipeline_messaging import PipelineMessaging
+from pypint.multi_level_providers.multi_time_level_provider import MultiTimeLevelProvider
+from pypint.problems import IInitialValueProblem
+from pypint.solvers.ml_sdc import MlSdc
+from pypint.solvers.cores.i_solver_core import ISolverCore
+from pypint.utilities import assert_is_instance, assert_condition, assert_named_argument, assert_is_in, class_name
+from pypint.utilities.logging import LOG
+
+
+def _run_time_slice(rank, problem, ml_provider, core, dt, time_start, options, previous_queue, next_queue, results):
+    """Runs :py:class:`.MlSdc` on a single time slice of a :py:class:`.Pfasst` run
+
+    This is the target of the processes spawned by :py:meth:`.Pfasst.run`.
+    """
+    _comm = PipelineMessaging(blocking_tags=[0])
+    _comm.link_solvers(previous=previous_queue, next=next_queue)
+    # until the previous solver sends its values the initial value of the problem is used on all levels
+    for _level in range(0, ml_provider.num_levels):
+        _comm.write_buffer(tag=_level, value=problem.initial_value.copy(), time_point=time_start)
+
+    try:
+        _solver = MlSdc(communicator=_comm)
+        _solver.init(problem=problem, ml_provider=ml_provider, num_predictor_sweeps=rank + 1, **options)
+        _solution = _solver.run(core, dt=dt)
+        results.put((rank, _solution, None))
+    except Exception:
+        # release the following solvers from waiting for this one
+        _comm.send(value=problem.initial_value, time_point=time_start, flag=Message.SolverFlag.failed)
+        results.put((rank, None, traceback.format_exc()))
+
+
+class Pfasst(object):
+    """*Parallel Full Approximation Scheme in Space and Time* built on :py:class:`.MlSdc`
+
+    The time interval of the problem is split into consecutive time slices of equal width.
+    Each time slice is solved by its own :py:class:`.MlSdc` solver in a separate process.
+    Neighbouring solvers are linked by :py:class:`.PipelineMessaging` communicators, where the level index is the tag
+    of a message:
+
+    * values on the coarsest level are received in order and waited for, i.e. the coarse sweeps are pipelined
+      through the time slices,
+    * values on all finer levels are received without waiting, using the latest value of the previous time slice.
+
+    The first iteration of each time slice starts from the pipelined ``coarse`` predictor, where the :math:`p`-th time
+    slice does :math:`p` sweeps on the coarsest level (see :py:meth:`.MlSdc._predict`).
+    A time slice does not terminate on its thresholds (except for the maximum number of iterations) before the previous
+    time slice has terminated.
+
+    Notes
+    -----
+    The problem, the multi-level provider and the solver core are passed to the processes.
+    With a start method other than ``fork`` (e.g. on Windows) they must be picklable.
+
+    Examples
+    --------
+    >>> pfasst = Pfasst()  # doctest: +SKIP
+    >>> pfasst.init(problem=problem, ml_provider=ml_provider, threshold=threshold)  # doctest: +SKIP
+    >>> solutions = pfasst.run(SemiImplicitMlSdcCore, dt=0.25)  # doctest: +SKIP
+    """
+
+    _poll_interval = 0.5
+    """Seconds to wait for a result before checking whether the processes are still alive
+    """
+
+    def __init__(self):
+        self._problem = None
+        self._ml_provider = None
+        self._solver_options = {}
+        self._num_time_slices = 0
+
+    def init(self, problem, **kwargs):
+        """Initializes PFASST with given problem and multi-level provider
+
+        Parameters
+        ----------
+        problem : :py:class:`.IInitialValueProblem`
+        ml_provider : :py:class:`.MultiTimeLevelProvider`
+            *(required)*
+            levels of the :py:class:`.MlSdc` solvers
+        predictor : :py:class:`str`
+            *(optional)*
+            predictor of the :py:class:`.MlSdc` solvers;
+            defaults to ``coarse``
+
+        All further options (e.g. ``threshold``) are passed on to :py:meth:`.MlSdc.init` of each time slice.
+
+        Raises
+        ------
+        ValueError :
+
+            * if given problem is not an :py:class:`.IInitialValueProblem`
+            * if no :py:class:`.MultiTimeLevelProvider` is given
+        """
+        assert_is_instance(problem, IInitialValueProblem, descriptor="Initial Value Problem", checking_obj=self)
+        assert_named_argument('ml_provider', kwargs, types=MultiTimeLevelProvider,
+                              descriptor='Multi Time Level Provider', checking_obj=self)
+        self._problem = problem
+        self._ml_provider = kwargs['ml_provider']
+        del kwargs['ml_provider']
+
+        if 'predictor' not in kwargs:
+            kwargs['predictor'] = 'coarse'
+        assert_is_in(kwargs['predictor'], MlSdc.predictor_types, elem_desc="Predictor", list_desc="Valid Predictors",
+                     checking_obj=self)
+        assert_condition('num_predictor_sweeps' not in kwargs, ValueError,
+                         message="The number of predictor sweeps is given by the position of the time slice.",
+                         checking_obj=self)
+        self._solver_options = kwargs
+
+    def run(self, core, **kwargs):
+        """Solves the problem with one process per time slice
+
+        Parameters
+        ----------
+        core : :py:class:`.SdcSolverCore`
+            core solver stepping method of the :py:class:`.MlSdc` solvers
+        dt : :py:class:`float`
+            width of a single time slice; must divide the time interval of the problem
+        timeout : :py:class:`float`
+            *(optional)*
+            seconds to wait for the results of all time slices before the processes are terminated;
+            defaults to :py:class:`None`, i.e. waiting as long as all processes are alive
+
+        Returns
+        -------
+        solutions : :py:class:`list`
+            the solutions of the :py:class:`.MlSdc` solvers ordered by their time slices
+
+        Raises
+        ------
+        ValueError :
+
+            * if ``dt`` does not divide the time interval of the problem
+        RuntimeError :
+
+            * if a solver failed
+            * if a process exited without posting its result (e.g. it was killed)
+            * if ``timeout`` expired
+        """
+        assert_condition(issubclass(core, ISolverCore),
+                         ValueError, message="The given solver core class must be valid: NOT {}"
+                                             .format(class_name(core)),
+                         checking_obj=self)
+        assert_named_argument('dt', kwargs, types=float, descriptor="Width of Time Slice", checking_obj=self)
+        _dt = kwargs['dt']
+        _timeout = kwargs.get('timeout')
+        _time_span = self._problem.time_end - self._problem.time_start
+        self._num_time_slices = int(round(_time_span / _dt))
+        assert_condition(self._num_time_slices > 0 and np.isclose(self._num_time_slices * _dt, _time_span),
+                         ValueError, message="Width of time slices must divide the time interval: {} / {}"
+                                             .format(_time_span, _dt),
+                         checking_obj=self)
+
+        LOG.info("Starting PFASST with {:d} time slices".format(self._num_time_slices))
+        _links = [None] + [Queue() for _rank in range(0, self._num_time_slices - 1)] + [None]
+        _results = Queue()
+        _processes = [
+            Process(target=_run_time_slice,
+                    args=(_rank, self._problem, self._ml_provider, core, _dt, self._problem.time_start + _rank * _dt,
+                          self._solver_options, _links[_rank], _links[_rank + 1], _results))
+            for _rank in range(0, self._num_time_slices)
+        ]
+        for _process in _processes:
+            _process.start()
+
+        # results must be received before joining as the processes wait for their queues to be flushed
+        _solutions = [None] * self._num_time_slices
+        _failures = []
+        _pending = set(range(0, self._num_time_slices))
+        _deadline = time.time() + _timeout if _timeout is not None else None
+        while _pending:
+            # processes post their result before they exit, thus one exited before the queue ran empty without
+            # posting a result will never post one
+            _exited = [_rank for _rank in _pending if _processes[_rank].exitcode is not None]
+            try:
+                _rank, _solution, _failure = _results.get(timeout=self._poll_interval)
+            except queue.Empty:
+                _stalled = [_rank for _rank in _exited if _rank in _pending]
+                if _stalled:
+                    for _rank in _stalled:
+                        _failures.append("Time slice {:d}: process exited with code {:d} without posting a result"
+                                         .format(_rank, _processes[_rank].exitcode))
+                elif _deadline is not None and time.time() > _deadline:
+                    _failures.append("Time slices {}: no result within {} seconds"
+                                     .format(sorted(_pending), _timeout))
+                else:
+                    continue
+                # the following time slices wait for the missing ones forever
+                LOG.error("PFASST failed: terminating the remaining processes")
+                for _rank in _pending:
+                    _processes[_rank].terminate()
+                break
+            _pending.discard(_rank)
+            _solutions[_rank] = _solution
+            if _failure is not None:
+                _failures.append("Time slice {:d}:\n{}".format(_rank, _failure))
+        for _process in _processes:
+            _process.join()
+
+        if _failures:
+            raise RuntimeError("PFASST failed:\n{}".format("\n".join(_failures)))
+        return _solutions
+
+    @property
+    def num_time_slices(self):
+        """Read-only accessor for the number of time slices (and processes) of the last run
+        """
+        return self._num_time_slices
+
+    @property
+    def problem(self):
+        return self._problem
+
+    @property
+    def ml_provider(self):
+        return self._ml_provider
+
+
+__all__ = ['Pfasst']
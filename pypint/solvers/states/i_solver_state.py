@@ -23,6 +23,7 @@ class IStepState(object):
         self._delta_tau = 0.0
         self._rhs = None
         self._rhs_evaluated = False
+        self._partial_rhs = {}
         self._integral = None
         self._integral_available = False
 
@@ -48,7 +49,7 @@ class IStepState(object):
     def value(self):
         """Proxy for the solution value
 
-        On setting, the right hand side evaluation (:py:attr:`.rhs`) gets reset.
+        On setting, the right hand side evaluations (:py:attr:`.rhs` and :py:attr:`.partial_rhs`) get reset.
         """
         return self._solution.value
 
@@ -56,6 +57,7 @@ class IStepState(object):
     def value(self, value):
         self._solution.value = value
         self._rhs_evaluated = False
+        self._partial_rhs = {}
         self._integral_available = False
 
     @property
@@ -77,6 +79,16 @@ class IStepState(object):
         self._rhs = rhs
         self._rhs_evaluated = True
 
+    @property
+    def partial_rhs(self):
+        """Cache of (partial) right hand side evaluations of :py:attr:`.value`
+
+        Maps tuples of the partial descriptor (e.g. ``expl``, ``impl`` or :py:class:`None`) and the time point of the
+        evaluation onto the right hand side.
+        See :py:meth:`.ISolverCore._evaluate_rhs`.
+        """
+        return self._partial_rhs
+
     @property
     def integral_available(self):
         return self._integral_available
@@ -203,9 +215,8 @@ class IStateIterator(object):
         RuntimeError
             if this state has already been finalized
         """
-        assert_condition(not self.finalized, RuntimeError,
-                         message="This {} is already done.".format(class_name(self)),
-                         checking_obj=self)
+        if self.finalized:
+            raise RuntimeError("This {} is already done.".format(class_name(self)))
         for _state in self:
             self.solution.add_solution_data(deepcopy(_state.solution))
         self.solution.finalize()
@@ -350,9 +361,8 @@ class IStaticStateIterator(IStateIterator):
         RuntimeError
             if this sequence has already been finalized via :py:meth:`.IStateIterator.finalize`
         """
-        assert_condition(not self.finalized, RuntimeError,
-                         message="This {} is already done.".format(class_name(self)),
-                         checking_obj=self)
+        if self.finalized:
+            raise RuntimeError("This {} is already done.".format(class_name(self)))
         if self.next_index is not None:
             self._current_index += 1
         else:
@@ -605,9 +615,8 @@ class IIterationState(IStaticStateIterator):
         --------
         :py:meth:`.IStateIterator.finalize` : overridden method
         """
-        assert_condition(not self.finalized, RuntimeError,
-                         message="This {} is already done.".format(class_name(self)),
-                         checking_obj=self)
+        if self.finalized:
+            raise RuntimeError("This {} is already done.".format(class_name(self)))
         for _time_step in self:
             for _step in _time_step:
                 self.solution.add_solution_data(deepcopy(_step.solution))
@@ -784,6 +793,7 @@ class ISolverState(IStateIterator):
         self._num_time_steps = kwargs['num_time_steps'] if 'num_time_steps' in kwargs else 0
         self._delta_interval = 0.0
         self._initial = IStepState()
+        self._predictor = None
 
     def proceed(self):
         """Proceeds to the next iteration
@@ -802,9 +812,8 @@ class ISolverState(IStateIterator):
         This copies the :py:class:`.TrajectorySolutionData` objects from the :py:class:`.IIterationState` instances of
         this sequence to the main :py:class:`.IterativeSolution` object and finalizes it.
         """
-        assert_condition(not self.finalized, RuntimeError,
-                         message="This {} is already done.".format(class_name(self)),
-                         checking_obj=self)
+        if self.finalized:
+            raise RuntimeError("This {} is already done.".format(class_name(self)))
         for _iter in self:
             self.solution.add_solution(_iter.solution)
         # self.solution.finalize()
@@ -860,6 +869,37 @@ class ISolverState(IStateIterator):
     def initial(self, initial):
         self._initial = initial
 
+    def init_predictor(self):
+        """Initializes an empty :py:attr:`.predictor`
+
+        The predictor has the set :py:attr:`.num_time_steps` and :py:attr:`.num_nodes`.
+        The initial value of its first time step is :py:attr:`.initial`; the initial values of all further time steps
+        are linked to the last step of their previous time step.
+
+        Returns
+        -------
+        predictor : :py:class:`.IIterationState`
+        """
+        self._predictor = self._element_type(num_states=self.num_nodes, num_time_steps=self.num_time_steps)
+        self._predictor.initial = self.initial
+        self._predictor.first_time_step.initial = self.initial
+        for _time_step_index in range(1, len(self._predictor)):
+            self._predictor[_time_step_index].initial = self._predictor[_time_step_index - 1].last_step
+        return self._predictor
+
+    @property
+    def predictor(self):
+        """Accessor for the predicted values of the first iteration
+
+        The predictor takes the place of the previous iteration of the first iteration.
+        It is :py:class:`None` if the first iteration starts from the spread initial value.
+        """
+        return self._predictor
+
+    @predictor.setter
+    def predictor(self, predictor):
+        self._predictor = predictor
+
     @property
     def current_iteration(self):
         """Proxies :py:attr:`.IStateIterator.current`
@@ -103,18 +103,13 @@ class MlSdcLevelState(IStaticStateIterator):
 
     @property
     def fas_correction(self):
-        _fas = np.empty(len(self) + 1, dtype=np.object)
-        _fas_shape = ()
-        for step_i in range(0, len(self)):
-            if self[step_i].has_fas_correction():
-                _fas_shape = self[step_i].fas_correction.shape
-                _fas[step_i + 1] = self[step_i].fas_correction.copy()
-
-        if len(_fas_shape) > 0:
-            _fas[0] = np.zeros(_fas_shape)
-            return _fas
-        else:
+        if not self[0].has_fas_correction():
             return None
+        # the steps hold the differences of the FAS corrections of consecutive nodes
+        _fas = np.zeros((len(self) + 1,) + self[0].fas_correction.shape,
+                        dtype=np.result_type(*[step.fas_correction for step in self]))
+        np.cumsum([step.fas_correction for step in self], axis=0, out=_fas[1:])
+        return _fas
 
     @fas_correction.setter
     def fas_correction(self, fas_correction):
@@ -247,9 +242,8 @@ class MlSdcIterationState(IStaticStateIterator):
         raise RuntimeError("'proceed' is not defined in the context of different levels.")
 
     def finalize(self):
-        assert_condition(not self.finalized, RuntimeError,
-                         message="This {} is already done.".format(class_name(self)),
-                         checking_obj=self)
+        if self.finalized:
+            raise RuntimeError("This {} is already done.".format(class_name(self)))
         self._solution = self.finest_level.solution
         self._current_index = 0
         self._finalized = True
@@ -20,14 +20,103 @@ Examples
 
 >>> a = 1
 >>> assert_is_instance(a, int, "'a' is an integer")
+
+Validation Levels
+-----------------
+The amount of runtime checks is controlled by the global :py:class:`.ValidationLevel`.
+It is taken from the environment variable ``$PYPINT_VALIDATION`` or, if that is not set, from the ``[Validation]``
+section of the configuration (see :py:func:`.config`) the first time it is needed.
+It can be changed at runtime with :py:func:`.set_validation_level`.
+
+Checks of arguments at public entry points (e.g. setting up a solver or a problem) are plain calls to the assertions
+below.
+Internal re-validation on the hot paths (e.g. evaluating right hand sides, integrating, running the cores) is guarded
+by ``if VALIDATION.internal:``, i.e. it is skipped completely below :py:attr:`.ValidationLevel.full`.
+Guards of the state of objects (e.g. changing finalized solutions) do not use these assertions and are never skipped.
 """
 import inspect
 from collections import Callable
+from enum import Enum, unique
+from os import environ
 
 from pypint.utilities.tracing import checking_obj_name, class_name, func_name
 from pypint.utilities.logging import LOG
 
 
+@unique
+class ValidationLevel(Enum):
+    """Levels of runtime validation
+    """
+
+    #: all checks, including the internal ones on the hot paths (default)
+    full = 'full'
+
+    #: only checks at public entry points
+    boundary = 'boundary'
+
+    #: no checks at all
+    off = 'off'
+
+
+class _Validation(object):
+    """Switches for the runtime checks derived from the :py:class:`.ValidationLevel`
+
+    Attributes
+    ----------
+    internal : :py:class:`bool`
+        whether internal checks on the hot paths are done
+    boundary : :py:class:`bool`
+        whether checks at public entry points are done
+    level : :py:class:`.ValidationLevel`
+    """
+
+    def __getattr__(self, name):
+        # only called as long as the level has not been resolved yet
+        if name in ('internal', 'boundary', 'level'):
+            set_validation_level(_configured_validation_level())
+            return getattr(self, name)
+        raise AttributeError(name)
+
+
+VALIDATION = _Validation()
+
+
+def _configured_validation_level():
+    if environ.get('PYPINT_VALIDATION'):
+        return environ['PYPINT_VALIDATION']
+    from pypint.utilities.config import config
+    return config()['Validation']['level']
+
+
+def validation_level():
+    """Returns the current validation level
+
+    Returns
+    -------
+    level : :py:class:`.ValidationLevel`
+    """
+    return VALIDATION.level
+
+
+def set_validation_level(level):
+    """Sets the global validation level
+
+    Parameters
+    ----------
+    level : :py:class:`.ValidationLevel` or :py:class:`str`
+        one of ``full``, ``boundary`` or ``off``
+
+    Raises
+    ------
+    ValueError
+        if ``level`` is not a valid validation level
+    """
+    level = ValidationLevel(level)
+    VALIDATION.level = level
+    VALIDATION.internal = level is ValidationLevel.full
+    VALIDATION.boundary = level is not ValidationLevel.off
+
+
 def assert_condition(condition, exception_type, message, checking_obj=None):
     """Asserts trueness of arbitrary condition
 
@@ -48,6 +137,8 @@ def assert_condition(condition, exception_type, message, checking_obj=None):
     exception_type
         if ``condition`` evaluates to :py:class:`False`
     """
+    if not VALIDATION.boundary:
+        return
     if not condition:
         LOG.critical(func_name(checking_obj) + message)
         raise exception_type("{:s}.{:s}(): {:s}"
@@ -73,6 +164,8 @@ def assert_is_callable(obj, message=None, descriptor=None, checking_obj=None):
     ValueError
         if ``obj`` is not :py:class:`Callable`
     """
+    if not VALIDATION.boundary:
+        return
     if not isinstance(obj, Callable):
         if not message:
             if descriptor:
@@ -110,16 +203,18 @@ def assert_is_in(element, test_list, message=None, elem_desc=None, list_desc=Non
     assert_is_in(True, bool_list, elem_desc='', list_desc='', checking_obj=self)
 
     """
+    if not VALIDATION.boundary:
+        return
     if element not in test_list:
         if not message:
             if not list_desc:
                 list_desc = class_name(test_list)
             if not elem_desc:
-                elem_desc = "Element {:r}".format(element)
+                elem_desc = "Element {!r}".format(element)
             message = "{:s} is not in {:s}.".format(elem_desc, list_desc)
         LOG.critical(func_name(checking_obj) + message)
         LOG.debug(func_name(checking_obj) +
-                  "Elements in {:s}: {:s}".format(class_name(test_list), ', '.join(test_list)))
+                  "Elements in {:s}: {:s}".format(class_name(test_list), ', '.join(str(_e) for _e in test_list)))
         raise ValueError("{:s}.{:s}(): {:s}".format(checking_obj_name(checking_obj), inspect.stack()[2][3], message))
 
 
@@ -145,6 +240,8 @@ def assert_is_instance(obj, instances, message=None, descriptor=None, checking_o
     ValueError
         if ``obj`` is not of type ``instances``
     """
+    if not VALIDATION.boundary:
+        return
     if not isinstance(obj, instances):
         if not message:
             _instances_str = set()
@@ -192,19 +289,24 @@ def assert_is_key(key, dictionary, message=None, key_desc=None, dict_desc=None,
     ValueError
         if ``key`` is not of a key in ``dictionary``
     """
+    if not VALIDATION.boundary:
+        return
     if key not in dictionary:
         if not message:
             if not key_desc:
-                key_desc = "'{:s}'".format(key)
+                key_desc = "'{}'".format(key)
             if not dict_desc:
                 dict_desc = "given dict"
             message = "{:s} is not a key in {:s}.".format(key_desc, dict_desc)
         LOG.critical(func_name(checking_obj) + message)
-        LOG.debug(func_name(checking_obj) + "Keys in {:s}: {:s}".format(id(dictionary), ', '.join(dictionary.keys())))
+        LOG.debug(func_name(checking_obj) + "Keys in 0x{:x}: {:s}"
+                  .format(id(dictionary), ', '.join(str(_k) for _k in dictionary.keys())))
         raise ValueError("{:s}.{:s}(): {:s}".format(checking_obj_name(checking_obj), inspect.stack()[2][3], message))
 
 
 def assert_named_argument(name, kwargs, types=None, message=None, descriptor=None, checking_obj=None):
+    if not VALIDATION.boundary:
+        return
     if name not in kwargs:
         if not message:
             if descriptor:
@@ -219,6 +321,7 @@ def assert_named_argument(name, kwargs, types=None, message=None, descriptor=Non
         assert_is_instance(kwargs[name], types, descriptor=descriptor, checking_obj=checking_obj)
 
 __all__ = [
+    'ValidationLevel', 'VALIDATION', 'validation_level', 'set_validation_level',
     'assert_condition',
     'assert_is_in',
     'assert_is_instance',
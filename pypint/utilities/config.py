@@ -5,8 +5,6 @@
 from os.path import expandvars, expanduser, abspath, dirname, isfile
 from sys import stdout, stderr
 
-from configobj import ConfigObj, ConfigObjError
-
 from pypint import __file__ as pypint_path
 
 
@@ -75,6 +73,8 @@ def _get_config(config_file=None):
     ConfigObjError
         on parsing errors
     """
+    from configobj import ConfigObj, ConfigObjError
+
     _config_file = expandvars('$PYPINT_CONFIG') if config_file is None else config_file
     if _config_file == '$PYPINT_CONFIG':
         # default config file location has not been overridden by user
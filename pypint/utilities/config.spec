@@ -23,3 +23,7 @@
     [[numpy]]
     precision = integer(default=4)
     linewidth = integer(default=80)
+
+# Options for the runtime checks (see pypint.utilities.assertions)
+[Validation]
+level = option('full', 'boundary', 'off', default='full')
@@ -3,47 +3,98 @@
 
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
-from logbook import Logger, StreamHandler, FileHandler
-from logbook.more import ColorizedStderrHandler
+from logbook import Handler, Logger
 from sys import stdout
 from datetime import datetime
 from collections import OrderedDict
 import inspect
+import threading
 import numpy
 
 from pypint.utilities.tracing import checking_obj_name
-from pypint.utilities.config import config
+from pypint.plugins.timers.instrumentation import timed
+
+
+class _DeferredSetupHandler(Handler):
+    """Handler setting up the handlers of :py:data:`.LOG` on the first record to handle
+
+    Thus, neither the configuration is read nor any handler is created on import or as long as the logger is disabled.
+    The first record is passed on to the created handlers.
+
+    Handlers are called after the record captured the frame of the logging call, thus the origin of the records
+    (e.g. ``record.func_name``) is not altered by this handler.
+    """
+
+    def __init__(self):
+        super(_DeferredSetupHandler, self).__init__(bubble=False)
+
+    def handle(self, record):
+        setup_logging()
+        for _handler in LOG.handlers:
+            if _handler is not self and _handler.should_handle(record) \
+                    and _handler.handle(record) and not _handler.bubble:
+                return True
+        return False
 
 
 LOG = Logger('PyPinT Logging')
-LOG.handlers = []
-
-
-if config()['Logger']['Stderr']['enable']:
-    # log ERRORS and WARNINGS to stderr
-    LOG.handlers.append(
-        ColorizedStderrHandler(level=config()['Logger']['Stderr']['level'],
-                               format_string=config()['Logger']['Stderr']['format_string'],
-                               bubble=config()['Logger']['Stderr']['bubble'])
-    )
-if config()['Logger']['Stdout']['enable']:
-    # then write all ERROR, WARNING and INFO messages to stdout
-    LOG.handlers.append(
-        StreamHandler(stdout,
-                      level=config()['Logger']['Stdout']['level'],
-                      format_string=config()['Logger']['Stdout']['format_string'],
-                      bubble=config()['Logger']['Stdout']['bubble'])
-    )
-if config()['Logger']['File']['enable']:
-    # finally, write everything (including DEBUG messages) to a logfile
-    LOG.handlers.append(
-        FileHandler(config()['Logger']['File']['file_name_format'].format(datetime.now()),
-                    level=config()['Logger']['File']['level'],
-                    format_string=config()['Logger']['File']['format_string'])
-    )
-
-numpy.set_printoptions(precision=config()['Logger']['numpy']['precision'],
-                       linewidth=config()['Logger']['numpy']['linewidth'])
+LOG.handlers = [_DeferredSetupHandler()]
+
+_LOGGING_SET_UP = False
+
+_LOGGING_SET_UP_LOCK = threading.Lock()
+
+
+def setup_logging():
+    """Creates the handlers of :py:data:`.LOG` and sets NumPy's print options as configured
+
+    This is done automatically when the first message is logged.
+    Calling it explicitly applies the configuration right away (e.g. NumPy's print options).
+    Subsequent calls do not have any effect.
+    """
+    global _LOGGING_SET_UP
+    if _LOGGING_SET_UP:
+        return
+    with _LOGGING_SET_UP_LOCK:
+        if not _LOGGING_SET_UP:
+            _setup_logging()
+            _LOGGING_SET_UP = True
+
+
+def _setup_logging():
+    from logbook import StreamHandler, FileHandler
+    from logbook.more import ColorizedStderrHandler
+    from pypint.utilities.config import config
+
+    # the handlers are replaced at once, as other threads may be handling records meanwhile
+    _handlers = []
+    if config()['Logger']['Stderr']['enable']:
+        # log ERRORS and WARNINGS to stderr
+        _handlers.append(
+            ColorizedStderrHandler(level=config()['Logger']['Stderr']['level'],
+                                   format_string=config()['Logger']['Stderr']['format_string'],
+                                   bubble=config()['Logger']['Stderr']['bubble'])
+        )
+    if config()['Logger']['Stdout']['enable']:
+        # then write all ERROR, WARNING and INFO messages to stdout
+        _handlers.append(
+            StreamHandler(stdout,
+                          level=config()['Logger']['Stdout']['level'],
+                          format_string=config()['Logger']['Stdout']['format_string'],
+                          bubble=config()['Logger']['Stdout']['bubble'])
+        )
+    if config()['Logger']['File']['enable']:
+        # finally, write everything (including DEBUG messages) to a logfile
+        _handlers.append(
+            FileHandler(config()['Logger']['File']['file_name_format'].format(datetime.now()),
+                        level=config()['Logger']['File']['level'],
+                        format_string=config()['Logger']['File']['format_string'])
+        )
+
+    LOG.handlers = _handlers
+
+    numpy.set_printoptions(precision=config()['Logger']['numpy']['precision'],
+                           linewidth=config()['Logger']['numpy']['linewidth'])
 
 
 VERBOSITY_LVL1 = '!> '
@@ -55,6 +106,7 @@ SEPARATOR_LVL2 = '-' * 80
 SEPARATOR_LVL3 = '.' * 80
 
 
+@timed('logging')
 def print_logging_message_tree(messages):
     for _key1, _value1 in messages.items():
         if isinstance(_value1, (dict, OrderedDict)):
@@ -102,5 +154,5 @@ __all__ = [
     'LOG',
     'VERBOSITY_LVL1', 'VERBOSITY_LVL2', 'VERBOSITY_LVL3',
     'SEPARATOR_LVL1', 'SEPARATOR_LVL2', 'SEPARATOR_LVL3',
-    'this_got_called', 'print_logging_message_tree'
+    'this_got_called', 'print_logging_message_tree', 'setup_logging'
 ]
@@ -3,6 +3,7 @@
 
 .. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
 """
+import numpy as np
 
 
 def lagrange_polynome(j, base_points, x):
@@ -36,3 +37,42 @@ def lagrange_polynome(j, base_points, x):
         if m != j:
             _val *= (x - base_points[m]) / (base_points[j] - base_points[m])
     return _val
+
+
+def lagrange_matrix(base_points, points):
+    """Evaluates all Lagrange polynomials based on ``base_points`` at all given points
+
+    Entry :math:`(k, j)` of the result equals ``lagrange_polynome(j, base_points, points[k])``.
+    The polynomials are evaluated with the barycentric formula
+
+    .. math::
+
+        P_j(x) = \\frac{\\frac{w_j}{x - b_j}}{\\sum_{m=1}^{n} \\frac{w_m}{x - b_m}}, \\quad
+        w_j = \\prod_{m=1, m \\neq j}^{n} \\frac{1}{b_j - b_m}
+
+    where points coinciding with a base point result in the respective unit row.
+
+    Parameters
+    ----------
+    base_points : :py:class:`numpy.ndarray` of :math:`n` :py:class:`float`
+        points to construct the Lagrange polynomials on
+    points : :py:class:`numpy.ndarray` of :math:`N` :py:class:`float`
+        points to evaluate the Lagrange polynomials at
+
+    Returns
+    -------
+    values : :py:class:`numpy.ndarray` of shape :math:`(N, n)`
+    """
+    _diff = base_points[:, np.newaxis] - base_points[np.newaxis, :]
+    np.fill_diagonal(_diff, 1.0)
+    _weights = 1.0 / np.prod(_diff, axis=1)
+
+    _dist = points[:, np.newaxis] - base_points[np.newaxis, :]
+    _exact = _dist == 0.0
+    _dist[_exact] = 1.0
+    _values = _weights / _dist
+    _values /= np.sum(_values, axis=1)[:, np.newaxis]
+
+    _coinciding = np.any(_exact, axis=1)
+    _values[_coinciding] = _exact[_coinciding]
+    return _values
@@ -0,0 +1,280 @@
+# coding=utf-8
+"""Resumable sweeps of a function over a grid of parameters
+
+Analyses like stability regions evaluate a solver for every point of a large parameter grid.
+:py:class:`.ParameterSweep` schedules chunks of grid points on a process pool and streams the results into a
+memory-mapped ``.npy`` file, which also records the points already computed.
+The parameter axes and further arguments are stored alongside in a ``.grid.npz`` file.
+Thus, an interrupted sweep is continued by running it again with the same file, grid and arguments.
+
+.. moduleauthor:: Torbjörn Klatt <t.klatt@fz-juelich.de>
+"""
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from multiprocessing import cpu_count
+import os
+
+import numpy as np
+
+from pypint.utilities import assert_condition, assert_is_callable, assert_is_instance, class_name
+from pypint.utilities.logging import LOG
+
+
+def _evaluate_chunk(function, names, arguments, indices, points):
+    """Evaluates the function for a chunk of grid points within a worker process
+
+    Returns
+    -------
+    results : :py:class:`list` of :py:class:`tuple`
+        ``(index, value, failure)`` for each point, where ``failure`` describes the exception raised by the function
+        (``value`` is :py:class:`None` then) or is :py:class:`None`.
+    """
+    _results = []
+    for _index, _point in zip(indices, points):
+        _arguments = dict(arguments)
+        _arguments.update(zip(names, _point))
+        try:
+            _results.append((_index, function(**_arguments), None))
+        except Exception as err:
+            _results.append((_index, None, "{}: {}".format(class_name(err), err)))
+    return _results
+
+
+class ParameterSweep(object):
+    """Resumable sweep of a function over a grid of parameters
+
+    The function is evaluated for each point of the Cartesian product of the given parameter axes with the parameters
+    passed as keyword arguments.
+    It must return a scalar convertible to the numeric type of the results and be picklable, i.e. be defined on module
+    level, to be run on a process pool.
+
+    Examples
+    --------
+    >>> def iterations(real, imag, max_iter):  # doctest: +SKIP
+    ...     # set up and run a solver for lambda = real + imag * 1j
+    ...     return max_iter
+    >>> sweep = ParameterSweep(iterations, OrderedDict([('imag', np.linspace(0.0, 8.0, 100)),
+    ...                                                  ('real', np.linspace(-6.0, 3.0, 100))]),
+    ...                        'iterations.npy', dtype=int, arguments={'max_iter': 100})  # doctest: +SKIP
+    >>> sweep.run(max_workers=8).shape  # doctest: +SKIP
+    (100, 100)
+    """
+
+    _default_chunk_size = 100
+    """Default number of grid points evaluated by a single task
+    """
+
+    def __init__(self, function, grid, file_name, dtype=float, arguments=None, chunk_size=_default_chunk_size,
+                 failed_value=None):
+        """
+        Parameters
+        ----------
+        function : :py:class:`callable`
+            function to evaluate, e.g. setting up and running a solver
+        grid : :py:class:`collections.OrderedDict`
+            parameter names mapped onto the one-dimensional values of their axis;
+            the results are of shape ``(len(values) for values in grid.values())``
+        file_name : :py:class:`str`
+            ``.npy`` file storing the results; if it exists, its already computed points are skipped;
+            the grid and arguments are stored in a file of the same name with the extension ``.grid.npz``
+        dtype : :py:class:`numpy.dtype`
+            *(optional)*
+            numeric type of the results
+            (defaults to :py:class:`float`)
+        arguments : :py:class:`dict`
+            *(optional)*
+            further keyword arguments passed on to each evaluation of the function;
+            they are compared by their representation when resuming
+        chunk_size : :py:class:`int`
+            *(optional)*
+            number of grid points evaluated by a single task
+        failed_value
+            *(optional)*
+            result stored for points the function raised an exception for;
+            if not given, these points are left to be computed on the next run
+
+        Raises
+        ------
+        ValueError :
+
+            * if ``function`` is not callable
+            * if ``grid`` is not an :py:class:`collections.OrderedDict` of one-dimensional axes
+            * if ``chunk_size`` is not a positive integer
+            * if an existing ``file_name`` does not match the grid, arguments and numeric type
+        """
+        assert_is_callable(function, descriptor="Function", checking_obj=self)
+        assert_is_instance(grid, OrderedDict, descriptor="Parameter Grid", checking_obj=self)
+        assert_condition(isinstance(chunk_size, int) and chunk_size > 0, ValueError,
+                         message="Chunk size must be a positive integer: NOT {}".format(chunk_size),
+                         checking_obj=self)
+        self._function = function
+        self._names = list(grid.keys())
+        self._axes = [np.asarray(_values) for _values in grid.values()]
+        for _name, _axis in zip(self._names, self._axes):
+            assert_condition(_axis.ndim == 1 and _axis.size > 0, ValueError,
+                             message="Values of parameter '{}' must be a non-empty one-dimensional array: NOT {}"
+                                     .format(_name, _axis.shape),
+                             checking_obj=self)
+        self._arguments = arguments if arguments is not None else {}
+        self._chunk_size = chunk_size
+        self._failed_value = failed_value
+        self._file_name = file_name
+        self._grid_file_name = os.path.splitext(file_name)[0] + '.grid.npz'
+        self._records = self._open(np.dtype([('value', dtype), ('done', np.bool_)]))
+
+    def run(self, executor=None, max_workers=None, max_pending=None):
+        """Evaluates the function for all grid points not yet computed
+
+        The results of each finished chunk are written to the file immediately.
+        Only a limited number of chunks is scheduled at once, thus neither the tasks nor their points pile up in
+        memory for large grids.
+        When interrupted, the pending tasks are cancelled; the finished ones are kept for the next run.
+
+        Parameters
+        ----------
+        executor : :py:class:`concurrent.futures.Executor`
+            *(optional)*
+            executor to schedule the chunks on; it is not shut down afterwards
+            (defaults to a new :py:class:`concurrent.futures.ProcessPoolExecutor`)
+        max_workers : :py:class:`int`
+            *(optional)*
+            number of worker processes of the default executor
+        max_pending : :py:class:`int`
+            *(optional)*
+            number of chunks scheduled at once
+            (defaults to twice ``max_workers`` or the number of CPUs)
+
+        Returns
+        -------
+        results : :py:class:`numpy.ndarray`
+            see :py:attr:`.results`
+
+        Raises
+        ------
+        ValueError :
+            if ``max_pending`` is not a positive integer
+        """
+        if max_pending is None:
+            max_pending = 2 * (max_workers if max_workers is not None else cpu_count())
+        assert_condition(isinstance(max_pending, int) and max_pending > 0, ValueError,
+                         message="Number of pending chunks must be a positive integer: NOT {}".format(max_pending),
+                         checking_obj=self)
+        _pending = np.flatnonzero(~self.done)
+        if _pending.size == 0:
+            return self.results
+
+        LOG.info("Sweeping {:d} of {:d} points in chunks of {:d}".format(_pending.size, self.done.size,
+                                                                         self._chunk_size))
+        _starts = iter(range(0, _pending.size, self._chunk_size))
+        _pool = executor if executor is not None else ProcessPoolExecutor(max_workers=max_workers)
+        _futures = set()
+        try:
+            while True:
+                # refill the window of scheduled chunks
+                for _start in islice(_starts, max_pending - len(_futures)):
+                    _indices = _pending[_start:_start + self._chunk_size]
+                    _futures.add(_pool.submit(_evaluate_chunk, self._function, self._names, self._arguments,
+                                              _indices.tolist(), self.points(_indices)))
+                if len(_futures) == 0:
+                    break
+                _finished, _futures = wait(_futures, return_when=FIRST_COMPLETED)
+                for _future in _finished:
+                    self._store(_future.result())
+                LOG.info("[{:6.2f}%] {:d} of {:d} points done"
+                         .format(100.0 * self.num_done / self.done.size, self.num_done, self.done.size))
+        finally:
+            for _future in _futures:
+                _future.cancel()
+            if executor is None:
+                _pool.shutdown(wait=True)
+            self._records.flush()
+
+        return self.results
+
+    def points(self, indices):
+        """Parameter values of the given grid points
+
+        Parameters
+        ----------
+        indices : :py:class:`numpy.ndarray`
+            flat indices of the grid points
+
+        Returns
+        -------
+        points : :py:class:`list` of :py:class:`tuple`
+            values of the parameters in the order of the grid for each point
+        """
+        _subscripts = np.unravel_index(indices, self.shape)
+        return list(zip(*[_axis[_subscript].tolist() for _axis, _subscript in zip(self._axes, _subscripts)]))
+
+    @property
+    def shape(self):
+        """Shape of the results, i.e. number of values of each parameter
+        """
+        return tuple(_axis.size for _axis in self._axes)
+
+    @property
+    def results(self):
+        """Memory-mapped results of the sweep
+
+        Points not yet computed are zero.
+        """
+        return self._records['value']
+
+    @property
+    def done(self):
+        """Flags of the grid points already computed
+        """
+        return self._records['done'].reshape(-1)
+
+    @property
+    def num_done(self):
+        """Number of grid points already computed
+        """
+        return int(np.count_nonzero(self._records['done']))
+
+    def _open(self, dtype):
+        _grid = dict(('axis_{:d}'.format(_index), _axis) for _index, _axis in enumerate(self._axes))
+        _grid.update(names=np.array(self._names), arguments=np.array(repr(sorted(self._arguments.items()))))
+        if os.path.exists(self._file_name):
+            _records = np.lib.format.open_memmap(self._file_name, mode='r+')
+            if _records.shape != self.shape or _records.dtype != dtype:
+                raise ValueError("Results in '{}' do not match the parameter grid: {} {} != {} {}"
+                                 .format(self._file_name, _records.shape, _records.dtype, self.shape, dtype))
+            if not os.path.exists(self._grid_file_name):
+                raise ValueError("Grid of the results in '{}' not found: '{}'"
+                                 .format(self._file_name, self._grid_file_name))
+            with np.load(self._grid_file_name) as _stored:
+                for _key in sorted(_grid):
+                    if _key not in _stored.files or not np.array_equal(_stored[_key], _grid[_key]):
+                        raise ValueError("Results in '{}' were computed for different {}: {} != {}"
+                                         .format(self._file_name, _key.replace('_', ' '),
+                                                 _stored[_key] if _key in _stored.files else None, _grid[_key]))
+            LOG.info("Resuming sweep with {:d} of {:d} points done from '{}'"
+                     .format(int(np.count_nonzero(_records['done'])), _records.size, self._file_name))
+            return _records
+        else:
+            np.savez(self._grid_file_name, **_grid)
+            return np.lib.format.open_memmap(self._file_name, mode='w+', dtype=dtype, shape=self.shape)
+
+    def _store(self, chunk_results):
+        _records = self._records.reshape(-1)
+        for _index, _value, _failure in chunk_results:
+            if _failure is not None:
+                LOG.warning("Failed for {}: {}"
+                            .format(", ".join("{}={}".format(_name, _parameter)
+                                              for _name, _parameter in zip(self._names, self.points([_index])[0])),
+                                    _failure))
+                if self._failed_value is None:
+                    continue
+                _value = self._failed_value
+            _records[_index] = (_value, True)
+        self._records.flush()
+
+    def __str__(self):
+        return "ParameterSweep<0x%x>(shape=%s, done=%d, file=%s)" \
+               % (id(self), self.shape, self.num_done, self._file_name)
+
+
+__all__ = ['ParameterSweep']
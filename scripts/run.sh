@@ -1,7 +1,23 @@
 #!/bin/bash
+#
+# usage: run.sh VERBOSITY SCRIPT [ARGS...]
+#        run.sh events FILE SCRIPT [ARGS...]
+#
+# The second form discards the log output and appends the solvers' events as JSON lines to FILE instead
+# (see pypint.plugins.events).
 
 VERBOSITY=$1
 shift
+
+if [[ $VERBOSITY == "events" ]]; then
+  EVENTS=$1
+  shift
+  SCRIPT=$1
+  shift
+  PYPINT_EVENTS=$EVENTS PYTHONPATH=$PYPINT python3 $SCRIPT "$@" > /dev/null
+  exit $?
+fi
+
 SCRIPT=$1
 shift
 
@@ -12,4 +28,3 @@ elif [[ $VERBOSITY -eq 2 ]]; then
 else
   PYTHONPATH=$PYPINT python3 $SCRIPT "$@" | sed -n 's/^\[.*\] [!> ]> //p'
 fi
-
@@ -0,0 +1,12 @@
+# coding=utf-8
+
+import unittest
+
+
+class ExamplesTests(unittest.TestSuite):
+    def __init__(self):
+        pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,12 @@
+# coding=utf-8
+
+import unittest
+
+
+class ExampleProblemsTests(unittest.TestSuite):
+    def __init__(self):
+        pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# coding=utf-8
+from concurrent.futures import ThreadPoolExecutor
+import subprocess
+import sys
+
+import numpy as np
+
+from examples.problems.aviles_giga import AvilesGiga
+from tests import NumpyAwareTestCase
+
+
+def _reference_rhs(u, n, epsilon, partial=None):
+    # the right hand side with full complex transforms
+    _k = np.fft.ifftshift(np.arange(-n, n + 1))
+    _k_x, _k_y = _k.reshape(-1, 1), _k.reshape(1, -1)
+    _u_f = np.fft.fft2(u)
+    _grad_x = np.fft.ifft2(1j * _k_x * _u_f).real
+    _grad_y = np.fft.ifft2(1j * _k_y * _u_f).real
+    _b = _grad_x ** 2 + _grad_y ** 2 - 1.0
+    _non_linear = np.fft.ifft2(1j * _k_x * np.fft.fft2(_b * _grad_x) + 1j * _k_y * np.fft.fft2(_b * _grad_y)).real
+    _linear = np.fft.ifft2((_k_x ** 2 + _k_y ** 2) ** 2 * _u_f).real
+    return {None: _non_linear / epsilon - epsilon * _linear, 'impl': -epsilon * _linear,
+            'expl': _non_linear / epsilon}[partial]
+
+
+class AvilesGigaTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._problem = AvilesGiga(epsilon=0.1, n=4)
+        self._times = np.linspace(0.0, 0.1, 3)
+        self._values = np.random.RandomState(1).rand(*((3,) + self._problem.dim_for_time_solver))
+
+    def test_evaluation_matches_complex_transforms(self):
+        for _partial in [None, 'impl', 'expl']:
+            for _value in self._values:
+                _reference = _reference_rhs(_value.reshape(9, 9), 4, 0.1, _partial).reshape(_value.shape)
+                self.assertNumpyArrayAlmostEqual(self._problem.evaluate_wrt_time(0.0, _value, partial=_partial),
+                                                 _reference, delta=1e-10)
+
+    def test_falls_back_to_numpy_transforms_without_scipy_fft(self):
+        _output = subprocess.check_output(
+            [sys.executable, '-c',
+             "import sys, types\n"
+             "import scipy.optimize, pypint.plugins.multigrid.i_transient_multigrid_problem\n"
+             "# hides the transforms of SciPy 1.4 and newer\n"
+             "sys.modules['scipy.fft'] = types.ModuleType('scipy.fft')\n"
+             "import numpy as np\n"
+             "from examples.problems.aviles_giga import AvilesGiga\n"
+             "from tests.examples_tests.problems_tests.aviles_giga_test import _reference_rhs\n"
+             "_problem = AvilesGiga(epsilon=0.1, n=4, fft_workers=2)\n"
+             "_value = np.random.RandomState(1).rand(*_problem.dim_for_time_solver)\n"
+             "_rhs = _problem.evaluate_wrt_time(0.0, _value)\n"
+             "print('>', AvilesGiga.fft.__globals__['rfft2'].__module__)\n"
+             "print('>', np.abs(_rhs - _reference_rhs(_value.reshape(9, 9), 4, 0.1).reshape(_rhs.shape)).max())\n"],
+            universal_newlines=True, stderr=subprocess.DEVNULL)
+        _lines = [_line[1:] for _line in _output.splitlines() if _line.startswith('>')]
+        self.assertEqual(len(_lines), 2)
+        self.assertTrue(_lines[0].strip().startswith('numpy'))
+        self.assertLess(float(_lines[1]), 1e-10)
+
+    def test_batched_evaluation_matches_single_evaluations(self):
+        for _partial in [None, 'impl', 'expl']:
+            _batch = self._problem.evaluate_wrt_time_batch(self._times, self._values, partial=_partial)
+            _single = np.array([self._problem.evaluate_wrt_time(_time, _value, partial=_partial)
+                                for _time, _value in zip(self._times, self._values)])
+            self.assertEqual(_batch.shape, self._values.shape)
+            self.assertNumpyArrayAlmostEqual(_batch, _single, delta=1e-12)
+        self.assertEqual(self._problem.rhs_evaluations, 3 * 2 * self._times.size)
+
+    def test_solves_linear_implicit_equations_exactly(self):
+        _delta_time = 0.05
+        for _expl_term in self._values:
+            _x = self._problem.implicit_solve(np.zeros(_expl_term.shape), lambda x: x, partial='impl',
+                                              expl_term=_expl_term, delta_time=_delta_time)
+            _residual = _x - _delta_time * self._problem.evaluate_wrt_time(0.0, _x, partial='impl') - _expl_term
+            self.assertLess(np.abs(_residual).max(), 1e-12)
+
+    def test_concurrent_evaluations_match_serial_evaluations(self):
+        _problem = AvilesGiga(epsilon=0.1, n=16)
+        _values = np.random.RandomState(2).rand(*((8,) + _problem.dim_for_time_solver))
+        _serial = [_problem.evaluate_wrt_time(0.0, _value) for _value in _values]
+        with ThreadPoolExecutor(max_workers=4) as _pool:
+            _concurrent = list(_pool.map(lambda i: _problem.evaluate_wrt_time(0.0, _values[i % 8]), range(400)))
+        for _index, _rhs in enumerate(_concurrent):
+            self.assertNumpyArrayAlmostEqual(_rhs, _serial[_index % 8], delta=1e-12)
@@ -0,0 +1,18 @@
+# coding=utf-8
+import numpy as np
+
+from examples.problems.constant import Constant
+from tests import NumpyAwareTestCase
+
+
+class ConstantTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._times = np.array([0.0, 0.25, 0.5, 1.0])
+
+    def test_batched_exact_solution_uses_reassigned_exact_function(self):
+        _problem = Constant(constant=-2.0, shift=1.0, dim=(2, 3, 1))
+        self.assertNumpyArrayAlmostEqual(_problem.exact_batch(self._times),
+                                         np.array([_problem.exact(_time) for _time in self._times]), delta=1e-15)
+        _problem.exact_function = lambda t: _problem.initial_value * np.cos(t)
+        self.assertNumpyArrayAlmostEqual(_problem.exact_batch(self._times),
+                                         np.array([_problem.exact(_time) for _time in self._times]), delta=1e-15)
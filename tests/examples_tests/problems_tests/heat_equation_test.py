@@ -0,0 +1,35 @@
+# coding=utf-8
+import numpy as np
+
+from pypint.plugins.multigrid.level import MultigridLevel1D
+from pypint.plugins.multigrid.stencil import Stencil
+from examples.problems.heat_equation import HeatEquation
+from tests import NumpyAwareTestCase
+
+
+def _heat_equation(num_points):
+    _zero = lambda x: np.zeros(x.shape)
+    _problem = HeatEquation(dim=(num_points, 1), time_end=1e-3, thermal_diffusivity=0.5,
+                            initial_value=np.zeros((num_points, 1)),
+                            rhs_function_wrt_space=lambda dof, tensor: 0.0,
+                            boundary_functions=[[_zero, _zero]],
+                            boundaries=['dirichlet'] * 2,
+                            geometry=np.asarray([[0, 1]]))
+    _level = MultigridLevel1D(num_points, mg_problem=_problem, max_borders=np.array([2, 2]), role='FL')
+    _problem._mg_level = _level
+    _problem._mg_stencil = Stencil(np.array([1.0, -2.0, 1.0]) * _problem.thermal_diffusivity / _level.h**2)
+    _problem._mg_stencil.grid = _level.mid.shape
+    return _problem
+
+
+class HeatEquationTest(NumpyAwareTestCase):
+    def test_batched_evaluation_matches_single_evaluations(self):
+        _problem = _heat_equation(15)
+        _times = np.linspace(0.0, 1e-3, 4)
+        _values = np.random.RandomState(1).rand(4, 15, 1)
+        for _partial in [None, 'impl', 'expl']:
+            _batch = _problem.evaluate_wrt_time_batch(_times, _values, partial=_partial)
+            _single = np.array([_problem.evaluate_wrt_time(_time, _value, partial=_partial)
+                                for _time, _value in zip(_times, _values)])
+            self.assertEqual(_batch.shape, _values.shape)
+            self.assertNumpyArrayAlmostEqual(_batch, _single, delta=1e-10)
@@ -0,0 +1,30 @@
+# coding=utf-8
+import numpy as np
+
+from examples.problems.lambda_u import LambdaU
+from tests import NumpyAwareTestCase
+
+
+class LambdaUTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._times = np.array([0.0, 0.25, 0.5, 1.0])
+        self._values = np.array([1.0, 0.5 - 1.0j, -2.0j, 3.0 + 1.0j]).reshape((4,) + LambdaU().dim_for_time_solver)
+
+    def test_batched_evaluation_matches_single_evaluations(self):
+        for _lmbda in [-1.0, complex(-1.0, 2.0)]:
+            for _partial in [None, 'impl', 'expl']:
+                _problem = LambdaU(lmbda=_lmbda)
+                _batch = _problem.evaluate_wrt_time_batch(self._times, self._values, partial=_partial)
+                self.assertEqual(_problem.rhs_evaluations, self._times.size)
+                _single = np.array([_problem.evaluate_wrt_time(_time, _value, partial=_partial)
+                                    for _time, _value in zip(self._times, self._values)])
+                self.assertNumpyArrayAlmostEqual(_batch, _single, delta=1e-15)
+                self.assertEqual(_problem.rhs_evaluations, 2 * self._times.size)
+
+    def test_batched_exact_solution_uses_reassigned_exact_function(self):
+        _problem = LambdaU(lmbda=complex(-1.0, 2.0))
+        self.assertNumpyArrayAlmostEqual(_problem.exact_batch(self._times),
+                                         np.array([_problem.exact(_time) for _time in self._times]), delta=1e-15)
+        _problem.exact_function = lambda phi_of_time: 2.0 * _problem.initial_value * phi_of_time
+        self.assertNumpyArrayAlmostEqual(_problem.exact_batch(self._times),
+                                         np.array([_problem.exact(_time) for _time in self._times]), delta=1e-15)
@@ -0,0 +1,67 @@
+# coding=utf-8
+import unittest
+
+import numpy as np
+
+try:
+    from mpi4py import MPI
+    from pypint.communicators.mpi_messaging import MpiMessaging
+except ImportError:
+    MPI = None
+from pypint.communicators import Message
+
+
+@unittest.skipIf(MPI is None, "mpi4py is not installed")
+class MpiMessagingTest(unittest.TestCase):
+    """Links all ranks to a ring; run with e.g. ``mpirun -np 4 python -m nose <this file>``
+    """
+    def setUp(self):
+        self._comm = MPI.COMM_WORLD.Dup()
+        self._rank = self._comm.Get_rank()
+        self._size = self._comm.Get_size()
+        self._test_obj = MpiMessaging(value_template=np.zeros(2, dtype=complex), tags=[None, 0, 1],
+                                      blocking_tags=[None, 0], comm=self._comm)
+        self._test_obj.link_solvers(previous=(self._rank - 1) % self._size, next=(self._rank + 1) % self._size)
+
+    def tearDown(self):
+        self._test_obj.close()
+        self._comm.Barrier()
+        self._comm.Free()
+
+    def test_solver_linking(self):
+        with self.assertRaises(ValueError):
+            MpiMessaging(value_template=np.zeros(1), comm=self._comm).link_solvers(previous=None)
+
+    def test_values_are_sent_to_next_rank(self):
+        self._test_obj.send(value=np.array([self._rank, 1j * self._rank]), time_point=0.5,
+                            flag=Message.SolverFlag.iterating)
+        _message = self._test_obj.receive()
+        _previous = (self._rank - 1) % self._size
+        np.testing.assert_array_equal(_message.value, np.array([_previous, 1j * _previous]))
+        self.assertEqual(_message.time_point, 0.5)
+        self.assertIs(_message.flag, Message.SolverFlag.iterating)
+        self.assertFalse(self._test_obj.previous_finished)
+
+    def test_blocking_tags_are_received_in_order(self):
+        self._test_obj.send(tag=0, value=np.ones(2), time_point=0.0)
+        self._test_obj.send(tag=0, value=2.0 * np.ones(2), time_point=0.0, flag=Message.SolverFlag.converged)
+        np.testing.assert_array_equal(self._test_obj.receive(tag=0).value, np.ones(2))
+        np.testing.assert_array_equal(self._test_obj.receive(tag=0).value, 2.0 * np.ones(2))
+        self.assertTrue(self._test_obj.previous_finished)
+
+    def test_other_tags_receive_latest_value(self):
+        self._test_obj.send(tag=1, value=np.ones(2), time_point=0.0)
+        self._test_obj.send(tag=1, value=2.0 * np.ones(2), time_point=0.5)
+        # the blocking tag waits until the previous rank has sent all messages
+        self._test_obj.send(tag=0, time_point=0.5)
+        self.assertEqual(self._test_obj.receive(tag=0).time_point, 0.5)
+        np.testing.assert_array_equal(self._test_obj.receive(tag=1).value, 2.0 * np.ones(2))
+        self.assertEqual(self._test_obj.receive(tag=1).time_point, 0.5)
+
+    def test_values_must_match_template(self):
+        with self.assertRaises(ValueError):
+            self._test_obj.send(value=np.zeros(3), time_point=0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
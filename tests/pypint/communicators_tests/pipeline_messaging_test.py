@@ -0,0 +1,49 @@
+# coding=utf-8
+from queue import Queue
+import unittest
+
+from pypint.communicators.pipeline_messaging import PipelineMessaging
+from pypint.communicators import Message
+
+
+class PipelineMessagingTest(unittest.TestCase):
+    def setUp(self):
+        self._queue = Queue()
+        self._sender = PipelineMessaging()
+        self._sender.link_solvers(previous=None, next=self._queue)
+        self._test_obj = PipelineMessaging(blocking_tags=[0])
+        self._test_obj.link_solvers(previous=self._queue, next=None)
+
+    def test_solver_linking(self):
+        with self.assertRaises(ValueError):
+            PipelineMessaging().link_solvers(previous=None)
+
+    def test_blocking_tags_are_received_in_order(self):
+        self._sender.send(tag=0, value=1.0, time_point=0.0)
+        self._sender.send(tag=0, value=2.0, time_point=0.0)
+        self.assertEqual(self._test_obj.receive(tag=0).value, 1.0)
+        self.assertEqual(self._test_obj.receive(tag=0).value, 2.0)
+
+    def test_other_tags_receive_latest_value(self):
+        self._sender.send(tag=1, value=1.0, time_point=0.0)
+        self._sender.send(tag=1, value=2.0, time_point=0.5)
+        self.assertEqual(self._test_obj.receive(tag=1).value, 2.0)
+        self.assertEqual(self._test_obj.receive(tag=1).time_point, 0.5)
+        self.assertIsNone(self._test_obj.receive(tag=2))
+
+    def test_finished_previous_solver_is_not_waited_for(self):
+        self.assertTrue(self._sender.previous_finished)
+        self.assertFalse(self._test_obj.previous_finished)
+        self._sender.send(value=1.0, time_point=1.0, flag=Message.SolverFlag.converged)
+        self.assertIs(self._test_obj.receive().flag, Message.SolverFlag.converged)
+        self.assertTrue(self._test_obj.previous_finished)
+        # nothing has been sent on the blocking tag
+        self.assertIsNone(self._test_obj.receive(tag=0))
+
+    def test_sending_without_next_solver(self):
+        self._test_obj.send(tag=0, value=1.0, time_point=0.0)
+        self.assertTrue(self._queue.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
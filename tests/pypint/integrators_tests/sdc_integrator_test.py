@@ -57,6 +57,52 @@ class SdcIntegratorTest(NumpyAwareTestCase):
         )
         self.assertNumpyArrayAlmostEqual(computed_qmat, expected_qmat, delta=1e-8)
 
+    def test_q_delta_implicit_and_explicit_euler(self):
+        self._test_obj.init(num_nodes=3, interval=numpy.array([0.0, 1.0]))
+        self.assertNumpyArrayAlmostEqual(self._test_obj.q_delta(),
+                                         numpy.array([[0.0, 0.0, 0.0], [0.0, 0.5, 0.0], [0.0, 0.5, 0.5]]))
+        self.assertNumpyArrayAlmostEqual(self._test_obj.q_delta('explicit_euler'),
+                                         numpy.array([[0.0, 0.0, 0.0], [0.5, 0.0, 0.0], [0.5, 0.5, 0.0]]))
+        self.assertRaises(ValueError, self._test_obj.q_delta, 'unknown')
+
+    def test_q_delta_lu_and_min_reduce_stiff_spectral_radius(self):
+        self._test_obj.init(num_nodes=5, interval=numpy.array([0.0, 2.0]))
+        _qmat = self._test_obj._qmat[1:, 1:]
+
+        def _stiff_spectral_radius(q_delta):
+            return numpy.abs(numpy.linalg.eigvals(numpy.eye(4) - numpy.linalg.solve(q_delta[1:, 1:], _qmat))).max()
+
+        _implicit_euler = _stiff_spectral_radius(self._test_obj.q_delta('implicit_euler'))
+        _lu = self._test_obj.q_delta('lu')
+        self.assertNumpyArrayAlmostEqual(_lu, numpy.tril(_lu))
+        self.assertLess(_stiff_spectral_radius(_lu), 1e-4)
+        _min = self._test_obj.q_delta('min')
+        self.assertNumpyArrayAlmostEqual(_min, numpy.diag(numpy.diag(_min)))
+        self.assertLess(_stiff_spectral_radius(_min), _implicit_euler)
+
+    def test_q_delta_is_recomputed_for_new_interval_width(self):
+        self._test_obj.init(num_nodes=3, interval=numpy.array([0.0, 1.0]))
+        _lu = self._test_obj.q_delta('lu').copy()
+        self._test_obj.transform_interval(numpy.array([0.0, 2.0]))
+        self.assertNumpyArrayAlmostEqual(self._test_obj.q_delta('lu'), 2.0 * _lu)
+
+    def test_evaluates_all_nodes_at_once(self):
+        self._test_obj.init(num_nodes=4, interval=numpy.array([0.0, 1.0]))
+        _data = numpy.arange(8.0).reshape(4, 2, 1)
+        _q = self._test_obj.evaluate_nodes(_data)
+        _s = self._test_obj.evaluate_nodes(_data, from_previous=True)
+        self.assertEqual(_q.shape, (4, 2, 1))
+        self.assertEqual(_s.shape, (3, 2, 1))
+        for _node in range(1, 4):
+            self.assertNumpyArrayAlmostEqual(_q[_node], self._test_obj.evaluate(_data, target_node=_node))
+            self.assertNumpyArrayAlmostEqual(_s[_node - 1],
+                                             self._test_obj.evaluate(_data, from_node=_node - 1, target_node=_node))
+
+        _out = numpy.empty((4, 2, 1))
+        self.assertIs(self._test_obj.evaluate_nodes(_data, out=_out), _out)
+        self.assertNumpyArrayAlmostEqual(_out, _q)
+        self.assertRaises(ValueError, self._test_obj.evaluate_nodes, _data[1:])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -49,6 +49,21 @@ class TimeTransitionProviderTest(unittest.TestCase):
     def setUp(self):
         pass
 
+    def test_injects_nested_nodes(self):
+        _test_obj = TimeTransitionProvider(coarse_nodes=numpy.linspace(0.0, 1.0, 3),
+                                           fine_nodes=numpy.linspace(0.0, 1.0, 5))
+        _fine = numpy.arange(10.0).reshape(5, 2)
+        assert_numpy_array_almost_equal(_test_obj.restringate(_fine), _fine[[0, 2, 4]])
+        assert_numpy_array_almost_equal(_test_obj.restringate(_fine),
+                                        numpy.tensordot(_test_obj.restringation_operator, _fine, axes=([1], [0])))
+
+    def test_shares_operators_of_shifted_intervals(self):
+        _first = TimeTransitionProvider(coarse_nodes=numpy.linspace(0.0, 1.0, 3),
+                                        fine_nodes=numpy.array([0.0, 0.2, 0.5, 0.8, 1.0]))
+        _second = TimeTransitionProvider(coarse_nodes=numpy.linspace(2.0, 4.0, 3),
+                                         fine_nodes=numpy.array([2.0, 2.4, 3.0, 3.6, 4.0]))
+        self.assertIs(_first.prolongation_operator, _second.prolongation_operator)
+
 
 if __name__ == '__main__':
     unittest.main()
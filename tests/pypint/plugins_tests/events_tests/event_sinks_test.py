@@ -0,0 +1,59 @@
+# coding=utf-8
+import io
+import json
+import unittest
+
+import numpy as np
+
+from pypint.plugins.events import SolverEvent, NullEventSink, RecordArrayEventSink, JsonLinesEventSink
+
+
+class SolverEventTest(unittest.TestCase):
+    def test_fills_missing_fields(self):
+        _event = SolverEvent(SolverEvent.Kind.interval_start, interval=1, time_start=0.5)
+        self.assertIsNone(_event.iteration)
+        _record = np.array([_event.as_record()], dtype=SolverEvent.dtype)[0]
+        self.assertEqual(_record['interval'], 1)
+        self.assertEqual(_record['iteration'], -1)
+        self.assertTrue(np.isnan(_record['residual']))
+        self.assertEqual(_record['reason'], '')
+
+    def test_rejects_unknown_fields(self):
+        self.assertRaises(TypeError, SolverEvent, SolverEvent.Kind.iteration, not_a_field=1)
+
+
+class EventSinksTest(unittest.TestCase):
+    def setUp(self):
+        self._events = [
+            SolverEvent(SolverEvent.Kind.iteration, interval=0, iteration=0, residual=np.float64(1e-3)),
+            SolverEvent(SolverEvent.Kind.interval_end, interval=0, iteration=0, reason='residual')
+        ]
+
+    def test_null_sink_is_disabled(self):
+        self.assertFalse(NullEventSink().enabled)
+
+    def test_record_array_sink(self):
+        _sink = RecordArrayEventSink()
+        self.assertEqual(_sink.records.shape, (0,))
+        for _event in self._events:
+            _sink.emit(_event)
+        self.assertEqual(len(_sink), 2)
+        self.assertEqual(_sink.records.dtype, SolverEvent.dtype)
+        self.assertEqual(_sink.of_kind(SolverEvent.Kind.iteration).residual.tolist(), [1e-3])
+        _sink.clear()
+        self.assertEqual(len(_sink), 0)
+
+    def test_json_lines_sink(self):
+        _file = io.StringIO()
+        _sink = JsonLinesEventSink(_file)
+        for _event in self._events:
+            _sink.emit(_event)
+        _sink.close()
+        _lines = [json.loads(_line) for _line in _file.getvalue().splitlines()]
+        self.assertEqual([_line['kind'] for _line in _lines], ['iteration', 'interval end'])
+        self.assertEqual(_lines[0]['residual'], 1e-3)
+        self.assertIsNone(_lines[0]['reason'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# coding=utf-8
+
+from concurrent.futures import ThreadPoolExecutor
+import pickle
+import time
+import unittest
+from tests.__init__ import NumpyAwareTestCase
+from pypint.plugins.implicit_solvers.newton_krylov import NewtonKrylovSolver
+import numpy as np
+import scipy.sparse as sprs
+
+
+def _bratu(size):
+    # -u'' - exp(u) = 0 discretized with homogeneous Dirichlet boundaries
+    _h = 1.0 / (size + 1)
+    _laplace = sprs.diags([np.ones(size - 1), -2.0 * np.ones(size), np.ones(size - 1)], [-1, 0, 1]) / _h ** 2
+    _func = lambda u: _laplace.dot(u) + np.exp(u)
+    _jacobian = lambda u: _laplace + sprs.diags([np.exp(u)], [0])
+    return _func, _jacobian
+
+
+class _SlowlyHashedKey(object):
+    """Switches threads between the lookup and the update of a cache entry
+    """
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        time.sleep(1e-4)
+        return hash(self.value)
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+class NewtonKrylovSolverTest(NumpyAwareTestCase):
+    def test_scalar_root(self):
+        _sol = NewtonKrylovSolver(tolerance=1e-12).solve(lambda x: x ** 3 - 8.0, np.array([1.0, 3.0]))
+        self.assertTrue(_sol.success)
+        self.assertNumpyArrayAlmostEqual(_sol.x, np.array([2.0, 2.0]))
+
+    def test_complex_root(self):
+        _func = lambda x: np.array([-1.0 + 1.0j, -1.0], dtype=np.complex) + x
+        _sol = NewtonKrylovSolver().solve(_func, np.array([0.0, 0.0], dtype=np.complex))
+        self.assertTrue(_sol.success)
+        self.assertNumpyArrayAlmostEqual(_sol.x, np.array([1.0 - 1.0j, 1.0], dtype=np.complex))
+
+    def test_matrix_free_and_preconditioned(self):
+        _func, _jacobian = _bratu(200)
+        _x0 = np.zeros(200)
+        _plain = NewtonKrylovSolver(preconditioner=None, krylov_tolerance=1e-8, max_iterations=20).solve(_func, _x0)
+        _preconditioned = NewtonKrylovSolver().solve(_func, _x0, jacobian=_jacobian(_x0))
+        _exact = NewtonKrylovSolver(matrix_free=False, preconditioner='lu').solve(_func, _x0, jacobian=_jacobian(_x0))
+        self.assertTrue(_preconditioned.success)
+        self.assertTrue(_exact.success)
+        self.assertLess(np.abs(_func(_preconditioned.x)).max(), 1e-10)
+        self.assertNumpyArrayAlmostEqual(_preconditioned.x, _exact.x, places=8)
+        if _plain.success:
+            self.assertNumpyArrayAlmostEqual(_plain.x, _exact.x, places=6)
+        self.assertLessEqual(_preconditioned.nfev, _plain.nfev)
+
+    def test_reuses_jacobian_by_key(self):
+        _func, _jacobian = _bratu(50)
+        _calls = []
+
+        def _counting_jacobian():
+            _calls.append(1)
+            return _jacobian(np.zeros(50))
+
+        _solver = NewtonKrylovSolver()
+        for i in range(3):
+            self.assertTrue(_solver.solve(_func, np.zeros(50), jacobian=_counting_jacobian, key='a').success)
+        self.assertEqual(len(_calls), 1)
+        _solver.solve(_func, np.zeros(50), jacobian=_counting_jacobian, key='b')
+        self.assertEqual(len(_calls), 2)
+        _solver.reset()
+        _solver.solve(_func, np.zeros(50), jacobian=_counting_jacobian, key='a')
+        self.assertEqual(len(_calls), 3)
+
+        _limited = NewtonKrylovSolver(max_reuse=2)
+        _calls.clear()
+        for i in range(3):
+            _limited.solve(_func, np.zeros(50), jacobian=_counting_jacobian, key='a')
+        self.assertEqual(len(_calls), 2)
+
+    def test_keeps_least_recently_used_jacobians(self):
+        _func, _jacobian = _bratu(50)
+        _calls = []
+
+        def _counting_jacobian():
+            _calls.append(1)
+            return _jacobian(np.zeros(50))
+
+        _solver = NewtonKrylovSolver(cache_size=2)
+        for _key in ['a', 'b', 'a', 'c']:
+            _solver.solve(_func, np.zeros(50), jacobian=_counting_jacobian, key=_key)
+        self.assertEqual(len(_calls), 3)
+        # 'b' was evicted as least recently used, 'a' is still cached
+        _solver.solve(_func, np.zeros(50), jacobian=_counting_jacobian, key='a')
+        self.assertEqual(len(_calls), 3)
+        _solver.solve(_func, np.zeros(50), jacobian=_counting_jacobian, key='b')
+        self.assertEqual(len(_calls), 4)
+
+        for _delta_time in np.linspace(0.1, 1.0, 50):
+            _solver.solve(_func, np.zeros(50), jacobian=_counting_jacobian, key=(_delta_time, None, 0))
+        self.assertEqual(len(_solver._cache), 2)
+
+    def test_shares_cache_between_threads(self):
+        _solver = NewtonKrylovSolver(cache_size=1)
+        with ThreadPoolExecutor(max_workers=8) as _pool:
+            _solutions = list(_pool.map(lambda _key: _solver.solve(lambda x: x - 1.0, np.zeros(2),
+                                                                   key=_SlowlyHashedKey(_key % 3)),
+                                        range(500)))
+        self.assertTrue(all(_sol.success for _sol in _solutions))
+        self.assertEqual(len(_solver._cache), 1)
+        # solvers without cached factorizations are passed to the processes of PFASST and Parareal
+        self.assertTrue(pickle.loads(pickle.dumps(NewtonKrylovSolver())).solve(lambda x: x - 1.0, np.zeros(2)).success)
+
+    def test_rejects_invalid_options(self):
+        self.assertRaises(ValueError, NewtonKrylovSolver, krylov_method='not a method')
+        self.assertRaises(ValueError, NewtonKrylovSolver, preconditioner='not a preconditioner')
+        self.assertRaises(ValueError, NewtonKrylovSolver, cache_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+# coding=utf-8
+
+import gc
+import unittest
+from tests.__init__ import NumpyAwareTestCase
+import numpy as np
+from pypint.plugins.multigrid.stencil import Stencil
+from pypint.plugins.multigrid.factorization_registry import FactorizationRegistry, FACTORIZATION_REGISTRY
+from pypint.utilities.assertions import validation_level, set_validation_level
+
+
+LAPLACE = np.array([1.0, -2.0, 1.0])
+
+
+class FactorizationRegistryTest(NumpyAwareTestCase):
+    def setUp(self):
+        self._registry = FactorizationRegistry()
+
+    def test_shares_factorizations(self):
+        _solver = self._registry.acquire(Stencil(LAPLACE), (7,))
+        self.assertIs(self._registry.acquire(Stencil(LAPLACE.copy()), (7,)), _solver)
+        self.assertIsNot(self._registry.acquire(Stencil(LAPLACE), (9,)), _solver)
+        self.assertIsNot(self._registry.acquire(Stencil(LAPLACE), (7,), boundaries=['periodic']), _solver)
+        self.assertEqual(len(self._registry), 3)
+        self.assertEqual(self._registry.references(self._registry.key(Stencil(LAPLACE), (7,))), 2)
+
+    def test_solves(self):
+        _stencil = Stencil(LAPLACE)
+        _x = np.arange(1.0, 8.0)
+        _b = _stencil.to_sparse_matrix((7,)).dot(_x)
+        self.assertNumpyArrayAlmostEqual(self._registry.acquire(_stencil, (7,))(_b), _x)
+
+    def test_evicts_unreferenced_only(self):
+        _stencil = Stencil(LAPLACE)
+        _referenced = self._registry.key(_stencil, (7,))
+        _unreferenced = self._registry.key(_stencil, (9,))
+        self._registry.acquire(_stencil, (7,))
+        self._registry.acquire(_stencil, (9,))
+        self._registry.release(_unreferenced)
+        self._registry.max_bytes = 0
+        self.assertIn(_referenced, self._registry)
+        self.assertNotIn(_unreferenced, self._registry)
+
+    def test_releases_with_owner(self):
+        _stencil = Stencil(LAPLACE)
+        _key = self._registry.key(_stencil, (7,))
+        self._registry.acquire(_stencil, (7,), owner=_stencil)
+        self.assertEqual(self._registry.references(_key), 1)
+        del _stencil
+        gc.collect()
+        self.assertEqual(self._registry.references(_key), 0)
+
+    def test_rejects_releases_without_reference(self):
+        _level = validation_level()
+        set_validation_level('off')
+        try:
+            _key = self._registry.key(Stencil(LAPLACE), (7,))
+            self._registry.acquire(Stencil(LAPLACE), (7,))
+            self._registry.release(_key)
+            self.assertRaises(RuntimeError, self._registry.release, _key)
+            self.assertEqual(self._registry.references(_key), 0)
+        finally:
+            set_validation_level(_level)
+
+    def test_stencil_uses_process_wide_registry(self):
+        _first = Stencil(LAPLACE)
+        _second = Stencil(LAPLACE.copy())
+        self.assertIs(_first.generate_direct_solver((11,)), _second.generate_direct_solver((11,)))
+        self.assertEqual(FACTORIZATION_REGISTRY.references(FACTORIZATION_REGISTRY.key(_first, (11,))), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
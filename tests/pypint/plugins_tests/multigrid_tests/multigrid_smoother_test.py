@@ -0,0 +1,115 @@
+# coding=utf-8
+
+import unittest
+from tests.__init__ import NumpyAwareTestCase
+import numpy as np
+from pypint.plugins.multigrid.multigrid_problem import MultigridProblem
+from pypint.plugins.multigrid.level2d import MultigridLevel2D
+from pypint.plugins.multigrid.stencil import Stencil
+from pypint.plugins.multigrid.multigrid_smoother import DirectSolverSmoother, MultiColorGaussSeidelSmoother, \
+    RedBlackGaussSeidelSmoother, ChebyshevSmoother, estimate_max_eigenvalue, ILUSmoother
+
+
+FIVE_POINT = np.array([[0.0, 1.0, 0.0], [1.0, -4.0, 1.0], [0.0, 1.0, 0.0]])
+NINE_POINT = np.array([[1.0, 4.0, 1.0], [4.0, -20.0, 4.0], [1.0, 4.0, 1.0]])
+
+
+def _boundary(x):
+    return np.sin(x[0] * np.pi)
+
+
+def _level_and_reference(stencil, shape=(9, 9)):
+    _problem = MultigridProblem(rhs_function_wrt_space=lambda x, y: 0.0, dim=(shape[0], shape[1], 1),
+                                boundary_functions=[[_boundary, _boundary], [_boundary, _boundary]],
+                                boundaries="dirichlet", geometry=np.array([[0, 1], [0, 1]]))
+    _levels = []
+    for _i in range(2):
+        _level = MultigridLevel2D(shape, mg_problem=_problem, max_borders=np.array([[1, 1], [1, 1]]), role="FL")
+        _level.pad()
+        _level.rhs[:] = 1.0
+        _levels.append(_level)
+    stencil.modify_rhs(_levels[1])
+    DirectSolverSmoother(stencil, _levels[1]).relax()
+    return _levels[0], _levels[1].mid
+
+
+class MultiColorGaussSeidelSmootherTest(NumpyAwareTestCase):
+    def test_red_black_converges_to_direct_solution(self):
+        _stencil = Stencil(FIVE_POINT)
+        _level, _reference = _level_and_reference(_stencil)
+        _smoother = RedBlackGaussSeidelSmoother(_stencil, _level)
+        self.assertEqual(_smoother.num_colors, 2)
+        _smoother.relax(300)
+        self.assertNumpyArrayAlmostEqual(_level.mid, _reference, places=8)
+
+    def test_red_black_with_modified_rhs(self):
+        _stencil = Stencil(FIVE_POINT)
+        _level, _reference = _level_and_reference(_stencil)
+        _stencil.modify_rhs(_level)
+        RedBlackGaussSeidelSmoother(_stencil, _level).relax(300)
+        self.assertNumpyArrayAlmostEqual(_level.mid, _reference, places=8)
+
+    def test_red_black_rejects_nine_point_stencil(self):
+        _stencil = Stencil(NINE_POINT)
+        _level, _reference = _level_and_reference(_stencil)
+        self.assertRaises(ValueError, RedBlackGaussSeidelSmoother, _stencil, _level)
+
+    def test_multicolor_converges_for_nine_point_stencil(self):
+        _stencil = Stencil(NINE_POINT)
+        _level, _reference = _level_and_reference(_stencil)
+        _smoother = MultiColorGaussSeidelSmoother(_stencil, _level)
+        self.assertEqual(_smoother.num_colors, 4)
+        _smoother.relax(300)
+        self.assertNumpyArrayAlmostEqual(_level.mid, _reference, places=8)
+
+    def test_over_relaxation_reduces_residual(self):
+        _stencil = Stencil(FIVE_POINT)
+        _level, _reference = _level_and_reference(_stencil)
+        _error = np.abs(_level.mid - _reference).max()
+        RedBlackGaussSeidelSmoother(_stencil, _level, omega=1.5).relax(5)
+        self.assertLess(np.abs(_level.mid - _reference).max(), _error)
+
+
+class ChebyshevSmootherTest(NumpyAwareTestCase):
+    def test_eigenvalue_estimate(self):
+        # eigenvalues of D^-1 A for the 5-point Laplacian are 1 - cos(k pi h) / 2 - cos(l pi h) / 2 < 2
+        _stencil = Stencil(FIVE_POINT)
+        for _method in ["power", "lanczos"]:
+            _lambda = estimate_max_eigenvalue(_stencil, (9, 9), method=_method, iterations=20)
+            self.assertGreater(_lambda, 1.6)
+            self.assertLess(_lambda, 2.0)
+
+    def test_eigenvalue_estimate_is_shared_by_scaled_stencils(self):
+        _lambda = estimate_max_eigenvalue(Stencil(FIVE_POINT), (9, 9))
+        self.assertEqual(estimate_max_eigenvalue(Stencil(0.1 * FIVE_POINT), (9, 9)), _lambda)
+
+    def test_converges_to_direct_solution(self):
+        for _modify in [False, True]:
+            _stencil = Stencil(FIVE_POINT)
+            _level, _reference = _level_and_reference(_stencil)
+            if _modify:
+                _stencil.modify_rhs(_level)
+            ChebyshevSmoother(_stencil, _level, degree=4).relax(100)
+            self.assertNumpyArrayAlmostEqual(_level.mid, _reference, places=8)
+
+
+class ILUSmootherTest(NumpyAwareTestCase):
+    def test_converges_to_direct_solution(self):
+        for _modify in [False, True]:
+            _stencil = Stencil(FIVE_POINT)
+            _level, _reference = _level_and_reference(_stencil)
+            if _modify:
+                _stencil.modify_rhs(_level)
+            ILUSmoother(_stencil, _level, drop_tolerance=1e-2).relax(50)
+            self.assertNumpyArrayAlmostEqual(_level.mid, _reference, places=8)
+
+    def test_reuses_factorization(self):
+        _level, _reference = _level_and_reference(Stencil(FIVE_POINT))
+        _first = ILUSmoother(Stencil(FIVE_POINT), _level)
+        _second = ILUSmoother(Stencil(FIVE_POINT.copy()), _level)
+        self.assertIs(_first.solver, _second.solver)
+        self.assertIsNot(ILUSmoother(Stencil(NINE_POINT), _level).solver, _first.solver)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# coding=utf-8
+from concurrent.futures import ThreadPoolExecutor
+import io
+import json
+import unittest
+
+from pypint.plugins.timers.instrumentation import Instrumentation, active_instrumentation, timed
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self):
+        self._test_obj = Instrumentation()
+
+    def test_nests_timers_per_context(self):
+        for _iteration in range(0, 2):
+            self._test_obj.set_context(interval=0, iteration=_iteration)
+            with self._test_obj.timing('sweep'):
+                for _node in range(0, 3):
+                    with self._test_obj.timing('rhs'):
+                        self._test_obj.count('values', 2)
+        _timers = self._test_obj.timers
+        self.assertEqual([(_t['iteration'], _t['path'], _t['count']) for _t in _timers],
+                         [(0, 'sweep', 1), (0, 'sweep/rhs', 3), (1, 'sweep', 1), (1, 'sweep/rhs', 3)])
+        self.assertGreaterEqual(_timers[0]['total'], _timers[1]['total'])
+        self.assertEqual(self._test_obj.counters[0]['path'], 'sweep/rhs/values')
+        self.assertEqual(self._test_obj.counters[0]['count'], 6)
+
+        _aggregated = self._test_obj.aggregate('interval')
+        self.assertEqual([(_t['interval'], _t['path'], _t['count']) for _t in _aggregated],
+                         [(0, 'sweep', 2), (0, 'sweep/rhs', 6)])
+        self.assertNotIn('iteration', _aggregated[0])
+
+    def test_records_into_active_instrumentation(self):
+        @timed('work')
+        def _work():
+            return active_instrumentation()
+
+        self.assertIsNot(_work(), self._test_obj)
+        self._test_obj.activate()
+        self.assertIs(_work(), self._test_obj)
+        self._test_obj.deactivate()
+        self.assertEqual(len(self._test_obj.timers), 1)
+
+    def test_joins_forks_of_worker_threads(self):
+        self._test_obj.set_context(interval=0, iteration=1)
+        _forks = [self._test_obj.fork() for _worker in range(0, 3)]
+
+        def _work(fork):
+            fork.activate()
+            with active_instrumentation().timing('rhs'):
+                active_instrumentation().count('values', 2)
+            fork.deactivate()
+
+        with ThreadPoolExecutor(max_workers=3) as _pool:
+            list(_pool.map(_work, _forks))
+        with self._test_obj.timing('sweep'):
+            for _fork in _forks:
+                self._test_obj.join(_fork)
+        self.assertEqual([(_t['interval'], _t['iteration'], _t['path'], _t['count']) for _t in self._test_obj.timers],
+                         [(0, 1, 'sweep', 1), (0, 1, 'sweep/rhs', 3)])
+        self.assertEqual(self._test_obj.counters[0]['path'], 'sweep/rhs/values')
+        self.assertEqual(self._test_obj.counters[0]['count'], 6)
+
+    def test_can_be_disabled(self):
+        self._test_obj.enabled = False
+        with self._test_obj.timing('sweep'):
+            self._test_obj.count('values')
+        self.assertEqual(self._test_obj.timers, [])
+        self.assertEqual(self._test_obj.counters, [])
+
+    def test_exports_json_and_csv(self):
+        self._test_obj.set_context(level=1)
+        with self._test_obj.timing('sweep'):
+            self._test_obj.count('values')
+
+        _json = io.StringIO()
+        self._test_obj.to_json(_json)
+        _data = json.loads(_json.getvalue())
+        self.assertEqual(_data['timers'][0]['level'], 1)
+        self.assertEqual(_data['counters'][0]['path'], 'sweep/values')
+
+        _csv = io.StringIO()
+        self._test_obj.to_csv(_csv)
+        _lines = _csv.getvalue().splitlines()
+        self.assertEqual(_lines[0], 'kind,interval,iteration,level,path,count,total,max')
+        self.assertEqual(len(_lines), 3)
+        self.assertTrue(_lines[2].startswith('counter,,,1,sweep/values,1'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 # coding=utf-8
 import unittest
 
+import numpy as np
+
 from pypint.problems.i_problem import IProblem
 from pypint.problems.has_exact_solution_mixin import HasExactSolutionMixin, problem_has_exact_solution
 
@@ -30,6 +32,12 @@ class HasExactSolutionMixinTest(unittest.TestCase):
         self._default.exact_function = self._func
         self.assertRaises(ValueError, self._default.exact, time="not a time")
 
+    def test_evaluates_exact_solution_at_multiple_time_points(self):
+        self._default.exact_function = lambda t: np.array([t, 2.0 * t])
+        self.assertEqual(self._default.exact_batch(np.array([0.0, 0.5, 1.0])).tolist(),
+                         [[0.0, 0.0], [0.5, 1.0], [1.0, 2.0]])
+        self.assertRaises(ValueError, self._default.exact_batch, [0.0, 0.5])
+
     def test_problem_has_exact_solution_introspection(self):
         self.assertTrue(problem_has_exact_solution(self._default))
         self.assertFalse(problem_has_exact_solution(IProblem()))
@@ -1,7 +1,11 @@
 # coding=utf-8
+from concurrent.futures import ThreadPoolExecutor
+import sys
+
 import numpy as np
 
 from pypint.problems.i_problem import IProblem
+from pypint.plugins.implicit_solvers.newton_krylov import NewtonKrylovSolver
 from tests import NumpyAwareTestCase
 
 
@@ -45,6 +49,28 @@ class IProblemTest(NumpyAwareTestCase):
         self.assertRaises(ValueError, self._default.evaluate_wrt_time, complex(1.0, 1.0), np.array([1.0]))
         self.assertRaises(ValueError, self._default.evaluate_wrt_time, 1.0, 1.0)
 
+    def test_provides_batched_evaluation(self):
+        _rhs = self._default.evaluate_wrt_time_batch(np.array([0.0, 0.5, 1.0]), np.ones((3, 1)))
+        self.assertEqual(_rhs.shape[0], 3)
+        self.assertEqual(self._default.rhs_evaluations, 3)
+        self.assertRaises(ValueError, self._default.evaluate_wrt_time_batch, np.array([0.0, 0.5]), np.ones((3, 1)))
+        self.assertRaises(ValueError, self._default.evaluate_wrt_time_batch, [0.0], np.ones((1, 1)))
+
+    def test_counts_evaluations_of_concurrent_threads(self):
+        def _evaluate(thread_index):
+            for i in range(2000):
+                self._default.evaluate_wrt_time(0.0, np.array([1.0]))
+
+        _switch_interval = sys.getswitchinterval()
+        # switching threads often makes lost updates of the counter likely
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as _pool:
+                list(_pool.map(_evaluate, range(8)))
+        finally:
+            sys.setswitchinterval(_switch_interval)
+        self.assertEqual(self._default.rhs_evaluations, 8 * 2000)
+
     def test_provides_implicit_solver(self):
         _test_obj = IProblem(dim=(3, 2, 1))
         _next_x = np.arange(6).reshape(_test_obj.dim_for_time_solver)
@@ -55,6 +81,27 @@ class IProblemTest(NumpyAwareTestCase):
         self.assertRaises(ValueError, _test_obj.implicit_solve, 1.0, _func)
         self.assertRaises(ValueError, _test_obj.implicit_solve, _next_x, "not callable")
 
+    def test_provides_newton_krylov_implicit_solver(self):
+        _jacobian_calls = []
+
+        class _CubicProblem(IProblem):
+            def evaluate_wrt_time(self, time, phi_of_time, **kwargs):
+                return -phi_of_time ** 3
+
+            def jacobian_wrt_time(self, time, phi_of_time, **kwargs):
+                _jacobian_calls.append(time)
+                return np.diag(-3.0 * phi_of_time.reshape(-1) ** 2)
+
+        _test_obj = _CubicProblem(dim=(3, 1), implicit_solver=NewtonKrylovSolver(tolerance=1e-12))
+        _expl = np.array([1.0, 2.0, 3.0])
+        for _time in [0.1, 0.2]:
+            _func = lambda x: _expl - 0.5 * x ** 3 - x
+            _x = _test_obj.implicit_solve(np.ones(3), _func, time_point=_time, delta_time=0.5)
+            self.assertNumpyArrayAlmostEqual(_func(_x.reshape(-1)), np.zeros(3))
+        self.assertEqual(len(_jacobian_calls), 1)
+
+        self.assertRaises(ValueError, IProblem, implicit_solver="not a solver")
+
     def test_takes_descriptive_strings(self):
         self.assertRegex(self._default.__str__(), "IProblem")
 
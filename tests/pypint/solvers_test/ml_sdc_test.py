@@ -0,0 +1,124 @@
+# coding=utf-8
+import unittest
+
+import numpy as np
+
+from pypint.solvers.ml_sdc import MlSdc
+from pypint.solvers.cores import ImplicitMlSdcCore, SemiImplicitMlSdcCore
+from pypint.communicators import ForwardSendingMessaging
+from pypint.multi_level_providers.multi_time_level_provider import MultiTimeLevelProvider
+from pypint.multi_level_providers.level_transition_providers.time_transition_provider import TimeTransitionProvider
+from pypint.integrators.sdc_integrator import SdcIntegrator
+from pypint.utilities.threshold_check import ThresholdCheck
+from pypint.plugins.events import RecordArrayEventSink, SolverEvent
+from pypint.plugins.timers.instrumentation import active_instrumentation
+from examples.problems.lambda_u import LambdaU
+from tests import NumpyAwareTestCase
+
+
+def _ml_provider(num_nodes, numeric_types=None):
+    _provider = MultiTimeLevelProvider()
+    _integrators = []
+    for _level, _num_nodes in enumerate(num_nodes):
+        _integrators.append(SdcIntegrator())
+        _integrators[-1].init(num_nodes=_num_nodes)
+        _provider.add_coarse_level(_integrators[-1],
+                                   numeric_type=numeric_types[_level] if numeric_types is not None else None)
+    for _fine in range(0, len(_integrators) - 1):
+        _coarse_level = len(_integrators) - 2 - _fine
+        _provider.add_level_transition(TimeTransitionProvider(fine_nodes=_integrators[_fine].nodes,
+                                                              coarse_nodes=_integrators[_fine + 1].nodes),
+                                       _coarse_level, _coarse_level + 1)
+    return _provider
+
+
+def _run_mlsdc(problem, core, num_nodes, numeric_types=None):
+    _comm = ForwardSendingMessaging()
+    _mlsdc = MlSdc(communicator=_comm)
+    _comm.link_solvers(previous=_comm, next=_comm)
+    _provider = _ml_provider(num_nodes, numeric_types)
+    _comm.write_buffer(tag=(_provider.num_levels - 1), value=problem.initial_value, time_point=problem.time_start)
+    _mlsdc.init(problem=problem, ml_provider=_provider,
+                threshold=ThresholdCheck(max_threshold=30, min_threshold=1e-12,
+                                         conditions=('solution reduction', 'iterations')))
+    return _mlsdc.run(core, dt=0.5)[-1].solutions[-1].data[-1].value
+
+
+def _run_mlsdc_with_predictor(problem, core, predictor):
+    _comm = ForwardSendingMessaging()
+    _mlsdc = MlSdc(communicator=_comm)
+    _mlsdc.event_sink = RecordArrayEventSink()
+    _comm.link_solvers(previous=_comm, next=_comm)
+    _provider = _ml_provider([7, 3])
+    _comm.write_buffer(tag=(_provider.num_levels - 1), value=problem.initial_value, time_point=problem.time_start)
+    _mlsdc.init(problem=problem, ml_provider=_provider, predictor=predictor,
+                threshold=ThresholdCheck(max_threshold=30, min_threshold=1e-10, conditions=('residual', 'iterations')))
+    _mlsdc.run(core, dt=1.0)
+    return _mlsdc
+
+
+class _FailingLambdaU(LambdaU):
+    def evaluate_wrt_time(self, time_point, phi_of_time, **kwargs):
+        raise ArithmeticError("failing right hand side")
+
+    def evaluate_wrt_time_batch(self, times, values, **kwargs):
+        raise ArithmeticError("failing right hand side")
+
+
+class MlSdcTest(NumpyAwareTestCase):
+    def test_three_levels_converge_to_collocation_solution_of_finest_level(self):
+        for _core in [ImplicitMlSdcCore, SemiImplicitMlSdcCore]:
+            _two_levels = _run_mlsdc(LambdaU(lmbda=complex(-1.0, 1.0)), _core, [7, 5])
+            _three_levels = _run_mlsdc(LambdaU(lmbda=complex(-1.0, 1.0)), _core, [7, 5, 3])
+            self.assertNumpyArrayAlmostEqual(_three_levels, _two_levels, delta=1e-12)
+
+    def test_coarse_predictor_improves_initial_guess(self):
+        for _core in [ImplicitMlSdcCore, SemiImplicitMlSdcCore]:
+            problem = LambdaU(lmbda=complex(-1.0, 1.0))
+            _spread = _run_mlsdc_with_predictor(problem, _core, 'spread')
+            _coarse = _run_mlsdc_with_predictor(problem, _core, 'coarse')
+            self.assertIsNone(_spread.state.predictor)
+            for _step_index in range(0, len(_coarse.state.predictor)):
+                _step = _coarse.state.predictor[_step_index]
+                _exact = problem.exact(_step.time_point)
+                self.assertLess(np.abs(_step.value - _exact).max(), np.abs(problem.initial_value - _exact).max())
+
+            _spread_iterations = _spread.event_sink.of_kind(SolverEvent.Kind.iteration)
+            _coarse_iterations = _coarse.event_sink.of_kind(SolverEvent.Kind.iteration)
+            self.assertLess(_coarse_iterations.residual[0], 0.5 * _spread_iterations.residual[0])
+            self.assertLess(len(_coarse_iterations), len(_spread_iterations))
+
+    def test_coarse_levels_in_single_precision(self):
+        for _core in [ImplicitMlSdcCore, SemiImplicitMlSdcCore]:
+            _double = _run_mlsdc(LambdaU(lmbda=complex(-1.0, 1.0)), _core, [7, 5, 3])
+            _mixed = _run_mlsdc(LambdaU(lmbda=complex(-1.0, 1.0)), _core, [7, 5, 3],
+                                numeric_types=[None, np.complex64, np.complex64])
+            self.assertEqual(_mixed.dtype, _double.dtype)
+            # well below the machine precision of the coarse levels
+            self.assertNumpyArrayAlmostEqual(_mixed, _double, delta=1e-8)
+
+    def test_transfers_cast_to_numeric_type_of_level(self):
+        _provider = _ml_provider([5, 3], numeric_types=[None, np.float32])
+        self.assertIsNone(_provider.numeric_type(1))
+        self.assertEqual(_provider.numeric_type(0), np.float32)
+        _fine = np.linspace(0.0, 1.0, 5)
+        _coarse = _provider.restringate(_fine, fine_level=1)
+        self.assertEqual(_coarse.dtype, np.float32)
+        self.assertEqual(_provider.restringate(_fine, fine_level=1, cast=False).dtype, np.float64)
+        self.assertEqual(_provider.prolongate(_coarse, coarse_level=0).dtype, np.float64)
+
+    def test_deactivates_instrumentation_if_run_raises(self):
+        problem = _FailingLambdaU(lmbda=-1.0)
+        _comm = ForwardSendingMessaging()
+        _mlsdc = MlSdc(communicator=_comm)
+        _comm.link_solvers(previous=_comm, next=_comm)
+        _provider = _ml_provider([5, 3])
+        _comm.write_buffer(tag=(_provider.num_levels - 1), value=problem.initial_value, time_point=problem.time_start)
+        _mlsdc.init(problem=problem, ml_provider=_provider)
+        _active = active_instrumentation()
+        self.assertRaises(ArithmeticError, _mlsdc.run, SemiImplicitMlSdcCore, dt=0.5)
+        self.assertIs(active_instrumentation(), _active)
+
+
+if __name__ == '__main__':
+    unittest.main()
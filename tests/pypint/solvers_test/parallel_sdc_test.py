@@ -1,4 +1,9 @@
 # coding=utf-8
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import numpy as np
+
 from nose.tools import *
 
 from tests import NumpyAwareTestCase
@@ -7,6 +12,8 @@ from pypint.solvers.parallel_sdc import ParallelSdc
 from pypint.communicators.forward_sending_messaging import ForwardSendingMessaging
 from pypint.utilities.threshold_check import ThresholdCheck
 from pypint.solvers.cores import ExplicitSdcCore, ImplicitSdcCore, SemiImplicitSdcCore
+from pypint.problems import IInitialValueProblem
+from pypint.plugins.events import SolverEvent, RecordArrayEventSink
 from examples.problems.lambda_u import LambdaU
 from examples.problems.constant import Constant
 
@@ -284,6 +291,28 @@ def test_lambda_u_with_semi_implicit_sdc():
                     _num_time_steps, _dt, _num_nodes, _expected_iterations[_num_time_steps][_dt][_num_nodes]
 
 
+class _LinearProblem(IInitialValueProblem):
+    """:math:`u' = \\lambda u` with the real part of :math:`\\lambda` as implicit part
+
+    The implicit equations are affine, thus they are solved exactly by a single evaluation of their function.
+    Hence, the number of right hand side evaluations of a run does not depend on an iterative implicit solver.
+    """
+    def __init__(self, lmbda):
+        super(_LinearProblem, self).__init__(time_start=0.0, time_end=1.0, numeric_type=np.complex)
+        self.initial_value = np.ones(self.dim, dtype=np.complex)
+        self.lmbda = lmbda
+
+    def evaluate_wrt_time(self, time, phi_of_time, **kwargs):
+        super(_LinearProblem, self).evaluate_wrt_time(time, phi_of_time, **kwargs)
+        _lmbda = {None: self.lmbda, 'impl': self.lmbda.real, 'expl': 1j * self.lmbda.imag}[kwargs.get('partial')]
+        return _lmbda * phi_of_time
+
+    def implicit_solve(self, next_x, func, method="unused", **kwargs):
+        _lmbda = self.lmbda.real if kwargs.get('partial') == 'impl' else self.lmbda
+        return (func(np.zeros(next_x.shape, dtype=np.complex)) / (1.0 - kwargs['delta_time'] * _lmbda))\
+            .reshape(self.dim_for_time_solver)
+
+
 class SdcTest(NumpyAwareTestCase):
     def setUp(self):
         # self._test_obj = ParallelSdc()
@@ -293,6 +322,211 @@ class SdcTest(NumpyAwareTestCase):
         problem = Constant(constant=-1.0, shift=1.0, dim=(2, 3, 1))
         _run_sdc_with_problem(problem, SemiImplicitSdcCore, 1, 1.0, 3, 2, PRECISION)
 
+    def test_lu_trick_reduces_iterations_for_stiff_problem(self):
+        _iterations = {}
+        _values = {}
+        for _q_delta_type in ['implicit_euler', 'lu']:
+            problem = LambdaU(lmbda=-20.0)
+            thresh = ThresholdCheck(max_threshold=50, min_threshold=1e-12,
+                                    conditions=('solution reduction', 'iterations'))
+            _comm = ForwardSendingMessaging()
+            _sdc = ParallelSdc(communicator=_comm)
+            _comm.link_solvers(previous=_comm, next=_comm)
+            _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+            _sdc.init(integrator=SdcIntegrator, threshold=thresh, problem=problem, num_time_steps=1, num_nodes=5,
+                      q_delta_type=_q_delta_type)
+            _sdc.run(ImplicitSdcCore, dt=1.0)
+            _iterations[_q_delta_type] = len(_sdc._states[-1])
+            _values[_q_delta_type] = _sdc._states[-1].last_iteration.final_step.value
+        self.assertLess(_iterations['lu'], _iterations['implicit_euler'] / 2)
+        self.assertNumpyArrayAlmostEqual(_values['lu'], _values['implicit_euler'], delta=1e-10)
+
+    def test_predictors_reduce_iterations(self):
+        _iterations = {}
+        _values = {}
+        for _predictor in ParallelSdc.predictor_types:
+            problem = LambdaU(lmbda=-1.0)
+            thresh = ThresholdCheck(max_threshold=50, min_threshold=1e-12,
+                                    conditions=('solution reduction', 'iterations'))
+            _comm = ForwardSendingMessaging()
+            _sdc = ParallelSdc(communicator=_comm)
+            _comm.link_solvers(previous=_comm, next=_comm)
+            _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+            _sdc.init(integrator=SdcIntegrator, threshold=thresh, problem=problem, num_time_steps=1, num_nodes=5,
+                      predictor=_predictor)
+            _sdc.run(ImplicitSdcCore, dt=0.25)
+            _iterations[_predictor] = [len(_state) for _state in _sdc._states]
+            _values[_predictor] = _sdc._states[-1].last_iteration.final_step.value
+        for _predictor in ['explicit_euler', 'implicit_euler']:
+            self.assertLess(sum(_iterations[_predictor]), sum(_iterations['spread']))
+        # extrapolation needs a previous interval
+        self.assertEqual(_iterations['extrapolation'][0], _iterations['spread'][0])
+        self.assertLess(sum(_iterations['extrapolation'][1:]), sum(_iterations['spread'][1:]))
+        for _predictor in ParallelSdc.predictor_types:
+            self.assertNumpyArrayAlmostEqual(_values[_predictor], _values['spread'], delta=1e-10)
+
+    def test_reuses_right_hand_side_evaluations(self):
+        # without the cached partial right hand sides of the steps the implicit core needs 98 and 130, the
+        # semi-implicit core 162 and 194 evaluations
+        _expected = {
+            (ExplicitSdcCore, 'explicit_euler'): 34,
+            (ImplicitSdcCore, 'implicit_euler'): 74,
+            (ImplicitSdcCore, 'lu'): 90,
+            (SemiImplicitSdcCore, 'implicit_euler'): 132,
+            (SemiImplicitSdcCore, 'lu'): 136
+        }
+        for (_core, _q_delta_type), _evaluations in _expected.items():
+            problem = _LinearProblem(complex(-1.0, 1.0))
+            _comm = ForwardSendingMessaging()
+            _sdc = ParallelSdc(communicator=_comm)
+            _comm.link_solvers(previous=_comm, next=_comm)
+            _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+            _sdc.init(integrator=SdcIntegrator, threshold=ThresholdCheck(max_threshold=4, conditions=('iterations',)),
+                      problem=problem, num_time_steps=2, num_nodes=3, q_delta_type=_q_delta_type)
+            _sdc.run(_core, dt=0.5)
+            self.assertEqual(problem.rhs_evaluations, _evaluations,
+                             msg="{} with {}".format(_core.__name__, _q_delta_type))
+
+    def test_node_parallel_sweeps_match_sequential_sweeps(self):
+        _values = []
+        for _node_parallel in [False, True, ThreadPoolExecutor(max_workers=2)]:
+            problem = LambdaU(lmbda=-20.0)
+            thresh = ThresholdCheck(max_threshold=10, min_threshold=1e-12,
+                                    conditions=('solution reduction', 'iterations'))
+            _comm = ForwardSendingMessaging()
+            _sdc = ParallelSdc(communicator=_comm)
+            _comm.link_solvers(previous=_comm, next=_comm)
+            _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+            _sdc.init(integrator=SdcIntegrator, threshold=thresh, problem=problem, num_time_steps=2, num_nodes=5,
+                      q_delta_type='min', node_parallel=_node_parallel)
+            _sdc.run(ImplicitSdcCore, dt=0.5)
+            _values.append(_sdc._states[-1].last_iteration.final_step.value)
+        self.assertNumpyArrayAlmostEqual(_values[1], _values[0], delta=1e-12)
+        self.assertNumpyArrayAlmostEqual(_values[2], _values[0], delta=1e-12)
+
+    def test_node_parallel_sweeps_record_instrumentation_of_worker_threads(self):
+        _counts = []
+        for _node_parallel in [False, True]:
+            problem = _LinearProblem(complex(-20.0, 0.0))
+            _comm = ForwardSendingMessaging()
+            _sdc = ParallelSdc(communicator=_comm)
+            _comm.link_solvers(previous=_comm, next=_comm)
+            _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+            _sdc.init(integrator=SdcIntegrator, threshold=ThresholdCheck(max_threshold=3, conditions=('iterations',)),
+                      problem=problem, num_time_steps=1, num_nodes=5, q_delta_type='min', node_parallel=_node_parallel)
+            _sdc.run(ImplicitSdcCore, dt=0.5)
+            _counts.append(dict(((_t['iteration'], _t['path']), _t['count']) for _t in _sdc.instrumentation.timers))
+        for _iteration in range(0, 3):
+            # one implicit solve per node, which are run by the worker threads if node-parallel
+            self.assertEqual(_counts[0][(_iteration, 'iteration/sweep/implicit solve')], 4)
+            self.assertEqual(_counts[1][(_iteration, 'iteration/sweep/implicit solve')], 4)
+
+    def test_node_parallel_sweeps_shut_down_worker_threads_on_failure(self):
+        class _FailingLambdaU(LambdaU):
+            def evaluate_wrt_time(self, time, phi_of_time, **kwargs):
+                if time > 0.25:
+                    raise RuntimeError("failing right hand side")
+                return super(_FailingLambdaU, self).evaluate_wrt_time(time, phi_of_time, **kwargs)
+
+        _workers = lambda: [_thread for _thread in threading.enumerate()
+                            if _thread.name.startswith('ThreadPoolExecutor')]
+        _workers_before = len(_workers())
+        problem = _FailingLambdaU(lmbda=-20.0)
+        _comm = ForwardSendingMessaging()
+        _sdc = ParallelSdc(communicator=_comm)
+        _comm.link_solvers(previous=_comm, next=_comm)
+        _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+        _sdc.init(integrator=SdcIntegrator, threshold=ThresholdCheck(max_threshold=3, conditions=('iterations',)),
+                  problem=problem, num_time_steps=1, num_nodes=5, q_delta_type='min', node_parallel=True)
+        self.assertRaises(RuntimeError, _sdc.run, ImplicitSdcCore, dt=0.5)
+        self.assertEqual(len(_workers()), _workers_before)
+
+    def test_node_parallel_sweeps_require_diagonal_q_delta(self):
+        problem = LambdaU(lmbda=-20.0)
+        _sdc = ParallelSdc(communicator=ForwardSendingMessaging())
+        self.assertRaises(ValueError, _sdc.init, integrator=SdcIntegrator, problem=problem, num_nodes=3,
+                          q_delta_type='lu', node_parallel=True)
+
+    def test_adaptive_interval_widths(self):
+        problem = LambdaU(lmbda=complex(-1.0, 1.0))
+        thresh = ThresholdCheck(max_threshold=4, min_threshold=1e-12, conditions=('solution reduction', 'iterations'))
+        _comm = ForwardSendingMessaging()
+        _sdc = ParallelSdc(communicator=_comm)
+        _comm.link_solvers(previous=_comm, next=_comm)
+        _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+        _sdc.init(integrator=SdcIntegrator, threshold=thresh, problem=problem, num_time_steps=1, num_nodes=3,
+                  adaptive=True, error_tolerance=1e-6)
+        self.assertTrue(_sdc.adaptive)
+        _sdc.run(ImplicitSdcCore, dt=0.25)
+
+        # the initial width is rejected and all accepted intervals are contiguous up to the end of time
+        _widths = [_state.delta_interval for _state in _sdc._states]
+        self.assertLess(max(_widths), 0.25)
+        for _previous, _next in zip(_sdc._states[:-1], _sdc._states[1:]):
+            self.assertAlmostEqual(_previous.initial.time_point + _previous.delta_interval, _next.initial.time_point)
+        _final_step = _sdc._states[-1].last_iteration.final_step
+        self.assertAlmostEqual(_final_step.time_point, problem.time_end)
+        self.assertLess(abs(_final_step.value - problem.exact(_final_step.time_point)).max(), 1e-6)
+
+    def test_records_instrumentation_per_interval_and_iteration(self):
+        problem = LambdaU(lmbda=complex(-1.0, 1.0))
+        thresh = ThresholdCheck(max_threshold=3, conditions=('iterations',))
+        _comm = ForwardSendingMessaging()
+        _sdc = ParallelSdc(communicator=_comm)
+        _comm.link_solvers(previous=_comm, next=_comm)
+        _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+        _sdc.init(integrator=SdcIntegrator, threshold=thresh, problem=problem, num_time_steps=2, num_nodes=3)
+        _sdc.run(SemiImplicitSdcCore, dt=0.5)
+
+        _timers = dict(((_t['interval'], _t['iteration'], _t['path']), _t['count'])
+                       for _t in _sdc.instrumentation.timers)
+        for _interval in range(0, 2):
+            for _iteration in range(0, 3):
+                self.assertEqual(_timers[(_interval, _iteration, 'iteration')], 1)
+                self.assertEqual(_timers[(_interval, _iteration, 'iteration/sweep')], 2)
+        _paths = set(_t['path'] for _t in _sdc.instrumentation.aggregate())
+        self.assertTrue({'receive', 'send', 'finalize', 'iteration/sweep/rhs'}.issubset(_paths))
+
+    def test_errors_with_exact_solution_of_interval(self):
+        problem = LambdaU(lmbda=complex(-1.0, 1.0))
+        self.assertNumpyArrayAlmostEqual(problem.exact_batch(np.array([0.0, 0.5])),
+                                         np.array([problem.exact(0.0), problem.exact(0.5)]), delta=1e-15)
+        thresh = ThresholdCheck(max_threshold=2, conditions=('iterations',))
+        _comm = ForwardSendingMessaging()
+        _sdc = ParallelSdc(communicator=_comm)
+        _comm.link_solvers(previous=_comm, next=_comm)
+        _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+        _sdc.init(integrator=SdcIntegrator, threshold=thresh, problem=problem, num_time_steps=2, num_nodes=3)
+        _sdc.run(SemiImplicitSdcCore, dt=0.5)
+        for _time_step in _sdc._states[-1].last_iteration:
+            for _step in _time_step:
+                self.assertNumpyArrayAlmostEqual(_step.solution.error.value,
+                                                 abs(_step.value - problem.exact(_step.time_point)), delta=1e-15)
+
+    def test_emits_events_per_interval_and_iteration(self):
+        problem = LambdaU(lmbda=complex(-1.0, 1.0))
+        thresh = ThresholdCheck(max_threshold=3, conditions=('iterations',))
+        _comm = ForwardSendingMessaging()
+        _sdc = ParallelSdc(communicator=_comm)
+        _sdc.event_sink = RecordArrayEventSink()
+        _comm.link_solvers(previous=_comm, next=_comm)
+        _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+        _sdc.init(integrator=SdcIntegrator, threshold=thresh, problem=problem, num_time_steps=2, num_nodes=3)
+        _sdc.run(SemiImplicitSdcCore, dt=0.5)
+
+        _records = _sdc.event_sink.records
+        self.assertEqual(_records.kind.tolist(),
+                         2 * (['interval start'] + 3 * ['iteration'] + ['interval end']))
+        _iterations = _sdc.event_sink.of_kind(SolverEvent.Kind.iteration)
+        self.assertEqual(_iterations.iteration.tolist(), [0, 1, 2, 0, 1, 2])
+        self.assertTrue((_iterations.residual >= 0.0).all())
+        self.assertTrue((_iterations.wall_time >= 0.0).all())
+        _ends = _sdc.event_sink.of_kind(SolverEvent.Kind.interval_end)
+        self.assertEqual(_ends.interval.tolist(), [0, 1])
+        self.assertEqual(_ends.reason.tolist(), ['iterations', 'iterations'])
+        for _time_end, _expected in zip(_ends.time_end, [0.5, 1.0]):
+            self.assertAlmostEqual(_time_end, _expected)
+
 
 if __name__ == "__main__":
     import unittest
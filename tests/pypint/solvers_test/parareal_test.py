@@ -0,0 +1,64 @@
+# coding=utf-8
+import pickle
+import unittest
+
+from pypint.solvers import parareal
+from pypint.solvers.parareal import Parareal
+from pypint.solvers.parallel_sdc import ParallelSdc
+from pypint.solvers.cores import ExplicitSdcCore
+from pypint.communicators import ForwardSendingMessaging
+from pypint.integrators.sdc_integrator import SdcIntegrator
+from pypint.utilities.threshold_check import ThresholdCheck
+from examples.problems.lambda_u import LambdaU
+from tests import NumpyAwareTestCase
+
+
+def _threshold():
+    return ThresholdCheck(max_threshold=30, min_threshold=1e-12, conditions=('residual', 'iterations'))
+
+
+class PararealTest(NumpyAwareTestCase):
+    def test_matches_serial_fine_propagator(self):
+        problem = LambdaU(lmbda=complex(-1.0, 1.0))
+        _parareal = Parareal()
+        _parareal.init(problem=problem, fine={'core': ExplicitSdcCore, 'num_nodes': 5, 'threshold': _threshold()},
+                       num_processes=2)
+        _values = _parareal.run(dt=0.25)
+        self.assertEqual(_parareal.num_time_slices, 4)
+        self.assertEqual(len(_values), 4)
+        self.assertLessEqual(_parareal.num_iterations, 4)
+
+        _comm = ForwardSendingMessaging()
+        _sdc = ParallelSdc(communicator=_comm)
+        _comm.link_solvers(previous=_comm, next=_comm)
+        _comm.write_buffer(value=problem.initial_value, time_point=problem.time_start)
+        _sdc.init(problem=problem, integrator=SdcIntegrator, num_nodes=5, threshold=_threshold())
+        _serial = _sdc.run(ExplicitSdcCore, dt=0.25)
+
+        for _slice in range(0, 4):
+            self.assertNumpyArrayAlmostEqual(_values[_slice], _serial[_slice].solutions[-1].data[-1].value,
+                                             delta=1e-10)
+
+    def test_workers_unpickle_fine_propagator_once_per_run(self):
+        problem = LambdaU(lmbda=complex(-1.0, 1.0))
+        _fine = pickle.dumps(parareal._Propagator(problem, {'core': ExplicitSdcCore, 'num_nodes': 3,
+                                                            'threshold': _threshold()}))
+        _first = parareal._propagate_fine(_fine, problem.initial_value, 0.0, 0.25)
+        _propagator = parareal._FINE_PROPAGATOR[1]
+        _second = parareal._propagate_fine(_fine, problem.initial_value, 0.0, 0.25)
+        self.assertIs(parareal._FINE_PROPAGATOR[1], _propagator)
+        self.assertNumpyArrayAlmostEqual(_second, _first, delta=1e-15)
+
+    def test_time_slices_must_divide_interval(self):
+        _parareal = Parareal()
+        _parareal.init(problem=LambdaU(lmbda=-1.0))
+        self.assertRaises(ValueError, _parareal.run, dt=0.3)
+
+    def test_propagators_must_not_be_adaptive(self):
+        _parareal = Parareal()
+        self.assertRaises(ValueError, _parareal.init, problem=LambdaU(lmbda=-1.0),
+                          fine={'core': ExplicitSdcCore, 'adaptive': True})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+# coding=utf-8
+import os
+import time
+import unittest
+
+import numpy as np
+
+from pypint.solvers.pfasst import Pfasst
+from pypint.solvers.ml_sdc import MlSdc
+from pypint.solvers.cores import SemiImplicitMlSdcCore
+from pypint.communicators import ForwardSendingMessaging
+from pypint.multi_level_providers.multi_time_level_provider import MultiTimeLevelProvider
+from pypint.multi_level_providers.level_transition_providers.time_transition_provider import TimeTransitionProvider
+from pypint.integrators.sdc_integrator import SdcIntegrator
+from pypint.utilities.threshold_check import ThresholdCheck
+from pypint.utilities.assertions import validation_level, set_validation_level
+from examples.problems.lambda_u import LambdaU
+from tests import NumpyAwareTestCase
+
+
+def _ml_provider():
+    _coarse = SdcIntegrator()
+    _coarse.init(num_nodes=3)
+    _fine = SdcIntegrator()
+    _fine.init(num_nodes=5)
+    _provider = MultiTimeLevelProvider()
+    _provider.add_coarse_level(_fine)
+    _provider.add_coarse_level(_coarse)
+    _provider.add_level_transition(TimeTransitionProvider(fine_nodes=_fine.nodes, coarse_nodes=_coarse.nodes), 0, 1)
+    return _provider
+
+
+class _FailingLambdaU(LambdaU):
+    """Kills or stalls the process solving the second half of the time interval
+    """
+    def __init__(self, *args, **kwargs):
+        self.stall = kwargs.pop('stall', False)
+        super(_FailingLambdaU, self).__init__(*args, **kwargs)
+
+    def evaluate_wrt_time(self, time_point, phi_of_time, **kwargs):
+        self._fail(np.array([time_point]))
+        return super(_FailingLambdaU, self).evaluate_wrt_time(time_point, phi_of_time, **kwargs)
+
+    def evaluate_wrt_time_batch(self, times, values, **kwargs):
+        self._fail(times)
+        return super(_FailingLambdaU, self).evaluate_wrt_time_batch(times, values, **kwargs)
+
+    def _fail(self, times):
+        if (times > 0.5).any():
+            if self.stall:
+                time.sleep(60.0)
+            os._exit(1)
+
+
+def _threshold():
+    return ThresholdCheck(max_threshold=20, min_threshold=1e-10, conditions=('solution reduction', 'iterations'))
+
+
+class PfasstTest(NumpyAwareTestCase):
+    def test_matches_serial_mlsdc(self):
+        problem = LambdaU(lmbda=complex(-1.0, -1.0))
+        _pfasst = Pfasst()
+        _pfasst.init(problem=problem, ml_provider=_ml_provider(), threshold=_threshold())
+        _solutions = _pfasst.run(SemiImplicitMlSdcCore, dt=0.5)
+        self.assertEqual(_pfasst.num_time_slices, 2)
+        self.assertEqual(len(_solutions), 2)
+
+        _comm = ForwardSendingMessaging()
+        _mlsdc = MlSdc(communicator=_comm)
+        _comm.link_solvers(previous=_comm, next=_comm)
+        _provider = _ml_provider()
+        _comm.write_buffer(tag=(_provider.num_levels - 1), value=problem.initial_value, time_point=problem.time_start)
+        _mlsdc.init(problem=problem, ml_provider=_provider, threshold=_threshold())
+        _serial = _mlsdc.run(SemiImplicitMlSdcCore, dt=0.5)
+
+        for _slice in range(0, 2):
+            self.assertNumpyArrayAlmostEqual(_solutions[_slice][0].solutions[-1].data[-1].value,
+                                             _serial[_slice].solutions[-1].data[-1].value, delta=1e-9)
+
+    def test_fails_if_a_process_dies(self):
+        _pfasst = Pfasst()
+        _pfasst.init(problem=_FailingLambdaU(lmbda=complex(-1.0, -1.0)), ml_provider=_ml_provider(),
+                     threshold=_threshold())
+        _start = time.time()
+        self.assertRaises(RuntimeError, _pfasst.run, SemiImplicitMlSdcCore, dt=0.5)
+        self.assertLess(time.time() - _start, 30.0)
+
+    def test_fails_if_a_process_dies_without_validation(self):
+        _level = validation_level()
+        set_validation_level('off')
+        try:
+            _pfasst = Pfasst()
+            _pfasst.init(problem=_FailingLambdaU(lmbda=complex(-1.0, -1.0)), ml_provider=_ml_provider(),
+                         threshold=_threshold())
+            self.assertRaises(RuntimeError, _pfasst.run, SemiImplicitMlSdcCore, dt=0.5)
+        finally:
+            set_validation_level(_level)
+
+    def test_fails_if_timeout_expires(self):
+        _pfasst = Pfasst()
+        _pfasst.init(problem=_FailingLambdaU(lmbda=complex(-1.0, -1.0), stall=True), ml_provider=_ml_provider(),
+                     threshold=_threshold())
+        _start = time.time()
+        self.assertRaises(RuntimeError, _pfasst.run, SemiImplicitMlSdcCore, dt=0.5, timeout=2.0)
+        self.assertLess(time.time() - _start, 30.0)
+
+    def test_time_slices_must_divide_interval(self):
+        _pfasst = Pfasst()
+        _pfasst.init(problem=LambdaU(lmbda=-1.0), ml_provider=_ml_provider())
+        self.assertRaises(ValueError, _pfasst.run, SemiImplicitMlSdcCore, dt=0.3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -39,6 +39,12 @@ class IStepStateTest(TestCase):
         with self.assertRaises(ValueError):
             self._default.delta_tau = -0.1
 
+    def test_resets_partial_rhs_on_new_value(self):
+        self.assertEqual(self._default.partial_rhs, {})
+        self._default.partial_rhs[('expl', 0.0)] = numpy.array([1.0])
+        self._default.value = numpy.array([2.0])
+        self.assertEqual(self._default.partial_rhs, {})
+
 
 def is_iterable(test_obj, state_class, num):
     assert_is(len(test_obj), num)
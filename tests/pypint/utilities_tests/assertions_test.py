@@ -0,0 +1,60 @@
+# coding=utf-8
+import unittest
+
+import numpy as np
+
+from pypint.utilities.assertions import ValidationLevel, VALIDATION, validation_level, set_validation_level, \
+    assert_is_instance, assert_is_in, assert_is_key
+from pypint.solutions.data_storage import StepSolutionData, TrajectorySolutionData
+from examples.problems.constant import Constant
+
+
+class AssertionsTest(unittest.TestCase):
+    def setUp(self):
+        self._level = validation_level()
+
+    def tearDown(self):
+        set_validation_level(self._level)
+
+    def test_failing_assertions_raise_value_errors(self):
+        self.assertRaises(ValueError, assert_is_instance, 1.0, int)
+        self.assertRaises(ValueError, assert_is_in, 3, [1, 2])
+        self.assertRaises(ValueError, assert_is_key, 3, {1: 'one'})
+
+    def test_boundary_level_skips_internal_checks(self):
+        set_validation_level('boundary')
+        self.assertIs(validation_level(), ValidationLevel.boundary)
+        self.assertFalse(VALIDATION.internal)
+        self.assertRaises(ValueError, assert_is_instance, 1.0, int)
+        # the time point is not a float, which is only checked internally
+        _problem = Constant()
+        self.assertEqual(_problem.evaluate_wrt_time(0, np.array([1.0])).shape, _problem.dim_for_time_solver)
+
+    def test_full_level_checks_internals(self):
+        set_validation_level(ValidationLevel.full)
+        self.assertTrue(VALIDATION.internal)
+        self.assertRaises(ValueError, Constant().evaluate_wrt_time, 0, np.array([1.0]))
+
+    def test_off_level_skips_all_checks(self):
+        set_validation_level('off')
+        self.assertFalse(VALIDATION.boundary)
+        assert_is_instance(1.0, int)
+
+    def test_off_level_keeps_finalized_solutions_locked(self):
+        set_validation_level('off')
+        _step = StepSolutionData(value=np.array([1.0]), time_point=0.0)
+        _step.finalize()
+        self.assertRaises(AttributeError, setattr, _step, 'value', np.array([2.0]))
+        self.assertRaises(AttributeError, _step.finalize)
+        _trajectory = TrajectorySolutionData()
+        _trajectory.add_solution_data(value=np.array([1.0]), time_point=0.0)
+        _trajectory.finalize()
+        self.assertRaises(AttributeError, _trajectory.add_solution_data, value=np.array([2.0]), time_point=1.0)
+        self.assertRaises(AttributeError, _trajectory.finalize)
+
+    def test_rejects_invalid_levels(self):
+        self.assertRaises(ValueError, set_validation_level, 'sometimes')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# coding=utf-8
+import subprocess
+import sys
+import unittest
+
+
+def _run(code):
+    # only the lines printed by the code itself start with '>'
+    _output = subprocess.check_output([sys.executable, '-c', code], universal_newlines=True,
+                                      stderr=subprocess.DEVNULL)
+    return [_line[1:].split() for _line in _output.splitlines() if _line.startswith('>')]
+
+
+class LoggingTest(unittest.TestCase):
+    def test_defers_configuration_until_first_message(self):
+        _output = _run("import sys\n"
+                       "from pypint.utilities.logging import LOG\n"
+                       "print('>', 'configobj' in sys.modules, len(LOG.handlers))\n"
+                       "LOG.disabled = True\n"
+                       "LOG.info('discarded')\n"
+                       "print('>', 'configobj' in sys.modules, len(LOG.handlers))\n"
+                       "LOG.disabled = False\n"
+                       "LOG.debug('handled')\n"
+                       "print('>', 'configobj' in sys.modules, len(LOG.handlers) > 0)\n")
+        # only the handler setting up the configured handlers is there before the first message
+        self.assertEqual(_output, [['False', '1'], ['False', '1'], ['True', 'True']])
+
+    def test_records_origin_of_first_message(self):
+        _output = _run("from logbook import TestHandler\n"
+                       "from pypint.utilities.logging import LOG\n"
+                       "def _caller():\n"
+                       "    LOG.debug('handled')\n"
+                       "with TestHandler() as _handler:\n"
+                       "    _caller()\n"
+                       "    _caller()\n"
+                       "for _record in _handler.records:\n"
+                       "    print('>', _record.module, _record.func_name)\n")
+        self.assertEqual(_output, [['__main__', '_caller'], ['__main__', '_caller']])
+
+    def test_sets_up_logging_once_for_concurrent_threads(self):
+        _output = _run("import io, sys\n"
+                       "from concurrent.futures import ThreadPoolExecutor\n"
+                       "from pypint.utilities.logging import LOG\n"
+                       "_stdout, sys.stdout = sys.stdout, io.StringIO()\n"
+                       "with ThreadPoolExecutor(max_workers=8) as _pool:\n"
+                       "    list(_pool.map(lambda i: LOG.debug('handled %d' % i), range(8)))\n"
+                       "_printed, sys.stdout = sys.stdout.getvalue(), _stdout\n"
+                       "print('>', _printed.count('Configuration has not yet been loaded'))\n")
+        self.assertEqual(_output, [['1']])
+
+    def test_solvers_do_not_import_optional_dependencies(self):
+        _output = _run("import sys\n"
+                       "import pypint.solvers.parallel_sdc, pypint.solvers.ml_sdc, pypint.plugins.plotters\n"
+                       "print('>', sorted(set(_m.split('.')[0] for _m in sys.modules)"
+                       "             .intersection(['scipy', 'matplotlib', 'configobj'])))\n")
+        self.assertEqual(_output, [['[]']])
+
+
+if __name__ == '__main__':
+    unittest.main()
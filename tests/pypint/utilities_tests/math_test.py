@@ -31,6 +31,16 @@ def test_lagrange_polynomial():
                     yield lagrange_polynomial_other_point, _set['base_points'].tolist().index(point), _set['base_points'], other
 
 
+def test_lagrange_matrix():
+    base_points = numpy.linspace(0.0, 1.0, 4)
+    points = numpy.array([0.0, 0.1, 0.5, 1.0])
+    values = lagrange_matrix(base_points, points)
+    assert_equal(values.shape, (4, 4))
+    for k in range(0, points.size):
+        for j in range(0, base_points.size):
+            assert_almost_equal(values[k][j], lagrange_polynome(j, base_points, points[k]))
+
+
 class MathTest(unittest.TestCase):
     def setUp(self):
         pass
@@ -0,0 +1,108 @@
+# coding=utf-8
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from pypint.utilities.parameter_sweep import ParameterSweep
+from pypint.utilities.assertions import validation_level, set_validation_level
+
+
+def _product(x, y, scale=1.0):
+    return scale * x * y
+
+
+def _fails_for_negative_x(x, y):
+    if x < 0.0:
+        raise ArithmeticError("negative")
+    return x * y
+
+
+class ParameterSweepTest(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+        self._file = os.path.join(self._dir, 'results.npy')
+        self._grid = OrderedDict([('x', np.array([-1.0, 1.0, 2.0])), ('y', np.array([1.0, 3.0]))])
+        self._expected = [[-1.0, -3.0], [1.0, 3.0], [2.0, 6.0]]
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def test_evaluates_all_points_on_process_pool(self):
+        _sweep = ParameterSweep(_product, self._grid, self._file, arguments={'scale': 2.0}, chunk_size=4)
+        self.assertEqual(_sweep.run(max_workers=2).tolist(), (2.0 * np.array(self._expected)).tolist())
+        self.assertEqual(_sweep.num_done, 6)
+        self.assertEqual(np.load(self._file)['value'].tolist(), (2.0 * np.array(self._expected)).tolist())
+
+    def test_resumes_from_file(self):
+        with ThreadPoolExecutor(max_workers=2) as _pool:
+            _sweep = ParameterSweep(_fails_for_negative_x, self._grid, self._file, chunk_size=1)
+            _sweep.run(executor=_pool)
+            # failed points are left for the next run
+            self.assertEqual(_sweep.num_done, 4)
+            self.assertEqual(_sweep.done.tolist(), [False, False, True, True, True, True])
+
+            _calls = []
+            _resumed = ParameterSweep(lambda x, y: _calls.append((x, y)) or x * y, self._grid, self._file)
+            self.assertEqual(_resumed.run(executor=_pool).tolist(), self._expected)
+            self.assertEqual(sorted(_calls), [(-1.0, 1.0), (-1.0, 3.0)])
+
+    def test_stores_value_for_failed_points(self):
+        _sweep = ParameterSweep(_fails_for_negative_x, self._grid, self._file, dtype=int, failed_value=-1)
+        with ThreadPoolExecutor(max_workers=1) as _pool:
+            self.assertEqual(_sweep.run(executor=_pool).tolist(), [[-1, -1], [1, 3], [2, 6]])
+
+    def test_schedules_bounded_number_of_chunks(self):
+        _scheduled = []
+
+        class _CountingExecutor(ThreadPoolExecutor):
+            def submit(self, *args, **kwargs):
+                _scheduled.append(1)
+                _future = super(_CountingExecutor, self).submit(*args, **kwargs)
+                _future.add_done_callback(lambda future: _scheduled.pop())
+                _maximum.append(len(_scheduled))
+                return _future
+
+        _maximum = []
+        _sweep = ParameterSweep(_product, self._grid, self._file, chunk_size=1)
+        with _CountingExecutor(max_workers=4) as _pool:
+            self.assertEqual(_sweep.run(executor=_pool, max_pending=2).tolist(), self._expected)
+            self.assertRaises(ValueError, _sweep.run, executor=_pool, max_pending=0)
+        self.assertEqual(len(_maximum), 6)
+        self.assertLessEqual(max(_maximum), 2)
+
+    def test_rejects_file_of_different_grid(self):
+        ParameterSweep(_product, self._grid, self._file, arguments={'scale': 2.0})
+        self.assertTrue(os.path.exists(os.path.join(self._dir, 'results.grid.npz')))
+        self.assertRaises(ValueError, ParameterSweep, _product, OrderedDict([('x', np.ones(2))]), self._file)
+        self.assertRaises(ValueError, ParameterSweep, _product, self._grid, self._file, dtype=int)
+        self.assertRaises(ValueError, ParameterSweep, _product, {'x': np.ones(2)}, self._file)
+        # same shape, but different values, names or arguments
+        self.assertRaises(ValueError, ParameterSweep, _product,
+                          OrderedDict([('x', np.array([-1.0, 1.0, 4.0])), ('y', np.array([1.0, 3.0]))]), self._file,
+                          arguments={'scale': 2.0})
+        self.assertRaises(ValueError, ParameterSweep, _product,
+                          OrderedDict([('y', self._grid['x']), ('x', self._grid['y'])]), self._file,
+                          arguments={'scale': 2.0})
+        self.assertRaises(ValueError, ParameterSweep, _product, self._grid, self._file, arguments={'scale': 3.0})
+        ParameterSweep(_product, self._grid, self._file, arguments={'scale': 2.0})
+
+    def test_rejects_file_of_different_grid_without_validation(self):
+        ParameterSweep(_product, self._grid, self._file)
+        _level = validation_level()
+        set_validation_level('off')
+        try:
+            self.assertRaises(ValueError, ParameterSweep, _product, self._grid, self._file, dtype=int)
+            self.assertRaises(ValueError, ParameterSweep, _product, self._grid, self._file, arguments={'scale': 3.0})
+            os.remove(os.path.join(self._dir, 'results.grid.npz'))
+            self.assertRaises(ValueError, ParameterSweep, _product, self._grid, self._file)
+        finally:
+            set_validation_level(_level)
+
+
+if __name__ == '__main__':
+    unittest.main()